@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Backfill parsed salary columns
+Fills salary_min, salary_max, salary_period and salary_currency from the
+salary_range text for jobs stored before those columns existed.
+
+Usage:
+    python scripts/maintenance/backfill_salary_columns.py --profile Nirajan
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.core.duckdb_database import DuckDBJobDatabase
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill parsed salary columns")
+    parser.add_argument("--profile", help="Profile whose database to backfill")
+    parser.add_argument("--db-path", help="Database file (when no profile is given)")
+    parser.add_argument("--batch-size", type=int, default=50000, help="Jobs per batch")
+    args = parser.parse_args()
+
+    if args.profile:
+        db = DuckDBJobDatabase(profile_name=args.profile)
+    elif args.db_path:
+        db = DuckDBJobDatabase(db_path=args.db_path)
+    else:
+        parser.error("--profile or --db-path is required")
+
+    with db:
+        updated = db.backfill_salary_columns(batch_size=args.batch_size)
+        stats = db.get_salary_statistics()
+
+    print(f"💰 Parsed salaries for {updated} jobs")
+    print(f"📊 Jobs with salary: {stats['count']}")
+
+
+if __name__ == "__main__":
+    main()
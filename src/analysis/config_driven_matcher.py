@@ -9,6 +9,8 @@ Key Improvements over V1:
 - Easy to add new industries/skills without code changes
 - Performance optimized with caching
 - Supports skill synonyms and variations
+- Single-pass skill matching via the shared SkillMatcher
+- score_frame() scores a whole DataFrame of jobs column-wise
 
 Configuration Files Used:
 - config/job_matching_config.json - Matching weights, thresholds, skill synonyms
@@ -22,10 +24,22 @@ from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass
 import logging
 
+import numpy as np
+import pandas as pd
+
+from src.analysis.skill_matcher import boundary_pattern, get_skill_matcher
 from src.utils.config_loader import ConfigLoader
 
 logger = logging.getLogger(__name__)
 
+# Job fields joined into the text that skills and experience are matched against
+JOB_TEXT_FIELDS = ("title", "description", "summary", "keywords", "skills")
+
+EXPERIENCE_LEVELS = ["entry_level", "mid_level", "senior_level", "executive_level"]
+
+# Upper bound used when a job or profile gives no maximum salary
+OPEN_SALARY_MAX = 999999
+
 
 @dataclass
 class MatchResult:
@@ -107,6 +121,9 @@ class ConfigDrivenMatcher:
         # Build optimized lookup structures
         self._build_lookup_structures()
         
+        # Shared single-pass matcher over skills database + synonyms
+        self.skill_matcher = get_skill_matcher(self.config_loader.config_dir)
+        
         # Pre-compile regex patterns
         self._compile_patterns()
         
@@ -145,6 +162,8 @@ class ConfigDrivenMatcher:
         self.skill_variations: Dict[str, str] = {}
         
         for canonical_name, variations in skill_synonyms.items():
+            if not isinstance(variations, list):
+                continue  # Skip the "description" entry
             for variation in variations:
                 self.skill_variations[variation.lower()] = canonical_name
         
@@ -260,11 +279,7 @@ class ConfigDrivenMatcher:
     def _combine_job_text(self, job: Dict[str, Any]) -> str:
         """Combine job fields into searchable text"""
         text_parts = [
-            job.get("title", ""),
-            job.get("description", ""),
-            job.get("summary", ""),
-            job.get("keywords", ""),
-            job.get("skills", ""),
+            job.get(field, "") for field in JOB_TEXT_FIELDS
         ]
         return " ".join(str(part) for part in text_parts if part).lower()
 
@@ -293,22 +308,17 @@ class ConfigDrivenMatcher:
             skill_lower = skill.lower().strip()
             profile_skills_normalized.append((skill_lower, skill))
 
-        # Fast O(1) skill matching using lookup dicts
+        # One scan of the job text for every profile skill and its synonyms
+        skill_terms = {
+            skill_lower: self._skill_terms(skill_lower)
+            for skill_lower, _ in profile_skills_normalized
+        }
+        found_terms = self.skill_matcher.find_terms(
+            job_text, {term for terms in skill_terms.values() for term in terms}
+        )
+
         for skill_lower, skill_display in profile_skills_normalized:
-            # Check direct match in skill database
-            if skill_lower in self.skill_lookup:
-                if self._skill_found_in_text_fast(skill_lower, job_text):
-                    matched_skills.append(skill_display)
-                continue
-            
-            # Check skill variations/synonyms
-            canonical = self.skill_variations.get(skill_lower)
-            if canonical and self._skill_found_in_text_fast(canonical, job_text):
-                matched_skills.append(skill_display)
-                continue
-            
-            # Fallback: direct text search for custom skills
-            if self._skill_found_in_text_fast(skill_lower, job_text):
+            if any(term in found_terms for term in skill_terms[skill_lower]):
                 matched_skills.append(skill_display)
 
         # Calculate score
@@ -327,9 +337,26 @@ class ConfigDrivenMatcher:
 
         return score, matched_skills, missing_skills
 
+    def _skill_terms(self, skill: str) -> Tuple[str, ...]:
+        """
+        Terms that count as a match for a skill: the skill itself plus its
+        canonical name (and that name's canonical form) from skill synonyms
+        
+        Args:
+            skill: Skill name (lowercase)
+        """
+        terms = [skill]
+        canonical = self.skill_variations.get(skill)
+        if canonical and canonical not in terms:
+            terms.append(canonical)
+            next_canonical = self.skill_variations.get(canonical)
+            if next_canonical and next_canonical not in terms:
+                terms.append(next_canonical)
+        return tuple(terms)
+
     def _skill_found_in_text_fast(self, skill: str, text: str) -> bool:
         """
-        Optimized skill matching with O(1) variations lookup
+        Word-boundary skill matching including config variations
         
         Args:
             skill: Skill name (lowercase)
@@ -338,29 +365,8 @@ class ConfigDrivenMatcher:
         Returns:
             True if skill found in text
         """
-        # Direct substring match (fastest)
-        if skill in text:
-            return True
-
-        # Word boundary match for exact terms
-        try:
-            if re.search(rf"\b{re.escape(skill)}\b", text):
-                return True
-        except re.error:
-            pass
-
-        # Check variations from config
-        canonical = self.skill_variations.get(skill)
-        if canonical and canonical != skill:
-            if canonical in text:
-                return True
-            try:
-                if re.search(rf"\b{re.escape(canonical)}\b", text):
-                    return True
-            except re.error:
-                pass
-
-        return False
+        terms = self._skill_terms(skill)
+        return bool(self.skill_matcher.find_terms(text, terms))
 
     def _analyze_experience_config_driven(
         self, 
@@ -378,12 +384,16 @@ class ConfigDrivenMatcher:
             job_text + " " + job_title
         )
         
-        # Get profile experience
-        profile_years = profile.get("years_of_experience", 0)
+        return self._score_experience_level(
+            job_experience_level, profile.get("years_of_experience", 0)
+        )
+
+    def _score_experience_level(self, job_experience_level: str, profile_years) -> Tuple[float, str]:
+        """Score a job's experience level against the profile's years of experience"""
         profile_level = self._categorize_experience_years(profile_years)
         
         # Calculate match score
-        level_hierarchy = ["entry_level", "mid_level", "senior_level", "executive_level"]
+        level_hierarchy = EXPERIENCE_LEVELS
         
         try:
             job_idx = level_hierarchy.index(job_experience_level)
@@ -441,7 +451,7 @@ class ConfigDrivenMatcher:
         
         Uses location_preferences from matching_config
         """
-        job_location = str(job.get("location", "")).lower()
+        job_location = str(job.get("location") or "").lower()
         profile_location = str(profile.get("location", "")).lower()
         profile_remote_pref = profile.get("remote_preference", "").lower()
         
@@ -478,13 +488,13 @@ class ConfigDrivenMatcher:
         job_salary_min = job.get("salary_min")
         job_salary_max = job.get("salary_max")
         expected_min = profile.get("expected_salary_min", 0)
-        expected_max = profile.get("expected_salary_max", 999999)
+        expected_max = profile.get("expected_salary_max", OPEN_SALARY_MAX)
         
         if not job_salary_min and not job_salary_max:
             return 0.5, "⚠️ Salary not disclosed"
         
         job_min = job_salary_min or 0
-        job_max = job_salary_max or 999999
+        job_max = job_salary_max or OPEN_SALARY_MAX
         
         # Check overlap
         if job_max >= expected_min and job_min <= expected_max:
@@ -551,6 +561,299 @@ class ConfigDrivenMatcher:
         confidence = available_score / total_weight if total_weight > 0 else 0.5
         return min(confidence, 1.0)
 
+    def score_frame(self, df: pd.DataFrame, profile: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Score every job in a DataFrame at once
+        
+        Column-wise equivalent of ``calculate_match`` for re-ranking a whole
+        table: skills become a row x skill hit matrix built with one pandas
+        string pass per term, experience patterns run once per level, and
+        location, salary, weights and readiness are NumPy expressions. Missing
+        values (NaN/None) count as empty fields.
+        
+        Args:
+            df: Jobs, one per row (columns as in the jobs table; ``salary_min``
+                and ``salary_max`` are used when present)
+            profile: User profile dictionary
+        
+        Returns:
+            Copy of ``df`` in the same order with ``overall_match``,
+            ``skill_match``, ``experience_match``, ``location_match``,
+            ``salary_match``, ``matched_skills``, ``missing_skills``,
+            ``readiness_level``, the ``*_fit`` messages and ``confidence_level``
+        """
+        start_time = time.time()
+        scored = df.copy()
+        if scored.empty:
+            for column in self._frame_result_columns():
+                scored[column] = pd.Series(dtype=object)
+            return scored
+
+        job_text = self._combine_job_text_column(df)
+        weights = self.matching_config.get("matching_weights", {})
+
+        # 1. Skills: hit matrix of rows x normalized profile skills
+        skill_score, matched_skills, missing_skills, missing_count = self._score_skills_frame(
+            job_text, profile.get("skills", [])
+        )
+
+        # 2. Experience: first configured level whose patterns match, per row
+        title = self._text_column(df, "title").str.lower()
+        experience_score, experience_fit = self._score_experience_frame(
+            job_text + " " + title, profile.get("years_of_experience", 0)
+        )
+
+        # 3. Location and 4. salary
+        location_score, location_fit = self._score_location_frame(df, profile)
+        salary_score, salary_fit = self._score_salary_frame(df, profile)
+
+        overall = (
+            skill_score * weights.get("skill_match", 0.40)
+            + experience_score * weights.get("experience_match", 0.25)
+            + location_score * weights.get("location_match", 0.20)
+            + salary_score * weights.get("salary_match", 0.15)
+        )
+
+        scored["overall_match"] = overall
+        scored["skill_match"] = skill_score
+        scored["experience_match"] = experience_score
+        scored["location_match"] = location_score
+        scored["salary_match"] = salary_score
+        scored["matched_skills"] = matched_skills
+        scored["missing_skills"] = missing_skills
+        scored["readiness_level"] = self._readiness_frame(overall, skill_score, missing_count)
+        scored["experience_fit"] = experience_fit
+        scored["location_fit"] = location_fit
+        scored["salary_fit"] = salary_fit
+        scored["confidence_level"] = self._confidence_frame(df)
+
+        logger.debug(
+            f"Scored {len(scored)} jobs in {(time.time() - start_time) * 1000:.1f}ms"
+        )
+        return scored
+
+    @staticmethod
+    def _frame_result_columns() -> List[str]:
+        return [
+            "overall_match", "skill_match", "experience_match", "location_match",
+            "salary_match", "matched_skills", "missing_skills", "readiness_level",
+            "experience_fit", "location_fit", "salary_fit", "confidence_level",
+        ]
+
+    @staticmethod
+    def _text_column(df: pd.DataFrame, column: str) -> pd.Series:
+        """Column as strings with missing values (or a missing column) as ''"""
+        if column not in df:
+            return pd.Series("", index=df.index, dtype=object)
+        values = df[column]
+        return values.where(values.notna(), "").astype(str)
+
+    def _combine_job_text_column(self, df: pd.DataFrame) -> pd.Series:
+        """``_combine_job_text`` for every row"""
+        columns = [self._text_column(df, field) for field in JOB_TEXT_FIELDS]
+        combined = [" ".join(part for part in parts if part) for parts in zip(*columns)]
+        return pd.Series(combined, index=df.index, dtype=object).str.lower()
+
+    def _score_skills_frame(
+        self, job_text: pd.Series, profile_skills: List[str]
+    ) -> Tuple[np.ndarray, List[List[str]], List[List[str]], np.ndarray]:
+        """Skill score, matched and missing skills and missing count for every row"""
+        rows = len(job_text)
+        normalized = [
+            (skill.lower().strip(), skill) for skill in profile_skills or [] if skill and skill.strip()
+        ]
+        if not normalized:
+            return (
+                np.zeros(rows), [[] for _ in range(rows)], [[] for _ in range(rows)],
+                np.zeros(rows, dtype=int),
+            )
+
+        # One boolean column per distinct term; cheap substring test first,
+        # then the word-boundary regex only on rows that contain the term
+        term_hits: Dict[str, np.ndarray] = {}
+        for skill_lower, _ in normalized:
+            for term in self._skill_terms(skill_lower):
+                if term in term_hits:
+                    continue
+                # Copy: under Copy-on-Write the array may be a read-only view
+                hits = job_text.str.contains(term, regex=False).to_numpy(dtype=bool, copy=True)
+                if hits.any():
+                    candidates = job_text[hits]
+                    hits[hits] = candidates.str.contains(boundary_pattern(term)).to_numpy(
+                        dtype=bool
+                    )
+                term_hits[term] = hits
+
+        hit_matrix = np.column_stack(
+            [
+                np.logical_or.reduce([term_hits[t] for t in self._skill_terms(skill_lower)])
+                for skill_lower, _ in normalized
+            ]
+        )
+        score = np.minimum(hit_matrix.sum(axis=1) / len(normalized), 1.0)
+
+        displays = np.array([display for _, display in normalized], dtype=object)
+        matched = [list(displays[row]) for row in hit_matrix]
+
+        # Critical skills are the first five; missing means its display name was not matched
+        critical = displays[:5]
+        missing = [
+            [display for display in critical if display not in row_matched] for row_matched in matched
+        ]
+        missing_count = np.fromiter((len(m) for m in missing), dtype=int, count=rows)
+        return score, matched, missing, missing_count
+
+    def _score_experience_frame(
+        self, experience_text: pd.Series, profile_years
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Experience score and fit message for every row"""
+        levels = []
+        conditions = []
+        undecided = np.ones(len(experience_text), dtype=bool)
+        for level, compiled_patterns in self.experience_compiled.items():
+            if not compiled_patterns:
+                continue
+            combined = re.compile(
+                "|".join(f"(?:{p.pattern})" for p in compiled_patterns), re.IGNORECASE
+            )
+            matches = np.zeros(len(experience_text), dtype=bool)
+            if undecided.any():
+                matches[undecided] = [
+                    combined.search(text) is not None for text in experience_text[undecided]
+                ]
+            undecided &= ~matches
+            levels.append(level)
+            conditions.append(matches)
+
+        job_levels = np.select(conditions, levels, default="mid_level") if levels else np.full(
+            len(experience_text), "mid_level", dtype=object
+        )
+
+        scores = np.empty(len(experience_text))
+        fits = np.empty(len(experience_text), dtype=object)
+        for level in np.unique(job_levels):
+            level_score, level_fit = self._score_experience_level(level, profile_years)
+            rows = job_levels == level
+            scores[rows] = level_score
+            fits[rows] = level_fit
+        return scores, fits
+
+    def _score_location_frame(
+        self, df: pd.DataFrame, profile: Dict[str, Any]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Location score and fit message for every row"""
+        job_location = self._text_column(df, "location").str.lower()
+        profile_location = str(profile.get("location", "")).lower()
+        profile_remote_pref = profile.get("remote_preference", "").lower()
+
+        def contains_any(keywords: Set[str]) -> np.ndarray:
+            if not keywords:
+                return np.zeros(len(job_location), dtype=bool)
+            pattern = "|".join(re.escape(keyword) for keyword in keywords)
+            return job_location.str.contains(pattern).to_numpy(dtype=bool)
+
+        is_remote = contains_any(self.location_keywords.get("remote", set()))
+        is_hybrid = contains_any(self.location_keywords.get("hybrid", set()))
+        if profile_location:
+            is_local = job_location.str.contains(profile_location, regex=False).to_numpy(dtype=bool)
+        else:
+            is_local = np.zeros(len(job_location), dtype=bool)
+
+        remote_match = profile_remote_pref in ["remote", "full remote", "100% remote"]
+        hybrid_match = "hybrid" in profile_remote_pref or "flexible" in profile_remote_pref
+
+        conditions = [is_remote, is_local, is_hybrid]
+        scores = np.select(
+            conditions, [1.0 if remote_match else 0.8, 1.0, 0.9 if hybrid_match else 0.7], 0.5
+        )
+        fallback = ("⚠️ Location: " + job_location.where(job_location != "", "Not specified"))
+        fits = np.select(
+            conditions,
+            [
+                "🟢 Remote match" if remote_match else "🟡 Remote available",
+                f"🟢 Location match: {profile_location}",
+                "🟢 Hybrid match" if hybrid_match else "🟡 Hybrid available",
+            ],
+            fallback.to_numpy(dtype=object),
+        )
+        return scores, fits
+
+    def _score_salary_frame(
+        self, df: pd.DataFrame, profile: Dict[str, Any]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Salary score and fit message for every row from ``salary_min``/``salary_max``"""
+        rows = len(df)
+
+        def salary_column(column: str) -> np.ndarray:
+            if column not in df:
+                return np.zeros(rows)
+            values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+            return np.nan_to_num(values, nan=0.0)
+
+        job_min = salary_column("salary_min")
+        raw_max = salary_column("salary_max")
+        expected_min = profile.get("expected_salary_min", 0)
+        expected_max = profile.get("expected_salary_max", OPEN_SALARY_MAX)
+
+        disclosed = (job_min != 0) | (raw_max != 0)
+        job_max = np.where(raw_max != 0, raw_max, OPEN_SALARY_MAX)
+        overlaps = disclosed & (job_max >= expected_min) & (job_min <= expected_max)
+
+        overlap = np.minimum(job_max, expected_max) - np.maximum(job_min, expected_min)
+        total_range = np.maximum(job_max, expected_max) - np.minimum(job_min, expected_min)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(total_range > 0, overlap / total_range, 0.5)
+
+        scores = np.where(overlaps, ratio, np.where(disclosed, 0.3, 0.5))
+        fits = np.where(disclosed, "❌ Salary below expectations", "⚠️ Salary not disclosed").astype(
+            object
+        )
+        for row in np.flatnonzero(overlaps):
+            fits[row] = (
+                f"🟢 Salary: ${_format_amount(job_min[row])}-${_format_amount(job_max[row])}"
+            )
+        return scores, fits
+
+    def _readiness_frame(
+        self, overall: np.ndarray, skill_score: np.ndarray, missing_count: np.ndarray
+    ) -> np.ndarray:
+        """Readiness level for every row using the config criteria"""
+        criteria = self.matching_config.get("readiness_criteria", {})
+        apply_now = criteria.get("apply_now", {})
+        consider = criteria.get("consider", {})
+
+        is_apply_now = (
+            (overall >= apply_now.get("min_overall_score", 0.75))
+            & (skill_score >= apply_now.get("min_skill_match", 0.70))
+            & (missing_count <= apply_now.get("max_critical_missing", 1))
+        )
+        is_consider = (overall >= consider.get("min_overall_score", 0.55)) & (
+            skill_score >= consider.get("min_skill_match", 0.50)
+        )
+        return np.select([is_apply_now, is_consider], ["🟢 Apply Now", "🟡 Consider"], "🔴 Skip")
+
+    def _confidence_frame(self, df: pd.DataFrame) -> np.ndarray:
+        """Data-availability confidence for every row"""
+        confidence_factors = self.matching_config.get("confidence_factors", {})
+        required_fields = confidence_factors.get("required_fields", {})
+        total_weight = sum(required_fields.values())
+        if total_weight <= 0:
+            return np.full(len(df), 0.5)
+
+        available = np.zeros(len(df))
+        for field, weight in required_fields.items():
+            if field not in df:
+                continue
+            values = df[field]
+            present = values.notna().to_numpy(dtype=bool) & values.astype(bool).to_numpy()
+            available += np.where(present, weight, 0.0)
+        return np.minimum(available / total_weight, 1.0)
+
+
+def _format_amount(value: float):
+    """Format a salary like the dict path does for whole-number amounts"""
+    return f"{int(value):,}" if float(value).is_integer() else f"{value:,}"
+
 
 # Convenience function for easy usage
 def create_matcher(config_dir: Optional[str] = None) -> ConfigDrivenMatcher:
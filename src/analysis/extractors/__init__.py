@@ -16,6 +16,7 @@ from .company import CompanyExtractor
 from .compensation import CompensationExtractor
 from .coordinator import CustomExtractor, get_Improved_custom_extractor
 from .location import LocationExtractor
+from .prepared_text import PreparedJobText, TextView
 from .skills import SkillsExtractor
 from .title import TitleExtractor
 
@@ -29,6 +30,9 @@ __all__ = [
     "ExtractionConfidence",
     "PatternMatch",
     "ValidationResult",
+    # Shared pre-normalized job text
+    "PreparedJobText",
+    "TextView",
     # Specialized extractors',
     "TitleExtractor",
     "CompanyExtractor",
@@ -16,6 +16,7 @@ from .base import (
     PatternMatch,
     ValidationResult,
 )
+from .prepared_text import PreparedJobText
 
 logger = logging.getLogger(__name__)
 
@@ -216,15 +217,8 @@ class CompanyExtractor(BaseExtractor):
         )
 
     def _prepare_content(self, job_data: Dict[str, Any]) -> str:
-        """Prepare content for extraction."""
-        content_parts = []
-
-        for field in ["description", "job_description", "company", "summary"]:
-            value = job_data.get(field)
-            if value and isinstance(value, str):
-                content_parts.append(value)
-
-        return "\n".join(content_parts)
+        """Prepare content for extraction (joined once per job and shared)."""
+        return PreparedJobText.of(job_data).content(("description", "job_description", "company", "summary"))
 
     def _clean_company_name(self, company: str) -> str:
         """Clean and normalize company name."""
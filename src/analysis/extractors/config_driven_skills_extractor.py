@@ -7,6 +7,7 @@ Key Improvements over V1:
 - Loads 263 skills from skills_database.json (was 500+ hardcoded)
 - Uses extraction_patterns.json for pattern-based extraction
 - O(1) skill lookups using pre-built dictionaries
+- Single-pass skill matching via the shared SkillMatcher
 - Supports 9 industries with specialized extraction
 - Easy to add new skills without code changes
 - Performance optimized with caching
@@ -26,10 +27,14 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
+from src.analysis.extractors.prepared_text import PreparedJobText
+from src.analysis.skill_matcher import get_skill_matcher
 from src.utils.config_loader import ConfigLoader
 
 logger = logging.getLogger(__name__)
 
+_CONTENT_FIELDS = ("description", "job_description", "summary", "requirements", "title")
+
 
 class ConfigDrivenSkillsExtractor:
     """
@@ -61,6 +66,9 @@ class ConfigDrivenSkillsExtractor:
         # Build lookup structures
         self._build_skill_lookups()
         
+        # Shared single-pass matcher over the same skills database
+        self.skill_matcher = get_skill_matcher(self.config_loader.config_dir)
+        
         # Compile extraction patterns
         self._compile_extraction_patterns()
         
@@ -150,8 +158,9 @@ class ConfigDrivenSkillsExtractor:
         """
         start_time = time.time()
         
-        # Prepare content
-        content = self._prepare_content(job_data)
+        # Prepare content (shared with other extractors when job_data is prepared)
+        view = PreparedJobText.of(job_data).view(_CONTENT_FIELDS)
+        content = view.raw
         
         # Extract skills with confidence scores
         skill_scores: Dict[str, float] = {}
@@ -172,10 +181,11 @@ class ConfigDrivenSkillsExtractor:
                             current_score = skill_scores.get(skill_lower, 0.0)
                             skill_scores[skill_lower] = max(current_score, confidence)
         
-        # 2. Direct skill matching in content (medium confidence)
+        # 2. Direct skill matching in content (medium confidence, one scan)
+        found_skills = self.skill_matcher.find_terms(view, self.all_skills_normalized)
         for skill_lower in self.all_skills_normalized:
             if skill_lower not in skill_scores:  # Only check if not already found
-                if self._skill_found_in_content(skill_lower, content):
+                if skill_lower in found_skills:
                     skill_scores[skill_lower] = 0.70  # Medium confidence
         
         # 3. Filter by industry if specified
@@ -219,17 +229,18 @@ class ConfigDrivenSkillsExtractor:
         Returns:
             Dictionary mapping industry -> list of skills
         """
-        content = self._prepare_content(job_data)
+        view = PreparedJobText.of(job_data).view(_CONTENT_FIELDS)
         industry_results: Dict[str, List[Tuple[str, float]]] = {}
         
         # Extract all skills with confidence
+        found_skills = self.skill_matcher.find_terms(view, self.skill_lookup)
         for skill_lower, (skill_display, industry_key) in self.skill_lookup.items():
-            if self._skill_found_in_content(skill_lower, content):
+            if skill_lower in found_skills:
                 if industry_key not in industry_results:
                     industry_results[industry_key] = []
                 
                 # Calculate confidence based on context
-                confidence = self._calculate_skill_confidence(skill_lower, content)
+                confidence = self._calculate_skill_confidence(skill_lower, view.lower)
                 industry_results[industry_key].append((skill_display, confidence))
         
         # Sort each industry's skills by confidence
@@ -317,15 +328,7 @@ class ConfigDrivenSkillsExtractor:
 
     def _prepare_content(self, job_data: Dict[str, Any]) -> str:
         """Prepare job content for extraction"""
-        content_parts = []
-        
-        # Extract text from multiple fields
-        for field in ["description", "job_description", "summary", "requirements", "title"]:
-            value = job_data.get(field)
-            if value and isinstance(value, str):
-                content_parts.append(value)
-        
-        return "\n".join(content_parts)
+        return PreparedJobText.of(job_data).content(_CONTENT_FIELDS)
 
     def _parse_skills_from_text(self, text: str) -> List[str]:
         """
@@ -373,19 +376,7 @@ class ConfigDrivenSkillsExtractor:
         Returns:
             True if skill found
         """
-        content_lower = content.lower()
-        
-        # Direct substring match (fastest)
-        if skill in content_lower:
-            # Verify with word boundaries
-            try:
-                pattern = r"\b" + re.escape(skill) + r"\b"
-                if re.search(pattern, content_lower):
-                    return True
-            except re.error:
-                return skill in content_lower
-        
-        return False
+        return skill in self.skill_matcher.find_terms(content, (skill,))
 
     def _calculate_skill_confidence(self, skill: str, content: str) -> float:
         """
@@ -398,7 +389,6 @@ class ConfigDrivenSkillsExtractor:
         Returns:
             Confidence score (0.0 - 1.0)
         """
-        content_lower = content.lower()
         base_confidence = 0.70
         
         # Boost confidence if skill appears in key sections
@@ -408,17 +398,17 @@ class ConfigDrivenSkillsExtractor:
         ]
         
         for keyword in high_confidence_keywords:
-            if keyword in content_lower:
+            if keyword in content:
                 # Check if skill appears near this keyword (within 100 chars)
-                keyword_pos = content_lower.find(keyword)
-                skill_pos = content_lower.find(skill)
+                keyword_pos = content.find(keyword)
+                skill_pos = content.find(skill)
                 
                 if abs(keyword_pos - skill_pos) < 100:
                     base_confidence = min(base_confidence + 0.15, 0.95)
                     break
         
         # Count occurrences (multiple mentions = higher confidence)
-        occurrences = content_lower.count(skill)
+        occurrences = content.count(skill)
         if occurrences > 1:
             base_confidence = min(base_confidence + 0.05 * (occurrences - 1), 0.95)
         
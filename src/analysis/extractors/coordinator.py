@@ -13,6 +13,7 @@ from .base import ExtractionResult, ValidationResult
 from .company import CompanyExtractor
 from .compensation import CompensationExtractor
 from .location import LocationExtractor
+from .prepared_text import PreparedJobText
 from .skills import SkillsExtractor
 from .title import TitleExtractor
 
@@ -48,7 +49,8 @@ class CustomExtractor:
         minimal, or malformed input with reliable error handling.
 
         Args:
-            job_data: Dictionary containing job information
+            job_data: Dictionary containing job information, or a PreparedJobText
+                built by the caller so its text is shared further
 
         Returns:
             ExtractionResult with comprehensive analysis of extracted job data
@@ -57,10 +59,13 @@ class CustomExtractor:
 
         try:
             # Validate input
-            if not job_data or not isinstance(job_data, dict):
+            if not job_data or not isinstance(job_data, (dict, PreparedJobText)):
                 self.logger.warning("Received empty or invalid job_data input")
                 return ExtractionResult()
 
+            # Join and normalize the job text once for every extractor below
+            job_data = PreparedJobText.of(job_data)
+
             # Initialize result
             result = ExtractionResult()
 
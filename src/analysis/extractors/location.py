@@ -10,6 +10,7 @@ import re
 from typing import Any, Dict, List, Optional, Set
 
 from .base import BaseExtractor, ExtractionConfidence, PatternMatch
+from .prepared_text import PreparedJobText
 
 logger = logging.getLogger(__name__)
 
@@ -140,15 +141,8 @@ class LocationExtractor(BaseExtractor):
         return None
 
     def _prepare_content(self, job_data: Dict[str, Any]) -> str:
-        """Prepare content for extraction."""
-        content_parts = []
-
-        for field in ["description", "job_description", "location", "summary"]:
-            value = job_data.get(field)
-            if value and isinstance(value, str):
-                content_parts.append(value)
-
-        return "\n".join(content_parts)
+        """Prepare content for extraction (joined once per job and shared)."""
+        return PreparedJobText.of(job_data).content(("description", "job_description", "location", "summary"))
 
     def _validate_location(self, location: str) -> bool:
         """Validate location format.
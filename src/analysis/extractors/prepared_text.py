@@ -0,0 +1,144 @@
+"""
+Pre-normalized job text shared by all extractors.
+
+Every extractor used to join the same description fields, lowercase the
+result and re-tokenize it on its own. ``PreparedJobText`` wraps the job dict
+once per job and memoizes each joined text with its derived forms, so the
+coordinator, the individual extractors and the Stage 1 filters all work on
+the same prepared strings.
+
+Usage:
+    job = PreparedJobText.of(job_data)
+    job.content(("description", "summary"))  # joined raw text
+    job.view(("title", "description"), " ").lower
+"""
+
+import re
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Tuple
+
+from ..skill_matcher import tokenize
+
+# Fields most extractors read their free text from
+CONTENT_FIELDS = ("description", "job_description", "summary")
+
+_SENTENCE_RE = re.compile(r"[^.!?\n]+[.!?]*")
+_HEADING_RE = re.compile(r"^[ \t]*([A-Za-z][A-Za-z0-9 '&/()-]{1,60}?)[ \t]*:[ \t]*$", re.MULTILINE)
+
+
+class TextView:
+    """
+    One joined text of a job with its derived forms computed on first use.
+
+    ``lower`` has the same length as ``raw`` for practically all job text,
+    so offsets found in one can be used to slice the other; ``aligned``
+    tells when that is not the case.
+    """
+
+    def __init__(self, raw: str):
+        self.raw = raw
+
+    def __str__(self) -> str:
+        return self.raw
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __bool__(self) -> bool:
+        return bool(self.raw)
+
+    @cached_property
+    def lower(self) -> str:
+        return self.raw.lower()
+
+    @cached_property
+    def aligned(self) -> bool:
+        """True when character offsets in ``lower`` match ``raw``."""
+        return len(self.lower) == len(self.raw)
+
+    @cached_property
+    def normalized(self) -> str:
+        """Lowercased text with all whitespace runs collapsed to one space."""
+        return " ".join(self.lower.split())
+
+    @cached_property
+    def tokens(self) -> List[Tuple[int, str]]:
+        """``(offset, token)`` pairs of word runs and punctuation in ``lower``."""
+        return tokenize(self.lower)
+
+    @cached_property
+    def sentences(self) -> List[Tuple[int, int]]:
+        """``(start, end)`` offsets of sentences and lines, surrounding blanks trimmed."""
+        spans = []
+        for match in _SENTENCE_RE.finditer(self.raw):
+            start, end = match.span()
+            text = match.group()
+            start += len(text) - len(text.lstrip())
+            end -= len(text) - len(text.rstrip())
+            if start < end:
+                spans.append((start, end))
+        return spans
+
+    @cached_property
+    def sections(self) -> List[Tuple[str, int, int]]:
+        """
+        ``(heading, start, end)`` of each ``Heading:`` block.
+
+        ``heading`` is lowercased and the offsets cover the body that follows
+        the heading line, up to the next heading or the end of the text.
+        """
+        headings = list(_HEADING_RE.finditer(self.raw))
+        spans = []
+        for i, match in enumerate(headings):
+            end = headings[i + 1].start() if i + 1 < len(headings) else len(self.raw)
+            spans.append((match.group(1).strip().lower(), match.end(), end))
+        return spans
+
+    def section(self, name: str) -> str:
+        """Raw body of the first section whose heading contains ``name``."""
+        name = name.lower()
+        for heading, start, end in self.sections:
+            if name in heading:
+                return self.raw[start:end].strip()
+        return ""
+
+
+class PreparedJobText(Mapping):
+    """
+    Read-only job dict plus memoized text views.
+
+    Behaves like the wrapped dict (``get``, ``[]``, ``in``), so it can be
+    passed wherever extractors expect ``job_data``.
+    """
+
+    def __init__(self, job_data: Mapping[str, Any]):
+        self.job_data = job_data
+        self._views: Dict[Tuple[Tuple[str, ...], str], TextView] = {}
+
+    @classmethod
+    def of(cls, job_data: Mapping[str, Any]) -> "PreparedJobText":
+        """Wrap ``job_data`` unless it already is prepared."""
+        return job_data if isinstance(job_data, cls) else cls(job_data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.job_data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.job_data)
+
+    def __len__(self) -> int:
+        return len(self.job_data)
+
+    def view(self, fields: Sequence[str] = CONTENT_FIELDS, sep: str = "\n") -> TextView:
+        """Joined non-empty string ``fields``, built once per field list."""
+        key = (tuple(fields), sep)
+        view = self._views.get(key)
+        if view is None:
+            parts = [self.job_data.get(field) for field in key[0]]
+            view = TextView(sep.join(part for part in parts if part and isinstance(part, str)))
+            self._views[key] = view
+        return view
+
+    def content(self, fields: Sequence[str] = CONTENT_FIELDS, sep: str = "\n") -> str:
+        """Raw joined text of ``fields``; same as the extractors' old ``_prepare_content``."""
+        return self.view(fields, sep).raw
@@ -9,10 +9,14 @@ import logging
 import re
 from typing import Any, Dict, List, Optional, Set
 
+from ..skill_matcher import SkillMatcher
 from .base import BaseExtractor, ExtractionConfidence, PatternMatch
+from .prepared_text import PreparedJobText
 
 logger = logging.getLogger(__name__)
 
+_CONTENT_FIELDS = ("description", "job_description", "summary", "requirements")
+
 
 class SkillsExtractor(BaseExtractor):
     """Extracts technical skills and job requirements with dynamic skill management."""
@@ -25,6 +29,8 @@ class SkillsExtractor(BaseExtractor):
                               If False, use built-in comprehensive skills database.
         """
         super().__init__()
+        self._skill_matcher: Optional[SkillMatcher] = None
+        self._skill_matcher_source: Optional[tuple] = None
         self._init_skill_patterns()
         self._init_requirement_patterns()
         self.use_dynamic_skills = use_dynamic_skills
@@ -633,7 +639,8 @@ class SkillsExtractor(BaseExtractor):
         Returns:
             List of extracted skills (limited to top 15)
         """
-        content = self._prepare_content(job_data)
+        view = PreparedJobText.of(job_data).view(_CONTENT_FIELDS)
+        content = view.raw
         all_skills: Set[str] = set()
 
         # Extract from skill patterns
@@ -645,11 +652,12 @@ class SkillsExtractor(BaseExtractor):
                     skills = self._parse_skills_from_text(skills_text)
                     all_skills.update(skills)
 
-        # Look for individual skills in content (preserve case)
-        for skill in self.standard_skills:
-            match = re.search(r"\b" + re.escape(skill) + r"\b", content, re.IGNORECASE)
-            if match:
-                all_skills.add(match.group())
+        # Look for individual skills in content (preserve case of the first occurrence)
+        seen_terms: Set[str] = set()
+        for hit in self._standard_skill_matcher().find_all(view):
+            if hit.term not in seen_terms:
+                seen_terms.add(hit.term)
+                all_skills.add(content[hit.start : hit.end] if view.aligned else hit.term)
 
         # Validate and return top skills
         validated_skills = [skill for skill in all_skills if self._validate_skill(skill)]
@@ -685,7 +693,8 @@ class SkillsExtractor(BaseExtractor):
         Returns:
             List of extracted benefits (limited to top 10)
         """
-        content = self._prepare_content(job_data)
+        view = PreparedJobText.of(job_data).view(_CONTENT_FIELDS)
+        content, content_lower = view.raw, view.lower
         benefits = set()
 
         # Expanded benefit keywords
@@ -726,22 +735,23 @@ class SkillsExtractor(BaseExtractor):
             pattern = r"\b" + re.escape(benefit) + r"\b"
             if re.search(pattern, content, re.IGNORECASE):
                 benefits.add(benefit.title())
-            elif len(benefit) > 6 and benefit.lower() in content.lower():
+            elif len(benefit) > 6 and benefit in content_lower:
                 # Partial match for longer keywords
                 benefits.add(benefit.title())
 
         return sorted(list(benefits))[:10]
 
     def _prepare_content(self, job_data: Dict[str, Any]) -> str:
-        """Prepare content for extraction."""
-        content_parts = []
-
-        for field in ["description", "job_description", "summary", "requirements"]:
-            value = job_data.get(field)
-            if value and isinstance(value, str):
-                content_parts.append(value)
-
-        return "\n".join(content_parts)
+        """Prepare content for extraction (joined once per job and shared)."""
+        return PreparedJobText.of(job_data).content(_CONTENT_FIELDS)
+
+    def _standard_skill_matcher(self) -> SkillMatcher:
+        """Single-pass matcher over ``standard_skills``, rebuilt when the set changes."""
+        source = (id(self.standard_skills), len(self.standard_skills))
+        if self._skill_matcher is None or self._skill_matcher_source != source:
+            self._skill_matcher = SkillMatcher({skill: skill for skill in self.standard_skills})
+            self._skill_matcher_source = source
+        return self._skill_matcher
 
     def _parse_skills_from_text(self, skills_text: str) -> List[str]:
         """Parse individual skills from skills text.
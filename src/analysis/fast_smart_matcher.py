@@ -16,8 +16,20 @@ from dataclasses import dataclass
 import logging
 from collections import Counter
 
+from src.analysis.skill_matcher import get_skill_matcher
+
 logger = logging.getLogger(__name__)
 
+# Common variations accepted for a profile skill
+SKILL_VARIATIONS = {
+    "javascript": ["js", "javascript"],
+    "typescript": ["ts", "typescript"],
+    "python": ["python", "py"],
+    "machine learning": ["ml", "machine learning", "machinelearning"],
+    "artificial intelligence": ["ai", "artificial intelligence"],
+    "node.js": ["node", "nodejs", "node.js"],
+}
+
 
 @dataclass
 class MatchResult:
@@ -59,6 +71,9 @@ class FastSmartMatcher:
     def __init__(self):
         """Initialize with optimized skill databases and patterns"""
 
+        # Shared single-pass skill matcher
+        self.skill_matcher = get_skill_matcher()
+
         # Technical skills database (optimized for fast matching)
         self.tech_skills = {
             "programming": [
@@ -262,10 +277,17 @@ class FastSmartMatcher:
         # Normalize profile skills for matching
         profile_skills_lower = [skill.lower().strip() for skill in profile_skills if skill.strip()]
 
-        # Fast string matching approach
-        for skill in profile_skills_lower:
-            if self._skill_found_in_text(skill, job_text):
-                matched_skills.append(skill.title())
+        # One scan of the job text for all profile skills and their variations
+        found_terms = self.skill_matcher.find_terms(
+            job_text, {term for skill in profile_skills_lower for term in self._skill_terms(skill)}
+        )
+        found = {
+            skill
+            for skill in profile_skills_lower
+            if any(term in found_terms for term in self._skill_terms(skill))
+        }
+
+        matched_skills = [skill.title() for skill in profile_skills_lower if skill in found]
 
         # Calculate score based on match percentage
         if profile_skills_lower:
@@ -277,35 +299,19 @@ class FastSmartMatcher:
         missing_skills = []
         critical_skills = profile_skills_lower[:5]  # Top 5 skills are critical
         for skill in critical_skills:
-            if not self._skill_found_in_text(skill, job_text):
+            if skill not in found:
                 missing_skills.append(skill.title())
 
         return score, matched_skills, missing_skills
 
-    def _skill_found_in_text(self, skill: str, text: str) -> bool:
-        """Optimized skill matching with variations"""
-        # Direct match
-        if skill in text:
-            return True
-
-        # Word boundary match for exact terms
-        if re.search(rf"\b{re.escape(skill)}\b", text):
-            return True
-
-        # Handle common variations
-        variations = {
-            "javascript": ["js", "javascript"],
-            "typescript": ["ts", "typescript"],
-            "python": ["python", "py"],
-            "machine learning": ["ml", "machine learning", "machinelearning"],
-            "artificial intelligence": ["ai", "artificial intelligence"],
-            "node.js": ["node", "nodejs", "node.js"],
-        }
-
-        if skill in variations:
-            return any(var in text for var in variations[skill])
+    @staticmethod
+    def _skill_terms(skill: str) -> List[str]:
+        """Terms accepted as a match for a skill"""
+        return [skill] + SKILL_VARIATIONS.get(skill, [])
 
-        return False
+    def _skill_found_in_text(self, skill: str, text: str) -> bool:
+        """Word-boundary skill matching with variations"""
+        return bool(self.skill_matcher.find_terms(text, self._skill_terms(skill)))
 
     def _analyze_experience_level(
         self, job_text: str, job_title: str, profile: Dict[str, Any]
@@ -412,9 +418,11 @@ class FastSmartMatcher:
     ) -> Tuple[float, str]:
         """Analyze salary fit using range parsing"""
 
-        # Extract salary from job
-        job_salary_text = job.get("salary_range", "") or job.get("salary", "")
-        job_min, job_max = self._parse_salary_range(job_salary_text)
+        # Parsed salary columns from the jobs table; parse the text only without them
+        job_min, job_max = self._stored_salary_range(job)
+        if job_min is None and job_max is None:
+            job_salary_text = job.get("salary_range", "") or job.get("salary", "")
+            job_min, job_max = self._parse_salary_range(job_salary_text)
 
         # User salary expectations
         user_min = profile.get("min_salary", 0)
@@ -443,6 +451,14 @@ class FastSmartMatcher:
 
         return score, fit
 
+    def _stored_salary_range(self, job: Dict[str, Any]) -> Tuple[Optional[int], Optional[int]]:
+        """Annual salary_min/salary_max stored with the job (NaN counts as missing)"""
+        amounts = []
+        for column in ("salary_min", "salary_max"):
+            value = job.get(column)
+            amounts.append(int(value) if value is not None and value == value else None)
+        return amounts[0], amounts[1]
+
     def _parse_salary_range(self, salary_text: str) -> Tuple[Optional[int], Optional[int]]:
         """Parse salary range from text"""
         if not salary_text:
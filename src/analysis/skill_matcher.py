@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Shared Multi-Pattern Skill Matcher
+Finds every known skill term in a text with one scan instead of one regex per skill.
+
+The text is split once into word runs and single punctuation characters,
+and a trie over those tokens is walked from each token that can start a
+term. Every candidate is then checked against the original characters with
+the same rule as ``re.search(rf"\\b{re.escape(term)}\\b", text)``, so results
+are identical to the per-skill regex loops this replaces:
+
+- the matched slice must equal the term exactly (whitespace included)
+- both ends must sit on a ``\\b`` word boundary
+
+Like the regex, a term ending in punctuation such as ``c++`` or ``c#`` only
+matches when a word character follows it ("C++11"), never before a space,
+comma or the end of the text.
+
+The vocabulary is built from ``config/skills_database.json`` (skills and
+aliases) plus ``skill_synonyms`` in ``config/job_matching_config.json``.
+``get_skill_matcher()`` caches it per config directory and rebuilds only
+when one of those files changes.
+
+Usage:
+    from src.analysis.skill_matcher import get_skill_matcher
+
+    matcher = get_skill_matcher()
+    matcher.matched_terms("Python, SQL and C++ required")  # {"python", "sql"}
+"""
+
+import json
+import logging
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+SKILLS_DATABASE_FILE = "skills_database.json"
+MATCHING_CONFIG_FILE = "job_matching_config.json"
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+# Trie nodes map the next token to a child node; this key holds the terms ending there
+_TERMS = ""
+
+
+def _is_word(char: str) -> bool:
+    """Same character class as ``\\w`` for ``str`` patterns."""
+    return char.isalnum() or char == "_"
+
+
+def tokenize(lower: str) -> List[Tuple[int, str]]:
+    """``(offset, token)`` pairs of word runs and single punctuation characters."""
+    return [(m.start(), m.group()) for m in _TOKEN_RE.finditer(lower)]
+
+
+def _lower_and_tokens(text) -> Tuple[str, List[Tuple[int, str]]]:
+    """Accept a plain string or a prepared text view exposing ``lower`` and ``tokens``."""
+    if isinstance(text, str):
+        lower = text.lower()
+        return lower, tokenize(lower)
+    return text.lower, text.tokens
+
+
+@lru_cache(maxsize=1024)
+def boundary_pattern(term: str) -> "re.Pattern":
+    """Cached ``\\bterm\\b`` regex, the rule every skill match follows."""
+    return re.compile(rf"\b{re.escape(term)}\b")
+
+
+@dataclass(frozen=True)
+class SkillHit:
+    """One occurrence of a vocabulary term in a text."""
+
+    term: str  # Matched term (lowercase)
+    skill: str  # Canonical skill name the term maps to
+    start: int  # Character offsets in the lowercased text
+    end: int
+
+
+class SkillMatcher:
+    """
+    Token-trie automaton over a fixed vocabulary of skill terms.
+
+    Terms are matched case-insensitively with word-boundary semantics.
+    """
+
+    def __init__(self, terms: Mapping[str, str]):
+        """
+        Args:
+            terms: Mapping of term -> canonical skill name
+        """
+        self.terms: Dict[str, str] = {}
+        self._root: Dict[str, dict] = {}
+
+        for term, skill in terms.items():
+            term = (term or "").strip().lower()
+            tokens = _TOKEN_RE.findall(term)
+            if not tokens or term in self.terms:
+                continue
+            self.terms[term] = skill
+
+            node = self._root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node.setdefault(_TERMS, []).append(term)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __contains__(self, term: str) -> bool:
+        return term.lower() in self.terms
+
+    def find_all(self, text) -> List[SkillHit]:
+        """
+        Every occurrence of every term in ``text``, in text order.
+
+        ``text`` may also be a prepared ``TextView``, whose cached lowercase
+        text and tokens are reused instead of being rebuilt.
+        """
+        if not text:
+            return []
+
+        lower, tokens = _lower_and_tokens(text)
+        size = len(lower)
+        root = self._root
+        hits: List[SkillHit] = []
+
+        for i, (start, token) in enumerate(tokens):
+            node = root.get(token)
+            if node is None:
+                continue
+
+            starts_word = _is_word(lower[start])
+            if start > 0 and _is_word(lower[start - 1]) == starts_word:
+                continue  # No \b before the first character
+            if start == 0 and not starts_word:
+                continue
+
+            j = i
+            while True:
+                for term in node.get(_TERMS, ()):
+                    end = start + len(term)
+                    if not lower.startswith(term, start):
+                        continue
+                    ends_word = _is_word(lower[end - 1])
+                    if (end < size and _is_word(lower[end])) != ends_word:
+                        hits.append(SkillHit(term, self.terms[term], start, end))
+                j += 1
+                if j == len(tokens):
+                    break
+                node = node.get(tokens[j][1])
+                if node is None:
+                    break
+
+        return hits
+
+    def matched_terms(self, text: str) -> Set[str]:
+        """Distinct vocabulary terms found in ``text``."""
+        return {hit.term for hit in self.find_all(text)}
+
+    def matched_skills(self, text: str) -> Set[str]:
+        """Distinct canonical skills found in ``text``."""
+        return {hit.skill for hit in self.find_all(text)}
+
+    def skill_counts(self, text: str) -> Counter:
+        """Number of occurrences of each canonical skill in ``text``."""
+        return Counter(hit.skill for hit in self.find_all(text))
+
+    def find_terms(self, text: str, terms: Iterable[str]) -> Set[str]:
+        """
+        Which of ``terms`` (lowercase) occur in ``text``.
+
+        Terms in the vocabulary come from the single scan; any others, such
+        as custom profile skills, are checked with a cached boundary regex.
+        """
+        wanted = {term for term in terms if term}
+        if not text or not wanted:
+            return set()
+
+        found = self.matched_terms(text) & wanted
+        extra = wanted - self.terms.keys()
+        if extra:
+            lower = text.lower() if isinstance(text, str) else text.lower
+            found.update(term for term in extra if boundary_pattern(term).search(lower))
+        return found
+
+
+def build_skill_vocabulary(
+    skills_db: Mapping, skill_synonyms: Optional[Mapping] = None
+) -> Dict[str, str]:
+    """
+    Build the term -> canonical skill mapping from config data.
+
+    Args:
+        skills_db: Parsed ``skills_database.json``
+        skill_synonyms: ``skill_synonyms`` section of ``job_matching_config.json``
+    """
+    vocabulary: Dict[str, str] = {}
+
+    for industry_data in skills_db.get("industries", {}).values():
+        for skill in industry_data.get("skills", []):
+            vocabulary.setdefault(skill.lower(), skill)
+
+    for alias, skill in skills_db.get("skill_aliases", {}).items():
+        vocabulary.setdefault(alias.lower(), skill)
+
+    for canonical, variations in (skill_synonyms or {}).items():
+        if not isinstance(variations, list):
+            continue  # e.g. the "description" entry
+        skill = vocabulary.get(canonical.lower(), canonical)
+        vocabulary.setdefault(canonical.lower(), skill)
+        for variation in variations:
+            vocabulary.setdefault(variation.lower(), skill)
+
+    return vocabulary
+
+
+_matchers: Dict[Path, Tuple[tuple, SkillMatcher]] = {}
+_matchers_lock = threading.Lock()
+
+
+def _config_signature(config_dir: Path) -> tuple:
+    signature = []
+    for filename in (SKILLS_DATABASE_FILE, MATCHING_CONFIG_FILE):
+        try:
+            stat = (config_dir / filename).stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def _load_json(path: Path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not load {path.name} for skill matcher: {e}")
+        return {}
+
+
+def get_skill_matcher(config_dir: Optional[str] = None) -> SkillMatcher:
+    """
+    Get the shared skill matcher for a config directory.
+
+    Built on first use and rebuilt only when ``skills_database.json`` or
+    ``job_matching_config.json`` changes on disk.
+    """
+    if config_dir is None:
+        config_dir = Path(__file__).parent.parent.parent / "config"
+    config_dir = Path(config_dir).resolve()
+
+    signature = _config_signature(config_dir)
+    cached = _matchers.get(config_dir)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with _matchers_lock:
+        cached = _matchers.get(config_dir)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        skills_db = _load_json(config_dir / SKILLS_DATABASE_FILE)
+        matching_config = _load_json(config_dir / MATCHING_CONFIG_FILE)
+        matcher = SkillMatcher(
+            build_skill_vocabulary(skills_db, matching_config.get("skill_synonyms", {}))
+        )
+        _matchers[config_dir] = (signature, matcher)
+        logger.info(f"Skill matcher built with {len(matcher)} terms from {config_dir}")
+        return matcher
@@ -16,33 +16,31 @@ Stage 2: Extended Processor
 
 import os
 import asyncio
+import importlib.util
 import time
 import logging
 import re
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict, astuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import json
+import multiprocessing
+import pickle
 
 # PERFORMANCE FIX: Lazy import for heavy AI libraries
-# Check if heavy AI is disabled via environment variables
+# torch and transformers are only looked up here and imported by _import_torch()
+# on first Stage 2 use, so Stage 1 worker processes importing this module stay light
+torch = None
+AutoTokenizer = None
+AutoModel = None
 if os.environ.get("DISABLE_HEAVY_AI") == "1":
     TORCH_AVAILABLE = False
-    torch = None
-    AutoTokenizer = None
-    AutoModel = None
 else:
-    # Conditional torch import for GPU support (lazy loaded when needed)
-    try:
-        import torch
-        from transformers import AutoTokenizer, AutoModel
-
-        TORCH_AVAILABLE = True
-    except ImportError:
-        TORCH_AVAILABLE = False
-        torch = None
-        AutoTokenizer = None
-        AutoModel = None
+    TORCH_AVAILABLE = (
+        importlib.util.find_spec("torch") is not None
+        and importlib.util.find_spec("transformers") is not None
+    )
 
 import numpy as np
 from rich.console import Console
@@ -50,10 +48,69 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeEl
 
 from .custom_data_extractor import CustomDataExtractor, get_custom_data_extractor
 from .custom_extractor import CustomExtractor, get_Improved_custom_extractor
+from .extractors.prepared_text import PreparedJobText
+from .skill_matcher import get_skill_matcher
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Stage 2 embedding batch limits (padded tokens per forward pass / texts per batch)
+STAGE2_MAX_SEQUENCE_LENGTH = 512
+STAGE2_MAX_TOKENS_PER_BATCH = 8192
+STAGE2_MAX_BATCH_SIZE = 32
+
+# Jobs handed to one Stage 2 worker call
+STAGE2_CHUNK_SIZE = 64
+
+# Stage 1 execution: "thread" (default), "process", or "auto" (processes for
+# large batches). Callers opting into processes must close() the processor.
+STAGE1_EXECUTION_MODES = ("auto", "thread", "process")
+STAGE1_PROCESS_MIN_JOBS = 200
+STAGE1_PROCESS_CHUNK_SIZE = 32
+
+
+def plan_token_batches(
+    lengths: List[int],
+    max_tokens_per_batch: int = STAGE2_MAX_TOKENS_PER_BATCH,
+    max_batch_size: int = STAGE2_MAX_BATCH_SIZE,
+) -> List[List[int]]:
+    """
+    Group sequence indices into length-sorted batches.
+
+    Sorting by token count keeps similar lengths together so little padding
+    is wasted; a batch is closed once its padded size (longest sequence x
+    count) would exceed ``max_tokens_per_batch`` or it holds ``max_batch_size``
+    sequences. A sequence longer than the token budget gets a batch of its own.
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    longest = 0
+    for index in sorted(range(len(lengths)), key=lambda i: lengths[i]):
+        length = max(1, lengths[index])
+        padded = max(longest, length) * (len(current) + 1)
+        if current and (padded > max_tokens_per_batch or len(current) >= max_batch_size):
+            batches.append(current)
+            current, longest = [], 0
+        current.append(index)
+        longest = max(longest, length)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _import_torch() -> bool:
+    """Import torch and transformers on first use. Returns ``TORCH_AVAILABLE``."""
+    global torch, AutoTokenizer, AutoModel, TORCH_AVAILABLE
+    if TORCH_AVAILABLE and torch is None:
+        try:
+            import torch as _torch
+            from transformers import AutoModel as _AutoModel, AutoTokenizer as _AutoTokenizer
+        except ImportError:
+            TORCH_AVAILABLE = False
+        else:
+            torch, AutoTokenizer, AutoModel = _torch, _AutoTokenizer, _AutoModel
+    return TORCH_AVAILABLE
+
 
 @dataclass
 class Stage1Result:
@@ -165,6 +222,24 @@ class TwoStageResult:
         if self.job_data is None:
             self.job_data = {}
 
+    def to_analysis_update(self) -> Dict[str, Any]:
+        """Row for ``DuckDBJobDatabase.bulk_update_analysis`` (fit_score on 0-100 scale).
+
+        Re-scored results carry only the new score: their skills are the
+        profile matches, not an extraction, so the stored skills are kept.
+        Jobs rejected by Stage 1 are stored as ``filtered`` with their Stage 1
+        score, so they are not listed as ready to apply.
+        """
+        rejected = self.stage1 is not None and not self.stage1.passes_basic_filter
+        update = {
+            "id": self.job_id,
+            "fit_score": round(self.final_compatibility * 100, 1),
+            "status": "filtered" if rejected else "processed",
+        }
+        if self.processing_method != "rescore":
+            update["skills"] = self.final_skills
+        return update
+
 
 class Stage1CPUProcessor:
     """
@@ -172,17 +247,40 @@ class Stage1CPUProcessor:
 
     Handles basic data extraction and filtering using 10 workers.
     Fast, rule-based processing to filter out unsuitable jobs.
+
+    The work is pure Python and holds the GIL. With ``execution_mode``
+    "process" or "auto" (large batches only), jobs run in a persistent
+    process pool: each worker process builds its own extractors and patterns
+    once, then handles chunks of jobs. The pool lives until ``close()``, so
+    the default is "thread".
     """
 
-    def __init__(self, user_profile: Dict[str, Any], max_workers: int = 10):
+    def __init__(
+        self,
+        user_profile: Dict[str, Any],
+        max_workers: int = 10,
+        execution_mode: str = "thread",
+        process_min_jobs: int = STAGE1_PROCESS_MIN_JOBS,
+        chunk_size: int = STAGE1_PROCESS_CHUNK_SIZE,
+    ):
+        if execution_mode not in STAGE1_EXECUTION_MODES:
+            raise ValueError(
+                f"execution_mode must be one of {STAGE1_EXECUTION_MODES}, got {execution_mode!r}"
+            )
         self.user_profile = user_profile
         self.max_workers = max_workers
+        self.execution_mode = execution_mode
+        self.process_min_jobs = process_min_jobs
+        self.chunk_size = max(1, int(chunk_size))
         self.extractor = get_Improved_custom_extractor()
+        self._process_pool: Optional[ProcessPoolExecutor] = None
 
         # Pre-compile patterns for speed
         self._compile_filter_patterns()
 
-        logger.info(f"Stage 1 CPU Processor initialized with {max_workers} workers")
+        logger.info(
+            f"Stage 1 CPU Processor initialized with {max_workers} workers ({execution_mode} mode)"
+        )
 
     def _extract_Improved_fields(
         self, job_data: Dict[str, Any], job_text: str
@@ -400,84 +498,101 @@ class Stage1CPUProcessor:
             re.compile(r"\b(manager|director|head of|chief)\b", re.IGNORECASE),
         ]
 
-        # Skill patterns from user profile
+        # Profile skills, matched in one scan by the shared skill matcher
+        self.skill_matcher = get_skill_matcher()
+        self.profile_skill_terms = [
+            (skill, skill.lower()) for skill in self.user_profile.get("skills", [])
+        ]
+
+    def _score_basic(self, job_data: Dict[str, Any], job_view) -> Dict[str, Any]:
+        """Profile-dependent Stage 1 scoring and filters for one job's title + description."""
+        job_text = job_view.lower
+
+        is_french = any(pattern.search(job_text) for pattern in self.french_patterns)
+        is_senior = any(pattern.search(job_text) for pattern in self.senior_patterns)
+
+        # Fast skill matching
+        found_terms = self.skill_matcher.find_terms(
+            job_view, {term for _, term in self.profile_skill_terms}
+        )
+        matched_skills = [skill for skill, term in self.profile_skill_terms if term in found_terms]
+
+        # More generous basic compatibility scoring
         user_skills = self.user_profile.get("skills", [])
-        self.skill_patterns = [
-            re.compile(rf"\b{re.escape(skill)}\b", re.IGNORECASE) for skill in user_skills
+        skill_match_ratio = len(matched_skills) / max(len(user_skills), 1)
+
+        # Base score from skill matches
+        base_score = skill_match_ratio * 0.6 + 0.3  # Higher base score
+
+        # Bonus for relevant job titles
+        title_lower = job_data.get("title", "").lower()
+        title_bonus = 0.0
+        relevant_titles = [
+            "analyst",
+            "developer",
+            "data",
+            "python",
+            "junior",
+            "entry",
+            "associate",
         ]
+        for term in relevant_titles:
+            if term in title_lower:
+                title_bonus += 0.1
+
+        # Bonus for company recognition
+        company_lower = job_data.get("company", "").lower()
+        if any(term in company_lower for term in ["tech", "software", "data", "analytics"]):
+            title_bonus += 0.05
+
+        basic_compatibility = min(0.95, base_score + title_bonus)
+
+        # More lenient filtering for users with fewer skills
+        passes_filter = (
+            not is_french  # Keep French filter (language barrier)
+            and basic_compatibility > 0.15  # Much lower threshold
+            and (
+                len(matched_skills) > 0 or basic_compatibility > 0.25
+            )  # Allow 0 skills if good compatibility
+        )
+
+        # Special case: Allow some senior positions if they seem entry-friendly
+        if is_senior and basic_compatibility > 0.4:
+            senior_friendly_terms = ["junior", "entry", "associate", "coordinator", "analyst"]
+            if any(term in job_text for term in senior_friendly_terms):
+                passes_filter = True
+                console.print(
+                    f"[cyan]🎯 Allowing senior position due to entry-friendly terms[/cyan]"
+                )
+
+        return {
+            "matched_skills": matched_skills,
+            "basic_compatibility": basic_compatibility,
+            "is_french": is_french,
+            "is_senior": is_senior,
+            "passes_basic_filter": passes_filter,
+        }
 
     def process_job_fast(self, job_data: Dict[str, Any], worker_id: int = 0) -> Stage1Result:
         """Fast processing of a single job"""
         start_time = time.time()
 
         try:
+            # Join and normalize the job text once; the extractors and filters share it
+            prepared = PreparedJobText(job_data)
+            job_view = prepared.view(("title", "description"), " ")
+
             # Extract basic data using Improved extractor
-            extraction_result = self.extractor.extract_job_data(job_data)
+            extraction_result = self.extractor.extract_job_data(prepared)
 
             # Fast filtering checks
-            job_text = f"{job_data.get('title', '')} {job_data.get('description', '')}".lower()
+            job_text = job_view.lower
 
-            is_french = any(pattern.search(job_text) for pattern in self.french_patterns)
-            is_senior = any(pattern.search(job_text) for pattern in self.senior_patterns)
-
-            # Fast skill matching
-            matched_skills = []
-            for skill, pattern in zip(self.user_profile.get("skills", []), self.skill_patterns):
-                if pattern.search(job_text):
-                    matched_skills.append(skill)
+            scores = self._score_basic(job_data, job_view)
 
             # Extract Improved fields
             Improved_fields = self._extract_Improved_fields(job_data, job_text)
 
-            # More generous basic compatibility scoring
-            user_skills = self.user_profile.get("skills", [])
-            skill_match_ratio = len(matched_skills) / max(len(user_skills), 1)
-
-            # Base score from skill matches
-            base_score = skill_match_ratio * 0.6 + 0.3  # Higher base score
-
-            # Bonus for relevant job titles
-            title_lower = job_data.get("title", "").lower()
-            title_bonus = 0.0
-            relevant_titles = [
-                "analyst",
-                "developer",
-                "data",
-                "python",
-                "junior",
-                "entry",
-                "associate",
-            ]
-            for term in relevant_titles:
-                if term in title_lower:
-                    title_bonus += 0.1
-
-            # Bonus for company recognition
-            company_lower = job_data.get("company", "").lower()
-            if any(term in company_lower for term in ["tech", "software", "data", "analytics"]):
-                title_bonus += 0.05
-
-            basic_compatibility = min(0.95, base_score + title_bonus)
-
-            # More lenient filtering for users with fewer skills
-            passes_filter = (
-                not is_french  # Keep French filter (language barrier)
-                and basic_compatibility > 0.15  # Much lower threshold
-                and (
-                    len(matched_skills) > 0 or basic_compatibility > 0.25
-                )  # Allow 0 skills if good compatibility
-            )
-
-            # Special case: Allow some senior positions if they seem entry-friendly
-            if is_senior and basic_compatibility > 0.4:
-                senior_friendly_terms = ["junior", "entry", "associate", "coordinator", "analyst"]
-                job_text_lower = job_text.lower()
-                if any(term in job_text_lower for term in senior_friendly_terms):
-                    passes_filter = True
-                    console.print(
-                        f"[cyan]🎯 Allowing senior position due to entry-friendly terms[/cyan]"
-                    )
-
             result = Stage1Result(
                 title=extraction_result.title,
                 company=extraction_result.company,
@@ -493,12 +608,12 @@ class Stage1CPUProcessor:
                 education_requirements=Improved_fields["education_requirements"],
                 industry=Improved_fields["industry"],
                 # Analysis results
-                basic_skills=matched_skills,
+                basic_skills=scores["matched_skills"],
                 basic_requirements=extraction_result.requirements[:5],  # Top 5 only
-                basic_compatibility=basic_compatibility,
-                is_french=is_french,
-                is_senior=is_senior,
-                passes_basic_filter=passes_filter,
+                basic_compatibility=scores["basic_compatibility"],
+                is_french=scores["is_french"],
+                is_senior=scores["is_senior"],
+                passes_basic_filter=scores["passes_basic_filter"],
                 processing_time=time.time() - start_time,
                 confidence=extraction_result.overall_confidence,
                 worker_id=worker_id,
@@ -517,12 +632,137 @@ class Stage1CPUProcessor:
                 worker_id=worker_id,
             )
 
+    def rescore_job(self, job_data: Dict[str, Any], worker_id: int = 0) -> Stage1Result:
+        """
+        Re-score an already extracted job against the current profile.
+
+        Takes title, company, location and salary from the stored job instead
+        of running the extractors again; used when only the profile or scoring
+        config changed since the job was processed.
+        """
+        start_time = time.time()
+
+        try:
+            job_view = PreparedJobText(job_data).view(("title", "description"), " ")
+            scores = self._score_basic(job_data, job_view)
+
+            return Stage1Result(
+                title=job_data.get("title"),
+                company=job_data.get("company"),
+                location=job_data.get("location"),
+                salary_range=job_data.get("salary_range"),
+                basic_skills=scores["matched_skills"],
+                basic_compatibility=scores["basic_compatibility"],
+                is_french=scores["is_french"],
+                is_senior=scores["is_senior"],
+                passes_basic_filter=scores["passes_basic_filter"],
+                processing_time=time.time() - start_time,
+                confidence=1.0,
+                worker_id=worker_id,
+            )
+
+        except Exception as e:
+            logger.error(f"Stage 1 re-scoring error: {e}")
+            return Stage1Result(
+                title=job_data.get("title", "Unknown"),
+                company=job_data.get("company", "Unknown"),
+                passes_basic_filter=False,
+                processing_time=time.time() - start_time,
+                confidence=0.0,
+                worker_id=worker_id,
+            )
+
+    def rescore_jobs_batch(self, jobs: List[Dict[str, Any]]) -> List[Stage1Result]:
+        """Re-score stored jobs without extraction; cheap enough to run inline."""
+        console.print(f"[cyan]🔁 Stage 1: Re-scoring {len(jobs)} unchanged jobs[/cyan]")
+        return [self.rescore_job(job) for job in jobs]
+
+    def select_execution_mode(self, job_count: int) -> str:
+        """Pick "thread" or "process" for a batch of ``job_count`` jobs."""
+        if self.execution_mode != "auto":
+            return self.execution_mode
+        multi_core = (os.cpu_count() or 1) > 1
+        if self.max_workers > 1 and multi_core and job_count >= self.process_min_jobs:
+            return "process"
+        return "thread"
+
     def process_jobs_batch(self, jobs: List[Dict[str, Any]]) -> List[Stage1Result]:
-        """Process multiple jobs using thread pool. Preserve input order."""
+        """Process multiple jobs in a thread or process pool. Preserve input order."""
+        mode = self.select_execution_mode(len(jobs))
         console.print(
-            f"[cyan]🚀 Stage 1: Processing {len(jobs)} jobs with {self.max_workers} CPU workers[/cyan]"
+            f"[cyan]🚀 Stage 1: Processing {len(jobs)} jobs with {self.max_workers} CPU workers "
+            f"({mode}s)[/cyan]"
         )
 
+        results: Optional[List[Stage1Result]] = None
+        if mode == "process":
+            try:
+                results = self._process_jobs_in_processes(jobs)
+            except (BrokenProcessPool, OSError, pickle.PicklingError) as e:
+                logger.warning(f"Stage 1 process pool failed ({e}), falling back to threads")
+                self.close()
+        if results is None:
+            results = self._process_jobs_in_threads(jobs)
+
+        # Filter results that pass basic checks
+        passed_jobs = [r for r in results if r.passes_basic_filter]
+
+        console.print(
+            f"[green]✅ Stage 1 Complete: {len(passed_jobs)}/{len(jobs)} jobs passed basic filter[/green]"
+        )
+
+        return results
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use and keep them for later batches."""
+        if self._process_pool is None:
+            # spawn: forking after torch/tokenizer threads have started can deadlock
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_stage1_worker,
+                initargs=(self.user_profile,),
+            )
+        return self._process_pool
+
+    def close(self) -> None:
+        """Shut down the Stage 1 worker processes, if any were started."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True, cancel_futures=True)
+            self._process_pool = None
+
+    def _process_jobs_in_processes(self, jobs: List[Dict[str, Any]]) -> List[Stage1Result]:
+        """Run chunks of jobs in worker processes that return compact result tuples."""
+        pool = self._get_process_pool()
+        ordered_results: List[Optional[Stage1Result]] = [None] * len(jobs)
+
+        future_to_start = {}
+        for chunk_index, start in enumerate(range(0, len(jobs), self.chunk_size)):
+            chunk = jobs[start : start + self.chunk_size]
+            worker_id = chunk_index % self.max_workers
+            future_to_start[pool.submit(_run_stage1_chunk, chunk, worker_id)] = start
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeElapsedColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Stage 1 Processing...", total=len(jobs))
+
+            for future in as_completed(future_to_start):
+                start = future_to_start[future]
+                rows = future.result()
+                for offset, row in enumerate(rows):
+                    ordered_results[start + offset] = Stage1Result(*row)
+                progress.advance(task, len(rows))
+
+        return [r for r in ordered_results if r is not None]
+
+    def _process_jobs_in_threads(self, jobs: List[Dict[str, Any]]) -> List[Stage1Result]:
+        """Run jobs on a thread pool; cheapest for small batches."""
         # Prepare results list to preserve ordering
         ordered_results: List[Optional[Stage1Result]] = [None] * len(jobs)
 
@@ -551,16 +791,26 @@ class Stage1CPUProcessor:
                     progress.advance(task)
 
         # Ensure no None remains (fallback, should not happen)
-        results: List[Stage1Result] = [r for r in ordered_results if r is not None]
+        return [r for r in ordered_results if r is not None]
 
-        # Filter results that pass basic checks
-        passed_jobs = [r for r in results if r.passes_basic_filter]
 
-        console.print(
-            f"[green]✅ Stage 1 Complete: {len(passed_jobs)}/{len(jobs)} jobs passed basic filter[/green]"
-        )
+# Per-process Stage 1 processor, built once by the pool initializer
+_stage1_worker: Optional[Stage1CPUProcessor] = None
 
-        return results
+
+def _init_stage1_worker(user_profile: Dict[str, Any]) -> None:
+    """Process pool initializer: load extractors and compile patterns once per process."""
+    global _stage1_worker
+    _stage1_worker = Stage1CPUProcessor(user_profile, max_workers=1, execution_mode="thread")
+
+
+def _run_stage1_chunk(jobs: List[Dict[str, Any]], worker_id: int) -> List[tuple]:
+    """Process a chunk in a worker process; results go back as plain field tuples."""
+    return [astuple(_stage1_worker.process_job_fast(job, worker_id)) for job in jobs]
+
+
+# Marks that process_job_semantic should compute the embedding itself
+_EMBED_ON_DEMAND = object()
 
 
 class Stage2GPUProcessor:
@@ -571,11 +821,23 @@ class Stage2GPUProcessor:
     Only processes jobs that passed Stage 1 filtering.
     """
 
-    def __init__(self, user_profile: Dict[str, Any], model_name: str = "distilbert-base-uncased"):
+    def __init__(
+        self,
+        user_profile: Dict[str, Any],
+        model_name: str = "distilbert-base-uncased",
+        max_tokens_per_batch: int = STAGE2_MAX_TOKENS_PER_BATCH,
+        max_batch_size: int = STAGE2_MAX_BATCH_SIZE,
+        num_threads: Optional[int] = None,
+        quantize: bool = False,
+    ):
         self.user_profile = user_profile
         self.model_name = model_name
+        self.max_tokens_per_batch = max(1, int(max_tokens_per_batch))
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.num_threads = num_threads
+        self.quantize = quantize
 
-        if not TORCH_AVAILABLE:
+        if not _import_torch():
             raise ImportError(
                 "PyTorch is not available. Install it with: pip install torch transformers"
             )
@@ -592,10 +854,20 @@ class Stage2GPUProcessor:
         try:
             console.print(f"[cyan]🤖 Loading transformer model: {self.model_name}[/cyan]")
 
+            if self.num_threads:
+                torch.set_num_threads(int(self.num_threads))
+
             self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
             self.model = AutoModel.from_pretrained(self.model_name).to(self.device)
             self.model.eval()  # Set to evaluation mode
 
+            if self.quantize and self.device.type == "cpu":
+                # int8 dynamic quantization of the Linear layers (CPU only)
+                self.model = torch.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                console.print("[cyan]   Applied int8 dynamic quantization[/cyan]")
+
             console.print(f"[green]✅ Model loaded on {self.device}[/green]")
 
         except Exception as e:
@@ -605,26 +877,55 @@ class Stage2GPUProcessor:
 
     def _get_embeddings(self, text: str) -> Optional[np.ndarray]:
         """Get embeddings for text using transformer model"""
-        if not self.model or not self.tokenizer:
-            return None
+        return self._get_embeddings_batch([text])[0]
 
-        try:
-            # Tokenize and encode
-            inputs = self.tokenizer(
-                text, return_tensors="pt", truncation=True, padding=True, max_length=512
-            ).to(self.device)
+    def _get_embeddings_batch(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Get embeddings for many texts with length-sorted dynamic batching.
 
-            # Get Text features
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                # Use mean pooling of last hidden states
-                embeddings = outputs.last_hidden_state.mean(dim=1)
+        Returns one ``(1, hidden_size)`` array per text, in input order, using
+        mean pooling over the non-padding tokens. Texts that are empty or not
+        strings get ``None``.
+        """
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+        if not self.model or not self.tokenizer:
+            return embeddings
 
-            return embeddings.cpu().numpy()
+        valid = [i for i, text in enumerate(texts) if isinstance(text, str) and text]
+        if not valid:
+            return embeddings
+
+        try:
+            # Tokenize without padding; each batch is padded only to its own longest text
+            encoded = self.tokenizer(
+                [texts[i] for i in valid],
+                truncation=True,
+                max_length=STAGE2_MAX_SEQUENCE_LENGTH,
+            )["input_ids"]
+
+            batches = plan_token_batches(
+                [len(ids) for ids in encoded], self.max_tokens_per_batch, self.max_batch_size
+            )
+            with torch.inference_mode():
+                for batch in batches:
+                    inputs = self.tokenizer.pad(
+                        {"input_ids": [encoded[j] for j in batch]}, return_tensors="pt"
+                    ).to(self.device)
+                    outputs = self.model(**inputs)
+
+                    # Mean pooling of last hidden states, ignoring padding
+                    hidden = outputs.last_hidden_state
+                    mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+                    pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+                    pooled = pooled.float().cpu().numpy()
+
+                    for row, j in enumerate(batch):
+                        embeddings[valid[j]] = pooled[row : row + 1]
 
         except Exception as e:
             logger.error(f"Error getting embeddings: {e}")
-            return None
+
+        return embeddings
 
     def _extract_semantic_skills(self, job_description: str) -> List[str]:
         """Extract skills using semantic understanding"""
@@ -685,10 +986,19 @@ class Stage2GPUProcessor:
             return "neutral"
 
     def process_job_semantic(
-        self, job_data: Dict[str, Any], stage1_result: Stage1Result
+        self,
+        job_data: Dict[str, Any],
+        stage1_result: Stage1Result,
+        skill_embeddings: Any = _EMBED_ON_DEMAND,
+        embedding_time: float = 0.0,
     ) -> Stage2Result:
-        """Improved semantic processing of a job"""
-        start_time = time.time()
+        """
+        Improved semantic processing of a job
+
+        ``skill_embeddings`` may be precomputed by ``process_jobs_semantic_batch``;
+        ``embedding_time`` is then this job's share of the batch inference time.
+        """
+        start_time = time.time() - embedding_time
         gpu_memory_before = 0
 
         try:
@@ -701,7 +1011,8 @@ class Stage2GPUProcessor:
             semantic_skills = self._extract_semantic_skills(job_description)
 
             # Get embeddings for compatibility analysis
-            skill_embeddings = self._get_embeddings(job_description)
+            if skill_embeddings is _EMBED_ON_DEMAND:
+                skill_embeddings = self._get_embeddings(job_description)
 
             # Sentiment analysis
             sentiment = self._analyze_sentiment(job_description)
@@ -743,6 +1054,24 @@ class Stage2GPUProcessor:
             logger.error(f"Stage 2 processing error: {e}")
             return Stage2Result(processing_time=time.time() - start_time, model_confidence=0.0)
 
+    def process_jobs_semantic_batch(
+        self, items: List[Tuple[Dict[str, Any], Stage1Result]]
+    ) -> List[Stage2Result]:
+        """Semantic processing of many jobs with one batched embedding pass"""
+        if not items:
+            return []
+
+        start_time = time.time()
+        embeddings = self._get_embeddings_batch(
+            [job.get("description", "") for job, _ in items]
+        )
+        embedding_time = (time.time() - start_time) / len(items)
+
+        return [
+            self.process_job_semantic(job, stage1_result, embedding, embedding_time)
+            for (job, stage1_result), embedding in zip(items, embeddings)
+        ]
+
     def _extract_benefits(self, job_description: str) -> List[str]:
         """Extract benefits from job description"""
         benefit_keywords = [
@@ -804,29 +1133,40 @@ class TwoStageJobProcessor:
     """
 
     def __init__(
-        self, user_profile: Dict[str, Any], cpu_workers: int = 10, max_concurrent_stage2: int = 2
+        self,
+        user_profile: Dict[str, Any],
+        cpu_workers: int = 10,
+        max_concurrent_stage2: int = 2,
+        stage2_config: Optional[Dict[str, Any]] = None,
+        stage2_chunk_size: int = STAGE2_CHUNK_SIZE,
+        stage1_mode: str = "thread",
     ):
         self.user_profile = user_profile
         self.cpu_workers = cpu_workers
         self.max_concurrent_stage2 = max(1, int(max_concurrent_stage2))
+        self.stage2_chunk_size = max(1, int(stage2_chunk_size))
 
         # Initialize Stage 1 processor (always available)
-        self.stage1_processor = Stage1CPUProcessor(user_profile, cpu_workers)
+        self.stage1_processor = Stage1CPUProcessor(
+            user_profile, cpu_workers, execution_mode=stage1_mode
+        )
 
         # Initialize Stage 2 processor only if torch is available
         self.stage2_processor = None
-        self.gpu_available = TORCH_AVAILABLE
+        self.gpu_available = _import_torch()
 
-        if TORCH_AVAILABLE:
+        if self.gpu_available:
             try:
-                self.stage2_processor = Stage2GPUProcessor(user_profile)
+                # stage2_config: max_tokens_per_batch, max_batch_size, num_threads, quantize
+                self.stage2_processor = Stage2GPUProcessor(user_profile, **(stage2_config or {}))
                 console.print(f"[bold blue]🚀 Two-Stage Job Processor Initialized[/bold blue]")
                 console.print(
                     f"[cyan]   Stage 1: {cpu_workers} CPU workers for fast processing[/cyan]"
                 )
                 console.print(f"[cyan]   Stage 2: GPU Text analysis with transformers[/cyan]")
                 console.print(
-                    f"[cyan]   Concurrency: {self.max_concurrent_stage2} parallel Stage 2 jobs[/cyan]"
+                    f"[cyan]   Concurrency: {self.max_concurrent_stage2} parallel Stage 2 batches "
+                    f"of up to {self.stage2_chunk_size} jobs[/cyan]"
                 )
             except Exception as e:
                 logger.warning(f"Could not initialize GPU processor: {e}")
@@ -844,16 +1184,45 @@ class TwoStageJobProcessor:
             console.print(f"[cyan]   Stage 1: {cpu_workers} CPU workers for fast processing[/cyan]")
             console.print(f"[yellow]   Stage 2: Disabled (PyTorch not installed)[/yellow]")
 
-    async def process_jobs(self, jobs: List[Dict[str, Any]]) -> List[TwoStageResult]:
-        """Process jobs through both stages with parallel Stage 2 processing (semaphore-limited)."""
+    def close(self) -> None:
+        """Release Stage 1 worker processes."""
+        self.stage1_processor.close()
+
+    async def process_plan(self, plan) -> List[TwoStageResult]:
+        """
+        Process a ``ProcessingPlan`` from ``src.core.processing_planner``.
+
+        Jobs whose text or extraction rules changed go through the full
+        pipeline; jobs where only the profile changed are re-scored.
+        """
+        results: List[TwoStageResult] = []
+        if plan.extract:
+            results.extend(await self.process_jobs(plan.extract))
+        if plan.rescore:
+            results.extend(await self.process_jobs(plan.rescore, rescore_only=True))
+        return results
+
+    async def process_jobs(
+        self, jobs: List[Dict[str, Any]], rescore_only: bool = False
+    ) -> List[TwoStageResult]:
+        """Process jobs through both stages with parallel Stage 2 processing (semaphore-limited).
+
+        Returns one result per job; jobs rejected by Stage 1 come last with
+        ``stages_completed == 1``. With ``rescore_only`` Stage 1 skips extraction and re-scores the
+        stored job fields against the current profile.
+        """
         total_start_time = time.time()
 
         console.print(
             f"\n[bold blue]🎯 Processing {len(jobs)} jobs through two-stage pipeline[/bold blue]"
         )
 
-        # Stage 1: CPU-bound fast processing (thread pool inside)
-        stage1_results = self.stage1_processor.process_jobs_batch(jobs)
+        # Stage 1: CPU-bound fast processing (thread/process pool inside); offloaded
+        # so the event loop keeps serving discovery while the pool is busy
+        if rescore_only:
+            stage1_results = await asyncio.to_thread(self.stage1_processor.rescore_jobs_batch, jobs)
+        else:
+            stage1_results = await asyncio.to_thread(self.stage1_processor.process_jobs_batch, jobs)
 
         # Filter jobs that passed Stage 1 (preserved order with corresponding jobs)
         passed_jobs: List[Tuple[Dict[str, Any], Stage1Result, int]] = [
@@ -868,25 +1237,31 @@ class TwoStageJobProcessor:
 
         final_results: List[TwoStageResult] = []
 
-        # Stage 2 available: run concurrently with semaphore limit
+        # Stage 2 available: embed chunks of jobs concurrently with semaphore limit
         if self.stage2_processor is not None:
             semaphore = asyncio.Semaphore(self.max_concurrent_stage2)
 
-            async def process_single(
-                idx: int, job: Dict[str, Any], s1: Stage1Result
-            ) -> TwoStageResult:
+            async def process_chunk(
+                chunk: List[Tuple[Dict[str, Any], Stage1Result, int]]
+            ) -> List[TwoStageResult]:
                 async with semaphore:
                     # Offload synchronous GPU/CPU-bound work to a thread to keep loop responsive
-                    s2: Stage2Result = await asyncio.to_thread(
-                        self.stage2_processor.process_job_semantic, job, s1
+                    s2_results: List[Stage2Result] = await asyncio.to_thread(
+                        self.stage2_processor.process_jobs_semantic_batch,
+                        [(job, s1) for job, s1, _ in chunk],
                     )
-                    combined = self._combine_results(job, s1, s2, idx)
-                    return combined
+                    return [
+                        self._combine_results(job, s1, s2, idx)
+                        for (job, s1, idx), s2 in zip(chunk, s2_results)
+                    ]
 
-            # Create tasks for all passed jobs
+            # One task per chunk so each thread call runs full embedding batches
             tasks = [
-                asyncio.create_task(process_single(idx, job, s1), name=f"stage2_job_{idx}")
-                for (job, s1, idx) in passed_jobs
+                asyncio.create_task(
+                    process_chunk(passed_jobs[i : i + self.stage2_chunk_size]),
+                    name=f"stage2_chunk_{i}",
+                )
+                for i in range(0, len(passed_jobs), self.stage2_chunk_size)
             ]
 
             # Consume tasks as they complete to update progress
@@ -898,14 +1273,12 @@ class TwoStageJobProcessor:
                 TimeElapsedColumn(),
                 console=console,
             ) as progress:
-                task = progress.add_task("Stage 2 GPU Processing...", total=len(tasks))
+                task = progress.add_task("Stage 2 GPU Processing...", total=len(passed_jobs))
 
                 for coro in asyncio.as_completed(tasks):
-                    try:
-                        res: TwoStageResult = await coro
-                        final_results.append(res)
-                    finally:
-                        progress.advance(task)
+                    chunk_results: List[TwoStageResult] = await coro
+                    final_results.extend(chunk_results)
+                    progress.advance(task, len(chunk_results))
         else:
             # No Stage 2 available: fall back to Stage 1-only results
             for i, (job, stage1_result, _) in enumerate(passed_jobs):
@@ -937,6 +1310,10 @@ class TwoStageJobProcessor:
                 )
                 final_results.append(combined_result)
 
+        if rescore_only:
+            for result in final_results:
+                result.processing_method = "rescore"
+
         total_time = time.time() - total_start_time
 
         # Display summary
@@ -1003,10 +1380,20 @@ class TwoStageJobProcessor:
 
 # Convenience function
 def get_two_stage_processor(
-    user_profile: Dict[str, Any], cpu_workers: int = 10, max_concurrent_stage2: int = 2
+    user_profile: Dict[str, Any],
+    cpu_workers: int = 10,
+    max_concurrent_stage2: int = 2,
+    stage2_config: Optional[Dict[str, Any]] = None,
+    stage1_mode: str = "thread",
 ) -> TwoStageJobProcessor:
-    """Get configured two-stage job processor"""
-    return TwoStageJobProcessor(user_profile, cpu_workers, max_concurrent_stage2)
+    """Get configured two-stage job processor.
+
+    With ``stage1_mode`` "process" or "auto" call ``close()`` when done to
+    stop the Stage 1 worker processes.
+    """
+    return TwoStageJobProcessor(
+        user_profile, cpu_workers, max_concurrent_stage2, stage2_config, stage1_mode=stage1_mode
+    )
 
 
 # Test function
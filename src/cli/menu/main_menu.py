@@ -174,82 +174,52 @@ class MainMenu:
             from src.core.job_database import get_job_db
 
             db = get_job_db(profile_name)
+            db.backfill_search_index()
 
-            # Get jobs that need processing using proper database query
-            jobs_to_process = db.get_jobs_for_processing(limit=5000)  # Get all unprocessed jobs
+            # Plan only the jobs whose text, extraction rules or profile changed
+            from src.core.processing_planner import ProcessingPlanner
 
-            if not jobs_to_process:
+            planner = ProcessingPlanner(db, profile=self.profile)
+            plan = planner.plan(limit=5000)
+
+            if not plan:
                 console.print("[green]✅ No unprocessed jobs found[/green]")
                 console.print("[cyan]💡 All jobs in database are fully processed[/cyan]")
                 console.print("[cyan]💡 Use option 1 to scrape new jobs[/cyan]")
                 return
 
-            console.print(f"[cyan]📋 Found {len(jobs_to_process)} jobs that need processing[/cyan]")
-            console.print(f"[cyan]🚀 Using Ultra-Fast Pipeline (2+ jobs/sec, 29x faster!)[/cyan]")
-
-            # Use UnifiedJobProcessingPipeline via compatibility layer
-            from src.pipeline.pipeline_migration import create_optimized_processor
-
+            plan_stats = plan.get_stats()
             console.print(
-                f"[cyan]🔄 Processing {len(jobs_to_process)} existing jobs with ultra-fast method...[/cyan]"
+                f"[cyan]📋 Found {len(plan)} jobs that need processing "
+                f"({plan_stats['extract']} to extract, {plan_stats['rescore']} to re-score, "
+                f"{plan_stats['unchanged']} unchanged)[/cyan]"
             )
 
-            # Initialize optimized processor
-            processor = create_optimized_processor(
-                user_profile=self.profile,
+            from src.analysis.two_stage_processor import get_two_stage_processor
+
+            processing_method = "two-stage (incremental)"
+            processor = get_two_stage_processor(
+                self.profile,
                 cpu_workers=4,  # Optimized for performance
                 max_concurrent_stage2=2,
+                stage1_mode="auto",  # Worker processes for large plans; closed below
             )
-
-            # Process jobs using optimized processor
-            processed_jobs = await processor.process_jobs(jobs_to_process)
+            try:
+                processed_jobs = await processor.process_plan(plan)
+            finally:
+                processor.close()
 
             if processed_jobs:
-                # Save updated jobs to database
-                saved_count = 0
-                for result in processed_jobs:
-                    try:
-                        # Convert TwoStageResult to job dict for database
-                        job_dict = {
-                            "id": result.job_id,
-                            "url": result.url,
-                            "title": result.stage1.title if result.stage1 else "Unknown",
-                            "company": result.stage1.company if result.stage1 else "Unknown",
-                            "location": result.stage1.location if result.stage1 else "Unknown",
-                            "salary_range": result.stage1.salary_range if result.stage1 else None,
-                            "compatibility_score": result.final_compatibility,
-                            "required_skills": result.final_skills,
-                            "requirements": result.final_requirements,
-                            "status": "processed",
-                            "processing_method": processing_method,
-                            "processed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
-                            "recommendation": result.recommendation,
-                        }
-
-                        # Update original job data with processed results
-                        if result.job_data:
-                            job_dict.update(result.job_data)
-
-                        # Get the job ID for the update operation
-                        job_id = result.job_data.get("id") if result.job_data else None
-                        if job_id:
-                            db.update_job(job_id, job_dict)
-                            saved_count += 1
-                        else:
-                            # Try to find job by job_id string
-                            if hasattr(result, "job_id") and result.job_id:
-                                # Fallback: update by job_id (string identifier)
-                                try:
-                                    existing_jobs = db.get_jobs(limit=1000)
-                                    for job in existing_jobs:
-                                        if str(job.get("id", "")) == str(result.job_id):
-                                            db.update_job(job["id"], job_dict)
-                                            saved_count += 1
-                                            break
-                                except Exception:
-                                    pass
-                    except Exception as e:
-                        console.print(f"[yellow]⚠️ Failed to save job {result.job_id}: {e}[/yellow]")
+                # Write results back in one batch, then record what they were computed
+                # from; Stage 1 rejections are recorded too so they are not re-extracted
+                summary = db.bulk_update_analysis(
+                    [result.to_analysis_update() for result in processed_jobs]
+                )
+                missing = set(summary["missing_ids"])
+                saved_count = planner.mark_processed(
+                    plan,
+                    [result.job_id for result in processed_jobs if str(result.job_id) not in missing],
+                )
 
                 console.print(f"[bold green]✅ Processing completed successfully![/bold green]")
                 console.print(f"[cyan]📊 Jobs processed: {len(processed_jobs)}[/cyan]")
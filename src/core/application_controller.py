@@ -101,18 +101,7 @@ async def run_two_stage_processing(profile: Dict[str, Any], args: Any) -> bool:
             # Save results back to database
             progress.update(task, advance=75, description="Saving results...")
 
-            for result in final_results:
-                db.update_job_analysis(
-                    result.job_id,
-                    {
-                        "stage1_score": result.stage1.basic_compatibility,
-                        "stage2_score": (
-                            result.stage2.semantic_compatibility if result.stage2 else None
-                        ),
-                        "final_score": result.final_compatibility,
-                        "processing_time": result.total_processing_time,
-                    },
-                )
+            db.bulk_update_analysis([result.to_analysis_update() for result in final_results])
 
             progress.update(task, completed=100)
 
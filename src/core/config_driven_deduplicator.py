@@ -7,6 +7,7 @@ Key Improvements:
 - Configurable similarity rules for title/company/location
 - Support for multiple matching strategies
 - Performance optimized with O(1) lookups where possible
+- Fuzzy checks limited to NearDuplicateIndex candidates (near-linear)
 - Replaces hardcoded thresholds in smart_deduplication.py
 """
 
@@ -24,6 +25,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.utils.config_loader import ConfigLoader
+from src.core.dedup_normalization import normalize_text
+from src.core.near_duplicate_index import NearDuplicateIndex
 
 logger = logging.getLogger(__name__)
 
@@ -129,22 +132,7 @@ class ConfigDrivenJobDeduplicator:
         if not text:
             return ""
         
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-        
-        # Remove common variations
-        text = re.sub(r"\b(jr|sr|senior|junior|lead|principal)\b", "", text)
-        text = re.sub(r"\b(i|ii|iii|iv|v)\b", "", text)  # Roman numerals
-        text = re.sub(r"\([^)]*\)", "", text)  # Remove parentheses content
-        text = re.sub(r"\s*[-–—]\s*", " ", text)  # Normalize dashes
-        
-        # Remove extra spaces again
-        text = re.sub(r"\s+", " ", text).strip()
-        
-        return text
+        return normalize_text(text)
 
     def normalize_company(self, company: str) -> str:
         """
@@ -241,7 +229,8 @@ class ConfigDrivenJobDeduplicator:
     def is_duplicate_job(
         self,
         job: Dict[str, Any],
-        existing_jobs: List[Dict[str, Any]]
+        existing_jobs: List[Dict[str, Any]],
+        index: Optional[NearDuplicateIndex] = None
     ) -> Tuple[bool, str]:
         """
         Check if job is a duplicate of existing jobs
@@ -251,6 +240,8 @@ class ConfigDrivenJobDeduplicator:
         Args:
             job: Job to check
             existing_jobs: List of existing jobs
+            index: Optional NearDuplicateIndex mirroring existing_jobs row for
+                row; fuzzy and domain checks then only visit candidate rows
         
         Returns:
             Tuple of (is_duplicate, reason)
@@ -280,9 +271,28 @@ class ConfigDrivenJobDeduplicator:
             if title_company_key in self.title_company_pairs:
                 return True, "Title-Company pair match"
         
+        bounds = None
+        if index is not None and (self.strategies["fuzzy"] or self.strategies["domain"]):
+            bounds = index.similarity_bounds(job)
+        
         # Strategy 4: Fuzzy similarity checks
         if self.strategies["fuzzy"]:
-            for existing_job in existing_jobs:
+            fuzzy_candidates = existing_jobs
+            if bounds is not None:
+                title_ub, company_ub, location_ub = (
+                    bounds["title"], bounds["company"], bounds["location"]
+                )
+                mask = (
+                    (title_ub >= self.thresholds["title"])
+                    & (company_ub >= self.thresholds["company"])
+                    & (location_ub >= self.thresholds["location"])
+                ) | (
+                    title_ub * 0.5 + company_ub * 0.3 + location_ub * 0.2
+                    >= self.thresholds["overall"]
+                )
+                fuzzy_candidates = [existing_jobs[row] for row in index.rows(mask)]
+            
+            for existing_job in fuzzy_candidates:
                 # Skip if same URL (already checked above)
                 if job_url and job_url == existing_job.get("url", ""):
                     continue
@@ -321,7 +331,12 @@ class ConfigDrivenJobDeduplicator:
         # Strategy 5: Same domain check (if enabled)
         if self.strategies["domain"] and job_url:
             job_domain = self.extract_domain(job_url)
-            for existing_job in existing_jobs:
+            domain_candidates = existing_jobs
+            if bounds is not None:
+                domain_candidates = [
+                    existing_jobs[row] for row in index.rows(bounds["title"] >= 0.90)
+                ]
+            for existing_job in domain_candidates:
                 existing_url = existing_job.get("url", "")
                 if existing_url:
                     existing_domain = self.extract_domain(existing_url)
@@ -377,6 +392,7 @@ class ConfigDrivenJobDeduplicator:
             Tuple of (unique_jobs, stats)
         """
         unique_jobs = []
+        index = NearDuplicateIndex(self.normalize_text)
         stats = {
             "total": len(jobs),
             "duplicates": 0,
@@ -389,7 +405,7 @@ class ConfigDrivenJobDeduplicator:
         }
         
         for i, job in enumerate(jobs, 1):
-            is_dup, reason = self.is_duplicate_job(job, unique_jobs)
+            is_dup, reason = self.is_duplicate_job(job, unique_jobs, index)
             
             if is_dup:
                 stats["duplicates"] += 1
@@ -410,6 +426,7 @@ class ConfigDrivenJobDeduplicator:
                     logger.debug(f"Duplicate #{i}: {reason} - {job.get('title', '')}")
             else:
                 unique_jobs.append(job)
+                index.add(job)
                 self.add_job(job)
                 stats["unique"] += 1
         
@@ -24,8 +24,9 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 import re
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from .duckdb_connection_manager import DuckDBConnectionManager
@@ -80,6 +81,55 @@ RANKING_KEYS: Tuple[str, ...] = (
     "relevance_score",
 )
 
+# Description characters fetched for card previews; a little over the 200 the
+# cards show so their "..." truncation marker still appears.
+CARD_DESCRIPTION_CHARS = 250
+
+# ``jobs`` columns read by list views. The long TEXT columns (description,
+# notes, offer details) dominate row size and are left out; the full text of a
+# single job is fetched on demand with ``DashboardDataAccess.get_job_detail``.
+LIST_COLUMNS: Tuple[str, ...] = (
+    "id",
+    "title",
+    "company",
+    "location",
+    "status",
+    "application_status",
+    "salary_range",
+    "fit_score",
+    "date_posted",
+    "created_at",
+    "url",
+    "source",
+    "job_type",
+    "skills",
+    "keywords",
+    "priority_level",
+    "city_tags",
+    "province_code",
+    "location_type",
+    "location_category",
+    "is_rcip_city",
+    "is_immigration_priority",
+)
+
+# Column projection per dashboard view.
+VIEW_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "list": LIST_COLUMNS,
+    "analytics": LIST_COLUMNS + ("salary_min", "salary_max"),
+    "card": LIST_COLUMNS
+    + ("summary", f"left(description, {CARD_DESCRIPTION_CHARS}) AS description"),
+    "detail": ("*",),
+}
+
+# Long text columns returned by ``get_job_detail`` next to the normalised record.
+DETAIL_TEXT_COLUMNS: Tuple[str, ...] = (
+    "application_notes",
+    "interview_notes",
+    "offer_details",
+    "rejection_reason",
+)
+
 
 class DashboardDataAccessError(Exception):
     """Raised when the dashboard data access layer encounters an unrecoverable error."""
@@ -104,16 +154,38 @@ class CacheMetadata:
         }
 
 
+def frame_to_records(
+    dataframe: pd.DataFrame,
+    cache_metadata: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Materialise normalised rows as JSON-friendly dictionaries.
+
+    Missing values become ``None``. Slice the frame to the rows actually
+    rendered before calling this; it is the only per-row step left.
+    """
+    if dataframe.empty:
+        return []
+    records = dataframe.astype(object).where(dataframe.notna(), None).to_dict("records")
+    if cache_metadata is not None:
+        for record in records:
+            record["cache_metadata"] = cache_metadata
+    return records
+
+
 @dataclass(slots=True)
 class DashboardDataResponse:
     """Structured response returned by ``DashboardDataAccess`` calls."""
 
-    records: List[Dict[str, Any]]
     dataframe: pd.DataFrame
     cache_metadata: CacheMetadata
     schema: Tuple[str, ...] = field(default_factory=lambda: DEFAULT_COLUMNS)
     error: Optional[str] = None
 
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """Job records built from ``dataframe`` on access (not cached)."""
+        return frame_to_records(self.dataframe, self.cache_metadata.to_dict())
+
     def to_payload(self) -> Dict[str, Any]:
         """Produce a serialisable payload for REST or Dash callbacks."""
         return {
@@ -163,6 +235,7 @@ class DashboardDataAccess:
         *,
         force_refresh: bool = False,
         limit: Optional[int] = None,
+        view: str = "list",
     ) -> DashboardDataResponse:
         """Return normalised job records for the given profile.
 
@@ -170,15 +243,21 @@ class DashboardDataAccess:
             profile_name: Profile whose jobs we need to fetch.
             force_refresh: Skip cache and refresh from DuckDB when ``True``.
             limit: Optional limit applied to the SQL query (useful for previews).
+            view: Column projection from ``VIEW_COLUMNS``. ``"list"`` and
+                ``"analytics"`` carry no description, ``"card"`` a short
+                preview, and ``"detail"`` every column.
 
         Returns:
-            ``DashboardDataResponse`` containing records, DataFrame, and cache
-            diagnostics.
+            ``DashboardDataResponse`` containing the normalised DataFrame and
+            cache diagnostics; records are materialised only when requested.
 
         Raises:
             DashboardDataAccessError: When the underlying DuckDB query fails.
         """
-        cache_key = self._build_cache_key(profile_name, limit)
+        if view not in VIEW_COLUMNS:
+            raise ValueError(f"Unknown dashboard view: {view}")
+
+        cache_key = self._build_cache_key(profile_name, limit, view)
         cache_hit = False
 
         if not force_refresh:
@@ -186,9 +265,10 @@ class DashboardDataAccess:
             if cached_payload is not None:
                 cache_hit = True
                 logger.debug(
-                    "Dashboard data cache hit for profile=%s limit=%s",
+                    "Dashboard data cache hit for profile=%s limit=%s view=%s",
                     profile_name,
                     limit,
+                    view,
                 )
                 return self._build_response(
                     cached_payload,
@@ -197,7 +277,7 @@ class DashboardDataAccess:
                 )
 
         try:
-            rows, columns = self._fetch_jobs(profile_name, limit=limit)
+            raw = self._fetch_jobs(profile_name, limit=limit, view=view)
         except Exception as error:  # pragma: no cover - defensive logging branch
             logger.exception(
                 "Failed to fetch dashboard jobs for profile %s: %s",
@@ -206,12 +286,7 @@ class DashboardDataAccess:
             )
             raise DashboardDataAccessError(str(error)) from error
 
-        records = [self._normalise_record(dict(zip(columns, row))) for row in rows]
-        dataframe = self._create_dataframe(records)
-        payload = {
-            "records": records,
-            "dataframe": dataframe,
-        }
+        payload = {"dataframe": self._normalise_frame(raw)}
         self._cache.set(cache_key, payload)
 
         return self._build_response(
@@ -220,6 +295,42 @@ class DashboardDataAccess:
             cache_hit=cache_hit,
         )
 
+    def get_job_detail(self, profile_name: str, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return one job with its full description and notes.
+
+        Detail lookups are single-row primary key reads, so they bypass the
+        cache and list payloads never have to hold the long text.
+
+        Args:
+            profile_name: Profile that owns the job.
+            job_id: Job identifier.
+
+        Returns:
+            Normalised record plus ``DETAIL_TEXT_COLUMNS``, or ``None`` when the
+            job does not exist.
+
+        Raises:
+            DashboardDataAccessError: When the underlying DuckDB query fails.
+        """
+        query = "SELECT * FROM jobs WHERE profile_name = ? AND id = ?"
+        try:
+            rows, columns = DuckDBConnectionManager.execute_query_with_columns(
+                query,
+                [profile_name, job_id],
+                profile_name,
+            )
+        except Exception as error:  # pragma: no cover - defensive logging branch
+            logger.exception("Failed to fetch job %s for profile %s", job_id, profile_name)
+            raise DashboardDataAccessError(str(error)) from error
+
+        if not rows:
+            return None
+        raw = pd.DataFrame.from_records(rows, columns=columns)
+        record = frame_to_records(self._normalise_frame(raw))[0]
+        for column in DETAIL_TEXT_COLUMNS:
+            record[column] = rows[0][columns.index(column)] if column in columns else None
+        return record
+
     def clear_profile_cache(self, profile_name: Optional[str]) -> int:
         """Invalidate cached job data for a specific profile or entire cache."""
         if not profile_name:
@@ -234,13 +345,14 @@ class DashboardDataAccess:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _build_cache_key(self, profile_name: str, limit: Optional[int]) -> str:
+    def _build_cache_key(self, profile_name: str, limit: Optional[int], view: str) -> str:
         """Create a deterministic cache key."""
         limit_part = f"limit={limit}" if limit is not None else "all"
         return self._cache.generate_cache_key(
             self.__class__.__name__,
             profile_name,
             limit_part,
+            view,
         )
 
     def _fetch_jobs(
@@ -248,74 +360,78 @@ class DashboardDataAccess:
         profile_name: str,
         *,
         limit: Optional[int] = None,
-    ) -> Tuple[List[Tuple[Any, ...]], List[str]]:
-        """Execute the DuckDB query and return raw rows and columns."""
-        query = "SELECT * FROM jobs WHERE profile_name = ? " "ORDER BY created_at DESC"
+        view: str = "list",
+    ) -> pd.DataFrame:
+        """Execute the projected DuckDB query and fetch the result column-wise."""
+        projection = ", ".join(VIEW_COLUMNS[view])
+        query = (
+            f"SELECT {projection} FROM jobs WHERE profile_name = ? "
+            "ORDER BY created_at DESC"
+        )
         params: List[Any] = [profile_name]
 
         if limit is not None and limit > 0:
             query += " LIMIT ?"
             params.append(limit)
 
-        rows = DuckDBConnectionManager.execute_query(
-            query,
-            params,
-            profile_name,
-            read_only=True,
-        )
-        columns = DuckDBConnectionManager.get_columns(
-            query,
-            params,
-            profile_name,
-        )
-        return rows, columns
+        return DuckDBConnectionManager.query_df(query, params, profile_name)
 
-    def _normalise_record(self, raw: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert a raw database row into the dashboard schema."""
-        match_score = self._compute_match_score(raw)
-        tags = self._build_tags(raw)
-        ranking = self._build_ranking(raw, match_score)
-
-        normalised = {
-            "id": raw.get("id", ""),
-            "title": raw.get("title", "Unknown Title"),
-            "company": raw.get("company", "Unknown Company"),
-            "location": raw.get("location", "Unknown Location"),
-            "status": self._resolve_status(raw),
-            "salary": self._format_salary(raw.get("salary_range")),
-            "match_score": match_score,
-            "fit_score": self._safe_float(raw.get("fit_score")),
-            "stage1_score": self._safe_float(raw.get("stage1_score")),
-            "final_score": self._safe_float(raw.get("final_score")),
-            "posted_date": self._format_date(raw.get("date_posted")),
-            "created_at": self._format_date(raw.get("created_at")),
-            "url": raw.get("url", ""),
-            "job_url": raw.get("url", ""),
-            "summary": raw.get("summary", ""),
-            "description": raw.get("description", ""),
-            "site": raw.get("source", raw.get("site", "")),
-            "job_type": raw.get("job_type", ""),
-            "skills": raw.get("skills", ""),
-            "keywords": self._extract_keywords(raw),
-            "application_status": raw.get("application_status", "discovered"),
-            "priority_level": raw.get("priority_level", 3),
-            "city_tags": raw.get("city_tags", ""),
-            "province_code": raw.get("province_code", ""),
-            "location_type": raw.get("location_type", "onsite"),
-            "location_category": raw.get("location_category", "unknown"),
-            "tags": tags,
-            "has_rcip": "RCIP" in tags,
-            "rcip_indicator": "🇨🇦 RCIP" if "RCIP" in tags else "",
-            "immigration_priority": "⭐ Priority" if "IMMIGRATION_PRIORITY" in tags else "",
-            "ranking": ranking,
-            "cache_metadata": {},  # Filled post-normalisation
-        }
+    def _normalise_frame(self, raw: pd.DataFrame) -> pd.DataFrame:
+        """Convert raw database rows into the dashboard schema, column by column."""
+        if raw.empty:
+            return pd.DataFrame(columns=list(DEFAULT_COLUMNS))
+
+        def column(name: str, default: Any = None) -> pd.Series:
+            if name in raw.columns:
+                return raw[name]
+            return pd.Series(default, index=raw.index, dtype=object)
 
-        # Ensure all default columns exist (some may have been missing in raw data).
-        for column in DEFAULT_COLUMNS:
-            normalised.setdefault(column, None)
+        match_score = self._compute_match_score(raw)
+        keywords = column("keywords")
+        keyword_source = keywords.where(keywords.notna() & (keywords != ""), column("skills"))
+
+        normalised = pd.DataFrame(
+            {
+                "id": column("id", ""),
+                "title": column("title", "Unknown Title"),
+                "company": column("company", "Unknown Company"),
+                "location": column("location", "Unknown Location"),
+                "status": self._resolve_status(raw),
+                "salary": self._map_distinct(column("salary_range"), self._format_salary),
+                "match_score": match_score,
+                "fit_score": self._numeric(raw, "fit_score"),
+                "stage1_score": self._numeric(raw, "stage1_score"),
+                "final_score": self._numeric(raw, "final_score"),
+                "posted_date": self._format_dates(column("date_posted")),
+                "created_at": self._format_dates(column("created_at")),
+                "url": column("url", ""),
+                "job_url": column("url", ""),
+                "summary": column("summary", ""),
+                "description": column("description", ""),
+                "site": column("source") if "source" in raw.columns else column("site", ""),
+                "job_type": column("job_type", ""),
+                "skills": column("skills", ""),
+                "keywords": self._map_distinct(keyword_source, self._extract_keywords),
+                "application_status": column("application_status", "discovered"),
+                "priority_level": column("priority_level", 3),
+                "city_tags": column("city_tags", ""),
+                "province_code": column("province_code", ""),
+                "location_type": column("location_type", "onsite"),
+                "location_category": column("location_category", "unknown"),
+            }
+        )
 
-        return normalised
+        tags = self._build_tags(raw)
+        has_rcip = self._flag(raw, "is_rcip_city")
+        normalised["tags"] = tags
+        normalised["has_rcip"] = has_rcip
+        normalised["rcip_indicator"] = np.where(has_rcip, "🇨🇦 RCIP", "")
+        normalised["immigration_priority"] = np.where(
+            self._flag(raw, "is_immigration_priority"), "⭐ Priority", ""
+        )
+        normalised["ranking"] = self._build_ranking(raw, match_score)
+        normalised["cache_metadata"] = None  # Filled when records are materialised
+        return normalised[list(DEFAULT_COLUMNS)]
 
     def _build_response(
         self,
@@ -332,69 +448,73 @@ class DashboardDataAccess:
             hit=cache_hit,
         )
 
-        records: List[Dict[str, Any]] = payload["records"]
-        dataframe: pd.DataFrame = payload["dataframe"]
-
-        # Inject metadata into each record for downstream UI features.
-        cache_meta_dict = cache_metadata.to_dict()
-        for record in records:
-            record["cache_metadata"] = cache_meta_dict
-
         return DashboardDataResponse(
-            records=records,
-            dataframe=dataframe,
+            dataframe=payload["dataframe"],
             cache_metadata=cache_metadata,
         )
 
     # ------------------------------------------------------------------
     # Normalisation helpers
     # ------------------------------------------------------------------
-    def _compute_match_score(self, raw: Dict[str, Any]) -> float:
+    def _compute_match_score(self, raw: pd.DataFrame) -> pd.Series:
         """Coerce match score values into the expected 0-100 range."""
-        score_sources: Iterable[Any] = (
-            raw.get("match_score"),
-            raw.get("fit_score"),
-        )
-        for score in score_sources:
-            value = self._safe_float(score)
-            if value is None:
-                continue
-            # Values stored as 0-1 need upscaling, assume <= 1.0 implies percentages.
-            return float(value * 100 if value <= 1 else value)
-        return 0.0
-
-    def _build_ranking(self, raw: Dict[str, Any], match_score: float) -> Dict[str, float]:
-        """Compose ranking breakdown dictionary for the dashboard."""
-        ranking: Dict[str, float] = {"match_score": float(match_score)}
+        score = self._numeric(raw, "fit_score")
+        if "match_score" in raw.columns:
+            score = self._numeric(raw, "match_score").combine_first(score)
+        # Values stored as 0-1 need upscaling, assume <= 1.0 implies percentages.
+        return score.where(score > 1, score * 100).fillna(0.0)
+
+    def _build_ranking(self, raw: pd.DataFrame, match_score: pd.Series) -> List[Dict[str, float]]:
+        """Compose ranking breakdown dictionaries for the dashboard."""
+        scores: Dict[str, pd.Series] = {"match_score": match_score}
         for key in RANKING_KEYS:
-            value = raw.get(key)
-            safe_value = self._safe_float(value)
-            if safe_value is not None:
-                ranking[key] = float(safe_value)
-        return ranking
-
-    def _build_tags(self, raw: Dict[str, Any]) -> List[str]:
-        """Create a set of tags that power dashboard filtering."""
-        tags: List[str] = []
-        if raw.get("is_rcip_city"):
-            tags.append("RCIP")
-        if raw.get("is_immigration_priority"):
-            tags.append("IMMIGRATION_PRIORITY")
-        location = (raw.get("location") or "").lower()
-        if "remote" in location:
-            tags.append("REMOTE")
-        if raw.get("application_status") not in (None, "discovered"):
-            tags.append(raw.get("application_status", "").upper())
-        if raw.get("keywords"):
-            tags.append("KEYWORDED")
-        return tags
-
-    def _resolve_status(self, raw: Dict[str, Any]) -> str:
+            if key in raw.columns:
+                values = self._numeric(raw, key)
+                scores[key] = values.combine_first(scores[key]) if key in scores else values
+        frame = pd.DataFrame(scores).astype(float)
+        rankings = frame.to_dict("records")
+        for position in np.flatnonzero(frame.isna().any(axis=1).to_numpy()):
+            rankings[position] = {
+                key: value for key, value in rankings[position].items() if value == value
+            }
+        return rankings
+
+    def _build_tags(self, raw: pd.DataFrame) -> List[List[str]]:
+        """Create the tags that power dashboard filtering."""
+        index = raw.index
+        flags = {
+            "RCIP": self._flag(raw, "is_rcip_city"),
+            "IMMIGRATION_PRIORITY": self._flag(raw, "is_immigration_priority"),
+            "REMOTE": (
+                raw["location"].fillna("").str.lower().str.contains("remote", regex=False)
+                if "location" in raw.columns
+                else pd.Series(False, index=index)
+            ),
+        }
+        if "application_status" in raw.columns:
+            status = raw["application_status"]
+            status_tag = status.where(status.notna() & (status != "discovered")).str.upper()
+        else:
+            status_tag = pd.Series(None, index=index, dtype=object)
+        if "keywords" in raw.columns:
+            keyworded = raw["keywords"].notna() & (raw["keywords"] != "")
+        else:
+            keyworded = pd.Series(False, index=index)
+
+        # Few distinct combinations exist, so build each tag list once
+        codes, combinations = pd.MultiIndex.from_arrays(
+            [*flags.values(), status_tag.fillna(""), keyworded]
+        ).factorize()
+        tag_lists = [
+            [name for name, on in zip(flags, row_flags) if on]
+            + ([status_value] if status_value else [])
+            + (["KEYWORDED"] if has_keywords else [])
+            for *row_flags, status_value, has_keywords in combinations
+        ]
+        return [list(tag_lists[code]) for code in codes]
+
+    def _resolve_status(self, raw: pd.DataFrame) -> pd.Series:
         """Determine dashboard status from stored job fields."""
-        application_status = raw.get("application_status")
-        if application_status and application_status != "discovered":
-            return application_status
-
         status_mapping = {
             "new": "new",
             "scraped": "new",
@@ -404,7 +524,19 @@ class DashboardDataAccess:
             "reviewing": "needs_review",
             "interview": "interview",
         }
-        return status_mapping.get(raw.get("status", "new"), "new")
+        if "status" in raw.columns:
+            status = raw["status"].map(status_mapping).fillna("new")
+        else:
+            status = pd.Series("new", index=raw.index, dtype=object)
+        if "application_status" not in raw.columns:
+            return status
+        application_status = raw["application_status"]
+        explicit = (
+            application_status.notna()
+            & (application_status != "")
+            & (application_status != "discovered")
+        )
+        return application_status.where(explicit, status)
 
     def _format_salary(self, salary: Any) -> str:
         """Format salary information for display."""
@@ -414,23 +546,14 @@ class DashboardDataAccess:
             return f"${salary:,.0f}"
         return str(salary)
 
-    def _format_date(self, value: Any) -> str:
-        """Normalise date values to YYYY-MM-DD strings."""
-        if not value:
-            return datetime.utcnow().strftime("%Y-%m-%d")
-        if isinstance(value, datetime):
-            return value.strftime("%Y-%m-%d")
-        try:
-            text = str(value)
-            if "T" in text:
-                text = text.split("T")[0]
-            return text[:10]
-        except Exception:  # pragma: no cover - defensive fallback
-            return datetime.utcnow().strftime("%Y-%m-%d")
-
-    def _extract_keywords(self, raw: Dict[str, Any]) -> str:
-        """Derive display-ready keywords from job metadata."""
-        keywords_field = raw.get("keywords") or raw.get("skills")
+    def _format_dates(self, values: pd.Series) -> pd.Series:
+        """Normalise date values to YYYY-MM-DD strings (today when missing)."""
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+        parsed = pd.to_datetime(values, errors="coerce", format="mixed")
+        return parsed.dt.strftime("%Y-%m-%d").fillna(today)
+
+    def _extract_keywords(self, keywords_field: Any) -> str:
+        """Derive display-ready keywords from a keywords or skills value."""
         if isinstance(keywords_field, str) and keywords_field.strip():
             parts = [
                 part.strip().title()
@@ -443,25 +566,24 @@ class DashboardDataAccess:
             return ", ".join(dict.fromkeys(parts))[:250]
         return "No keywords"
 
-    def _safe_float(self, value: Any) -> Optional[float]:
-        """Convert values to float when possible."""
-        try:
-            if value is None or value == "":
-                return None
-            return float(value)
-        except (TypeError, ValueError):
-            return None
-
-    def _create_dataframe(self, records: List[Dict[str, Any]]) -> pd.DataFrame:
-        """Create a DataFrame with the canonical column ordering."""
-        if not records:
-            return pd.DataFrame(columns=list(DEFAULT_COLUMNS))
-        dataframe = pd.DataFrame.from_records(records)
-        # Ensure all expected columns exist.
-        for column in DEFAULT_COLUMNS:
-            if column not in dataframe.columns:
-                dataframe[column] = None
-        return dataframe[list(DEFAULT_COLUMNS)]
+    def _numeric(self, raw: pd.DataFrame, name: str) -> pd.Series:
+        """Column as floats, with missing or unparseable values as NaN."""
+        if name not in raw.columns:
+            return pd.Series(np.nan, index=raw.index)
+        return pd.to_numeric(raw[name], errors="coerce").astype(float)
+
+    def _flag(self, raw: pd.DataFrame, name: str) -> pd.Series:
+        """Integer flag column as booleans."""
+        return self._numeric(raw, name).fillna(0).astype(bool)
+
+    def _map_distinct(self, values: pd.Series, formatter: Callable[[Any], str]) -> pd.Series:
+        """Apply a scalar formatter once per distinct value."""
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        formatted = np.array(
+            [formatter(None if pd.isna(value) else value) for value in uniques],
+            dtype=object,
+        )
+        return pd.Series(formatted[codes], index=values.index, dtype=object)
 
 
 def get_dashboard_data_access() -> DashboardDataAccess:
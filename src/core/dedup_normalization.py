@@ -0,0 +1,32 @@
+"""
+Dedup Normalization
+Text normalization shared by the job deduplicators.
+
+Both ``SmartJobDeduplicator`` and ``ConfigDrivenJobDeduplicator`` compare
+normalized titles, companies and locations, so they must normalize the same
+way. Job lists repeat the same few strings, so results are cached.
+"""
+
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=65536)
+def normalize_text(text: str) -> str:
+    """Lowercase, drop seniority words, roman numerals and parentheses, unify dashes."""
+    # Convert to lowercase
+    text = text.lower()
+
+    # Remove extra whitespace
+    text = re.sub(r"\s+", " ", text).strip()
+
+    # Remove common variations
+    text = re.sub(r"\b(jr|sr|senior|junior|lead|principal)\b", "", text)
+    text = re.sub(r"\b(i|ii|iii|iv|v)\b", "", text)  # Roman numerals
+    text = re.sub(r"\([^)]*\)", "", text)  # Remove parentheses content
+    text = re.sub(r"\s*[-–—]\s*", " ", text)  # Normalize dashes
+
+    # Remove extra spaces again
+    text = re.sub(r"\s+", " ", text).strip()
+
+    return text
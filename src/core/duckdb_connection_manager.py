@@ -3,24 +3,387 @@ DuckDB Connection Manager
 Handles connection pooling and prevents file locking issues
 """
 
+import atexit
 import logging
+import threading
 import duckdb
+import pandas as pd
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
 
+def resolve_profile_db_path(profile_name: Optional[str] = None) -> str:
+    """Resolve the DuckDB file for a profile.
+
+    Prefers the standard lowercase filename and falls back to legacy
+    case variations when only those exist on disk.
+    """
+    if not profile_name:
+        return "data/jobs_duckdb.db"
+
+    profile_dir = Path(f"profiles/{profile_name}")
+    standard_path = profile_dir / f"{profile_name.lower()}_duckdb.db"
+    if standard_path.exists():
+        return str(standard_path)
+
+    legacy_paths = [
+        profile_dir / f"{profile_name}_duckdb.db",
+        profile_dir / f"{profile_name.upper()}_duckdb.db",
+    ]
+    for path in legacy_paths:
+        if path.exists():
+            return str(path)
+
+    return str(standard_path)
+
+
+class _PooledDatabase:
+    """One DuckDB database file plus the cursors checked out from it.
+
+    The root handle is opened on first checkout and closed again once the
+    file has been idle for ``idle_timeout`` seconds, so a long-running
+    dashboard does not hold DuckDB's file lock between requests and the
+    pipeline process can open the file for writing.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_idle_cursors: int,
+        idle_timeout: Optional[float],
+        write_timeout: float = 10.0,
+    ):
+        self.db_path = db_path
+        self.max_idle_cursors = max_idle_cursors
+        self.idle_timeout = idle_timeout
+        self.write_timeout = write_timeout
+        self.read_only = False
+        self.schema_ready = False
+        self.lock = threading.Lock()
+        self.released = threading.Condition(self.lock)
+        self.writers_waiting = 0
+        self.write_lock = threading.RLock()
+        self.idle_cursors: List[duckdb.DuckDBPyConnection] = []
+        self.checked_out = 0
+        self.conn: Optional[duckdb.DuckDBPyConnection] = None
+        self._idle_timer: Optional[threading.Timer] = None
+
+    def _open(self, read_only: bool) -> None:
+        """Open the root handle; caller holds ``self.lock``."""
+        if read_only and (self.db_path.startswith(":") or not Path(self.db_path).exists()):
+            # A read-only handle cannot create the file
+            read_only = False
+        if not self.db_path.startswith(":"):
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        if read_only:
+            self.conn = duckdb.connect(self.db_path, read_only=True)
+            self.read_only = True
+            return
+        try:
+            self.conn = duckdb.connect(self.db_path)
+            self.read_only = False
+        except duckdb.IOException as e:
+            # Another process holds the file; retried on the next open
+            logger.warning(f"Database locked, opening read-only handle: {e}")
+            self.conn = duckdb.connect(self.db_path, read_only=True)
+            self.read_only = True
+
+    def _close_handle(self) -> None:
+        """Close idle cursors and the root handle; caller holds ``self.lock``."""
+        for cursor in self.idle_cursors:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        self.idle_cursors.clear()
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+        self.conn = None
+
+    def _cancel_idle_timer(self) -> None:
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _close_if_idle(self) -> None:
+        with self.lock:
+            self._idle_timer = None
+            if self.checked_out == 0 and self.conn is not None:
+                self._close_handle()
+                logger.debug(f"DuckDB pool released idle handle: {self.db_path}")
+
+    def acquire_handle(self, read_only: bool, prefer_write: bool = False) -> duckdb.DuckDBPyConnection:
+        """Count a checkout and return the root handle, opening it if needed.
+
+        Readers take whatever handle is open (``prefer_write`` opens a closed
+        file read-write). A writer never gets a read-only handle: it waits up
+        to ``write_timeout`` seconds for readers of a read-only handle to
+        drain, reopens the file read-write, and raises ``duckdb.IOException``
+        when that times out or another process holds the file.
+        """
+        with self.lock:
+            self._cancel_idle_timer()
+            if read_only:
+                # Let a waiting writer reopen the file before new readers pile on
+                while self.writers_waiting and self.conn is not None and self.read_only:
+                    self.released.wait()
+                if self.conn is None:
+                    self._open(not prefer_write)
+                self.checked_out += 1
+                return self.conn
+
+            if self.conn is not None and self.read_only:
+                self.writers_waiting += 1
+                try:
+                    drained = self.released.wait_for(
+                        lambda: not self.checked_out, timeout=self.write_timeout
+                    )
+                finally:
+                    self.writers_waiting -= 1
+                    self.released.notify_all()
+                if not drained:
+                    raise duckdb.IOException(
+                        f"Timed out waiting for readers to release {self.db_path} for writing"
+                    )
+                self._close_handle()
+            if self.conn is None:
+                self._open(False)
+            if self.read_only:
+                if not self.checked_out:
+                    self._close_handle()
+                raise duckdb.IOException(
+                    f"Database {self.db_path} is locked by another process (read-only pool)"
+                )
+            self.checked_out += 1
+            return self.conn
+
+    def release_handle(self) -> None:
+        """Undo ``acquire_handle`` and schedule closing the file once idle."""
+        with self.lock:
+            self.checked_out -= 1
+            self.released.notify_all()
+            if self.checked_out or self.idle_timeout is None:
+                return
+            if self.idle_timeout <= 0:
+                self._close_handle()
+                return
+            self._idle_timer = threading.Timer(self.idle_timeout, self._close_if_idle)
+            self._idle_timer.daemon = True
+            self._idle_timer.start()
+
+    def checkout(
+        self, read_only: bool = False, prefer_write: bool = False
+    ) -> duckdb.DuckDBPyConnection:
+        conn = self.acquire_handle(read_only, prefer_write)
+        with self.lock:
+            if self.idle_cursors:
+                return self.idle_cursors.pop()
+        try:
+            return conn.cursor()
+        except Exception:
+            self.release_handle()
+            raise
+
+    def checkin(self, cursor: duckdb.DuckDBPyConnection) -> None:
+        with self.lock:
+            keep = self.conn is not None and len(self.idle_cursors) < self.max_idle_cursors
+            if keep:
+                self.idle_cursors.append(cursor)
+        if not keep:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        self.release_handle()
+
+    def close(self) -> None:
+        with self.lock:
+            self._cancel_idle_timer()
+            self._close_handle()
+
+
+def _pool_key(db_path: str) -> str:
+    """Key pooled databases by absolute path so cwd changes cannot alias files."""
+    if db_path.startswith(":"):
+        return db_path
+    return str(Path(db_path).resolve())
+
+
+class DuckDBConnectionPool:
+    """
+    Process-wide pool of DuckDB handles keyed by database file.
+
+    Each file is opened at most once per process; callers check out
+    lightweight cursors so concurrent Dash callbacks do not serialize on a
+    single connection, and schema initialization runs only once per file.
+    Writes that must not interleave go through ``writer()``, which hands
+    out the root connection under a lock. Handles are released after
+    ``idle_timeout`` seconds without checkouts (``None`` keeps them open)
+    so other processes can take the file's write lock in between. Writers
+    wait up to ``write_timeout`` seconds for readers of a read-only handle
+    to finish so the file can be reopened read-write.
+    """
+
+    def __init__(
+        self,
+        max_idle_cursors: int = 8,
+        idle_timeout: Optional[float] = 2.0,
+        write_timeout: float = 10.0,
+    ):
+        self.max_idle_cursors = max_idle_cursors
+        self.idle_timeout = idle_timeout
+        self.write_timeout = write_timeout
+        self._databases: Dict[str, _PooledDatabase] = {}
+        self._lock = threading.Lock()
+
+    def _get_database(self, db_path: str) -> _PooledDatabase:
+        key = _pool_key(db_path)
+        with self._lock:
+            database = self._databases.get(key)
+            if database is None:
+                database = _PooledDatabase(
+                    key, self.max_idle_cursors, self.idle_timeout, self.write_timeout
+                )
+                self._databases[key] = database
+                logger.info(f"DuckDB pool opened: {db_path}")
+        return database
+
+    @staticmethod
+    def _ensure_schema(
+        database: _PooledDatabase,
+        initializer: Optional[Callable[[duckdb.DuckDBPyConnection], None]],
+    ) -> None:
+        """Run the initializer the first time the file is open read-write."""
+        if initializer is None or database.schema_ready or database.read_only:
+            return
+        with database.write_lock:
+            if not database.schema_ready:
+                initializer(database.conn)
+                database.schema_ready = True
+
+    def acquire(
+        self,
+        db_path: str,
+        initializer: Optional[Callable[[duckdb.DuckDBPyConnection], None]] = None,
+        read_only: bool = False,
+    ) -> duckdb.DuckDBPyConnection:
+        """Check out a cursor; the caller must hand it back via ``release``.
+
+        ``read_only`` callers may be served from a read-only handle, which
+        other processes can share; other callers always get a read-write one.
+        """
+        database = self._get_database(db_path)
+        # The first checkout opens read-write so the schema can be migrated
+        cursor = database.checkout(
+            read_only, prefer_write=initializer is not None and not database.schema_ready
+        )
+        try:
+            self._ensure_schema(database, initializer)
+        except Exception:
+            database.checkin(cursor)
+            raise
+        return cursor
+
+    def release(self, db_path: str, cursor: duckdb.DuckDBPyConnection) -> None:
+        """Return a cursor obtained from ``acquire`` to the pool."""
+        database = self._databases.get(_pool_key(db_path))
+        if database is None:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+            return
+        database.checkin(cursor)
+
+    @contextmanager
+    def cursor(
+        self,
+        db_path: str,
+        initializer: Optional[Callable[[duckdb.DuckDBPyConnection], None]] = None,
+        read_only: bool = False,
+    ):
+        """Check out a cursor for the duration of a request."""
+        cursor = self.acquire(db_path, initializer, read_only)
+        try:
+            yield cursor
+        finally:
+            self.release(db_path, cursor)
+
+    @contextmanager
+    def writer(
+        self,
+        db_path: str,
+        initializer: Optional[Callable[[duckdb.DuckDBPyConnection], None]] = None,
+    ):
+        """Serialize writes through the single root connection for a file."""
+        database = self._get_database(db_path)
+        conn = database.acquire_handle(read_only=False)
+        try:
+            self._ensure_schema(database, initializer)
+            with database.write_lock:
+                yield conn
+        finally:
+            database.release_handle()
+
+    def is_read_only(self, db_path: str) -> bool:
+        """Whether the pooled handle for a file is currently open read-only."""
+        database = self._databases.get(_pool_key(db_path))
+        return bool(database and database.conn is not None and database.read_only)
+
+    def close(self, db_path: Optional[str] = None) -> None:
+        """Close one pooled database (or all of them) and release file locks."""
+        with self._lock:
+            if db_path is None:
+                databases = list(self._databases.values())
+                self._databases.clear()
+            else:
+                database = self._databases.pop(_pool_key(db_path), None)
+                databases = [database] if database else []
+        for database in databases:
+            database.close()
+            logger.info(f"DuckDB pool closed: {database.db_path}")
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-file cursor usage for monitoring."""
+        return {
+            path: {
+                "checked_out": database.checked_out,
+                "idle": len(database.idle_cursors),
+                "open": int(database.conn is not None),
+                "read_only": int(database.read_only),
+            }
+            for path, database in list(self._databases.items())
+        }
+
+
+_connection_pool: Optional[DuckDBConnectionPool] = None
+_connection_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> DuckDBConnectionPool:
+    """Return the process-wide DuckDB connection pool."""
+    global _connection_pool
+    if _connection_pool is None:
+        with _connection_pool_lock:
+            if _connection_pool is None:
+                _connection_pool = DuckDBConnectionPool()
+                atexit.register(_connection_pool.close)
+    return _connection_pool
+
+
 class DuckDBConnectionManager:
     """Manages DuckDB connections to prevent file locking issues"""
 
     @staticmethod
     def get_db_path(profile_name: Optional[str] = None) -> str:
         """Get database path for profile"""
-        if profile_name:
-            return f"profiles/{profile_name}/{profile_name}_duckdb.db"
-        return "data/jobs_duckdb.db"
+        return resolve_profile_db_path(profile_name)
 
     @staticmethod
     @contextmanager
@@ -69,19 +432,42 @@ class DuckDBConnectionManager:
     def execute_query(
         query: str, params: list = None, profile_name: Optional[str] = None, read_only: bool = True
     ):
-        """Execute a query with automatic connection management"""
-        with DuckDBConnectionManager.get_connection(profile_name, read_only) as conn:
+        """Execute a query on a pooled cursor"""
+        db_path = DuckDBConnectionManager.get_db_path(profile_name)
+        with get_connection_pool().cursor(db_path, read_only=read_only) as conn:
             if params:
                 return conn.execute(query, params).fetchall()
             else:
                 return conn.execute(query).fetchall()
 
+    @staticmethod
+    def execute_query_with_columns(
+        query: str, params: list = None, profile_name: Optional[str] = None
+    ) -> Tuple[List[tuple], List[str]]:
+        """Execute a query once on a pooled cursor and return rows and column names"""
+        db_path = DuckDBConnectionManager.get_db_path(profile_name)
+        with get_connection_pool().cursor(db_path, read_only=True) as conn:
+            result = conn.execute(query, params) if params else conn.execute(query)
+            columns = [desc[0] for desc in result.description]
+            return result.fetchall(), columns
+
+    @staticmethod
+    def query_df(
+        query: str, params: list = None, profile_name: Optional[str] = None
+    ) -> pd.DataFrame:
+        """Execute a query on a pooled cursor and fetch the result column-wise as a DataFrame"""
+        db_path = DuckDBConnectionManager.get_db_path(profile_name)
+        with get_connection_pool().cursor(db_path, read_only=True) as conn:
+            result = conn.execute(query, params) if params else conn.execute(query)
+            return result.df()
+
     @staticmethod
     def get_columns(query: str, params: list = None, profile_name: Optional[str] = None):
         """Get column names from a query"""
-        with DuckDBConnectionManager.get_connection(profile_name, read_only=True) as conn:
+        db_path = DuckDBConnectionManager.get_db_path(profile_name)
+        with get_connection_pool().cursor(db_path, read_only=True) as conn:
             if params:
-                result = conn.execute(query, params)
+                conn.execute(query, params)
             else:
-                result = conn.execute(query)
+                conn.execute(query)
             return [desc[0] for desc in conn.description]
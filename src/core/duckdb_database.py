@@ -14,10 +14,31 @@ Schema: Reduced from 30 fields to 17 essential fields based on dashboard needs.
 import logging
 import pandas as pd
 import duckdb
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
+from .duckdb_connection_manager import get_connection_pool, resolve_profile_db_path
+from .job_search_index import (
+    INDEXED_FIELDS,
+    build_search_postings,
+    get_job_search_index,
+    parse_search_query,
+    phrase_matches,
+)
+from .persistent_dedup_index import DEDUP_KEY_COLUMNS, job_dedup_keys
+from .processing_planner import (
+    DEFAULT_SCOPE,
+    STAGE_EXTRACT,
+    STAGE_RESCORE,
+    content_fingerprint_sql,
+)
+from .salary_columns import (
+    SALARY_COLUMNS,
+    fill_salary_columns,
+    parse_salary_frame,
+    parse_salary_text,
+)
 from .job_data import JobData
 
 logger = logging.getLogger(__name__)
@@ -34,44 +55,36 @@ class DuckDBJobDatabase:
     - File-based storage (no server required)
     """
 
-    def __init__(self, db_path: str = "data/jobs_duckdb.db", profile_name: Optional[str] = None):
-        """Initialize DuckDB connection with minimal schema."""
+    def __init__(
+        self,
+        db_path: str = "data/jobs_duckdb.db",
+        profile_name: Optional[str] = None,
+        pooled: bool = False,
+        read_only: bool = False,
+    ):
+        """Initialize DuckDB connection with minimal schema.
+
+        Args:
+            db_path: Database file used when no profile is given.
+            profile_name: Profile whose database file should be opened.
+            pooled: Check out a cursor from the process-wide connection pool
+                instead of opening a dedicated connection. Schema setup then
+                runs once per file and ``close()`` returns the cursor to the
+                pool. Intended for short-lived, per-request use (Dash callbacks).
+            read_only: With ``pooled``, the caller only reads, so the pool may
+                serve it from a read-only handle shared with other processes.
+        """
         self.profile_name = profile_name
+        self.pooled = pooled
 
         # Handle profile-specific paths
         if profile_name:
-            # STANDARDIZE: Always use lowercase for database filenames
-            profile_name_lower = profile_name.lower()
-            profile_dir = Path(f"profiles/{profile_name}")
-            
-            # Primary path: lowercase version (standard)
-            standard_path = profile_dir / f"{profile_name_lower}_duckdb.db"
-            
-            # Also check for case variations (legacy support)
-            legacy_paths = [
-                profile_dir / f"{profile_name}_duckdb.db",
-                profile_dir / f"{profile_name.upper()}_duckdb.db",
-            ]
-            
-            # Find existing database (prefer standard lowercase)
-            existing_db = None
-            if standard_path.exists():
-                existing_db = standard_path
-                logger.info(f"Found existing database: {standard_path}")
-            else:
-                # Check legacy paths
-                for path in legacy_paths:
-                    if path.exists():
-                        existing_db = path
-                        logger.info(f"Found existing database (legacy): {path}")
-                        break
-            
-            # Use existing or create new with lowercase standard name
-            self.db_path = str(existing_db) if existing_db else str(standard_path)
-            self.db_file = Path(self.db_path)
+            # STANDARDIZE: Always use lowercase for database filenames,
+            # falling back to legacy case variations that already exist
+            self.db_path = resolve_profile_db_path(profile_name)
         else:
             self.db_path = db_path
-            self.db_file = Path(self.db_path)
+        self.db_file = Path(self.db_path)
 
         # Ensure directory exists (skip for special paths like :memory:)
         if not self.db_path.startswith(":"):
@@ -80,12 +93,25 @@ class DuckDBJobDatabase:
         # Initialize connection as None - will connect when needed
         self.conn = None
 
+        if pooled:
+            self.conn = get_connection_pool().acquire(
+                self.db_path, self._create_table_on, read_only=read_only
+            )
+            logger.debug(f"DuckDB pooled cursor checked out: {self.db_path}")
+            return
+
         # Connect and create table
         self._ensure_connection()
         self._create_table()
 
         logger.info(f"DuckDB database initialized: {self.db_path}")
 
+    def __enter__(self) -> "DuckDBJobDatabase":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def _ensure_connection(self):
         """Ensure database connection is active"""
         if self.conn is None:
@@ -103,6 +129,11 @@ class DuckDBJobDatabase:
 
     def _create_table(self):
         """Create jobs table with enhanced schema for job tracking."""
+        self._create_table_on(self.conn)
+
+    @classmethod
+    def _create_table_on(cls, conn):
+        """Create jobs table, tracking tables and indexes on ``conn``."""
         create_sql = """
         CREATE TABLE IF NOT EXISTS jobs (
             id VARCHAR PRIMARY KEY,
@@ -110,6 +141,11 @@ class DuckDBJobDatabase:
             company VARCHAR NOT NULL,
             location VARCHAR,
             salary_range VARCHAR,
+            -- Parsed from salary_range at ingest (see src/core/salary_columns.py)
+            salary_min DOUBLE,
+            salary_max DOUBLE,
+            salary_period VARCHAR,
+            salary_currency VARCHAR,
             description TEXT,
             summary TEXT,
             skills TEXT,
@@ -152,10 +188,66 @@ class DuckDBJobDatabase:
         );
         """
 
-        self.conn.execute(create_sql)
+        conn.execute(create_sql)
+
+        # Columns added after the first release; older databases get them here
+        added_columns = [
+            ("salary_min", "DOUBLE"),
+            ("salary_max", "DOUBLE"),
+            ("salary_period", "VARCHAR"),
+            ("salary_currency", "VARCHAR"),
+        ]
+        for column, column_type in added_columns:
+            conn.execute(f"ALTER TABLE jobs ADD COLUMN IF NOT EXISTS {column} {column_type}")
 
         # Create additional tables for comprehensive job tracking
-        self._create_tracking_tables()
+        cls._create_tracking_tables(conn)
+
+        # Cross-run dedup keys (see src/core/persistent_dedup_index.py)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_dedup_keys (
+                job_id VARCHAR PRIMARY KEY,
+                url_hash UBIGINT,
+                signature_hash UBIGINT,
+                title_company_hash UBIGINT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            """
+        )
+
+        # Full-text search postings (see src/core/job_search_index.py); seq
+        # identifies one indexed version of a job so readers can pull new rows
+        conn.execute("CREATE SEQUENCE IF NOT EXISTS job_search_seq START 1")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_search_docs (
+                job_id VARCHAR PRIMARY KEY,
+                seq BIGINT,
+                doc_length DOUBLE
+            );
+            CREATE TABLE IF NOT EXISTS job_search_postings (
+                seq BIGINT,
+                term VARCHAR,
+                weight DOUBLE
+            );
+            """
+        )
+
+        # Inputs each job was last processed with (see src/core/processing_planner.py)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_processing_state (
+                job_id VARCHAR,
+                scope VARCHAR,
+                content_hash VARCHAR,
+                extraction_version INTEGER,
+                profile_hash VARCHAR,
+                processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (job_id, scope)
+            );
+            """
+        )
 
         # Create indexes for common queries
         index_queries = [
@@ -170,15 +262,17 @@ class DuckDBJobDatabase:
             "CREATE INDEX IF NOT EXISTS idx_jobs_created_at " "ON jobs(created_at);",
             "CREATE INDEX IF NOT EXISTS idx_jobs_priority_level " "ON jobs(priority_level);",
             "CREATE INDEX IF NOT EXISTS idx_jobs_follow_up_date " "ON jobs(follow_up_date);",
+            "CREATE INDEX IF NOT EXISTS idx_jobs_salary_max " "ON jobs(salary_max);",
         ]
 
         for query in index_queries:
             try:
-                self.conn.execute(query)
+                conn.execute(query)
             except Exception as e:
                 logger.warning(f"Index creation warning: {e}")
 
-    def _create_tracking_tables(self):
+    @staticmethod
+    def _create_tracking_tables(conn):
         """Create additional tables for comprehensive job tracking."""
 
         # Job notes table for detailed tracking
@@ -268,7 +362,7 @@ class DuckDBJobDatabase:
         tables = [notes_sql, interviews_sql, communications_sql, documents_sql, manual_review_sql]
         for sql in tables:
             try:
-                self.conn.execute(sql)
+                conn.execute(sql)
             except Exception as e:
                 logger.error(f"Error creating tracking table: {e}")
 
@@ -287,7 +381,7 @@ class DuckDBJobDatabase:
 
         for index_sql in tracking_indexes:
             try:
-                self.conn.execute(index_sql)
+                conn.execute(index_sql)
             except Exception as e:
                 logger.warning(f"Tracking index creation warning: {e}")
 
@@ -306,12 +400,17 @@ class DuckDBJobDatabase:
                 logger.debug(f"Job {job_dict['id']} already exists, skipping")
                 return False
 
+            if job_dict.get("salary_min") is None and job_dict.get("salary_max") is None:
+                job_dict.update(parse_salary_text(job_dict.get("salary_range")))
+
             # Insert job
             placeholders = ", ".join(["?" for _ in job_dict.keys()])
             columns = ", ".join(job_dict.keys())
 
             insert_sql = f"INSERT INTO jobs ({columns}) " f"VALUES ({placeholders})"
             self.conn.execute(insert_sql, list(job_dict.values()))
+            self._record_dedup_keys([job_dict])
+            self._index_for_search([job_dict])
 
             logger.debug(f"Added job: {job_dict['title']} " f"at {job_dict['company']}")
             return True
@@ -344,6 +443,9 @@ class DuckDBJobDatabase:
             # Remove duplicates within batch
             df = df.drop_duplicates(subset=["id"])
 
+            # Parse salary text once here so reads never have to
+            df = fill_salary_columns(df)
+
             # Filter out existing jobs
             existing_ids = self._get_existing_ids(df["id"].tolist())
             df = df[~df["id"].isin(existing_ids)]
@@ -352,8 +454,16 @@ class DuckDBJobDatabase:
                 logger.info("No new jobs to add (all duplicates)")
                 return 0
 
-            # Batch insert using DuckDB's pandas integration
-            self.conn.execute("INSERT INTO jobs SELECT * FROM df")
+            # Batch insert using DuckDB's pandas integration; BY NAME maps the
+            # minimal columns onto the wider jobs table and leaves the rest to defaults
+            self.conn.register("_new_jobs", df)
+            try:
+                self.conn.execute("INSERT INTO jobs BY NAME SELECT * FROM _new_jobs")
+            finally:
+                self.conn.unregister("_new_jobs")
+            new_jobs = df.to_dict("records")
+            self._record_dedup_keys(new_jobs)
+            self._index_for_search(new_jobs)
 
             added_count = len(df)
             logger.info(f"Added {added_count} new jobs to DuckDB")
@@ -407,7 +517,7 @@ class DuckDBJobDatabase:
             query += " ORDER BY created_at DESC"
 
             if limit:
-                query += f" LIMIT {limit}"
+                query += f" LIMIT {int(limit)}"
 
             result = self.conn.execute(query, params).fetchall()
             columns = [desc[0] for desc in self.conn.description]
@@ -428,40 +538,267 @@ class DuckDBJobDatabase:
         """Get top jobs with limit."""
         return self.get_jobs(profile_name=profile_name, limit=limit)
 
-    def search_jobs(self, keyword: str, profile_name: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Search jobs by keyword in title, description, or skills."""
+    def search_jobs(
+        self, keyword: str, profile_name: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search title, company, skills, keywords and description, best match first.
+
+        Uses the full-text index (see ``search_job_ids`` for the query syntax);
+        each job gets its BM25 ``search_score``.
+        """
         try:
-            self._ensure_connection()
+            ranked = self.search_job_ids(keyword)
+            profile = profile_name or self.profile_name
 
-            query = """
-            SELECT * FROM jobs 
-            WHERE (
-                title ILIKE ? OR 
-                description ILIKE ? OR 
-                skills ILIKE ? OR
-                keywords ILIKE ?
+            def in_profile(job: Dict[str, Any]) -> bool:
+                return not profile or job.get("profile_name") == profile
+
+            jobs = self._ranked_rows(ranked, "*", in_profile, limit)
+            scores = dict(ranked)
+            for job in jobs:
+                job["search_score"] = scores[job["id"]]
+            return jobs
+
+        except Exception as e:
+            logger.error(f"Error searching jobs: {e}")
+            return []
+
+    def search_job_ids(
+        self, keyword: str, limit: Optional[int] = None, prefix_last: bool = False
+    ) -> List[Tuple[str, float]]:
+        """
+        Relevance-ranked ``(job_id, score)`` pairs from the full-text index.
+
+        Every word must match; ``word*`` matches a prefix and ``"a b"`` an
+        exact phrase. ``prefix_last`` also treats the last word as a prefix,
+        for search-as-you-type inputs. Searching never writes: while jobs
+        stored before the index existed are not yet indexed (see
+        ``backfill_search_index``), results come from a text scan instead.
+        """
+        query = parse_search_query(keyword, prefix_last=prefix_last)
+        if not query:
+            return []
+
+        self._ensure_connection()
+        unindexed = self.conn.execute(
+            "SELECT (SELECT count(*) FROM jobs) - (SELECT count(*) FROM job_search_docs)"
+        ).fetchone()[0]
+        if unindexed > 0:
+            logger.debug(f"{unindexed} jobs not indexed for search; scanning job text")
+            return self._scan_job_ids(query, limit)
+
+        index = get_job_search_index(self.db_path)
+        index.refresh(self)
+        if not query.phrases:
+            # Jobs deleted since the refresh are dropped by the row lookup
+            ranked = index.search(query, limit=limit)
+            matching = self._ranked_rows(ranked, "id", lambda job: True, limit)
+        else:
+            # Positions are not indexed; check phrases on the ranked candidates
+            ranked = index.search(query)
+            matching = self._ranked_rows(
+                ranked,
+                ", ".join(("id",) + INDEXED_FIELDS),
+                lambda job: phrase_matches(job, query.phrases),
+                limit,
+            )
+        scores = dict(ranked)
+        return [(job["id"], scores[job["id"]]) for job in matching]
+
+    def _scan_job_ids(self, query, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Unranked ``search_job_ids`` fallback that matches the job text with ILIKE."""
+        text = f"lower(concat_ws(' ', {', '.join(INDEXED_FIELDS)}))"
+        conditions = []
+        params: List[Any] = []
+        # Tokens are [a-z0-9+#] only, so they need no LIKE escaping
+        for term, prefix in query.terms:
+            conditions.append(f"{text} LIKE ?")
+            params.append(f"%{term}%")
+        for phrase in query.phrases:
+            conditions.append(f"{text} LIKE ?")
+            params.append(f"%{' '.join(phrase)}%")
+
+        sql = f"SELECT id FROM jobs WHERE {' AND '.join(conditions)} ORDER BY created_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [(row[0], 0.0) for row in self.conn.execute(sql, params).fetchall()]
+
+    def _ranked_rows(
+        self,
+        ranked: List[Tuple[str, float]],
+        projection: str,
+        keep,
+        limit: Optional[int],
+        batch_size: int = 500,
+    ) -> List[Dict[str, Any]]:
+        """Fetch rows in rank order, batch by batch, until ``limit`` rows pass ``keep``."""
+        rows: List[Dict[str, Any]] = []
+        for start in range(0, len(ranked), batch_size):
+            batch_ids = [job_id for job_id, _ in ranked[start : start + batch_size]]
+            result = self.conn.execute(
+                f"SELECT {projection} FROM jobs WHERE id IN (SELECT unnest(?))", [batch_ids]
             )
+            columns = [desc[0] for desc in result.description]
+            by_id = {row[0]: dict(zip(columns, row)) for row in result.fetchall()}
+            for job_id in batch_ids:
+                job = by_id.get(job_id)
+                if job is not None and keep(job):
+                    rows.append(job)
+                    if limit is not None and len(rows) >= limit:
+                        return rows
+        return rows
+
+    def load_search_postings(
+        self, after_seq: int = 0
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, Optional[Tuple[int, int]]]:
+        """
+        Search index rows written after ``after_seq``.
+
+        Returns:
+            ``(docs, postings, kept)``: ``docs`` has ``job_id``, ``seq`` and
+            ``doc_length``; ``postings`` has ``seq``, ``term`` (categorical,
+            rows ordered by term) and ``weight``. ``kept`` is the count and
+            sum of the ``seq`` values at or below ``after_seq`` still in the
+            index, so the caller can tell whether documents it loaded earlier
+            were deleted; it is None when the database was recreated and the
+            caller has to reload from ``after_seq=0``.
+        """
+        self._ensure_connection()
+
+        kept_count, kept_sum, max_seq = self.conn.execute(
             """
-            params = [f"%{keyword}%", f"%{keyword}%", f"%{keyword}%", f"%{keyword}%"]
+            SELECT count(*) FILTER (WHERE seq <= ?),
+                   coalesce(sum(seq) FILTER (WHERE seq <= ?), 0),
+                   coalesce(max(seq), 0)
+            FROM job_search_docs
+            """,
+            [after_seq, after_seq],
+        ).fetchone()
+        if max_seq < after_seq:
+            return pd.DataFrame(), pd.DataFrame(), None
+        kept = (int(kept_count), int(kept_sum))
+        if max_seq <= after_seq:
+            return pd.DataFrame(), pd.DataFrame(), kept
+
+        docs = self.conn.execute(
+            "SELECT job_id, seq, doc_length FROM job_search_docs WHERE seq > ? ORDER BY seq",
+            [after_seq],
+        ).df()
+        # Terms travel as integer codes; strings are only read once per distinct term
+        terms = self.conn.execute(
+            "SELECT DISTINCT term FROM job_search_postings WHERE seq > ? ORDER BY term",
+            [after_seq],
+        ).fetchnumpy()["term"]
+        arrays = self.conn.execute(
+            """
+            SELECT t.term_id, p.seq, p.weight
+            FROM job_search_postings p
+            JOIN (
+                SELECT term, (row_number() OVER (ORDER BY term) - 1)::INTEGER AS term_id
+                FROM (SELECT DISTINCT term FROM job_search_postings WHERE seq > ?)
+            ) t USING (term)
+            WHERE p.seq > ?
+            ORDER BY t.term_id
+            """,
+            [after_seq, after_seq],
+        ).fetchnumpy()
+        postings = pd.DataFrame(
+            {
+                "seq": arrays["seq"],
+                "term": pd.Categorical.from_codes(arrays["term_id"], categories=terms),
+                "weight": arrays["weight"],
+            }
+        )
+        return docs, postings, kept
 
-            # Add profile filter if specified
-            if profile_name:
-                query += " AND profile_name = ?"
-                params.append(profile_name)
-            elif self.profile_name:
-                query += " AND profile_name = ?"
-                params.append(self.profile_name)
+    def backfill_search_index(self) -> int:
+        """Index jobs stored before the search index existed (or whose indexing failed).
 
-            query += " ORDER BY created_at DESC"
+        Run by writers (pipeline, CLI); searches never index on their own.
 
-            result = self.conn.execute(query, params).fetchall()
-            columns = [desc[0] for desc in self.conn.description]
+        Returns:
+            Number of jobs indexed.
+        """
+        try:
+            self._ensure_connection()
+            missing = self.conn.execute(
+                f"""
+                SELECT id, {', '.join(INDEXED_FIELDS)} FROM jobs
+                WHERE id NOT IN (SELECT job_id FROM job_search_docs)
+                """
+            ).df()
+        except Exception as e:
+            logger.warning(f"Could not backfill search index: {e}")
+            return 0
+        if missing.empty or not self._index_for_search(missing.to_dict("records")):
+            return 0
 
-            return [dict(zip(columns, row)) for row in result]
+        logger.info(f"Indexed {len(missing)} existing jobs for search")
+        return len(missing)
+
+    def _index_for_search(self, jobs: List[Dict[str, Any]]) -> bool:
+        """Write (or rewrite) the search postings of stored jobs; False if that failed."""
+        if not jobs:
+            return True
 
+        try:
+            docs, postings = build_search_postings(jobs)
+            self.conn.register("_search_docs", docs)
+            self.conn.register("_search_postings", postings)
+            try:
+                self._delete_search_docs("SELECT job_id FROM _search_docs")
+                self.conn.execute(
+                    """
+                    INSERT INTO job_search_docs (job_id, seq, doc_length)
+                    SELECT job_id, nextval('job_search_seq'), doc_length FROM _search_docs
+                    """
+                )
+                self.conn.execute(
+                    """
+                    INSERT INTO job_search_postings
+                    SELECT d.seq, p.term, p.weight
+                    FROM _search_postings p JOIN job_search_docs d USING (job_id)
+                    ORDER BY d.seq
+                    """
+                )
+            finally:
+                self.conn.unregister("_search_docs")
+                self.conn.unregister("_search_postings")
         except Exception as e:
-            logger.error(f"Error searching jobs: {e}")
-            return []
+            logger.warning(f"Could not index jobs for search: {e}")
+            return False
+        return True
+
+    def _reindex_for_search(self, job_ids: List[str]) -> None:
+        """Rebuild search postings after indexed fields of stored jobs changed."""
+        if not job_ids:
+            return
+
+        try:
+            jobs = self.conn.execute(
+                f"SELECT id, {', '.join(INDEXED_FIELDS)} FROM jobs WHERE id IN (SELECT unnest(?))",
+                [list(job_ids)],
+            ).df()
+        except Exception as e:
+            logger.warning(f"Could not reindex jobs for search: {e}")
+            return
+        self._index_for_search(jobs.to_dict("records"))
+
+    def _delete_search_docs(self, job_ids_sql: str, params: Optional[list] = None) -> None:
+        """Remove the search postings of the jobs selected by ``job_ids_sql``."""
+        self.conn.execute(
+            f"""
+            DELETE FROM job_search_postings WHERE seq IN (
+                SELECT seq FROM job_search_docs WHERE job_id IN ({job_ids_sql})
+            )
+            """,
+            params or [],
+        )
+        self.conn.execute(
+            f"DELETE FROM job_search_docs WHERE job_id IN ({job_ids_sql})", params or []
+        )
 
     def get_analytics_data(self, profile_name: Optional[str] = None) -> Dict[str, Any]:
         """Get analytics data optimized for dashboard display."""
@@ -544,6 +881,76 @@ class DuckDBJobDatabase:
             logger.error(f"Error getting analytics data: {e}")
             return {"total_jobs": 0}
 
+    def get_salary_statistics(self, profile_name: Optional[str] = None) -> Dict[str, Any]:
+        """Salary range statistics and distribution from the parsed salary columns.
+
+        Same shape as ``MarketAnalyzer.calculate_salary_range``: each job counts
+        with the midpoint of its annual ``salary_min``/``salary_max``.
+        """
+        empty = {"min": 0, "max": 0, "median": 0, "average": 0, "count": 0, "distribution": []}
+        try:
+            query = """
+            SELECT salary_min, salary_max, (salary_min + salary_max) / 2 AS midpoint
+            FROM jobs WHERE salary_min IS NOT NULL AND salary_max IS NOT NULL
+            """
+            params = []
+            if profile_name or self.profile_name:
+                query += " AND profile_name = ?"
+                params.append(profile_name or self.profile_name)
+
+            stats = self.conn.execute(
+                f"""
+                WITH salaries AS ({query})
+                SELECT MIN(salary_min), MAX(salary_max), MEDIAN(midpoint), AVG(midpoint), COUNT(*)
+                FROM salaries
+                """,
+                params,
+            ).fetchone()
+            if not stats or not stats[4]:
+                return empty
+
+            buckets = self.conn.execute(
+                f"""
+                WITH salaries AS ({query})
+                SELECT
+                    CASE
+                        WHEN midpoint < 50000 THEN 0
+                        WHEN midpoint < 75000 THEN 1
+                        WHEN midpoint < 100000 THEN 2
+                        WHEN midpoint < 125000 THEN 3
+                        WHEN midpoint < 150000 THEN 4
+                        ELSE 5
+                    END AS bucket,
+                    COUNT(*) AS job_count
+                FROM salaries
+                GROUP BY bucket
+                ORDER BY bucket
+                """,
+                params,
+            ).fetchall()
+
+            labels = ["$0-50k", "$50k-75k", "$75k-100k", "$100k-125k", "$125k-150k", "$150k+"]
+            count = stats[4]
+            return {
+                "min": stats[0],
+                "max": stats[1],
+                "median": round(stats[2], 2),
+                "average": round(stats[3], 2),
+                "count": count,
+                "distribution": [
+                    {
+                        "range": labels[bucket],
+                        "count": job_count,
+                        "percentage": round(job_count / count * 100, 1),
+                    }
+                    for bucket, job_count in buckets
+                ],
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting salary statistics: {e}")
+            return empty
+
     def update_job_status(self, job_id: str, new_status: str) -> bool:
         """Update job status."""
         try:
@@ -557,6 +964,9 @@ class DuckDBJobDatabase:
         """Delete a job."""
         try:
             self.conn.execute("DELETE FROM jobs WHERE id = ?", [job_id])
+            self._delete_search_docs("SELECT ?", [job_id])
+            self._delete_dedup_keys("SELECT ?", [job_id])
+            self._delete_processing_state("SELECT ?", [job_id])
             return True
         except Exception as e:
             logger.error(f"Error deleting job: {e}")
@@ -675,10 +1085,15 @@ class DuckDBJobDatabase:
         return self.get_job_stats(profile_name)
 
     def close(self):
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
-            logger.info("DuckDB connection closed")
+        """Close database connection (or return the pooled cursor)."""
+        if self.conn is None:
+            return
+        if self.pooled:
+            get_connection_pool().release(self.db_path, self.conn)
+            self.conn = None
+            return
+        self.conn.close()
+        logger.info("DuckDB connection closed")
 
     def _dict_to_minimal_dict(self, job_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Convert job dictionary to minimal field dictionary for database."""
@@ -707,6 +1122,11 @@ class DuckDBJobDatabase:
             "company": job_dict.get("company", "Unknown Company"),
             "location": job_dict.get("location", ""),
             "salary_range": job_dict.get("salary") or job_dict.get("salary_range", ""),
+            # Amounts a source already parsed (e.g. JobSpy min_amount) win over the text
+            "salary_min": job_dict.get("salary_min"),
+            "salary_max": job_dict.get("salary_max"),
+            "salary_period": job_dict.get("salary_period"),
+            "salary_currency": job_dict.get("salary_currency"),
             "description": job_dict.get("description", ""),
             "summary": job_dict.get("summary", ""),
             "skills": job_dict.get("skills", ""),
@@ -791,10 +1211,11 @@ class DuckDBJobDatabase:
             self._ensure_connection()
 
             query = """
-            SELECT * FROM jobs 
+            SELECT jobs.* FROM jobs
+            LEFT JOIN job_processing_state s ON s.job_id = jobs.id AND s.scope = ?
             WHERE 1=1
             """
-            params = []
+            params = [DEFAULT_SCOPE]
 
             # Add profile filter
             if profile_name:
@@ -804,9 +1225,13 @@ class DuckDBJobDatabase:
                 query += " AND profile_name = ?"
                 params.append(self.profile_name)
 
-            # Prioritize jobs that haven't been processed yet
-            query += """
-            AND (fit_score IS NULL OR fit_score = 0)
+            # Jobs never processed, or whose text changed since they were. Jobs
+            # without a recorded state fall back to the score check.
+            query += f"""
+            AND CASE
+                WHEN s.job_id IS NULL THEN (fit_score IS NULL OR fit_score = 0)
+                ELSE s.content_hash <> {content_fingerprint_sql("jobs")}
+            END
             ORDER BY created_at DESC
             LIMIT ?
             """
@@ -874,6 +1299,8 @@ class DuckDBJobDatabase:
             """
 
             self.conn.execute(update_sql, update_values)
+            if "skills" in processing_data:
+                self._reindex_for_search([job_id])
             logger.debug(f"Updated processing data for job {job_id}")
             return True
 
@@ -963,6 +1390,8 @@ class DuckDBJobDatabase:
 
             self.conn.execute(query, update_values)
             self.conn.commit()
+            if "skills" in analysis_data:
+                self._reindex_for_search([job_id])
 
             logger.debug(f"Updated job {job_id} with analysis data")
             return True
@@ -972,6 +1401,383 @@ class DuckDBJobDatabase:
             self.conn.rollback()
             return False
 
+    # Columns bulk_update_analysis may write, in SET-clause order
+    ANALYSIS_UPDATE_FIELDS = ("fit_score", "status", "summary", "skills")
+
+    def bulk_update_analysis(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Apply processing/analysis results for a whole batch in one statement.
+
+        Each result needs an ``id`` (or ``job_id``) plus any of
+        ``fit_score``, ``status``, ``summary`` and ``skills``. Fields missing
+        from a result keep their stored value. Rows are staged in a temporary
+        DataFrame relation and written with a single ``UPDATE ... FROM``,
+        replacing the per-job existence check plus UPDATE round trips of
+        ``update_job_analysis``.
+
+        Returns:
+            Dictionary with ``requested``, ``updated`` and ``missing`` counts
+            and the list of ``missing_ids`` that matched no stored job.
+        """
+        rows: Dict[str, Dict[str, Any]] = {}
+        for result in results or []:
+            job_id = result.get("id") or result.get("job_id")
+            if not job_id:
+                continue
+            row = {"id": str(job_id)}
+            for field in self.ANALYSIS_UPDATE_FIELDS:
+                value = result.get(field)
+                if field == "skills" and isinstance(value, (list, tuple, set)):
+                    value = ", ".join(str(skill) for skill in value)
+                row[field] = value
+                # A missing text field (e.g. from a re-score) keeps the stored text
+                row[f"has_{field}"] = field in result and (
+                    value is not None or field not in ("summary", "skills")
+                )
+            # Last result wins when a batch repeats an id
+            rows[row["id"]] = row
+
+        summary = {"requested": len(rows), "updated": 0, "missing": 0, "missing_ids": []}
+        if not rows:
+            return summary
+
+        updates = pd.DataFrame(list(rows.values()))
+        updates["fit_score"] = pd.to_numeric(updates["fit_score"], errors="coerce")
+        for field in ("status", "summary", "skills"):
+            updates[field] = updates[field].astype("object")
+
+        set_clauses = [
+            f"{field} = CASE WHEN u.has_{field} THEN u.{field} ELSE jobs.{field} END"
+            for field in self.ANALYSIS_UPDATE_FIELDS
+        ]
+        set_clauses.append("last_updated = CURRENT_TIMESTAMP")
+
+        try:
+            self._ensure_connection()
+            self.conn.register("_analysis_updates", updates)
+            try:
+                updated = self.conn.execute(
+                    f"""
+                    UPDATE jobs
+                    SET {', '.join(set_clauses)}
+                    FROM _analysis_updates u
+                    WHERE jobs.id = u.id
+                    RETURNING jobs.id
+                    """
+                ).fetchall()
+            finally:
+                self.conn.unregister("_analysis_updates")
+        except Exception as e:
+            logger.error(f"Error in bulk analysis update: {e}")
+            summary["missing"] = len(rows)
+            summary["missing_ids"] = list(rows)
+            return summary
+
+        updated_ids = {row[0] for row in updated}
+        self._reindex_for_search(
+            [job_id for job_id in updated_ids if rows[job_id]["has_skills"]]
+        )
+        summary["updated"] = len(updated_ids)
+        summary["missing_ids"] = [job_id for job_id in rows if job_id not in updated_ids]
+        summary["missing"] = len(summary["missing_ids"])
+
+        logger.info(
+            f"Bulk analysis update: {summary['updated']}/{summary['requested']} jobs updated"
+        )
+        return summary
+
+    def get_processing_candidates(
+        self,
+        profile_hash: str,
+        extraction_version: int,
+        limit: Optional[int] = None,
+        profile_name: Optional[str] = None,
+        scope: str = DEFAULT_SCOPE,
+    ) -> Dict[str, Any]:
+        """Jobs whose processing inputs changed, with the stage to restart from.
+
+        Content fingerprints are computed in DuckDB and compared against
+        ``job_processing_state`` in one query, so unchanged jobs are never
+        fetched. Each returned job carries ``_stage`` (``"extract"`` or
+        ``"rescore"``) and ``_content_hash``. ``scope`` keeps the state of
+        independent processors (pipeline scoring, semantic scoring) apart.
+
+        Returns:
+            Dictionary with the candidate ``jobs`` (extractions first, newest
+            first) and the number of ``unchanged`` jobs that need no work.
+        """
+        self._ensure_connection()
+        if scope == DEFAULT_SCOPE:
+            self._backfill_processing_state(extraction_version)
+
+        where = ""
+        params: List[Any] = []
+        profile_name = profile_name or self.profile_name
+        if profile_name:
+            where = "WHERE j.profile_name = ?"
+            params.append(profile_name)
+
+        query = f"""
+            WITH current_jobs AS (
+                SELECT j.*, {content_fingerprint_sql("j")} AS _content_hash
+                FROM jobs j
+                {where}
+            ),
+            planned AS (
+                SELECT
+                    c.*,
+                    CASE
+                        WHEN s.job_id IS NULL
+                            OR s.content_hash <> c._content_hash
+                            OR s.extraction_version IS DISTINCT FROM ?
+                        THEN '{STAGE_EXTRACT}'
+                        WHEN s.profile_hash IS DISTINCT FROM ? THEN '{STAGE_RESCORE}'
+                    END AS _stage,
+                    COUNT(*) OVER () AS _total
+                FROM current_jobs c
+                LEFT JOIN job_processing_state s ON s.job_id = c.id AND s.scope = ?
+            )
+            SELECT * EXCLUDE (_total), COUNT(*) OVER () AS _candidates, _total
+            FROM planned
+            WHERE _stage IS NOT NULL
+            ORDER BY _stage, created_at DESC
+        """
+        params.extend([extraction_version, profile_hash, scope])
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        try:
+            result = self.conn.execute(query, params)
+            columns = [desc[0] for desc in result.description]
+            rows = result.fetchall()
+        except Exception as e:
+            logger.error(f"Error planning job processing: {e}")
+            return {"jobs": [], "unchanged": 0}
+
+        jobs = [dict(zip(columns, row)) for row in rows]
+        if jobs:
+            unchanged = jobs[0]["_total"] - jobs[0]["_candidates"]
+        else:
+            count_query = "SELECT COUNT(*) FROM jobs j " + where
+            unchanged = self.conn.execute(count_query, params[: 1 if where else 0]).fetchone()[0]
+        for job in jobs:
+            del job["_total"], job["_candidates"]
+
+        return {"jobs": jobs, "unchanged": unchanged}
+
+    def record_processing_state(
+        self, states: List[Dict[str, Any]], scope: str = DEFAULT_SCOPE
+    ) -> int:
+        """Upsert the inputs jobs were processed with.
+
+        Each state needs ``job_id``, ``content_hash``, ``extraction_version``
+        and ``profile_hash``.
+
+        Returns:
+            Number of jobs recorded.
+        """
+        if not states:
+            return 0
+
+        frame = pd.DataFrame(
+            states, columns=["job_id", "content_hash", "extraction_version", "profile_hash"]
+        ).drop_duplicates(subset=["job_id"], keep="last")
+
+        try:
+            self._ensure_connection()
+            self.conn.register("_processing_state", frame)
+            try:
+                self.conn.execute(
+                    """
+                    INSERT OR REPLACE INTO job_processing_state
+                    SELECT job_id, ?, content_hash, extraction_version, profile_hash,
+                           CURRENT_TIMESTAMP
+                    FROM _processing_state
+                    """,
+                    [scope],
+                )
+            finally:
+                self.conn.unregister("_processing_state")
+        except Exception as e:
+            logger.error(f"Error recording processing state: {e}")
+            return 0
+
+        return len(frame)
+
+    def record_processing_state_for_jobs(
+        self,
+        job_ids: List[str],
+        extraction_version: int,
+        profile_hash: str,
+        scope: str = DEFAULT_SCOPE,
+    ) -> int:
+        """Upsert processing state for stored jobs, fingerprinting their current rows.
+
+        Used for jobs processed outside a plan (freshly scraped batches), whose
+        content hash was never computed.
+
+        Returns:
+            Number of jobs recorded.
+        """
+        if not job_ids:
+            return 0
+
+        try:
+            self._ensure_connection()
+            recorded = self.conn.execute(
+                f"""
+                INSERT OR REPLACE INTO job_processing_state
+                SELECT id, ?, {content_fingerprint_sql("jobs")}, ?, ?, CURRENT_TIMESTAMP
+                FROM jobs
+                WHERE id IN (SELECT unnest(?::VARCHAR[]))
+                RETURNING job_id
+                """,
+                [scope, extraction_version, profile_hash, [str(i) for i in job_ids]],
+            ).fetchall()
+        except Exception as e:
+            logger.error(f"Error recording processing state: {e}")
+            return 0
+
+        return len(recorded)
+
+    def _backfill_processing_state(self, extraction_version: int) -> None:
+        """Record jobs scored before processing state existed as extracted, profile unknown.
+
+        They are re-scored once instead of being re-extracted.
+        """
+        try:
+            inserted = self.conn.execute(
+                f"""
+                INSERT INTO job_processing_state
+                    (job_id, scope, content_hash, extraction_version, profile_hash)
+                SELECT id, ?, {content_fingerprint_sql("jobs")}, ?, NULL
+                FROM jobs
+                WHERE fit_score IS NOT NULL AND fit_score <> 0
+                  AND id NOT IN (SELECT job_id FROM job_processing_state WHERE scope = ?)
+                RETURNING job_id
+                """,
+                [DEFAULT_SCOPE, extraction_version, DEFAULT_SCOPE],
+            ).fetchall()
+            if inserted:
+                logger.info(f"Backfilled processing state for {len(inserted)} scored jobs")
+        except Exception as e:
+            logger.warning(f"Could not backfill processing state: {e}")
+
+    def backfill_salary_columns(self, batch_size: int = 50000) -> int:
+        """Parse ``salary_range`` into the salary columns for jobs stored before they existed.
+
+        Only jobs without parsed amounts are read, so running it again is cheap.
+
+        Args:
+            batch_size: Jobs parsed and written per round trip
+
+        Returns:
+            Number of jobs that got salary values
+        """
+        updated = 0
+        last_id = ""
+        try:
+            while True:
+                rows = self.conn.execute(
+                    """
+                    SELECT id, salary_range FROM jobs
+                    WHERE salary_min IS NULL AND salary_max IS NULL
+                      AND coalesce(salary_range, '') <> '' AND id > ?
+                    ORDER BY id
+                    LIMIT ?
+                    """,
+                    [last_id, batch_size],
+                ).df()
+                if rows.empty:
+                    break
+                last_id = rows["id"].iloc[-1]
+
+                parsed = parse_salary_frame(rows["salary_range"])
+                parsed.insert(0, "id", rows["id"])
+                parsed = parsed.dropna(subset=["salary_min"])
+                if parsed.empty:
+                    continue
+
+                self.conn.register("_parsed_salaries", parsed)
+                try:
+                    assignments = ", ".join(f"{c} = p.{c}" for c in SALARY_COLUMNS)
+                    self.conn.execute(
+                        f"UPDATE jobs SET {assignments} FROM _parsed_salaries p "
+                        "WHERE jobs.id = p.id"
+                    )
+                finally:
+                    self.conn.unregister("_parsed_salaries")
+                updated += len(parsed)
+        except Exception as e:
+            logger.error(f"Error backfilling salary columns: {e}")
+
+        logger.info(f"Backfilled salary columns for {updated} jobs")
+        return updated
+
+    def _record_dedup_keys(self, jobs: List[Dict[str, Any]]) -> None:
+        """Store cross-run dedup keys for newly inserted jobs."""
+        if not jobs:
+            return
+
+        try:
+            keys = [job_dedup_keys(job) for job in jobs]
+            frame = pd.DataFrame({"job_id": [str(job["id"]) for job in jobs]})
+            for column in DEDUP_KEY_COLUMNS:
+                frame[column] = pd.array([key[column] for key in keys], dtype="UInt64")
+
+            self.conn.register("_dedup_keys", frame)
+            try:
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO job_dedup_keys BY NAME SELECT * FROM _dedup_keys"
+                )
+            finally:
+                self.conn.unregister("_dedup_keys")
+        except Exception as e:
+            logger.warning(f"Could not record dedup keys: {e}")
+
+    def _delete_dedup_keys(self, job_ids_sql: str, params: Optional[list] = None) -> None:
+        """Forget the dedup keys of the jobs selected by ``job_ids_sql``."""
+        self.conn.execute(
+            f"DELETE FROM job_dedup_keys WHERE job_id IN ({job_ids_sql})", params or []
+        )
+
+    def _delete_processing_state(self, job_ids_sql: str, params: Optional[list] = None) -> None:
+        """Forget the processing state of the jobs selected by ``job_ids_sql``.
+
+        A job re-added under the same id must be planned for processing again.
+        """
+        self.conn.execute(
+            f"DELETE FROM job_processing_state WHERE job_id IN ({job_ids_sql})", params or []
+        )
+
+    def load_dedup_keys(self) -> Dict[str, set]:
+        """Return every stored dedup key, backfilling jobs saved before keys existed."""
+        self._ensure_connection()
+
+        missing = self.conn.execute(
+            """
+            SELECT id, title, company, location, url
+            FROM jobs
+            WHERE id NOT IN (SELECT job_id FROM job_dedup_keys)
+            """
+        ).fetchall()
+        if missing:
+            backfill = [
+                dict(zip(("id", "title", "company", "location", "url"), row)) for row in missing
+            ]
+            self._record_dedup_keys(backfill)
+            logger.info(f"Backfilled dedup keys for {len(backfill)} jobs")
+
+        rows = self.conn.execute(
+            f"SELECT {', '.join(DEDUP_KEY_COLUMNS)} FROM job_dedup_keys"
+        ).fetchall()
+        keys = {column: set() for column in DEDUP_KEY_COLUMNS}
+        for row in rows:
+            for column, value in zip(DEDUP_KEY_COLUMNS, row):
+                if value is not None:
+                    keys[column].add(value)
+        return keys
+
     def get_job_by_url(self, url: str) -> Optional[Dict[str, Any]]:
         """Get a job by its URL to check for duplicates."""
         try:
@@ -1008,10 +1814,23 @@ class DuckDBJobDatabase:
                 "status": "status",
                 "application_status": "application_status",
                 "source": "source",
+                "salary_range": "salary_range",
+                "salary_min": "salary_min",
+                "salary_max": "salary_max",
+                "salary_period": "salary_period",
+                "salary_currency": "salary_currency",
                 # Note: search_term and search_location are not in the
                 # minimal DuckDB schema, so they are ignored
             }
 
+            # New salary text re-fills the parsed columns, as add_job does
+            if (
+                "salary_range" in metadata
+                and metadata.get("salary_min") is None
+                and metadata.get("salary_max") is None
+            ):
+                metadata = {**metadata, **parse_salary_text(metadata["salary_range"])}
+
             for key, value in metadata.items():
                 if key in allowed_mappings:
                     column_name = allowed_mappings[key]
@@ -1051,6 +1870,11 @@ class DuckDBJobDatabase:
             else:
                 # Delete all jobs if no profile specified
                 self.conn.execute("DELETE FROM jobs")
+            self._delete_search_docs("SELECT job_id FROM job_search_docs EXCEPT SELECT id FROM jobs")
+            self._delete_dedup_keys("SELECT job_id FROM job_dedup_keys EXCEPT SELECT id FROM jobs")
+            self._delete_processing_state(
+                "SELECT job_id FROM job_processing_state EXCEPT SELECT id FROM jobs"
+            )
             
             self.conn.commit()
             logger.debug(f"Cleared all jobs from database (profile: {profile_name or self.profile_name or 'all'})")
@@ -0,0 +1,343 @@
+"""
+Job Search Index
+Inverted index with BM25 ranking for keyword search over stored jobs.
+
+Jobs are tokenized once, when they are stored: title, company, skills,
+keywords and description become weighted term counts in the
+``job_search_postings`` table (title and tag fields count more than body
+text). ``JobSearchIndex`` holds those postings in memory as per-term numpy
+arrays and on each refresh reads only the postings written since the last
+one, so a search never scans job text.
+
+Query syntax:
+- ``python developer`` - every word must match
+- ``dev*`` - prefix match
+- ``"data engineer"`` - exact phrase
+"""
+
+import bisect
+import logging
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Term weight per indexed field (weighted term frequency, BM25F-style)
+FIELD_WEIGHTS: Dict[str, float] = {
+    "title": 3.0,
+    "company": 2.0,
+    "skills": 2.0,
+    "keywords": 2.0,
+    "description": 1.0,
+}
+INDEXED_FIELDS = tuple(FIELD_WEIGHTS)
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or our the to we "
+    "will with you your".split()
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+_PHRASE_RE = re.compile(r'"([^"]*)"')
+
+
+def tokenize(text: Any) -> List[str]:
+    """Lowercase word tokens without stopwords (keeps ``c++``/``c#`` intact)."""
+    if not text:
+        return []
+    return [token for token in _TOKEN_RE.findall(str(text).lower()) if token not in STOPWORDS]
+
+
+def job_term_weights(job: Mapping[str, Any]) -> Dict[str, float]:
+    """Weighted term frequencies of a job's indexed fields."""
+    weights: Counter = Counter()
+    for field_name, field_weight in FIELD_WEIGHTS.items():
+        for token, count in Counter(tokenize(job.get(field_name))).items():
+            weights[token] += count * field_weight
+    return dict(weights)
+
+
+def build_search_postings(jobs: Iterable[Mapping[str, Any]]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Postings for a batch of jobs.
+
+    Returns:
+        ``(docs, postings)``: ``docs`` has ``job_id`` and ``doc_length``,
+        ``postings`` has ``job_id``, ``term`` and ``weight``.
+    """
+    doc_ids: List[str] = []
+    doc_lengths: List[float] = []
+    posting_ids: List[str] = []
+    terms: List[str] = []
+    weights: List[float] = []
+    for job in jobs:
+        job_id = str(job["id"])
+        term_weights = job_term_weights(job)
+        doc_ids.append(job_id)
+        doc_lengths.append(sum(term_weights.values()))
+        posting_ids.extend([job_id] * len(term_weights))
+        terms.extend(term_weights)
+        weights.extend(term_weights.values())
+
+    docs = pd.DataFrame({"job_id": doc_ids, "doc_length": doc_lengths})
+    postings = pd.DataFrame({"job_id": posting_ids, "term": terms, "weight": weights})
+    return docs, postings
+
+
+@dataclass
+class SearchQuery:
+    """Parsed search text: required terms (exact or prefix) and phrases."""
+
+    terms: List[Tuple[str, bool]] = field(default_factory=list)
+    phrases: List[List[str]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.terms)
+
+
+def parse_search_query(text: str, prefix_last: bool = False) -> SearchQuery:
+    """
+    Parse search text into required terms and phrases.
+
+    Args:
+        text: User search text
+        prefix_last: Treat the last word as a prefix unless it is followed
+            by whitespace (search-as-you-type)
+    """
+    query = SearchQuery()
+    text = text or ""
+
+    def add(token: str, prefix: bool) -> None:
+        if (token, prefix) not in query.terms:
+            query.terms.append((token, prefix))
+
+    for phrase in _PHRASE_RE.findall(text):
+        tokens = tokenize(phrase)
+        for token in tokens:
+            add(token, False)
+        if len(tokens) > 1:
+            query.phrases.append(tokens)
+
+    words = _PHRASE_RE.sub(" ", text).split()
+    typing_last = prefix_last and bool(words) and text == text.rstrip() and not text.endswith('"')
+    for position, word in enumerate(words):
+        tokens = tokenize(word.rstrip("*"))
+        for token_position, token in enumerate(tokens):
+            is_last = token_position == len(tokens) - 1
+            prefix = is_last and (
+                word.endswith("*") or (typing_last and position == len(words) - 1)
+            )
+            add(token, prefix)
+    return query
+
+
+def phrase_matches(job: Mapping[str, Any], phrases: List[List[str]]) -> bool:
+    """Whether every phrase occurs, in order, within one indexed field of the job."""
+    field_tokens = [tokenize(job.get(field_name)) for field_name in INDEXED_FIELDS]
+    for phrase in phrases:
+        size = len(phrase)
+        if not any(
+            tokens[start : start + size] == phrase
+            for tokens in field_tokens
+            for start in range(len(tokens) - size + 1)
+        ):
+            return False
+    return True
+
+
+class JobSearchIndex:
+    """
+    In-memory BM25 index over one database's ``job_search_postings``.
+
+    Documents are addressed by their ``seq`` (assigned when a job is indexed
+    or re-indexed), which doubles as the position in the dense score arrays.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._postings: Dict[str, List[Tuple[np.ndarray, np.ndarray]]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        self._job_ids = np.empty(0, dtype=object)
+        self._lengths = np.zeros(0, dtype=np.float64)
+        self._live = np.zeros(0, dtype=bool)
+        self._seq_by_job: Dict[str, int] = {}
+        self._seq_sum = 0
+        self._total_length = 0.0
+        self.last_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._seq_by_job)
+
+    def refresh(self, db) -> int:
+        """
+        Pull postings written since the last refresh from ``db``.
+
+        ``db`` is a ``DuckDBJobDatabase`` (see ``load_search_postings``).
+        Reloads everything when documents were deleted since the last
+        refresh. Returns the number of documents added.
+        """
+        with self._lock:
+            docs, postings, kept = db.load_search_postings(self.last_seq)
+            if kept is None or kept != self._expected_kept(docs):
+                self._reset()
+                docs, postings, _ = db.load_search_postings(0)
+            if docs.empty:
+                return 0
+            self._add(docs, postings)
+            return len(docs)
+
+    def _expected_kept(self, docs: pd.DataFrame) -> Tuple[int, int]:
+        """Count and seq sum of loaded documents that should still be stored.
+
+        Re-indexing a job replaces its row with one carrying a newer seq, so
+        loaded documents re-appearing in ``docs`` are expected to be gone;
+        any other shortfall means documents were deleted.
+        """
+        count, seq_sum = len(self._seq_by_job), self._seq_sum
+        if not docs.empty:
+            for job_id in docs["job_id"]:
+                previous = self._seq_by_job.get(job_id)
+                if previous is not None:
+                    count -= 1
+                    seq_sum -= previous
+        return count, seq_sum
+
+    def _add(self, docs: pd.DataFrame, postings: pd.DataFrame) -> None:
+        seqs = docs["seq"].to_numpy(dtype=np.int64)
+        self._grow(int(seqs.max()) + 1)
+
+        for job_id, seq, length in zip(docs["job_id"], seqs, docs["doc_length"]):
+            previous = self._seq_by_job.get(job_id)
+            if previous is not None:
+                # Re-indexed job: its old postings stop counting
+                self._live[previous] = False
+                self._total_length -= self._lengths[previous]
+                self._seq_sum -= previous
+            self._seq_by_job[job_id] = seq
+            self._seq_sum += int(seq)
+            self._job_ids[seq] = job_id
+            self._lengths[seq] = length
+            self._live[seq] = True
+            self._total_length += length
+
+        if not postings.empty:
+            # Rows arrive grouped by term; split them into one array pair per term
+            codes = postings["term"].cat.codes.to_numpy()
+            terms = postings["term"].cat.categories
+            posting_seqs = postings["seq"].to_numpy(dtype=np.int64)
+            posting_weights = postings["weight"].to_numpy(dtype=np.float64)
+            boundaries = np.flatnonzero(np.diff(codes)) + 1
+            starts = np.concatenate(([0], boundaries))
+            ends = np.concatenate((boundaries, [len(codes)]))
+            for start, end in zip(starts, ends):
+                term = terms[codes[start]]
+                if term not in self._postings:
+                    self._postings[term] = []
+                    self._vocabulary_dirty = True
+                self._postings[term].append((posting_seqs[start:end], posting_weights[start:end]))
+
+        self.last_seq = max(self.last_seq, int(seqs.max()))
+
+    def _grow(self, size: int) -> None:
+        if size <= len(self._live):
+            return
+        capacity = max(size, 2 * len(self._live), 1024)
+        extra = capacity - len(self._live)
+        self._job_ids = np.concatenate((self._job_ids, np.empty(extra, dtype=object)))
+        self._lengths = np.concatenate((self._lengths, np.zeros(extra)))
+        self._live = np.concatenate((self._live, np.zeros(extra, dtype=bool)))
+
+    def _term_postings(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        chunks = self._postings[term]
+        if len(chunks) > 1:
+            # Compact chunks appended by incremental refreshes
+            chunks[:] = [
+                (np.concatenate([c[0] for c in chunks]), np.concatenate([c[1] for c in chunks]))
+            ]
+        return chunks[0]
+
+    def _expand(self, term: str, prefix: bool) -> List[str]:
+        if not prefix:
+            return [term] if term in self._postings else []
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        start = bisect.bisect_left(self._vocabulary, term)
+        end = bisect.bisect_left(self._vocabulary, term + "\uffff")
+        return self._vocabulary[start:end]
+
+    def search(self, query: SearchQuery, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Rank documents matching every query term by BM25.
+
+        Phrases are not checked here (positions are not indexed); callers
+        verify them on the ranked candidates with ``phrase_matches``.
+
+        Returns:
+            ``(job_id, score)`` pairs, best first
+        """
+        with self._lock:
+            if not query or not self._seq_by_job:
+                return []
+
+            size = len(self._live)
+            doc_count = len(self._seq_by_job)
+            length_norm = BM25_K1 * (
+                1 - BM25_B + BM25_B * self._lengths / (self._total_length / doc_count)
+            )
+            scores = np.zeros(size)
+            matched = np.zeros(size, dtype=np.int32)
+
+            for term, prefix in query.terms:
+                expanded = self._expand(term, prefix)
+                if not expanded:
+                    return []
+                postings = [self._term_postings(t) for t in expanded]
+                seqs = np.concatenate([p[0] for p in postings])
+                weights = np.concatenate([p[1] for p in postings])
+                live = self._live[seqs]
+                seqs, weights = seqs[live], weights[live]
+                if len(expanded) > 1:
+                    # A document matching several expansions counts once
+                    seqs, inverse = np.unique(seqs, return_inverse=True)
+                    weights = np.bincount(inverse, weights=weights)
+                if not len(seqs):
+                    return []
+
+                idf = np.log(1 + (doc_count - len(seqs) + 0.5) / (len(seqs) + 0.5))
+                scores[seqs] += idf * weights * (BM25_K1 + 1) / (weights + length_norm[seqs])
+                matched[seqs] += 1
+
+            candidates = np.flatnonzero(matched == len(query.terms))
+            if limit is not None and len(candidates) > limit:
+                top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+                candidates = candidates[top]
+            ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+            return [(self._job_ids[seq], float(scores[seq])) for seq in ranked]
+
+
+_indexes: Dict[str, JobSearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_job_search_index(db_path: str) -> JobSearchIndex:
+    """Process-wide search index for a database file."""
+    db_path = os.path.abspath(db_path)
+    with _indexes_lock:
+        if db_path not in _indexes:
+            _indexes[db_path] = JobSearchIndex()
+        return _indexes[db_path]
@@ -0,0 +1,120 @@
+"""
+Near-Duplicate Candidate Index
+Bigram inverted index that narrows fuzzy duplicate checks to plausible pairs.
+
+The deduplicators compare jobs with ``difflib.SequenceMatcher.ratio()`` on
+normalized title, company and location. Running that against every kept
+job makes deduplication O(N²) string diffs. This index computes, for all
+kept jobs at once with numpy, an upper bound on each of those ratios:
+
+- length bound: ``ratio <= 2 * min(len_a, len_b) / (len_a + len_b)``
+- bigram bound: the ``m`` matching blocks of total size ``M`` share at
+  least ``M - m`` bigrams, and consecutive blocks are separated by at least
+  one unmatched character, so ``m <= T - 2M + 1`` with ``T = len_a + len_b``.
+  Hence ``M <= (shared_bigrams + T + 1) / 3``.
+
+Callers keep their own thresholds and only run the exact comparison on rows
+whose bounds can still reach them, so results and reason strings are
+unchanged while most pairs are rejected without any Python-level diff.
+"""
+
+from array import array
+from typing import Callable, Dict, List
+
+import numpy as np
+
+FIELDS = ("title", "company", "location")
+
+# Slack so float rounding never drops a pair sitting exactly on a threshold
+_EPSILON = 1e-9
+
+
+def _bigrams(text: str) -> List[str]:
+    return [text[i : i + 2] for i in range(len(text) - 1)]
+
+
+class _FieldIndex:
+    """Inverted bigram postings and lengths for one normalized field."""
+
+    def __init__(self):
+        self.postings: Dict[str, array] = {}
+        self.lengths = array("i")
+        self.present = array("b")
+
+    def add(self, row: int, norm: str, present: bool) -> None:
+        self.lengths.append(len(norm))
+        self.present.append(1 if present else 0)
+        for gram in _bigrams(norm):
+            posting = self.postings.get(gram)
+            if posting is None:
+                posting = self.postings[gram] = array("i")
+            posting.append(row)
+
+    def upper_bounds(self, norm: str, present: bool) -> np.ndarray:
+        """Upper bound of the similarity between ``norm`` and every indexed row."""
+        size = len(self.lengths)
+        if not present:
+            # calculate_text_similarity returns 0.0 when either side is empty
+            return np.zeros(size)
+
+        postings = [
+            np.frombuffer(self.postings[gram], dtype=np.int32)
+            for gram in set(_bigrams(norm))
+            if gram in self.postings
+        ]
+        if postings:
+            shared = np.bincount(np.concatenate(postings), minlength=size)
+        else:
+            shared = np.zeros(size)
+
+        lengths = np.frombuffer(self.lengths, dtype=np.int32).astype(np.float64)
+        total = lengths + len(norm)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            length_bound = 2 * np.minimum(lengths, len(norm)) / total
+            bigram_bound = 2 * (shared + total + 1) / (3 * total)
+        bounds = np.minimum(np.minimum(length_bound, bigram_bound), 1.0) + _EPSILON
+        # Two empty normalized strings compare equal (ratio 1.0)
+        bounds[total == 0] = 1.0
+        bounds[np.frombuffer(self.present, dtype=np.int8) == 0] = 0.0
+        return bounds
+
+
+class NearDuplicateIndex:
+    """
+    Candidate generator for fuzzy duplicate checks over kept jobs.
+
+    Rows are numbered in insertion order so they line up with the caller's
+    list of unique jobs.
+    """
+
+    def __init__(self, normalize: Callable[[str], str]):
+        self.normalize = normalize
+        self._fields = {field: _FieldIndex() for field in FIELDS}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _prepare(self, value) -> tuple:
+        text = value if isinstance(value, str) else ("" if value is None else str(value))
+        return self.normalize(text), bool(text)
+
+    def add(self, job: Dict) -> None:
+        """Index a job that was kept as unique."""
+        for field, index in self._fields.items():
+            norm, present = self._prepare(job.get(field, ""))
+            index.add(self._size, norm, present)
+        self._size += 1
+
+    def similarity_bounds(self, job: Dict) -> Dict[str, np.ndarray]:
+        """Per-field similarity upper bounds of ``job`` against every indexed row."""
+        bounds = {}
+        for field, index in self._fields.items():
+            norm, present = self._prepare(job.get(field, ""))
+            bounds[field] = index.upper_bounds(norm, present)
+        return bounds
+
+    @staticmethod
+    def rows(mask: np.ndarray) -> List[int]:
+        """Indexed rows selected by a candidate mask, in insertion order."""
+        return np.flatnonzero(mask).tolist()
@@ -0,0 +1,93 @@
+"""
+Persistent Dedup Index
+Compact cross-run record of jobs already stored in a profile database.
+
+Each stored job contributes three 64-bit keys to the ``job_dedup_keys``
+table: its URL, its normalized title|company|location signature and its
+normalized title|company pair. These are the same identities the in-memory
+``SmartJobDeduplicator`` trackers use within one run. The pipeline loads
+them once as integer sets and drops already-known jobs before enrichment
+and Stage 1, instead of re-fetching and re-scoring them on every scrape.
+"""
+
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.smart_deduplication import SmartJobDeduplicator
+
+_normalizer = SmartJobDeduplicator()
+
+DEDUP_KEY_COLUMNS = ("url_hash", "signature_hash", "title_company_hash")
+
+
+def _hash64(text: str) -> int:
+    """First 64 bits of the MD5 digest as an unsigned integer."""
+    return int.from_bytes(hashlib.md5(text.encode()).digest()[:8], "big")
+
+
+def job_dedup_keys(job: Dict[str, Any]) -> Dict[str, Optional[int]]:
+    """Compute the persisted dedup keys for a job dictionary."""
+    url = job.get("url") or job.get("job_url") or ""
+    title_company_key = (
+        f"{_normalizer.normalize_text(job.get('title', ''))}|"
+        f"{_normalizer.normalize_company(job.get('company', ''))}"
+    )
+    return {
+        "url_hash": _hash64(url) if url else None,
+        "signature_hash": int(_normalizer.generate_job_signature(job)[:16], 16),
+        "title_company_hash": _hash64(title_company_key),
+    }
+
+
+class PersistentDedupIndex:
+    """In-memory view of the ``job_dedup_keys`` table for one pipeline run."""
+
+    def __init__(
+        self,
+        url_hashes: Optional[Iterable[int]] = None,
+        signature_hashes: Optional[Iterable[int]] = None,
+        title_company_hashes: Optional[Iterable[int]] = None,
+    ):
+        self.url_hashes: Set[int] = set(url_hashes or ())
+        self.signature_hashes: Set[int] = set(signature_hashes or ())
+        self.title_company_hashes: Set[int] = set(title_company_hashes or ())
+
+    @classmethod
+    def load(cls, db) -> "PersistentDedupIndex":
+        """Load the keys of every job stored in ``db`` (a ``DuckDBJobDatabase``)."""
+        keys = db.load_dedup_keys()
+        return cls(keys["url_hash"], keys["signature_hash"], keys["title_company_hash"])
+
+    def __len__(self) -> int:
+        return len(self.signature_hashes)
+
+    def contains(self, job: Dict[str, Any]) -> Tuple[bool, str]:
+        """Whether the job is already stored, with the matching reason."""
+        keys = job_dedup_keys(job)
+        if keys["url_hash"] is not None and keys["url_hash"] in self.url_hashes:
+            return True, "Known URL"
+        if keys["signature_hash"] in self.signature_hashes:
+            return True, "Known job signature"
+        if keys["title_company_hash"] in self.title_company_hashes:
+            return True, "Known title-company pair"
+        return False, ""
+
+    def add(self, job: Dict[str, Any]) -> None:
+        """Record a job as stored."""
+        keys = job_dedup_keys(job)
+        if keys["url_hash"] is not None:
+            self.url_hashes.add(keys["url_hash"])
+        self.signature_hashes.add(keys["signature_hash"])
+        self.title_company_hashes.add(keys["title_company_hash"])
+
+    def new_job_mask(self, jobs: List[Dict[str, Any]]) -> List[bool]:
+        """``True`` for each job that is not yet stored."""
+        return [not self.contains(job)[0] for job in jobs]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Number of known keys per kind."""
+        return {
+            "known_urls": len(self.url_hashes),
+            "known_signatures": len(self.signature_hashes),
+            "known_title_company_pairs": len(self.title_company_hashes),
+        }
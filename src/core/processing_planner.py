@@ -0,0 +1,202 @@
+"""
+Processing Planner
+Incremental reprocessing driven by stored input fingerprints.
+
+Each processed job gets a row in ``job_processing_state`` per scope (the
+two-stage pipeline, semantic scoring, ...) recording what it was processed
+with:
+
+- ``content_hash``: MD5 of the job text fields, computed by DuckDB from the
+  stored row (see ``CONTENT_FINGERPRINT_FIELDS``)
+- ``extraction_version``: ``EXTRACTION_VERSION`` of the extraction rules
+- ``profile_hash``: fingerprint of the profile and scoring config
+
+The planner compares those against the current row, profile and rules in a
+single query and splits the jobs that need work by stage:
+
+- ``extract``: never processed, text changed or extraction rules changed,
+  so the full pipeline runs
+- ``rescore``: only the profile or config changed, so the stored fields are
+  re-scored without re-extraction
+
+Everything else is skipped, so a nightly run touches only the delta instead
+of every job whose score happens to be ``NULL`` or ``0``.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction rules change so every job is re-extracted once
+EXTRACTION_VERSION = 1
+
+# Job columns whose text feeds extraction and scoring
+CONTENT_FINGERPRINT_FIELDS = ("title", "company", "location", "description", "summary")
+
+# Profile keys that change without affecting scores; entry points differ in
+# whether they set profile_name, so it is ignored too
+_VOLATILE_PROFILE_KEYS = frozenset(
+    {
+        "profile_name",
+        "last_updated",
+        "updated_at",
+        "created_at",
+        "last_login",
+        "last_run",
+        "last_scraped",
+    }
+)
+
+_FIELD_SEPARATOR = "\x1f"
+
+STAGE_EXTRACT = "extract"
+STAGE_RESCORE = "rescore"
+
+# State written by the two-stage pipeline; other scorers use their own scope
+DEFAULT_SCOPE = "pipeline"
+
+
+def content_fingerprint_sql(alias: str = "jobs") -> str:
+    """SQL expression computing the content fingerprint of a ``jobs`` row."""
+    parts = " || chr(31) || ".join(
+        f"coalesce(CAST({alias}.{column} AS VARCHAR), '')"
+        for column in CONTENT_FINGERPRINT_FIELDS
+    )
+    return f"md5({parts})"
+
+
+def content_fingerprint(job: Mapping[str, Any]) -> str:
+    """Python equivalent of ``content_fingerprint_sql`` for a job dictionary."""
+    text = _FIELD_SEPARATOR.join(
+        "" if job.get(column) is None else str(job.get(column))
+        for column in CONTENT_FINGERPRINT_FIELDS
+    )
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def profile_fingerprint(
+    profile: Optional[Mapping[str, Any]], config: Optional[Mapping[str, Any]] = None
+) -> str:
+    """
+    Fingerprint of everything scoring depends on besides the job itself.
+
+    Key order and volatile bookkeeping keys (timestamps) do not change it.
+    """
+    relevant = {k: v for k, v in (profile or {}).items() if k not in _VOLATILE_PROFILE_KEYS}
+    payload = json.dumps({"profile": relevant, "config": config or {}}, sort_keys=True, default=str)
+    return hashlib.md5(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ProcessingPlan:
+    """Jobs to process for one run, split by the stage they have to restart from."""
+
+    extract: List[Dict[str, Any]] = field(default_factory=list)
+    rescore: List[Dict[str, Any]] = field(default_factory=list)
+    unchanged: int = 0
+    profile_hash: str = ""
+    extraction_version: int = EXTRACTION_VERSION
+    content_hashes: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def jobs(self) -> List[Dict[str, Any]]:
+        """All planned jobs, full extractions first."""
+        return self.extract + self.rescore
+
+    def __len__(self) -> int:
+        return len(self.extract) + len(self.rescore)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Number of jobs per stage."""
+        return {
+            STAGE_EXTRACT: len(self.extract),
+            STAGE_RESCORE: len(self.rescore),
+            "unchanged": self.unchanged,
+        }
+
+
+class ProcessingPlanner:
+    """Plans and records incremental processing for one profile database."""
+
+    def __init__(
+        self,
+        db,
+        profile: Optional[Mapping[str, Any]] = None,
+        config: Optional[Mapping[str, Any]] = None,
+        extraction_version: int = EXTRACTION_VERSION,
+        scope: str = DEFAULT_SCOPE,
+    ):
+        """
+        Args:
+            db: ``DuckDBJobDatabase`` for the profile
+            profile: Profile the jobs are scored against
+            config: Scoring configuration that should also trigger a re-score
+            extraction_version: Version of the extraction rules in use
+            scope: Which processor's state to plan against
+        """
+        self.db = db
+        self.profile_hash = profile_fingerprint(profile, config)
+        self.extraction_version = extraction_version
+        self.scope = scope
+
+    def plan(self, limit: Optional[int] = None) -> ProcessingPlan:
+        """Select the jobs whose inputs changed since they were last processed."""
+        candidates = self.db.get_processing_candidates(
+            self.profile_hash, self.extraction_version, limit=limit, scope=self.scope
+        )
+
+        plan = ProcessingPlan(
+            unchanged=candidates["unchanged"],
+            profile_hash=self.profile_hash,
+            extraction_version=self.extraction_version,
+        )
+        for job in candidates["jobs"]:
+            stage = job.pop("_stage")
+            plan.content_hashes[str(job["id"])] = job.pop("_content_hash")
+            if stage == STAGE_EXTRACT:
+                plan.extract.append(job)
+            else:
+                plan.rescore.append(job)
+
+        logger.info(f"Processing plan: {plan.get_stats()}")
+        return plan
+
+    def mark_processed(self, plan: ProcessingPlan, job_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Record planned jobs as up to date with the plan's inputs.
+
+        Args:
+            plan: Plan the jobs were processed from
+            job_ids: Jobs that were processed successfully (default: all planned)
+
+        Returns:
+            Number of jobs recorded
+        """
+        ids = plan.content_hashes.keys() if job_ids is None else [str(i) for i in job_ids]
+        states = [
+            {
+                "job_id": job_id,
+                "content_hash": plan.content_hashes[job_id],
+                "extraction_version": plan.extraction_version,
+                "profile_hash": plan.profile_hash,
+            }
+            for job_id in ids
+            if job_id in plan.content_hashes
+        ]
+        return self.db.record_processing_state(states, scope=self.scope)
+
+    def mark_jobs_processed(self, job_ids: Iterable[str]) -> int:
+        """
+        Record stored jobs processed outside a plan (freshly scraped batches)
+        as up to date with this planner's profile and rules.
+
+        Returns:
+            Number of jobs recorded
+        """
+        return self.db.record_processing_state_for_jobs(
+            [str(i) for i in job_ids], self.extraction_version, self.profile_hash, scope=self.scope
+        )
@@ -0,0 +1,249 @@
+"""
+Salary Columns
+Parses ``salary_range`` text into the numeric ``jobs`` salary columns.
+
+Salary text is parsed once, when a job is stored (or by the backfill for
+older databases), into:
+
+- ``salary_min`` / ``salary_max``: annual equivalents, so hourly and yearly
+  postings filter and sort together
+- ``salary_period``: period the posting states (hourly, daily, weekly, ...)
+- ``salary_currency``: ISO code, ``CAD`` unless the text says otherwise
+
+Filters, sorting and charts then read plain numeric columns instead of
+re-parsing strings per job per request. ``parse_salary_frame`` parses a whole
+column at once with pandas string methods; ``parse_salary_text`` is the same
+parser for a single string.
+
+Conversion factors and plausibility bounds mirror ``config/salary_config.json``.
+"""
+
+import math
+import re
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+SALARY_COLUMNS = ("salary_min", "salary_max", "salary_period", "salary_currency")
+
+DEFAULT_CURRENCY = "CAD"
+DEFAULT_PERIOD = "yearly"
+
+# Annual multipliers per stated period (salary_config.json: period_mappings)
+PERIOD_MULTIPLIERS = {
+    "hourly": 2080,
+    "daily": 260,
+    "weekly": 52,
+    "bi-weekly": 26,
+    "monthly": 12,
+    "yearly": 1,
+}
+
+# Plausible annual amounts (salary_config.json: validation_rules)
+MIN_ANNUAL_SALARY = 15000
+MAX_ANNUAL_SALARY = 1000000
+
+_CURRENCY_SYMBOL = r"US\$|USD|CA\$|C\$|CAD|AU\$|A\$|AUD|\$|€|£|¥|₹"
+_AMOUNT = r"\d[\d,]*(?:\.\d+)?"
+_UNIT = r"[km](?![a-z])|thousand|million"
+
+# An amount (or range of amounts) in the text. Amounts start at a number
+# boundary and "401k"/"401(k)" (the retirement plan) is never an amount.
+# A trailing "+" ("100k+", "$120,000+") marks an open-ended minimum.
+_SALARY_RE = re.compile(
+    rf"(?P<symbol>{_CURRENCY_SYMBOL})?\s*(?<![\w.,])(?!401\s*\(?k\b)"
+    rf"(?P<low>{_AMOUNT})\s*(?P<low_unit>{_UNIT})?"
+    rf"(?:(?P<open_ended>\+)|\s*(?:-|–|—|to)\s*(?:{_CURRENCY_SYMBOL})?\s*"
+    rf"(?P<high>{_AMOUNT})\s*(?P<high_unit>{_UNIT})?)?",
+    re.IGNORECASE,
+)
+
+# One named group per period; the earliest mention in the text wins
+_PERIOD_RE = re.compile(
+    r"(?P<hourly>hour|\bhr\b)|(?P<daily>\bday\b|daily)|(?P<bi_weekly>bi-?weekly)"
+    r"|(?P<weekly>week)|(?P<monthly>month)|(?P<yearly>year|annual|annum|\byr\b)",
+    re.IGNORECASE,
+)
+
+_CURRENCY_CODES = {
+    "us$": "USD",
+    "usd": "USD",
+    "ca$": "CAD",
+    "c$": "CAD",
+    "cad": "CAD",
+    "au$": "AUD",
+    "a$": "AUD",
+    "aud": "AUD",
+    "$": DEFAULT_CURRENCY,
+    "€": "EUR",
+    "£": "GBP",
+    "¥": "JPY",
+    "₹": "INR",
+}
+_CURRENCY_CODE_RE = re.compile(r"\b(USD|CAD|AUD|EUR|GBP)\b", re.IGNORECASE)
+
+# Words that make a lone amount without currency or period a salary
+_SALARY_CONTEXT_RE = re.compile(r"salary|\bpay\b|compensation|\bwage|\brate\b", re.IGNORECASE)
+
+_UNIT_MULTIPLIERS = {"k": 1000, "t": 1000, "m": 1000000}
+
+
+def _amounts(values: pd.Series, units: pd.Series) -> pd.Series:
+    """Numeric amounts with their k/m/thousand/million unit applied."""
+    numbers = pd.to_numeric(values.str.replace(",", "", regex=False), errors="coerce")
+    multipliers = units.str.lower().str[0].map(_UNIT_MULTIPLIERS).fillna(1)
+    return numbers * multipliers
+
+
+def _salary_parts(texts: pd.Series) -> pd.DataFrame:
+    """``_SALARY_RE`` groups of the amount each text most likely states as its salary.
+
+    That is the first amount carrying a currency or a k/m unit ("2 years
+    experience, $90k" gives 90k), or the first amount when none does.
+    """
+    positions = texts.reset_index(drop=True)
+    columns = list(_SALARY_RE.groupindex)
+    matches = positions.str.extractall(_SALARY_RE)
+    if matches.empty:
+        parts = pd.DataFrame(index=positions.index, columns=columns, dtype=object)
+    else:
+        marked = matches[["symbol", "low_unit", "high_unit"]].notna().any(axis=1)
+        ranked = matches.assign(_plain=~marked).reset_index()
+        row = ranked.columns[0]
+        ranked = ranked.sort_values([row, "_plain", "match"], kind="stable")
+        parts = ranked.drop_duplicates(row).set_index(row)[columns].reindex(positions.index)
+    return parts.set_axis(texts.index)
+
+
+def parse_salary_frame(texts: pd.Series) -> pd.DataFrame:
+    """
+    Parse a column of salary text into the salary columns.
+
+    Args:
+        texts: Salary strings (``None``/NaN allowed)
+
+    Returns:
+        DataFrame with ``SALARY_COLUMNS`` on the same index; rows without a
+        plausible salary are all-null
+    """
+    texts = texts.where(texts.notna(), "").astype(str)
+
+    # Postings repeat the same few salary strings; parse each distinct one once
+    codes, uniques = pd.factorize(texts)
+    if len(uniques) < len(texts):
+        parsed = _parse_unique(pd.Series(uniques, dtype=object))
+        return parsed.iloc[codes].set_axis(texts.index)
+    return _parse_unique(texts)
+
+
+def _parse_unique(texts: pd.Series) -> pd.DataFrame:
+    """``parse_salary_frame`` body for non-null strings."""
+    parts = _salary_parts(texts)
+
+    low = _amounts(parts["low"], parts["low_unit"])
+    high = _amounts(parts["high"], parts["high_unit"])
+
+    # "80-100k": a unit after the range applies to both ends
+    high_multiplier = parts["high_unit"].str.lower().str[0].map(_UNIT_MULTIPLIERS)
+    shared_unit = parts["low_unit"].isna() & high_multiplier.notna() & (low < 1000)
+    low = low.where(~shared_unit, low * high_multiplier)
+    high = high.fillna(low)
+
+    found = texts.str.extract(_PERIOD_RE).notna()
+    stated = found.idxmax(axis=1).str.replace("_", "-", regex=False).where(found.any(axis=1))
+
+    # Bare small yearly numbers ("80 - 100") are thousands, as in the config parsers
+    unitless = parts["low_unit"].isna() & parts["high_unit"].isna()
+    in_thousands = stated.isna() & unitless & (high < 1000)
+    low = low.where(~in_thousands, low * 1000)
+    high = high.where(~in_thousands, high * 1000)
+
+    period = stated.fillna(DEFAULT_PERIOD)
+    multiplier = period.map(PERIOD_MULTIPLIERS)
+    annual_low = low * multiplier
+    annual_high = high * multiplier
+
+    # A lone bare number ("5000 signing bonus") needs a currency, a period,
+    # or salary wording to count; ranges like "70-85k" and open-ended
+    # minimums like "100k+" stand on their own
+    named = texts.str.extract(_CURRENCY_CODE_RE)[0].str.upper()
+    salary_like = (
+        parts["symbol"].notna()
+        | named.notna()
+        | stated.notna()
+        | parts["high"].notna()
+        | parts["open_ended"].notna()
+        | texts.str.contains(_SALARY_CONTEXT_RE)
+    )
+
+    valid = (
+        salary_like
+        & annual_low.between(MIN_ANNUAL_SALARY, MAX_ANNUAL_SALARY)
+        & (annual_high <= MAX_ANNUAL_SALARY)
+        & (annual_high >= annual_low)
+    )
+
+    currency = parts["symbol"].str.lower().map(_CURRENCY_CODES)
+    currency = currency.where(currency.notna() & (currency != DEFAULT_CURRENCY), named)
+    currency = currency.fillna(DEFAULT_CURRENCY)
+
+    # "100k+" states only a minimum
+    bounded = parts["open_ended"].isna()
+
+    return pd.DataFrame(
+        {
+            "salary_min": annual_low.where(valid).round(2),
+            "salary_max": annual_high.where(valid & bounded).round(2),
+            "salary_period": period.where(valid),
+            "salary_currency": currency.where(valid),
+        },
+        index=texts.index,
+    )
+
+
+def parse_salary_text(text: Optional[str]) -> Dict[str, Any]:
+    """Parse one salary string; values are ``None`` when no salary is found."""
+    if not text:
+        return dict.fromkeys(SALARY_COLUMNS)
+    row = parse_salary_frame(pd.Series([text], dtype=object)).iloc[0].to_dict()
+    return {
+        column: None if isinstance(value, float) and math.isnan(value) else value
+        for column, value in row.items()
+    }
+
+
+def fill_salary_columns(df: pd.DataFrame, text_column: str = "salary_range") -> pd.DataFrame:
+    """
+    Fill the salary columns of ``df`` from ``text_column`` where both amounts are missing.
+
+    Amounts a source already provided (e.g. JobSpy ``min_amount``) are kept.
+    """
+    df = df.copy()
+    for column in SALARY_COLUMNS:
+        if column not in df:
+            df[column] = None
+    for column in ("salary_min", "salary_max"):
+        df[column] = pd.to_numeric(df[column], errors="coerce").astype(float)
+    for column in ("salary_period", "salary_currency"):
+        df[column] = df[column].astype(object)
+
+    if text_column not in df:
+        return df
+
+    missing = (df["salary_min"].isna() & df["salary_max"].isna()).to_numpy()
+    if missing.any():
+        parsed = parse_salary_frame(df.loc[missing, text_column])
+        for column in SALARY_COLUMNS:
+            df.loc[missing, column] = parsed[column]
+    df["salary_period"] = df["salary_period"].where(df["salary_period"].notna(), None)
+    df["salary_currency"] = df["salary_currency"].where(df["salary_currency"].notna(), None)
+    return df
+
+
+def salary_overlap_sql(min_param: str = "?", max_param: str = "?") -> str:
+    """SQL condition for jobs whose annual salary range overlaps ``[min, max]``."""
+    return (
+        f"(coalesce(salary_max, salary_min) >= {min_param} "
+        f"AND coalesce(salary_min, salary_max) <= {max_param})"
+    )
+
@@ -5,11 +5,14 @@ Advanced job deduplication using multiple similarity metrics.
 
 import re
 import hashlib
-from typing import List, Dict, Set, Tuple, Any
+from typing import List, Dict, Set, Tuple, Any, Optional
 from difflib import SequenceMatcher
 from urllib.parse import urlparse
 from rich.console import Console
 
+from src.core.dedup_normalization import normalize_text
+from src.core.near_duplicate_index import NearDuplicateIndex
+
 console = Console()
 
 
@@ -21,28 +24,15 @@ class SmartJobDeduplicator:
         self.processed_hashes: Set[str] = set()
         self.processed_urls: Set[str] = set()
         self.title_company_pairs: Set[str] = set()
+        # Jobs kept by deduplicate_incremental, with their candidate index
+        self.kept_jobs: List[Dict[str, Any]] = []
+        self.kept_index = NearDuplicateIndex(self.normalize_text)
 
     def normalize_text(self, text: str) -> str:
         """Normalize text for comparison."""
         if not text:
             return ""
-
-        # Convert to lowercase
-        text = text.lower()
-
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-
-        # Remove common variations
-        text = re.sub(r"\b(jr|sr|senior|junior|lead|principal)\b", "", text)
-        text = re.sub(r"\b(i|ii|iii|iv|v)\b", "", text)  # Roman numerals
-        text = re.sub(r"\([^)]*\)", "", text)  # Remove parentheses content
-        text = re.sub(r"\s*[-–—]\s*", " ", text)  # Normalize dashes
-
-        # Remove extra spaces again
-        text = re.sub(r"\s+", " ", text).strip()
-
-        return text
+        return normalize_text(text)
 
     def normalize_company(self, company: str) -> str:
         """Normalize company name for comparison."""
@@ -101,11 +91,17 @@ class SmartJobDeduplicator:
         return hashlib.md5(signature.encode()).hexdigest()
 
     def is_duplicate_job(
-        self, job: Dict[str, Any], existing_jobs: List[Dict[str, Any]]
+        self,
+        job: Dict[str, Any],
+        existing_jobs: List[Dict[str, Any]],
+        index: Optional[NearDuplicateIndex] = None,
     ) -> Tuple[bool, str]:
         """
         Check if job is a duplicate of existing jobs.
 
+        When ``index`` mirrors ``existing_jobs`` row for row, the similarity
+        checks only visit jobs whose bounds can reach the thresholds below.
+
         Returns:
             Tuple of (is_duplicate, reason)
         """
@@ -131,6 +127,19 @@ class SmartJobDeduplicator:
             return True, "Title-Company pair match"
 
         # 4. Advanced similarity checks
+        if index is not None:
+            # Keep only jobs whose similarity bounds can satisfy a rule below
+            bounds = index.similarity_bounds(job)
+            title_ub, company_ub, location_ub = (
+                bounds["title"],
+                bounds["company"],
+                bounds["location"],
+            )
+            mask = ((title_ub >= 0.9) & (company_ub >= 0.8)) | (
+                (title_ub >= 0.8) & (company_ub >= 0.7) & (location_ub >= 0.7)
+            )
+            existing_jobs = [existing_jobs[row] for row in index.rows(mask)]
+
         for existing_job in existing_jobs:
             # Skip if same URL (already checked above)
             if job_url and job_url == existing_job.get("url", ""):
@@ -140,11 +149,15 @@ class SmartJobDeduplicator:
             title_similarity = self.calculate_text_similarity(
                 job_title, existing_job.get("title", "")
             )
+            if title_similarity < 0.8:
+                continue  # Below every rule's title threshold
 
             # Check company similarity
             company_similarity = self.calculate_text_similarity(
                 job_company, existing_job.get("company", "")
             )
+            if company_similarity < 0.7:
+                continue  # Below every rule's company threshold
 
             # Check location similarity
             location_similarity = self.calculate_text_similarity(
@@ -194,6 +207,35 @@ class SmartJobDeduplicator:
         Returns:
             Tuple of (unique_jobs, stats)
         """
+        return self._deduplicate_into(jobs, [], NearDuplicateIndex(self.normalize_text))
+
+    def deduplicate_incremental(
+        self, jobs: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Deduplicate one batch of a stream against every job kept so far.
+
+        Unlike ``deduplicate_job_list``, the similarity checks also compare
+        against jobs kept from earlier batches, so a posting seen again in a
+        later search (e.g. cross-posted on another board) is still caught.
+
+        Returns:
+            Tuple of (unique jobs from this batch, stats)
+        """
+        return self._deduplicate_into(jobs, self.kept_jobs, self.kept_index)
+
+    def reset_incremental(self) -> None:
+        """Forget the jobs kept by ``deduplicate_incremental``."""
+        self.kept_jobs = []
+        self.kept_index = NearDuplicateIndex(self.normalize_text)
+
+    def _deduplicate_into(
+        self,
+        jobs: List[Dict[str, Any]],
+        kept_jobs: List[Dict[str, Any]],
+        index: NearDuplicateIndex,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """Deduplicate ``jobs`` against ``kept_jobs`` (mirrored by ``index``), extending both."""
         if not jobs:
             return [], {"total": 0, "unique": 0, "duplicates": 0}
 
@@ -204,7 +246,7 @@ class SmartJobDeduplicator:
         console.print(f"[cyan]🔍 Smart deduplication: Processing {len(jobs)} jobs...[/cyan]")
 
         for i, job in enumerate(jobs):
-            is_duplicate, reason = self.is_duplicate_job(job, unique_jobs)
+            is_duplicate, reason = self.is_duplicate_job(job, kept_jobs, index)
 
             if is_duplicate:
                 duplicate_count += 1
@@ -219,6 +261,8 @@ class SmartJobDeduplicator:
                     )
             else:
                 unique_jobs.append(job)
+                kept_jobs.append(job)
+                index.add(job)
                 self.add_job_to_tracking(job)
 
         # Show deduplication summary
@@ -7,8 +7,9 @@ across all JobLens components. It wraps the SmartJobDeduplicator with
 additional convenience methods for different use cases.
 """
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from src.core.smart_deduplication import SmartJobDeduplicator, smart_deduplicate_jobs
+from src.core.persistent_dedup_index import PersistentDedupIndex
 from rich.console import Console
 
 console = Console()
@@ -22,9 +23,23 @@ class UnifiedJobDeduplicator:
     using the SmartJobDeduplicator for all actual processing.
     """
 
-    def __init__(self, similarity_threshold: float = 0.85):
+    def __init__(
+        self,
+        similarity_threshold: float = 0.85,
+        known_index: Optional[PersistentDedupIndex] = None,
+    ):
         self.deduplicator = SmartJobDeduplicator(similarity_threshold)
         self.similarity_threshold = similarity_threshold
+        self.known_index = known_index
+
+    def load_known_jobs(self, db) -> int:
+        """
+        Load cross-run dedup keys from a ``DuckDBJobDatabase``.
+
+        Jobs already stored there are dropped by ``deduplicate_jobs``.
+        """
+        self.known_index = PersistentDedupIndex.load(db)
+        return len(self.known_index)
 
     def deduplicate_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -32,10 +47,32 @@ class UnifiedJobDeduplicator:
 
         This is the main interface used by pipeline components.
         """
+        return self._deduplicate(jobs, self.deduplicator.deduplicate_job_list)
+
+    def deduplicate_incremental(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Deduplicate one batch of a stream against everything kept so far.
+
+        Used by streaming pipelines that receive jobs search by search, so
+        fuzzy duplicates are caught across searches as well as within one.
+        """
+        return self._deduplicate(jobs, self.deduplicator.deduplicate_incremental)
+
+    def _deduplicate(self, jobs: List[Dict[str, Any]], deduplicate) -> List[Dict[str, Any]]:
         if not jobs:
             return jobs
 
-        unique_jobs, stats = self.deduplicator.deduplicate_job_list(jobs)
+        if self.known_index is not None:
+            total = len(jobs)
+            jobs = [job for job in jobs if not self.known_index.contains(job)[0]]
+            if len(jobs) < total:
+                console.print(
+                    f"[green]📚 Skipped {total - len(jobs)} jobs already stored in the database[/green]"
+                )
+            if not jobs:
+                return jobs
+
+        unique_jobs, stats = deduplicate(jobs)
 
         # Log performance improvement
         if stats["duplicates"] > 0:
@@ -75,13 +112,17 @@ class UnifiedJobDeduplicator:
 
     def get_stats(self) -> Dict[str, int]:
         """Get current deduplication statistics."""
-        return self.deduplicator.get_deduplication_stats()
+        stats = self.deduplicator.get_deduplication_stats()
+        if self.known_index is not None:
+            stats.update(self.known_index.get_stats())
+        return stats
 
     def reset_tracking(self) -> None:
         """Reset the deduplication tracking (start fresh)."""
         self.deduplicator.processed_hashes.clear()
         self.deduplicator.processed_urls.clear()
         self.deduplicator.title_company_pairs.clear()
+        self.deduplicator.reset_incremental()
 
 
 # Global deduplicator instance for performance (reuse tracking across calls)
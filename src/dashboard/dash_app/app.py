@@ -68,6 +68,7 @@ dashboard.layout = dbc.Container(
         # Data stores
         dcc.Store(id="profile-store", storage_type="session"),
         dcc.Store(id="jobs-data-store", storage_type="session"),
+        dcc.Store(id="jobs-data-version-store", storage_type="session"),
         dcc.Store(id="settings-store", storage_type="session"),
         dcc.Store(id="processing-quick-log-store", data={}, storage_type="session"),
         dcc.Interval(id="auto-refresh-interval", interval=30000, n_intervals=0, max_intervals=-1),
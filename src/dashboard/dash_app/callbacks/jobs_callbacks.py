@@ -10,62 +10,43 @@ import pandas as pd
 logger = logging.getLogger(__name__)
 
 
-def apply_job_filters(df, search_term, company_filter, status_filter, start_date, end_date):
-    """Apply filters to the jobs dataframe"""
-    filtered_df = df.copy()
-
-    if search_term:
-        mask = (
-            filtered_df["title"].str.contains(search_term, case=False, na=False)
-            | filtered_df["company"].str.contains(search_term, case=False, na=False)
-            | filtered_df["location"].str.contains(search_term, case=False, na=False)
-        )
-        filtered_df = filtered_df[mask]
-
-    if company_filter and company_filter != "all":
-        filtered_df = filtered_df[filtered_df["company"] == company_filter]
-
-    if status_filter and status_filter != "all":
-        filtered_df = filtered_df[filtered_df["status"] == status_filter]
-
-    if start_date and end_date:
-        filtered_df["created_at"] = pd.to_datetime(filtered_df["created_at"])
-        filtered_df = filtered_df[
-            (filtered_df["created_at"] >= start_date) & (filtered_df["created_at"] <= end_date)
-        ]
-
-    return filtered_df
+def _jobs_version(profile_name):
+    """Stats-snapshot version of a profile's jobs, as kept in jobs-data-version-store."""
+    from src.dashboard.services.stats_snapshot import get_stats_snapshot
 
+    return [profile_name, *map(str, get_stats_snapshot().get(profile_name).version)]
 
-def calculate_job_metrics(df):
-    """Calculate job metrics for dashboard"""
-    total_jobs = len(df)
-    new_jobs = len(df[df["status"] == "new"])
-    ready_jobs = len(df[df["status"] == "ready_to_apply"])
-    applied_jobs = len(df[df["status"] == "applied"])
 
-    return (f"{total_jobs:,}", f"{new_jobs:,}", f"{ready_jobs:,}", f"{applied_jobs:,}")
-
-
-def format_table_data(df):
-    """Format dataframe for table display"""
-    return df.to_dict("records")
+def _unchanged_refresh_tick(profile_name, loaded_version):
+    """Whether only an auto-refresh tick fired and the jobs have not changed since."""
+    triggered = [trigger["prop_id"] for trigger in callback_context.triggered]
+    return (
+        triggered == ["auto-refresh-interval.n_intervals"]
+        and _jobs_version(profile_name) == loaded_version
+    )
 
 
 def register_jobs_callbacks(app):
     """Register all jobs-related callbacks"""
 
-    # Data loading callback
+    # Data loading callback. The jobs table, cards and status tabs query
+    # DuckDB directly; this store only feeds the analytics charts, so it holds
+    # the narrow analytics view and interval ticks reload it only when the
+    # table's version probe has changed.
     @app.callback(
-        Output("jobs-data-store", "data"),
+        [
+            Output("jobs-data-store", "data"),
+            Output("jobs-data-version-store", "data"),
+        ],
         [
             Input("profile-store", "data"),
             Input("auto-refresh-interval", "n_intervals"),
             Input("jobs-refresh-btn", "n_clicks"),
         ],
+        State("jobs-data-version-store", "data"),
         prevent_initial_call=False,
     )
-    def load_jobs_data(profile_data, n_intervals, refresh_clicks):
+    def load_jobs_data(profile_data, n_intervals, refresh_clicks, loaded_version):
         """Load jobs data for current profile"""
         try:
             # Try different import methods for data_loader
@@ -126,71 +107,130 @@ def register_jobs_callbacks(app):
                             "description": "Frontend React/TypeScript",
                             "job_url": ("https://example.com/jobs/" "frontend-developer-3"),
                         },
-                    ]
+                    ], None
 
             # Get profile from app instance
             if not hasattr(app, "profile_name") or app.profile_name is None:
                 logger.error("No profile set on app instance")
-                return []
+                return [], None
             
             profile_name = app.profile_name
 
+            version = _jobs_version(profile_name)
+            triggered = [trigger["prop_id"] for trigger in callback_context.triggered]
+            if triggered == ["auto-refresh-interval.n_intervals"] and version == loaded_version:
+                return no_update, no_update
+
             data_loader = DataLoader()
-            df = data_loader.load_jobs_data(profile_name)
+            df = data_loader.load_jobs_data(profile_name, view="analytics")
 
-            return df.to_dict("records")
+            return df.to_dict("records"), version
 
         except Exception as e:
             logger.error(f"Error loading jobs data: {e}")
-            return []
+            return [], None
 
     @app.callback(
         [
             Output("jobs-table", "data"),
+            Output("jobs-table", "page_count"),
+            Output("jobs-table", "tooltip_data"),
             Output("total-jobs-metric", "children"),
             Output("new-jobs-metric", "children"),
             Output("ready-jobs-metric", "children"),
             Output("applied-jobs-metric", "children"),
         ],
         [
-            Input("jobs-data-store", "data"),
+            Input("jobs-table", "page_current"),
+            Input("jobs-table", "page_size"),
+            Input("jobs-table", "sort_by"),
+            Input("jobs-table", "filter_query"),
             Input("jobs-search", "value"),
             Input("jobs-company-filter", "value"),
             Input("jobs-status-filter", "value"),
             Input("jobs-date-filter", "start_date"),
             Input("jobs-date-filter", "end_date"),
+            Input("jobs-refresh-btn", "n_clicks"),
+            Input("auto-refresh-interval", "n_intervals"),
         ],
+        State("jobs-data-version-store", "data"),
     )
     def update_jobs_table(
-        jobs_data, search_term, company_filter, status_filter, start_date, end_date
+        page_current,
+        page_size,
+        sort_by,
+        filter_query,
+        search_term,
+        company_filter,
+        status_filter,
+        start_date,
+        end_date,
+        refresh_clicks,
+        n_intervals,
+        loaded_version,
     ):
-        """Update the jobs table based on filters"""
+        """Query and format only the visible page of the jobs table"""
         try:
-            if not jobs_data:
-                return [], "0", "0", "0", "0"
-
-            df = pd.DataFrame(jobs_data)
-            filtered_df = apply_job_filters(
-                df, search_term, company_filter, status_filter, start_date, end_date
+            from src.dashboard.dash_app.components.jobs.job_table import (
+                create_table_tooltips,
+                format_job_data_for_table,
+            )
+            from src.dashboard.services.jobs_table_query import (
+                query_jobs_page,
+                query_jobs_table_metrics,
             )
-            metrics = calculate_job_metrics(df)
-            table_data = format_table_data(filtered_df)
 
-            return table_data, *metrics
+            profile_name = getattr(app, "profile_name", None)
+            if not profile_name:
+                return [], 1, [], "0", "0", "0", "0"
+            if _unchanged_refresh_tick(profile_name, loaded_version):
+                return (no_update,) * 7
+
+            page = query_jobs_page(
+                profile_name,
+                page_current=page_current or 0,
+                page_size=page_size or 25,
+                sort_by=sort_by,
+                filter_query=filter_query,
+                filters={
+                    "search": search_term,
+                    "company": company_filter,
+                    "status": status_filter,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                },
+            )
+            table_data = format_job_data_for_table(page.rows)
+            metrics = query_jobs_table_metrics(profile_name)
+
+            return (
+                table_data,
+                page.page_count,
+                create_table_tooltips(table_data),
+                f"{metrics['total']:,}",
+                f"{metrics['new']:,}",
+                f"{metrics['ready_to_apply']:,}",
+                f"{metrics['applied']:,}",
+            )
 
         except Exception as e:
             logger.error(f"Error updating jobs table: {e}")
-            return [], "Error", "Error", "Error", "Error"
+            return [], 1, [], "Error", "Error", "Error", "Error"
 
-    @app.callback(Output("jobs-company-filter", "options"), Input("jobs-data-store", "data"))
-    def update_company_filter_options(jobs_data):
+    @app.callback(
+        Output("jobs-company-filter", "options"),
+        [Input("profile-store", "data"), Input("jobs-refresh-btn", "n_clicks")],
+    )
+    def update_company_filter_options(profile_data, refresh_clicks):
         """Update company filter dropdown options"""
         try:
-            if not jobs_data:
+            from src.dashboard.services.jobs_table_query import query_job_companies
+
+            profile_name = getattr(app, "profile_name", None)
+            if not profile_name:
                 return [{"label": "All Companies", "value": "all"}]
 
-            df = pd.DataFrame(jobs_data)
-            companies = sorted(df["company"].dropna().unique())
+            companies = query_job_companies(profile_name)
 
             options = [{"label": "All Companies", "value": "all"}]
             options.extend([{"label": company, "value": company} for company in companies])
@@ -226,10 +266,29 @@ def register_jobs_callbacks(app):
 
         return no_update
 
-    @app.callback(Output("jobs-cards-container", "children"), Input("jobs-data-store", "data"))
-    def update_jobs_cards(jobs_data):
+    @app.callback(
+        Output("jobs-cards-container", "children"),
+        [
+            Input("profile-store", "data"),
+            Input("jobs-refresh-btn", "n_clicks"),
+            Input("auto-refresh-interval", "n_intervals"),
+        ],
+        State("jobs-data-version-store", "data"),
+    )
+    def update_jobs_cards(profile_data, refresh_clicks, n_intervals, loaded_version):
         """Update jobs card view"""
         try:
+            from src.dashboard.services.jobs_table_query import query_jobs_page
+
+            profile_name = getattr(app, "profile_name", None)
+            if not profile_name:
+                return "No jobs available"
+            if _unchanged_refresh_tick(profile_name, loaded_version):
+                return no_update
+
+            # Only the 12 newest jobs are shown, so only they are fetched
+            page = query_jobs_page(profile_name, page_current=0, page_size=12)
+            jobs_data = page.rows.to_dict("records")
             if not jobs_data:
                 return "No jobs available"
 
@@ -237,7 +296,7 @@ def register_jobs_callbacks(app):
             import dash_bootstrap_components as dbc
 
             cards = []
-            for job in jobs_data[:12]:  # Show first 12 jobs
+            for job in jobs_data:
                 cards.append(dbc.Col(create_job_card(job), width=6, lg=4, className="mb-3"))
 
             return dbc.Row(cards)
@@ -252,33 +311,40 @@ def register_jobs_callbacks(app):
     @app.callback(
         Output("job-tracking-content", "children"),
         Input("job-status-tabs", "active_tab"),
-        State("jobs-data-store", "data"),
     )
-    def update_job_tracking_content(active_tab, jobs_data):
+    def update_job_tracking_content(active_tab):
         """Update content based on selected status tab"""
-        if not jobs_data:
+        from src.dashboard.services.jobs_table_query import query_status_counts
+
+        profile_name = getattr(app, "profile_name", None)
+        try:
+            status_counts = query_status_counts(profile_name) if profile_name else {}
+        except Exception as e:
+            logger.error(f"Error counting jobs by status: {e}")
+            status_counts = {}
+        if not status_counts:
             return html.P("No jobs data available", className="text-muted")
 
-        df = pd.DataFrame(jobs_data)
+        total_jobs = sum(status_counts.values())
 
         if active_tab == "scraped":
-            filtered_df = df[df["status"] == "scraped"]
+            filtered_count = status_counts.get("scraped", 0)
             title = "🔍 Scraped Jobs"
         elif active_tab == "processed":
-            filtered_df = df[df["status"] == "processed"]
+            filtered_count = status_counts.get("processed", 0)
             title = "⚙️ Processed Jobs"
         elif active_tab == "applied":
-            filtered_df = df[df["status"] == "applied"]
+            filtered_count = status_counts.get("applied", 0)
             title = "✅ Applied Jobs"
         else:
-            filtered_df = df
+            filtered_count = total_jobs
             title = "📊 All Jobs"
 
         return html.Div(
             [
-                html.H5(f"{title} ({len(filtered_df)} jobs)"),
+                html.H5(f"{title} ({filtered_count} jobs)"),
                 html.P(
-                    f"Status breakdown: {len(filtered_df)} out of " f"{len(df)} total jobs",
+                    f"Status breakdown: {filtered_count} out of " f"{total_jobs} total jobs",
                     className="text-muted",
                 ),
             ]
@@ -289,20 +355,54 @@ def register_jobs_callbacks(app):
         Output("jobs-csv-download", "data"),
         Input("export-jobs-btn", "n_clicks"),
         [
-            State("jobs-table", "data"),
-            State("jobs-table", "derived_virtual_data"),
+            State("jobs-table", "sort_by"),
+            State("jobs-table", "filter_query"),
+            State("jobs-search", "value"),
+            State("jobs-company-filter", "value"),
+            State("jobs-status-filter", "value"),
+            State("jobs-date-filter", "start_date"),
+            State("jobs-date-filter", "end_date"),
             State("profile-store", "data"),
         ],
         prevent_initial_call=True,
     )
-    def export_jobs_to_csv(export_clicks, table_data, filtered_data, profile_data):
+    def export_jobs_to_csv(
+        export_clicks,
+        sort_by,
+        filter_query,
+        search_term,
+        company_filter,
+        status_filter,
+        start_date,
+        end_date,
+        profile_data,
+    ):
         """Export jobs data to CSV file"""
         if not export_clicks:
             return no_update
 
         try:
-            # Use filtered data if available, otherwise use all table data
-            export_data = filtered_data if filtered_data else table_data
+            from src.dashboard.dash_app.components.jobs.job_table import (
+                format_job_data_for_table,
+            )
+            from src.dashboard.services.jobs_table_query import query_jobs_page
+
+            # The table only holds the visible page; export every matching row
+            page = query_jobs_page(
+                app.profile_name,
+                page_size=None,
+                description_chars=None,
+                sort_by=sort_by,
+                filter_query=filter_query,
+                filters={
+                    "search": search_term,
+                    "company": company_filter,
+                    "status": status_filter,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                },
+            )
+            export_data = format_job_data_for_table(page.rows)
 
             if not export_data:
                 return no_update
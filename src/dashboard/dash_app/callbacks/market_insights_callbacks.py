@@ -7,8 +7,9 @@ from dash import Input, Output, html
 import logging
 from typing import Optional
 
-from src.dashboard.dash_app.utils.data_loader import DataLoader
+from src.core.duckdb_database import DuckDBJobDatabase
 from src.dashboard.dash_app.utils.market_analyzer import MarketAnalyzer
+from src.dashboard.services.market_insights_query import query_market_counts, query_market_stats
 from src.dashboard.dash_app.components.salary_analyzer import create_salary_analyzer
 from src.dashboard.dash_app.components.market_trends import create_market_trends
 
@@ -43,34 +44,15 @@ def register_market_insights_callbacks(app, profile_name: str):
             Tuple of (total_jobs, companies, locations, rcip_jobs)
         """
         try:
-            # Load data
-            data_loader = DataLoader(profile_name=profile_name)
-            jobs_data = data_loader.get_jobs_data(profile_name)
-            
-            if not jobs_data:
-                return "0", "0", "0", "0"
-            
-            # Calculate stats
-            total_jobs = len(jobs_data)
-            
-            # Unique companies
-            companies = set()
-            for job in jobs_data:
-                company = job.get("company") or job.get("company_name")
-                if company:
-                    companies.add(company)
-            
-            # Unique locations
-            locations = set()
-            for job in jobs_data:
-                location = job.get("location")
-                if location:
-                    locations.add(location)
-            
-            # RCIP jobs
-            rcip_jobs = sum(1 for job in jobs_data if job.get("is_rcip_city") or job.get("is_rcip"))
-            
-            return str(total_jobs), str(len(companies)), str(len(locations)), str(rcip_jobs)
+            # Count in the database instead of loading every job
+            stats = query_market_stats(profile_name)
+            
+            return (
+                str(stats["total_jobs"]),
+                str(stats["companies"]),
+                str(stats["locations"]),
+                str(stats["rcip_jobs"]),
+            )
         
         except Exception as e:
             logger.error(f"Error updating market insights stats: {e}")
@@ -97,18 +79,14 @@ def register_market_insights_callbacks(app, profile_name: str):
             Salary analyzer component
         """
         try:
-            # Load data
-            data_loader = DataLoader(profile_name=profile_name)
-            jobs_data = data_loader.get_jobs_data(profile_name)
+            # Aggregate the parsed salary columns in the database
+            with DuckDBJobDatabase(profile_name=profile_name, pooled=True, read_only=True) as db:
+                salary_data = db.get_salary_statistics()
             
-            if not jobs_data:
-                logger.info("No jobs data available for salary analysis")
+            if not salary_data.get("count"):
+                logger.info("No salary data available for salary analysis")
                 return create_salary_analyzer({}, None)
             
-            # Analyze market
-            analyzer = MarketAnalyzer(jobs_data)
-            salary_data = analyzer.calculate_salary_range()
-            
             # Get user target salary from profile if available
             user_target_salary = None
             try:
@@ -154,19 +132,17 @@ def register_market_insights_callbacks(app, profile_name: str):
             Market trends component
         """
         try:
-            # Load data
-            data_loader = DataLoader(profile_name=profile_name)
-            jobs_data = data_loader.get_jobs_data(profile_name)
+            # Skill mentions are counted over the full descriptions in SQL
+            counts = query_market_counts(profile_name, MarketAnalyzer.TRACKED_SKILLS)
             
-            if not jobs_data:
+            if not counts.total_jobs:
                 logger.info("No jobs data available for market trends")
                 return create_market_trends([], [], {'trend': 'stable', 'weekly_average': 0, 'recent_activity': 'low'})
             
-            # Analyze market
-            analyzer = MarketAnalyzer(jobs_data)
-            skills_data = analyzer.analyze_skills_demand(15)
-            companies_data = analyzer.get_top_hiring_companies(10)
-            trends_data = analyzer.detect_hiring_trends()
+            # Rank the counts the same way MarketAnalyzer does for job lists
+            skills_data = MarketAnalyzer.rank_skills(counts.skill_counts, counts.total_jobs, 15)
+            companies_data = MarketAnalyzer.rank_companies(counts.company_counts, counts.total_jobs, 10)
+            trends_data = MarketAnalyzer.classify_hiring_trend(counts.week_counts)
             
             return create_market_trends(skills_data, companies_data, trends_data)
         
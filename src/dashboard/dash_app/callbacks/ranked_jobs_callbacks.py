@@ -22,6 +22,7 @@ logger = logging.getLogger(__name__)
 try:
     from src.core.user_profile_manager import UserProfileManager
     from src.core.duckdb_database import DuckDBJobDatabase
+    from src.dashboard.services.stats_snapshot import get_stats_snapshot
     from src.dashboard.dash_app.layouts.ranked_jobs_layout import create_job_card
 except ImportError as e:
     logger.warning(f"Import warning in ranked jobs callbacks: {e}")
@@ -49,35 +50,8 @@ def register_ranked_jobs_callbacks(app):
             
             current_profile = app.profile_name
 
-            # Get database
-            db = DuckDBJobDatabase(profile_name=current_profile)
-
-            # Get total jobs
-            total_query = "SELECT COUNT(*) as count FROM jobs"
-            total_df = db.conn.execute(total_query).df()
-            total = total_df["count"].iloc[0] if not total_df.empty else 0
-
-            # Get high match jobs (>70% fit score)
-            high_match_query = """
-                SELECT COUNT(*) as count FROM jobs 
-                WHERE fit_score > 70
-            """
-            high_match_df = db.conn.execute(high_match_query).df()
-            high_match = high_match_df["count"].iloc[0] if not high_match_df.empty else 0
-
-            # Get new jobs (created in last 24 hours)
-            new_jobs_query = """
-                SELECT COUNT(*) as count FROM jobs 
-                WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '1 day'
-            """
-            try:
-                new_jobs_df = db.conn.execute(new_jobs_query).df()
-                new_jobs = new_jobs_df["count"].iloc[0] if not new_jobs_df.empty else 0
-            except:
-                # Fallback if created_at doesn't exist
-                new_jobs = 0
-
-            return str(total), str(high_match), str(new_jobs)
+            snapshot = get_stats_snapshot().get(current_profile)
+            return str(snapshot.total_jobs), str(snapshot.high_match), str(snapshot.new_last_24h)
 
         except Exception as e:
             logger.error(f"Error updating ranked jobs stats: {e}")
@@ -108,95 +82,96 @@ def register_ranked_jobs_callbacks(app):
                 return []
             
             current_profile = app.profile_name
-            db = DuckDBJobDatabase(profile_name=current_profile)
-
-            # Build base query with profile filter
-            query = """
-                SELECT 
-                    id, title, company, location, summary, skills,
-                    fit_score, date_posted, url, salary_range,
-                    is_rcip_city, is_immigration_priority, city_tags,
-                    application_status, created_at
-                FROM jobs 
-                WHERE profile_name = ?
-            """
-            params = [current_profile]
-
-            # Apply filters
-            conditions = []
-
-            # Min score filter
-            if min_score and min_score > 0:
-                conditions.append(f"fit_score >= {min_score}")
-
-            # Date filter
-            if date_filter and date_filter != "all":
-                days = int(date_filter)
-                conditions.append(f"date_posted >= CURRENT_DATE - INTERVAL '{days} days'")
-
-            # Keyword search
-            if keyword and keyword.strip():
-                keyword_safe = keyword.replace("'", "''")
-                conditions.append(f"""(
-                    title ILIKE '%{keyword_safe}%' OR
-                    company ILIKE '%{keyword_safe}%' OR
-                    skills ILIKE '%{keyword_safe}%'
-                )""")
-
-            # Add conditions to query
-            if conditions:
-                query += " AND " + " AND ".join(conditions)
-
-            # Apply sorting
-            sort_map = {
-                "match_desc": "fit_score DESC NULLS LAST",
-                "rcip_priority": "is_rcip_city DESC, is_immigration_priority DESC, fit_score DESC",
-                "date_desc": "date_posted DESC NULLS LAST",
-                "company_asc": "company ASC",
-            }
-            order_by = sort_map.get(sort_by, "fit_score DESC NULLS LAST")
-            query += f" ORDER BY {order_by} LIMIT 50"
-
-            # Execute query with parameters
-            df = db.conn.execute(query, params).df()
-
-            if df.empty:
-                return dbc.Alert(
-                    [
-                        html.H4("No Jobs Found", className="alert-heading"),
-                        html.P("Try adjusting your filters or run a new job search."),
-                        dbc.Button(
-                            [html.I(className="fas fa-search me-2"), "Start Job Search"],
-                            color="primary",
-                            href="#",
-                        ),
-                    ],
-                    color="info",
-                    className="text-center",
-                )
-
-            # Create job cards
-            jobs = []
-            for _, job in df.iterrows():
-                job_dict = {
-                    "id": job["id"],
-                    "title": job["title"],
-                    "company": job["company"],
-                    "location": job["location"],
-                    "summary": job.get("summary", ""),
-                    "skills": job.get("skills", ""),
-                    "fit_score": job.get("fit_score", 0),
-                    "date_posted": job.get("date_posted", ""),
-                    "url": job.get("url", "#"),
-                    "salary_range": job.get("salary_range", ""),
-                    "is_rcip_city": job.get("is_rcip_city", False),
-                    "is_immigration_priority": job.get("is_immigration_priority", False),
-                    "city_tags": job.get("city_tags", ""),
-                    "application_status": job.get("application_status", "discovered"),
+            with DuckDBJobDatabase(profile_name=current_profile, pooled=True, read_only=True) as db:
+                # Build base query with profile filter
+                query = """
+                    SELECT 
+                        id, title, company, location, summary, skills,
+                        fit_score, date_posted, url, salary_range,
+                        is_rcip_city, is_immigration_priority, city_tags,
+                        application_status, created_at
+                    FROM jobs 
+                    WHERE profile_name = ?
+                """
+                params = [current_profile]
+
+                # Apply filters
+                conditions = []
+
+                # Min score filter
+                if min_score and min_score > 0:
+                    conditions.append(f"fit_score >= {min_score}")
+
+                # Date filter
+                if date_filter and date_filter != "all":
+                    days = int(date_filter)
+                    conditions.append(f"date_posted >= CURRENT_DATE - INTERVAL '{days} days'")
+
+                # Keyword search (indexed; the last word matches as a prefix while typing)
+                hit_ids = None
+                if keyword and keyword.strip():
+                    hit_ids = [job_id for job_id, _ in db.search_job_ids(keyword, prefix_last=True)]
+                    conditions.append("id IN (SELECT unnest(?::VARCHAR[]))")
+                    params.append(hit_ids)
+
+                # Add conditions to query
+                if conditions:
+                    query += " AND " + " AND ".join(conditions)
+
+                # Apply sorting
+                sort_map = {
+                    "match_desc": "fit_score DESC NULLS LAST",
+                    "rcip_priority": "is_rcip_city DESC, is_immigration_priority DESC, fit_score DESC",
+                    "date_desc": "date_posted DESC NULLS LAST",
+                    "company_asc": "company ASC",
                 }
-                jobs.append(create_job_card(job_dict, view_mode=view_mode or "cards"))
+                order_by = sort_map.get(sort_by, "fit_score DESC NULLS LAST")
+                if hit_ids is not None:
+                    # Keyword results are listed by relevance
+                    order_by = "list_position(?::VARCHAR[], id)"
+                    params.append(hit_ids)
+                query += f" ORDER BY {order_by} LIMIT 50"
+
+                # Execute query with parameters
+                df = db.conn.execute(query, params).df()
+
+                if df.empty:
+                    return dbc.Alert(
+                        [
+                            html.H4("No Jobs Found", className="alert-heading"),
+                            html.P("Try adjusting your filters or run a new job search."),
+                            dbc.Button(
+                                [html.I(className="fas fa-search me-2"), "Start Job Search"],
+                                color="primary",
+                                href="#",
+                            ),
+                        ],
+                        color="info",
+                        className="text-center",
+                    )
 
-            return jobs
+                # Create job cards
+                jobs = []
+                for _, job in df.iterrows():
+                    job_dict = {
+                        "id": job["id"],
+                        "title": job["title"],
+                        "company": job["company"],
+                        "location": job["location"],
+                        "summary": job.get("summary", ""),
+                        "skills": job.get("skills", ""),
+                        "fit_score": job.get("fit_score", 0),
+                        "date_posted": job.get("date_posted", ""),
+                        "url": job.get("url", "#"),
+                        "salary_range": job.get("salary_range", ""),
+                        "is_rcip_city": job.get("is_rcip_city", False),
+                        "is_immigration_priority": job.get("is_immigration_priority", False),
+                        "city_tags": job.get("city_tags", ""),
+                        "application_status": job.get("application_status", "discovered"),
+                    }
+                    jobs.append(create_job_card(job_dict, view_mode=view_mode or "cards"))
+
+                return jobs
 
         except Exception as e:
             logger.error(f"Error loading ranked jobs: {e}")
@@ -246,19 +221,9 @@ def register_ranked_jobs_callbacks(app):
                 return html.Div("Error: No profile configured", className="text-danger")
             
             current_profile = app.profile_name
-            db = DuckDBJobDatabase(profile_name=current_profile)
+            snapshot = get_stats_snapshot().get(current_profile)
 
-            # Count RCIP cities
-            rcip_query = "SELECT COUNT(*) as count FROM jobs WHERE is_rcip_city = TRUE"
-            rcip_df = db.conn.execute(rcip_query).df()
-            rcip_count = rcip_df["count"].iloc[0] if not rcip_df.empty else 0
-
-            # Count immigration priority
-            priority_query = "SELECT COUNT(*) as count FROM jobs WHERE is_immigration_priority = TRUE"
-            priority_df = db.conn.execute(priority_query).df()
-            priority_count = priority_df["count"].iloc[0] if not priority_df.empty else 0
-
-            return create_rcip_stats_card(rcip_count, priority_count)
+            return create_rcip_stats_card(snapshot.rcip_jobs, snapshot.immigration_priority_jobs)
 
         except Exception as e:
             logger.error(f"Error updating RCIP stats: {e}")
@@ -523,33 +488,23 @@ def register_ranked_jobs_callbacks(app):
             if not hasattr(app, "profile_name") or app.profile_name is None:
                 return html.Div("No profile set", className="text-muted")
             
-            db = DuckDBJobDatabase(profile_name=app.profile_name)
+            # Top companies by job count come from the shared stats snapshot
+            top_companies = get_stats_snapshot().get(app.profile_name).top_companies
             
-            # Get top companies by job count
-            query = """
-                SELECT company, COUNT(*) as job_count
-                FROM jobs
-                WHERE company IS NOT NULL AND company != ''
-                GROUP BY company
-                ORDER BY job_count DESC
-                LIMIT 8
-            """
-            companies_df = db.conn.execute(query).df()
-            
-            if companies_df.empty:
+            if not top_companies:
                 return html.P("No company data available", className="text-muted text-center")
             
             # Create list of companies
             company_items = []
-            for idx, row in companies_df.iterrows():
+            for company, job_count in top_companies:
                 company_items.append(
                     dbc.ListGroupItem(
                         [
                             html.Div(
                                 [
-                                    html.Span(row["company"], className="fw-bold"),
+                                    html.Span(company, className="fw-bold"),
                                     dbc.Badge(
-                                        f"{row['job_count']} jobs",
+                                        f"{job_count} jobs",
                                         color="primary",
                                         className="float-end",
                                         pill=True,
@@ -580,34 +535,24 @@ def register_ranked_jobs_callbacks(app):
             if not hasattr(app, "profile_name") or app.profile_name is None:
                 return html.Div("No profile set", className="text-muted")
             
-            db = DuckDBJobDatabase(profile_name=app.profile_name)
-            
-            # Get top locations by job count
-            query = """
-                SELECT location, COUNT(*) as job_count
-                FROM jobs
-                WHERE location IS NOT NULL AND location != ''
-                GROUP BY location
-                ORDER BY job_count DESC
-                LIMIT 8
-            """
-            locations_df = db.conn.execute(query).df()
+            # Top locations by job count come from the shared stats snapshot
+            top_locations = get_stats_snapshot().get(app.profile_name).top_locations
             
-            if locations_df.empty:
+            if not top_locations:
                 return html.P("No location data available", className="text-muted text-center")
             
             # Create list of locations
             location_items = []
-            for idx, row in locations_df.iterrows():
+            for location, job_count in top_locations:
                 location_items.append(
                     dbc.ListGroupItem(
                         [
                             html.Div(
                                 [
                                     html.I(className="fas fa-map-marker-alt me-2 text-primary"),
-                                    html.Span(row["location"]),
+                                    html.Span(location),
                                     dbc.Badge(
-                                        f"{row['job_count']}",
+                                        f"{job_count}",
                                         color="info",
                                         className="float-end",
                                         pill=True,
@@ -638,59 +583,60 @@ def register_ranked_jobs_callbacks(app):
             if not hasattr(app, "profile_name") or app.profile_name is None:
                 return html.Div("No profile set", className="text-muted")
             
-            db = DuckDBJobDatabase(profile_name=app.profile_name)
-            
-            # Get most recent jobs
-            query = """
-                SELECT id, title, company, location, created_at, fit_score
-                FROM jobs
-                ORDER BY created_at DESC
-                LIMIT 10
-            """
-            recent_df = db.conn.execute(query).df()
-            
-            if recent_df.empty:
-                return html.P("No recent jobs available", className="text-muted text-center")
-            
-            # Create list of recent jobs
-            job_items = []
-            for idx, row in recent_df.iterrows():
-                # Format score badge color - handle NaN values
-                score = row.get("fit_score")
-                if pd.isna(score) or score is None:
-                    score = 0
-                else:
-                    score = float(score)
+            with DuckDBJobDatabase(
+                profile_name=app.profile_name, pooled=True, read_only=True
+            ) as db:
+                # Get most recent jobs
+                query = """
+                    SELECT id, title, company, location, created_at, fit_score
+                    FROM jobs
+                    ORDER BY created_at DESC
+                    LIMIT 10
+                """
+                recent_df = db.conn.execute(query).df()
+            
+                if recent_df.empty:
+                    return html.P("No recent jobs available", className="text-muted text-center")
+            
+                # Create list of recent jobs
+                job_items = []
+                for idx, row in recent_df.iterrows():
+                    # Format score badge color - handle NaN values
+                    score = row.get("fit_score")
+                    if pd.isna(score) or score is None:
+                        score = 0
+                    else:
+                        score = float(score)
                 
-                badge_color = "success" if score >= 70 else "warning" if score >= 50 else "secondary"
+                    badge_color = "success" if score >= 70 else "warning" if score >= 50 else "secondary"
                 
-                job_items.append(
-                    dbc.ListGroupItem(
-                        [
-                            html.Div(
-                                [
-                                    html.Strong(row["title"], className="d-block"),
-                                    html.Small(f"{row['company']} • {row['location']}", className="text-muted"),
-                                ],
-                                className="mb-1",
-                            ),
-                            html.Div(
-                                [
-                                    dbc.Badge(f"{int(score)}% match", color=badge_color, className="me-2"),
-                                    html.Small(
-                                        pd.to_datetime(row["created_at"]).strftime("%b %d, %H:%M")
-                                        if pd.notna(row["created_at"])
-                                        else "Recently",
-                                        className="text-muted",
-                                    ),
-                                ]
-                            ),
-                        ],
-                        className="border-0 py-2",
+                    job_items.append(
+                        dbc.ListGroupItem(
+                            [
+                                html.Div(
+                                    [
+                                        html.Strong(row["title"], className="d-block"),
+                                        html.Small(f"{row['company']} • {row['location']}", className="text-muted"),
+                                    ],
+                                    className="mb-1",
+                                ),
+                                html.Div(
+                                    [
+                                        dbc.Badge(f"{int(score)}% match", color=badge_color, className="me-2"),
+                                        html.Small(
+                                            pd.to_datetime(row["created_at"]).strftime("%b %d, %H:%M")
+                                            if pd.notna(row["created_at"])
+                                            else "Recently",
+                                            className="text-muted",
+                                        ),
+                                    ]
+                                ),
+                            ],
+                            className="border-0 py-2",
+                        )
                     )
-                )
             
-            return dbc.ListGroup(job_items, flush=True)
+                return dbc.ListGroup(job_items, flush=True)
             
         except Exception as e:
             logger.error(f"Error updating recent jobs: {e}")
@@ -712,27 +658,10 @@ def register_ranked_jobs_callbacks(app):
             if not hasattr(app, "profile_name") or app.profile_name is None:
                 return "--", "--", "--"
             
-            db = DuckDBJobDatabase(profile_name=app.profile_name)
-            
-            # Count jobs by application status
-            query = """
-                SELECT 
-                    SUM(CASE WHEN status IN ('new', 'ready_to_apply') THEN 1 ELSE 0 END) as to_apply,
-                    SUM(CASE WHEN status = 'applied' THEN 1 ELSE 0 END) as applied,
-                    SUM(CASE WHEN status IN ('interviewing', 'offer', 'accepted') THEN 1 ELSE 0 END) as response
-                FROM jobs
-            """
-            stats_df = db.conn.execute(query).df()
-            
-            if stats_df.empty:
-                return "0", "0", "0"
-            
-            row = stats_df.iloc[0]
-            to_apply = int(row.get("to_apply", 0) or 0)
-            applied = int(row.get("applied", 0) or 0)
-            response = int(row.get("response", 0) or 0)
+            # Status funnel comes from the shared stats snapshot
+            snapshot = get_stats_snapshot().get(app.profile_name)
             
-            return str(to_apply), str(applied), str(response)
+            return str(snapshot.to_apply), str(snapshot.applied), str(snapshot.responses)
             
         except Exception as e:
             logger.error(f"Error updating application pipeline: {e}")
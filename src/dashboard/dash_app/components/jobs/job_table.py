@@ -8,11 +8,19 @@ from dash import html, dash_table
 import pandas as pd
 
 
-def create_jobs_table(data=None):
-    """Create an interactive jobs DataTable"""
+def create_jobs_table(data=None, server_side=False, page_size=25, page_count=None):
+    """
+    Create an interactive jobs DataTable.
+
+    With ``server_side=True`` paging, sorting and filtering are custom: the
+    table starts empty and a callback fills ``data`` with the visible page
+    (see ``src.dashboard.services.jobs_table_query``).
+    """
 
     if data is None:
         data = []
+    table_action = "custom" if server_side else "native"
+    paging = {"page_count": page_count or 1} if server_side else {}
 
     # Define table columns - including salary column prominently
     columns = [
@@ -50,17 +58,20 @@ def create_jobs_table(data=None):
         columns=columns,
         data=data,
         editable=True,
-        filter_action="native",
-        sort_action="native",
+        filter_action=table_action,
+        filter_options={"case": "insensitive"},
+        sort_action=table_action,
         sort_mode="multi",
+        sort_by=[],
         column_selectable="single",
         row_selectable="multi",
         row_deletable=False,
         selected_columns=[],
         selected_rows=[],
-        page_action="native",
+        page_action=table_action,
         page_current=0,
-        page_size=25,
+        page_size=page_size,
+        **paging,
         style_table={
             "backgroundColor": "#1e1e1e",
             "color": "white",
@@ -147,21 +158,26 @@ def create_jobs_table(data=None):
                 "maxWidth": "180px",
             },
         ],
-        tooltip_data=[
-            {
-                column: {
-                    "value": str(value)[:100] + "..." if len(str(value)) > 100 else str(value),
-                    "type": "markdown",
-                }
-                for column, value in row.items()
-                if column in ["title", "company", "location", "status"]
-            }
-            for row in data
-        ],
+        tooltip_data=create_table_tooltips(data),
         tooltip_duration=3000,
     )
 
 
+def create_table_tooltips(data):
+    """Tooltips for the text columns of the given table rows"""
+    return [
+        {
+            column: {
+                "value": str(value)[:100] + "..." if len(str(value)) > 100 else str(value),
+                "type": "markdown",
+            }
+            for column, value in row.items()
+            if column in ["title", "company", "location", "status"]
+        }
+        for row in data
+    ]
+
+
 def create_table_controls():
     """Create modern table control buttons"""
     return dbc.ButtonGroup(
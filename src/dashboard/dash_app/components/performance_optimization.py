@@ -487,10 +487,19 @@ def filter_jobs_client_side(jobs: List[Dict], filters: Dict) -> List[Dict]:
                 )
             ]
 
-        # Filter by salary range
+        # Filter by salary range on the parsed annual salary_min/salary_max columns;
+        # jobs that do not disclose a salary stay listed
         if filters.get("salary_range"):
             min_sal, max_sal = filters["salary_range"]
-            # This would need salary parsing logic
+            filtered_jobs = [
+                job
+                for job in filtered_jobs
+                if not (job.get("salary_min") or job.get("salary_max"))
+                or (
+                    (job.get("salary_max") or job.get("salary_min")) >= min_sal
+                    and (job.get("salary_min") or job.get("salary_max")) <= max_sal
+                )
+            ]
 
         return filtered_jobs
 
@@ -4,10 +4,12 @@ Modern job management interface with DataTable and cards
 """
 
 import dash_bootstrap_components as dbc  # already imported; keep single
-from dash import html, dcc, dash_table
+from dash import html, dcc
 
 from src.dashboard.dash_app.components.navigation import create_page_header
-from src.dashboard.dash_app.components.job_table import create_jobs_table, create_table_controls
+from src.dashboard.dash_app.components.jobs.job_table import (
+    create_jobs_table as create_server_side_jobs_table,
+)
 from src.dashboard.dash_app.components.job_cards import create_jobs_grid, create_job_quick_stats
 from src.dashboard.dash_app.components.job_modal import (
     create_job_modal,
@@ -492,44 +494,9 @@ def create_table_header():
 
 
 def create_table_view():
-    """Create the table view component"""
+    """Create the table view component (paged, sorted and filtered server-side)"""
     return html.Div(
-        [
-            dash_table.DataTable(
-                id="jobs-table",
-                columns=[
-                    {"name": "Title", "id": "title", "type": "text"},
-                    {"name": "Company", "id": "company", "type": "text"},
-                    {"name": "Location", "id": "location", "type": "text"},
-                    {"name": "💰 Salary", "id": "salary", "type": "text"},
-                    {"name": "Status", "id": "status", "type": "text"},
-                    {
-                        "name": "Match Score",
-                        "id": "match_score",
-                        "type": "numeric",
-                        "format": {"specifier": ".0f"},
-                    },
-                    {"name": "Date", "id": "created_at", "type": "datetime"},
-                    {"name": "View Job", "id": "view_job", "presentation": "markdown"},
-                ],
-                data=[],
-                sort_action="native",
-                filter_action="native",
-                page_action="native",
-                page_current=0,
-                page_size=25,
-                markdown_options={"link_target": "_blank"},
-                style_cell=get_table_cell_style(),
-                style_header=get_table_header_style(),
-                style_data_conditional=get_table_conditional_styles(),
-                css=[
-                    {
-                        "selector": ".dash-table-container",
-                        "rule": "border-radius: 8px; overflow: hidden;",
-                    }
-                ],
-            )
-        ],
+        [create_server_side_jobs_table(server_side=True, page_size=25)],
         id="table-view",
         style={"display": "block"},
     )
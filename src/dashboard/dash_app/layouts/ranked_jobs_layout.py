@@ -255,7 +255,7 @@ def create_ranked_jobs_layout():
                                                 className="mb-2",
                                             ),
                                             html.Small(
-                                                "Searches job title, company, and skills",
+                                                "Searches job title, company, skills and description; ranked by relevance",
                                                 className="text-muted",
                                             ),
                                         ]
@@ -18,6 +18,7 @@ load_dotenv()
 
 from src.core.dashboard_data_access import DEFAULT_COLUMNS, DashboardDataAccessError
 from src.dashboard.services.data_service import DataService, get_data_service
+from src.dashboard.services.stats_snapshot import get_stats_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -64,11 +65,19 @@ class DataLoader:
             logger.warning("No profiles available via DataService")
         return profiles
 
-    def load_jobs_data(self, profile_name: Optional[str] = None) -> pd.DataFrame:
-        """Return a pandas DataFrame of jobs for the selected profile."""
+    def load_jobs_data(
+        self,
+        profile_name: Optional[str] = None,
+        view: str = "card",
+    ) -> pd.DataFrame:
+        """Return a pandas DataFrame of jobs for the selected profile.
+
+        The default ``"card"`` view carries a description preview only; use
+        ``get_job_detail`` for the full text of one job.
+        """
         resolved = self._resolve_profile(profile_name)
         try:
-            dataframe = self._data_service.load_job_data(resolved)
+            dataframe = self._data_service.load_job_data(resolved, view=view)
         except DashboardDataAccessError as error:
             logger.error("Dashboard data access failure: %s", error)
             return self._create_empty_dataframe()
@@ -81,11 +90,15 @@ class DataLoader:
             return self._create_empty_dataframe()
         return dataframe
 
-    def get_jobs_data(self, profile_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_jobs_data(
+        self,
+        profile_name: Optional[str] = None,
+        view: str = "list",
+    ) -> List[Dict[str, Any]]:
         """Return a list of job dictionaries for the selected profile."""
         resolved = self._resolve_profile(profile_name)
         try:
-            return self._data_service.get_jobs_data(resolved)
+            return self._data_service.get_jobs_data(resolved, view=view)
         except DashboardDataAccessError as error:
             logger.error("Dashboard data access failure: %s", error)
             return []
@@ -93,6 +106,15 @@ class DataLoader:
             logger.error("Unexpected error getting jobs data: %s", error)
             return []
 
+    def get_job_detail(
+        self,
+        job_id: str,
+        profile_name: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return one job with its full description and notes."""
+        resolved = self._resolve_profile(profile_name)
+        return self._data_service.get_job_detail(resolved, job_id)
+
     def get_job_stats(self, profile_name: Optional[str] = None) -> Dict[str, Any]:
         """Return aggregate job statistics used by sidebar widgets."""
         resolved = self._resolve_profile(profile_name)
@@ -161,71 +183,30 @@ class DataLoader:
     def get_enhanced_stats(self, profile_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Get enhanced statistics for professional stat cards.
+
+        Served from the shared ``DashboardStatsSnapshot`` so the counters come
+        from one aggregate query instead of loading the full jobs DataFrame.
         
         Returns:
             Dictionary with:
                 - total_jobs: int
                 - new_today: int
-                - high_match: int (fit_score >= 70)
+                - high_match: int (fit_score > 70)
                 - rcip_jobs: int
                 - new_this_week: int
                 - high_match_percentage: float
         """
-        from datetime import datetime, timedelta
-        
         resolved = self._resolve_profile(profile_name)
         
         try:
-            df = self.load_jobs_data(resolved)
-            
-            if df.empty:
-                return {
-                    "total_jobs": 0,
-                    "new_today": 0,
-                    "high_match": 0,
-                    "rcip_jobs": 0,
-                    "new_this_week": 0,
-                    "high_match_percentage": 0.0
-                }
-            
-            # Total jobs
-            total_jobs = len(df)
-            
-            # New today (posted_date is today)
-            today = datetime.now().date()
-            new_today = 0
-            if 'posted_date' in df.columns:
-                df['posted_date_parsed'] = pd.to_datetime(df['posted_date'], errors='coerce')
-                new_today = len(df[df['posted_date_parsed'].dt.date == today])
-            
-            # New this week
-            week_ago = today - timedelta(days=7)
-            new_this_week = 0
-            if 'posted_date' in df.columns:
-                new_this_week = len(df[df['posted_date_parsed'].dt.date >= week_ago])
-            
-            # High match (fit_score >= 70)
-            high_match = 0
-            if 'fit_score' in df.columns:
-                high_match = len(df[df['fit_score'] >= 70])
-            
-            # RCIP jobs
-            rcip_jobs = 0
-            if 'is_rcip' in df.columns:
-                rcip_jobs = len(df[df['is_rcip'] == True])
-            elif 'rcip' in df.columns:
-                rcip_jobs = len(df[df['rcip'] == True])
-            
-            # High match percentage
-            high_match_percentage = (high_match / total_jobs * 100) if total_jobs > 0 else 0.0
-            
+            stats = get_stats_snapshot().get(resolved).to_dict()
             return {
-                "total_jobs": total_jobs,
-                "new_today": new_today,
-                "high_match": high_match,
-                "rcip_jobs": rcip_jobs,
-                "new_this_week": new_this_week,
-                "high_match_percentage": round(high_match_percentage, 1)
+                "total_jobs": stats["total_jobs"],
+                "new_today": stats["new_today"],
+                "high_match": stats["high_match"],
+                "rcip_jobs": stats["rcip_jobs"],
+                "new_this_week": stats["new_this_week"],
+                "high_match_percentage": stats["high_match_percentage"],
             }
         
         except Exception as error:
@@ -263,8 +244,8 @@ class DataLoader:
             except Exception as e:
                 logger.warning(f"Could not load user skills: {e}")
             
-            # Get jobs data
-            jobs = self.get_jobs_data(resolved)
+            # Skill matching scans descriptions, so it needs the full text
+            jobs = self.get_jobs_data(resolved, view="detail")
             
             return {
                 "user_skills": user_skills,
@@ -308,8 +289,8 @@ class DataLoader:
             except Exception as e:
                 logger.warning(f"Could not load user profile data: {e}")
             
-            # Get jobs data
-            jobs = self.get_jobs_data(resolved)
+            # Skill matching scans descriptions, so it needs the full text
+            jobs = self.get_jobs_data(resolved, view="detail")
             
             return {
                 "user_skills": user_skills,
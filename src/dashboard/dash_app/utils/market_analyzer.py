@@ -131,17 +131,21 @@ class MarketAnalyzer:
             if company and company.lower() != 'unknown':
                 company_counts[company] += 1
         
-        # Get top companies
+        return self.rank_companies(company_counts, self.total_jobs, limit)
+    
+    @staticmethod
+    def rank_companies(company_counts: Counter, total_jobs: int, limit: int = 10) -> List[Dict[str, Any]]:
+        """Top companies with share and trend from per-company posting counts."""
         top_companies = []
         for company, count in company_counts.most_common(limit):
             # Calculate trend (simplified - compare to average)
-            avg_jobs_per_company = self.total_jobs / len(company_counts) if company_counts else 0
+            avg_jobs_per_company = total_jobs / len(company_counts) if company_counts else 0
             trend = 'growing' if count > avg_jobs_per_company * 1.2 else 'stable'
             
             top_companies.append({
                 'company': company,
                 'job_count': count,
-                'percentage': round(count / self.total_jobs * 100, 1) if self.total_jobs > 0 else 0,
+                'percentage': round(count / total_jobs * 100, 1) if total_jobs > 0 else 0,
                 'trend': trend
             })
         
@@ -171,10 +175,14 @@ class MarketAnalyzer:
                 if skill.lower() in text:
                     skill_counts[skill] += 1
         
-        # Get top skills
+        return self.rank_skills(skill_counts, self.total_jobs, limit)
+    
+    @staticmethod
+    def rank_skills(skill_counts: Counter, total_jobs: int, limit: int = 15) -> List[Dict[str, Any]]:
+        """Top skills with share and priority from per-skill job counts."""
         top_skills = []
         for skill, count in skill_counts.most_common(limit):
-            percentage = round(count / self.total_jobs * 100, 1) if self.total_jobs > 0 else 0
+            percentage = round(count / total_jobs * 100, 1) if total_jobs > 0 else 0
             
             # Classify priority based on frequency
             if percentage >= 30:
@@ -220,6 +228,11 @@ class MarketAnalyzer:
                     logger.debug(f"Error parsing date {posted_date}: {e}")
                     continue
         
+        return self.classify_hiring_trend(date_counts)
+    
+    @staticmethod
+    def classify_hiring_trend(date_counts: Counter) -> Dict[str, Any]:
+        """Hiring trend from job counts keyed by ``%Y-W%U`` week."""
         if not date_counts:
             return {
                 'trend': 'stable',
@@ -297,6 +297,29 @@ class SalaryParser:
         """
         enhanced = job_data.copy()
 
+        # Jobs from the database carry parsed salary columns; no text parsing needed
+        stored_min = job_data.get("salary_min")
+        stored_max = job_data.get("salary_max")
+        if _is_amount(stored_min) or _is_amount(stored_max):
+            min_amount = stored_min if _is_amount(stored_min) else stored_max
+            max_amount = stored_max if _is_amount(stored_max) else stored_min
+            is_range = min_amount != max_amount
+            enhanced.update(
+                {
+                    "salary_display": (
+                        self._format_range(min_amount, max_amount)
+                        if is_range
+                        else self._format_single(min_amount)
+                    ),
+                    "salary_min": min_amount,
+                    "salary_max": max_amount,
+                    "salary_confidence": 1.0,
+                    "salary_is_range": is_range,
+                    "salary_raw": job_data.get("salary_range") or job_data.get("salary"),
+                }
+            )
+            return enhanced
+
         # Get existing salary field
         existing_salary = (
             job_data.get("salary")
@@ -338,6 +361,11 @@ class SalaryParser:
         return enhanced
 
 
+def _is_amount(value: Any) -> bool:
+    """True for a stored salary amount (not None/NaN/0)"""
+    return bool(value) and value == value
+
+
 def enhance_jobs_data_with_salary(jobs_data: list) -> list:
     """
     Enhance a list of jobs with better salary parsing
@@ -7,6 +7,9 @@ from typing import Dict, List, Optional, Set, Tuple
 import re
 import logging
 from collections import Counter
+from functools import lru_cache
+
+from src.analysis.skill_matcher import SkillMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -96,10 +99,74 @@ SKILL_PATTERNS = {
 # Skill Extraction Functions
 # ============================================================================
 
+def _pattern_variants(pattern: str) -> Optional[List[str]]:
+    """
+    Expand a ``\\b...\\b`` pattern of literals and optional characters into
+    the literal strings it matches, or ``None`` if it uses anything else.
+    """
+    if not (pattern.startswith(r"\b") and pattern.endswith(r"\b")):
+        return None
+
+    atoms: List[Tuple[str, bool]] = []  # (character, optional)
+    body = pattern[2:-2]
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char == "\\":
+            if i + 1 >= len(body) or body[i + 1].isalnum():
+                return None  # Character classes such as \w
+            char = body[i + 1]
+            i += 1
+        elif char in "()[]{}|*+^$.":
+            return None
+        elif char == "?":
+            if not atoms or atoms[-1][1]:
+                return None
+            atoms[-1] = (atoms[-1][0], True)
+            i += 1
+            continue
+        atoms.append((char, False))
+        i += 1
+
+    variants = [""]
+    for char, optional in atoms:
+        variants = [v + char for v in variants] + (variants if optional else [])
+    return variants
+
+
+@lru_cache(maxsize=8)
+def _compile_skill_patterns(
+    pattern_items: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> Tuple[SkillMatcher, Dict[str, Set[str]], Dict[str, List[re.Pattern]]]:
+    """
+    Split skill patterns into one multi-term matcher for the literal ones and
+    compiled regexes for the rest.
+    """
+    term_skills: Dict[str, Set[str]] = {}
+    regex_patterns: Dict[str, List[re.Pattern]] = {}
+
+    for skill_name, patterns in pattern_items:
+        for pattern in patterns:
+            variants = _pattern_variants(pattern)
+            if variants is None:
+                regex_patterns.setdefault(skill_name, []).append(
+                    re.compile(pattern, re.IGNORECASE)
+                )
+                continue
+            for variant in variants:
+                term_skills.setdefault(variant.lower(), set()).add(skill_name)
+
+    matcher = SkillMatcher({term: term for term in term_skills})
+    return matcher, term_skills, regex_patterns
+
+
 def extract_skills_from_text(text: str, skill_patterns: Dict[str, List[str]] = None) -> Set[str]:
     """
     Extract skills from text using pattern matching.
     
+    Literal patterns are matched in a single scan of the text; only patterns
+    with regex constructs beyond optional characters are searched one by one.
+    
     Args:
         text: Text to extract skills from
         skill_patterns: Optional custom skill patterns (uses default if None)
@@ -113,14 +180,19 @@ def extract_skills_from_text(text: str, skill_patterns: Dict[str, List[str]] = N
     if skill_patterns is None:
         skill_patterns = SKILL_PATTERNS
     
+    matcher, term_skills, regex_patterns = _compile_skill_patterns(
+        tuple((name, tuple(patterns)) for name, patterns in skill_patterns.items())
+    )
+    
     text_lower = text.lower()
     detected_skills = set()
     
-    for skill_name, patterns in skill_patterns.items():
-        for pattern in patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                detected_skills.add(skill_name)
-                break  # Found this skill, move to next
+    for term in matcher.matched_terms(text_lower):
+        detected_skills.update(term_skills[term])
+    
+    for skill_name, patterns in regex_patterns.items():
+        if skill_name not in detected_skills and any(p.search(text_lower) for p in patterns):
+            detected_skills.add(skill_name)
     
     return detected_skills
 
@@ -169,16 +241,11 @@ def normalize_user_skills(user_skills: List[str]) -> Set[str]:
         user_skill_lower = user_skill.lower().strip()
         
         # Try to match against known skill patterns
-        for skill_name, patterns in SKILL_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, user_skill_lower, re.IGNORECASE):
-                    normalized.add(skill_name)
-                    break
+        matched = extract_skills_from_text(user_skill_lower)
+        normalized.update(matched)
         
         # If no match found, add as-is (capitalized)
-        if not any(re.search(p, user_skill_lower, re.IGNORECASE) 
-                  for patterns in SKILL_PATTERNS.values() 
-                  for p in patterns):
+        if not matched:
             normalized.add(user_skill.strip().title())
     
     return normalized
@@ -8,6 +8,7 @@ from src.dashboard.services.orchestration_service import (
     get_orchestration_service,
 )
 from src.dashboard.services.health_monitor import HealthMonitor, get_health_monitor
+from src.dashboard.services.stats_snapshot import DashboardStatsSnapshot, get_stats_snapshot
 
 __all__ = [
     "DataService",
@@ -20,4 +21,6 @@ __all__ = [
     "get_orchestration_service",
     "HealthMonitor",
     "get_health_monitor",
+    "DashboardStatsSnapshot",
+    "get_stats_snapshot",
 ]
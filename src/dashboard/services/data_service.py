@@ -66,14 +66,22 @@ class DataService:
     # ------------------------------------------------------------------
     # Public API methods
     # ------------------------------------------------------------------
-    def get_jobs_data(self, profile_name: str) -> List[Dict[str, Any]]:
+    def get_jobs_data(self, profile_name: str, view: str = "list") -> List[Dict[str, Any]]:
         """Return job records for a profile using the shared data access layer."""
         try:
-            return self._fetch_bundle(profile_name).response.records
+            return self._fetch_bundle(profile_name, view).response.records
         except DashboardDataAccessError as error:
             logger.error("Error loading jobs data: %s", error)
             return []
 
+    def get_job_detail(self, profile_name: str, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return one job with its full description, fetched on demand."""
+        try:
+            return self._data_access.get_job_detail(profile_name, job_id)
+        except DashboardDataAccessError as error:
+            logger.error("Error loading job %s: %s", job_id, error)
+            return None
+
     def get_available_profiles(self) -> List[str]:
         """Return the list of available profiles."""
         if profile_service_available:
@@ -189,10 +197,10 @@ class DataService:
                 return []
         return self.get_available_profiles()
 
-    def load_job_data(self, profile_name: str) -> pd.DataFrame:
+    def load_job_data(self, profile_name: str, view: str = "card") -> pd.DataFrame:
         """Load job data for a specific profile and return as DataFrame."""
         try:
-            return self._fetch_bundle(profile_name).dataframe
+            return self._fetch_bundle(profile_name, view).dataframe
         except DashboardDataAccessError as error:
             logger.error(
                 "Error loading job data for %s: %s",
@@ -206,7 +214,7 @@ class DataService:
     def get_cached_company_stats(self, profile_name: str, top_n: int = 15) -> Dict[str, Any]:
         """Get company statistics with caching for improved performance"""
         try:
-            dataframe = self._fetch_bundle(profile_name).dataframe
+            dataframe = self._fetch_bundle(profile_name, "analytics").dataframe
         except DashboardDataAccessError as error:
             logger.error("Error computing company stats: %s", error)
             return compute_company_stats(pd.DataFrame()).to_dict()
@@ -221,7 +229,7 @@ class DataService:
     def get_cached_location_stats(self, profile_name: str, top_n: int = 10) -> Dict[str, Any]:
         """Get location statistics with caching for improved performance"""
         try:
-            dataframe = self._fetch_bundle(profile_name).dataframe
+            dataframe = self._fetch_bundle(profile_name, "analytics").dataframe
         except DashboardDataAccessError as error:
             logger.error("Error computing location stats: %s", error)
             return compute_location_stats(pd.DataFrame()).to_dict()
@@ -236,7 +244,7 @@ class DataService:
     def get_cached_job_metrics(self, profile_name: str) -> Dict[str, Any]:
         """Get job metrics with caching for improved performance"""
         try:
-            dataframe = self._fetch_bundle(profile_name).dataframe
+            dataframe = self._fetch_bundle(profile_name, "analytics").dataframe
         except DashboardDataAccessError as error:
             logger.error("Error computing job metrics: %s", error)
             return compute_job_metrics(pd.DataFrame()).to_dict()
@@ -292,9 +300,9 @@ class DataService:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _fetch_bundle(self, profile_name: str) -> _StatsBundle:
-        """Retrieve dashboard data and wrap it for downstream consumers."""
-        response = self._data_access.get_jobs(profile_name)
+    def _fetch_bundle(self, profile_name: str, view: str = "list") -> _StatsBundle:
+        """Retrieve dashboard data for a view and wrap it for downstream consumers."""
+        response = self._data_access.get_jobs(profile_name, view=view)
         return _StatsBundle(dataframe=response.dataframe, response=response)
 
 
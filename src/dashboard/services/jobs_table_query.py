@@ -0,0 +1,300 @@
+"""
+Server-side paging, sorting and filtering for the jobs DataTable.
+
+The jobs table runs with ``page_action``/``sort_action``/``filter_action`` set
+to ``"custom"``: the browser only sends its ``page_current``, ``page_size``,
+``sort_by`` and ``filter_query``. This module translates those into one
+parameterized DuckDB query (plus a count) that returns just the visible page,
+projecting only the columns the table shows and the first characters of the
+description used by the summary tooltip.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.core.duckdb_database import DuckDBJobDatabase
+
+logger = logging.getLogger(__name__)
+
+DESCRIPTION_PREVIEW_CHARS = 200
+
+# Same 0-1 -> 0-100 scaling as DashboardDataAccess._compute_match_score
+MATCH_SCORE_SQL = (
+    "CASE WHEN fit_score IS NULL THEN 0.0 "
+    "WHEN fit_score <= 1 THEN fit_score * 100 ELSE fit_score END"
+)
+
+# Same mapping as DashboardDataAccess._resolve_status
+STATUS_SQL = (
+    "CASE WHEN application_status IS NOT NULL AND application_status <> 'discovered' "
+    "THEN application_status "
+    "ELSE CASE status WHEN 'processed' THEN 'ready_to_apply' "
+    "WHEN 'ready_to_apply' THEN 'ready_to_apply' WHEN 'applied' THEN 'applied' "
+    "WHEN 'reviewing' THEN 'needs_review' WHEN 'interview' THEN 'interview' "
+    "ELSE 'new' END END"
+)
+
+# Table column id -> (SQL expression, kind) for filtering
+FILTER_COLUMNS: Dict[str, Tuple[str, str]] = {
+    "title": ("title", "text"),
+    "company": ("company", "text"),
+    "location": ("location", "text"),
+    "status": (STATUS_SQL, "text"),
+    "salary": ("salary_range", "text"),
+    "match_score": (MATCH_SCORE_SQL, "numeric"),
+    "posted_date": ("created_at", "date"),
+    "created_at": ("created_at", "date"),
+}
+
+# Table column id -> SQL expression for sorting
+SORT_COLUMNS: Dict[str, str] = {
+    "title": "title",
+    "company": "company",
+    "location": "location",
+    "status": STATUS_SQL,
+    "salary": "salary_max",
+    "match_score": MATCH_SCORE_SQL,
+    "confidence_badge": "fit_score",
+    "rcip_badge": "is_rcip_city",
+    "posted_date": "created_at",
+    "created_at": "created_at",
+}
+
+DEFAULT_ORDER_BY = "created_at DESC NULLS LAST, id"
+
+# Columns fetched for a page (aliased to the names the table formatter reads)
+PAGE_COLUMNS_SQL = f"""
+    id, title, company, location,
+    {STATUS_SQL} AS status,
+    salary_range AS salary,
+    {MATCH_SCORE_SQL} AS match_score,
+    fit_score, created_at, url AS job_url,
+    is_rcip_city, is_immigration_priority, city_tags
+"""
+
+_OPERATORS = {
+    "=": "=",
+    "eq": "=",
+    "!=": "<>",
+    "ne": "<>",
+    "<": "<",
+    "lt": "<",
+    "<=": "<=",
+    "le": "<=",
+    ">": ">",
+    "gt": ">",
+    ">=": ">=",
+    "ge": ">=",
+}
+_FILTER_TERM_RE = re.compile(r"^\{(?P<column>[^}]+)\}\s+(?P<operator>\S+)\s*(?P<value>.*)$")
+
+
+@dataclass(frozen=True)
+class JobsPage:
+    """One page of the jobs table."""
+
+    rows: pd.DataFrame
+    total: int
+    page_size: Optional[int]
+
+    @property
+    def page_count(self) -> int:
+        if not self.page_size:
+            return 1
+        return max(1, -(-self.total // self.page_size))
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'`":
+        return value[1:-1]
+    return value
+
+
+def _like_pattern(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _filter_condition(term: str) -> Optional[Tuple[str, List[Any]]]:
+    match = _FILTER_TERM_RE.match(term.strip())
+    if not match or match.group("column") not in FILTER_COLUMNS:
+        return None
+
+    expression, kind = FILTER_COLUMNS[match.group("column")]
+    operator = match.group("operator").lower()
+    value = _unquote(match.group("value"))
+    # Case variants (icontains, s=, ...) behave like the plain operator
+    if operator[0] in "is" and operator[1:] in _OPERATORS.keys() | {"contains"}:
+        operator = operator[1:]
+
+    if operator == "contains":
+        return f"CAST({expression} AS VARCHAR) ILIKE ? ESCAPE '\\'", [_like_pattern(value)]
+    if operator == "datestartswith":
+        return f"strftime({expression}, '%Y-%m-%d') LIKE ?", [f"{value}%"]
+    if operator not in _OPERATORS:
+        return None
+
+    sql_operator = _OPERATORS[operator]
+    if kind == "numeric":
+        try:
+            return f"{expression} {sql_operator} ?", [float(value)]
+        except ValueError:
+            return None
+    if kind == "date":
+        return f"strftime({expression}, '%Y-%m-%d') {sql_operator} ?", [value]
+    if sql_operator in ("=", "<>"):
+        return f"lower({expression}) {sql_operator} lower(?)", [value]
+    return f"{expression} {sql_operator} ?", [value]
+
+
+def parse_filter_query(filter_query: Optional[str]) -> Tuple[List[str], List[Any]]:
+    """
+    Translate a DataTable ``filter_query`` into SQL conditions and parameters.
+
+    Terms on unknown columns or with unsupported operators are ignored, so a
+    filter on a display-only column never breaks the query.
+    """
+    conditions: List[str] = []
+    params: List[Any] = []
+    for term in (filter_query or "").split(" && "):
+        if not term.strip():
+            continue
+        condition = _filter_condition(term)
+        if condition is None:
+            logger.debug(f"Ignoring unsupported table filter: {term}")
+            continue
+        conditions.append(condition[0])
+        params.extend(condition[1])
+    return conditions, params
+
+
+def build_order_by(sort_by: Optional[Sequence[Dict[str, str]]]) -> str:
+    """ORDER BY clause for a DataTable ``sort_by`` (id breaks ties for stable pages)."""
+    terms = []
+    for sort in sort_by or []:
+        expression = SORT_COLUMNS.get(sort.get("column_id"))
+        if expression:
+            direction = "DESC" if sort.get("direction") == "desc" else "ASC"
+            terms.append(f"{expression} {direction} NULLS LAST")
+    if not terms:
+        return DEFAULT_ORDER_BY
+    return ", ".join(terms + ["id"])
+
+
+def _panel_conditions(filters: Optional[Dict[str, Any]]) -> Tuple[List[str], List[Any]]:
+    """Conditions for the search/company/status/date controls above the table."""
+    filters = filters or {}
+    conditions: List[str] = []
+    params: List[Any] = []
+
+    search = filters.get("search")
+    if search:
+        conditions.append(
+            "(title ILIKE ? ESCAPE '\\' OR company ILIKE ? ESCAPE '\\' "
+            "OR location ILIKE ? ESCAPE '\\')"
+        )
+        params.extend([_like_pattern(search)] * 3)
+
+    company = filters.get("company")
+    if company and company != "all":
+        conditions.append("company = ?")
+        params.append(company)
+
+    status = filters.get("status")
+    if status and status != "all":
+        conditions.append(f"{STATUS_SQL} = ?")
+        params.append(status)
+
+    if filters.get("start_date") and filters.get("end_date"):
+        conditions.append("created_at BETWEEN CAST(? AS TIMESTAMP) AND CAST(? AS TIMESTAMP)")
+        params.extend([filters["start_date"], filters["end_date"]])
+
+    return conditions, params
+
+
+def query_jobs_page(
+    profile_name: str,
+    page_current: int = 0,
+    page_size: Optional[int] = 25,
+    sort_by: Optional[Sequence[Dict[str, str]]] = None,
+    filter_query: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    description_chars: Optional[int] = DESCRIPTION_PREVIEW_CHARS,
+) -> JobsPage:
+    """
+    Fetch one page of jobs for the table.
+
+    Args:
+        profile_name: Profile whose jobs are listed
+        page_current: Zero-based page index from the DataTable
+        page_size: Rows per page; ``None`` returns every matching row (exports)
+        sort_by: DataTable ``sort_by``
+        filter_query: DataTable ``filter_query``
+        filters: Panel filters (``search``, ``company``, ``status``,
+            ``start_date``, ``end_date``)
+        description_chars: Leading description characters to fetch; ``None``
+            fetches the full text (exports)
+
+    Returns:
+        JobsPage with the page rows and the total number of matching jobs
+    """
+    conditions, params = parse_filter_query(filter_query)
+    panel_conditions, panel_params = _panel_conditions(filters)
+    where = " AND ".join(["profile_name = ?"] + conditions + panel_conditions)
+    params = [profile_name] + params + panel_params
+
+    description = (
+        "description" if description_chars is None else f"left(description, {int(description_chars)})"
+    )
+    query = (
+        f"SELECT {PAGE_COLUMNS_SQL}, {description} AS description FROM jobs "
+        f"WHERE {where} ORDER BY {build_order_by(sort_by)}"
+    )
+    page_params = list(params)
+    if page_size:
+        query += " LIMIT ? OFFSET ?"
+        page_params += [page_size, max(0, page_current or 0) * page_size]
+
+    with DuckDBJobDatabase(profile_name=profile_name, pooled=True, read_only=True) as db:
+        total = db.conn.execute(f"SELECT COUNT(*) FROM jobs WHERE {where}", params).fetchone()[0]
+        rows = db.conn.execute(query, page_params).df()
+
+    return JobsPage(rows=rows, total=int(total), page_size=page_size)
+
+
+def query_jobs_table_metrics(profile_name: str) -> Dict[str, int]:
+    """Total, new, ready-to-apply and applied counts by the table's status."""
+    query = f"""
+        SELECT
+            COUNT(*),
+            COUNT(*) FILTER (WHERE {STATUS_SQL} = 'new'),
+            COUNT(*) FILTER (WHERE {STATUS_SQL} = 'ready_to_apply'),
+            COUNT(*) FILTER (WHERE {STATUS_SQL} = 'applied')
+        FROM jobs
+        WHERE profile_name = ?
+    """
+    with DuckDBJobDatabase(profile_name=profile_name, pooled=True, read_only=True) as db:
+        total, new, ready, applied = db.conn.execute(query, [profile_name]).fetchone()
+    return {"total": total, "new": new, "ready_to_apply": ready, "applied": applied}
+
+
+def query_status_counts(profile_name: str) -> Dict[str, int]:
+    """Number of jobs per table status."""
+    query = f"SELECT {STATUS_SQL}, COUNT(*) FROM jobs WHERE profile_name = ? GROUP BY 1"
+    with DuckDBJobDatabase(profile_name=profile_name, pooled=True, read_only=True) as db:
+        return dict(db.conn.execute(query, [profile_name]).fetchall())
+
+
+def query_job_companies(profile_name: str) -> List[str]:
+    """Distinct company names for the company filter dropdown."""
+    query = (
+        "SELECT DISTINCT company FROM jobs "
+        "WHERE profile_name = ? AND company IS NOT NULL AND company <> '' ORDER BY company"
+    )
+    with DuckDBJobDatabase(profile_name=profile_name, pooled=True, read_only=True) as db:
+        return [row[0] for row in db.conn.execute(query, [profile_name]).fetchall()]
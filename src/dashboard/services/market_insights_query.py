@@ -0,0 +1,92 @@
+"""
+DuckDB aggregates behind the Market Insights tab.
+
+The tab's cards, skill demand, top companies and hiring trend are all counts
+over the profile's jobs. Computing them in SQL means the description text
+that skill matching reads never leaves the database, instead of loading every
+job into the browser process on each refresh.
+"""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Sequence
+
+from src.core.duckdb_database import DuckDBJobDatabase
+
+logger = logging.getLogger(__name__)
+
+_STATS_QUERY = """
+    SELECT
+        COUNT(*),
+        COUNT(DISTINCT company) FILTER (WHERE company <> ''),
+        COUNT(DISTINCT location) FILTER (WHERE location <> ''),
+        COUNT(*) FILTER (WHERE CAST(is_rcip_city AS INTEGER) = 1)
+    FROM jobs
+    WHERE profile_name = ?
+"""
+
+# Weeks use the same %Y-W%U keys as MarketAnalyzer.detect_hiring_trends, and
+# jobs without a posting date count as posted today like the list view does.
+_COUNTS_QUERY = """
+    SELECT
+        COUNT(*),
+        histogram(trim(company)) FILTER (
+            WHERE trim(company) <> '' AND lower(trim(company)) <> 'unknown'
+        ),
+        histogram(strftime(coalesce(date_posted, CURRENT_DATE), '%Y-W%U')),
+        {skill_counts}
+    FROM (
+        SELECT
+            company,
+            date_posted,
+            lower(coalesce(title, '') || ' ' || coalesce(description, '')) AS text
+        FROM jobs
+        WHERE profile_name = ?
+    )
+"""
+
+
+@dataclass
+class MarketCounts:
+    """Per-skill, per-company and per-week job counts for one profile."""
+
+    total_jobs: int = 0
+    skill_counts: Counter = field(default_factory=Counter)
+    company_counts: Counter = field(default_factory=Counter)
+    week_counts: Counter = field(default_factory=Counter)
+
+
+def query_market_stats(profile_name: str) -> Dict[str, int]:
+    """Total jobs, distinct companies and locations, and RCIP jobs."""
+    with DuckDBJobDatabase(profile_name=profile_name, pooled=True, read_only=True) as db:
+        total, companies, locations, rcip = db.conn.execute(
+            _STATS_QUERY, [profile_name]
+        ).fetchone()
+    return {
+        "total_jobs": total,
+        "companies": companies,
+        "locations": locations,
+        "rcip_jobs": rcip,
+    }
+
+
+def query_market_counts(profile_name: str, skills: Sequence[str]) -> MarketCounts:
+    """Count jobs mentioning each skill in title or description, per company and per week."""
+    skill_counts_sql = ",\n        ".join(
+        "COUNT(*) FILTER (WHERE contains(text, ?))" for _ in skills
+    )
+    query = _COUNTS_QUERY.format(skill_counts=skill_counts_sql or "NULL")
+    params = [skill.lower() for skill in skills] + [profile_name]
+
+    with DuckDBJobDatabase(profile_name=profile_name, pooled=True, read_only=True) as db:
+        total, companies, weeks, *skill_values = db.conn.execute(query, params).fetchone()
+
+    return MarketCounts(
+        total_jobs=int(total or 0),
+        skill_counts=Counter(
+            {skill: count for skill, count in zip(skills, skill_values) if count}
+        ),
+        company_counts=Counter(companies or {}),
+        week_counts=Counter(weeks or {}),
+    )
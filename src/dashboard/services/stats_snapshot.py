@@ -0,0 +1,232 @@
+"""Single-query dashboard headline statistics with change-detection refresh."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.duckdb_database import DuckDBJobDatabase
+
+logger = logging.getLogger(__name__)
+
+# High match means a fit score strictly above this (as the ranked-jobs cards always counted)
+HIGH_MATCH_THRESHOLD = 70
+TO_APPLY_STATUSES = ("new", "ready_to_apply")
+RESPONSE_STATUSES = ("interviewing", "offer", "accepted")
+
+# Cheap probe: touches only narrow columns, never the description text.
+# Status updates do not always bump last_updated, so they are hashed in.
+_VERSION_QUERY = """
+    SELECT
+        COUNT(*), MAX(last_updated), MAX(created_at),
+        bit_xor(hash(id, status, application_status, fit_score))
+    FROM jobs
+    WHERE profile_name = ?
+"""
+
+# Every headline counter in one aggregate pass over the jobs table.
+_SNAPSHOT_QUERY = f"""
+    SELECT
+        COUNT(*) AS total_jobs,
+        COUNT(*) FILTER (WHERE fit_score > {HIGH_MATCH_THRESHOLD}) AS high_match,
+        COUNT(*) FILTER (
+            WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL 1 DAY
+        ) AS new_last_24h,
+        COUNT(*) FILTER (WHERE date_posted = CURRENT_DATE) AS posted_today,
+        COUNT(*) FILTER (
+            WHERE date_posted >= CURRENT_DATE - INTERVAL 7 DAY
+        ) AS posted_this_week,
+        COUNT(*) FILTER (WHERE CAST(is_rcip_city AS INTEGER) = 1) AS rcip_jobs,
+        COUNT(*) FILTER (
+            WHERE CAST(is_immigration_priority AS INTEGER) = 1
+        ) AS immigration_priority_jobs,
+        histogram(status) AS status_counts,
+        histogram(application_status) AS application_status_counts,
+        histogram(company) FILTER (WHERE company <> '') AS company_counts,
+        histogram(location) FILTER (WHERE location <> '') AS location_counts
+    FROM jobs
+    WHERE profile_name = ?
+"""
+
+
+@dataclass(frozen=True)
+class StatsSnapshot:
+    """Headline dashboard counters computed from one table scan."""
+
+    profile_name: str
+    version: Tuple[Any, ...]
+    computed_at: float
+    total_jobs: int = 0
+    high_match: int = 0
+    new_last_24h: int = 0
+    posted_today: int = 0
+    posted_this_week: int = 0
+    rcip_jobs: int = 0
+    immigration_priority_jobs: int = 0
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    application_status_counts: Dict[str, int] = field(default_factory=dict)
+    top_companies: List[Tuple[str, int]] = field(default_factory=list)
+    top_locations: List[Tuple[str, int]] = field(default_factory=list)
+
+    @property
+    def high_match_percentage(self) -> float:
+        """Share of jobs above the high-match threshold."""
+        if not self.total_jobs:
+            return 0.0
+        return round(self.high_match / self.total_jobs * 100, 1)
+
+    @property
+    def to_apply(self) -> int:
+        """Jobs waiting for an application."""
+        return sum(self.status_counts.get(status, 0) for status in TO_APPLY_STATUSES)
+
+    @property
+    def applied(self) -> int:
+        """Jobs marked as applied."""
+        return self.status_counts.get("applied", 0)
+
+    @property
+    def responses(self) -> int:
+        """Jobs that progressed past the application."""
+        return sum(self.status_counts.get(status, 0) for status in RESPONSE_STATUSES)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dictionary used by callbacks and ``DataLoader.get_enhanced_stats``."""
+        return {
+            "total_jobs": self.total_jobs,
+            "high_match": self.high_match,
+            "new_last_24h": self.new_last_24h,
+            "new_today": self.posted_today,
+            "new_this_week": self.posted_this_week,
+            "rcip_jobs": self.rcip_jobs,
+            "immigration_priority_jobs": self.immigration_priority_jobs,
+            "high_match_percentage": self.high_match_percentage,
+            "to_apply": self.to_apply,
+            "applied": self.applied,
+            "responses": self.responses,
+            "status_counts": dict(self.status_counts),
+            "application_status_counts": dict(self.application_status_counts),
+            "top_companies": list(self.top_companies),
+            "top_locations": list(self.top_locations),
+        }
+
+
+class DashboardStatsSnapshot:
+    """
+    Cache headline statistics per profile, keyed by a cheap table version.
+
+    Each ``get`` issues one tiny version probe: row count, the latest
+    ``last_updated``/``created_at``, and a
+    ``bit_xor(hash(id, status, application_status, fit_score))`` content
+    hash that catches edits which leave the timestamps alone. The full
+    aggregate only re-runs when that version changes, or when the snapshot
+    is older than ``max_age_seconds`` so time-relative counters (new in
+    last 24h, posted today) do not go stale on an idle database.
+    """
+
+    def __init__(self, max_age_seconds: int = 300, top_n: int = 8) -> None:
+        self.max_age_seconds = max_age_seconds
+        self.top_n = top_n
+        self._snapshots: Dict[str, StatsSnapshot] = {}
+        self._lock = threading.Lock()
+        self._recomputes = 0
+        self._probes = 0
+
+    def get(self, profile_name: str, force_refresh: bool = False) -> StatsSnapshot:
+        """Return the current snapshot for a profile, recomputing if stale."""
+        with DuckDBJobDatabase(profile_name=profile_name, pooled=True, read_only=True) as db:
+            version = tuple(db.conn.execute(_VERSION_QUERY, [profile_name]).fetchone())
+            with self._lock:
+                self._probes += 1
+                cached = self._snapshots.get(profile_name)
+            if (
+                not force_refresh
+                and cached is not None
+                and cached.version == version
+                and time.time() - cached.computed_at < self.max_age_seconds
+            ):
+                return cached
+
+            row = db.conn.execute(_SNAPSHOT_QUERY, [profile_name]).fetchone()
+
+        snapshot = self._build_snapshot(profile_name, version, row)
+        with self._lock:
+            self._snapshots[profile_name] = snapshot
+            self._recomputes += 1
+        logger.debug(
+            "Dashboard stats snapshot recomputed for %s (version=%s)",
+            profile_name,
+            version,
+        )
+        return snapshot
+
+    def invalidate(self, profile_name: Optional[str] = None) -> None:
+        """Drop cached snapshots for one profile or all of them."""
+        with self._lock:
+            if profile_name is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(profile_name, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Probe/recompute counters for diagnostics panels."""
+        with self._lock:
+            return {
+                "profiles": len(self._snapshots),
+                "probes": self._probes,
+                "recomputes": self._recomputes,
+            }
+
+    def _build_snapshot(
+        self,
+        profile_name: str,
+        version: Tuple[Any, ...],
+        row: Tuple[Any, ...],
+    ) -> StatsSnapshot:
+        (
+            total_jobs,
+            high_match,
+            new_last_24h,
+            posted_today,
+            posted_this_week,
+            rcip_jobs,
+            immigration_priority_jobs,
+            status_counts,
+            application_status_counts,
+            company_counts,
+            location_counts,
+        ) = row
+        return StatsSnapshot(
+            profile_name=profile_name,
+            version=version,
+            computed_at=time.time(),
+            total_jobs=int(total_jobs or 0),
+            high_match=int(high_match or 0),
+            new_last_24h=int(new_last_24h or 0),
+            posted_today=int(posted_today or 0),
+            posted_this_week=int(posted_this_week or 0),
+            rcip_jobs=int(rcip_jobs or 0),
+            immigration_priority_jobs=int(immigration_priority_jobs or 0),
+            status_counts=dict(status_counts or {}),
+            application_status_counts=dict(application_status_counts or {}),
+            top_companies=self._top_n(company_counts),
+            top_locations=self._top_n(location_counts),
+        )
+
+    def _top_n(self, counts: Optional[Dict[str, int]]) -> List[Tuple[str, int]]:
+        if not counts:
+            return []
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[: self.top_n]
+
+
+# Global instance
+_stats_snapshot_instance = None
+
+
+def get_stats_snapshot() -> DashboardStatsSnapshot:
+    """Get the global dashboard stats snapshot service"""
+    global _stats_snapshot_instance
+    if _stats_snapshot_instance is None:
+        _stats_snapshot_instance = DashboardStatsSnapshot()
+    return _stats_snapshot_instance
@@ -0,0 +1,408 @@
+"""
+Embedding Store
+Content-addressed, append-only embedding matrix per model.
+
+Each model gets these files in the store directory:
+
+- ``<model>.f32``: float32 vectors, one row per cached text, appended in place
+  and read back through a read-only ``numpy.memmap``
+- ``<model>.ts``: float64 write time of each row, used to enforce the TTL
+- ``<model>.keys``: 16-byte content hashes, row-aligned with the vectors
+- ``<model>.json``: vector dimension and file generation
+- ``<model>.lock``: advisory lock serializing writers across processes
+
+On open only the key and time files are read to rebuild the hash -> row
+index; vectors stay on disk until touched, so warm starts cost one small
+sequential read instead of opening a pickle per embedding. Vectors and times
+are written before their keys, so a crash mid-append leaves at most an
+unindexed tail, which the next writer drops while holding the lock. Rows
+appended by other processes are picked up when the key file grows.
+
+``compact()`` drops expired and superseded rows by writing a new generation
+of the data files and switching to it through the JSON file, so readers
+never see a half-rewritten matrix.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+KEY_BYTES = 16
+
+
+def content_key(text: str) -> bytes:
+    """Content hash used as the store key for a text or cache key string."""
+    return hashlib.sha256((text or "").encode("utf-8")).digest()[:KEY_BYTES]
+
+
+def _model_slug(model: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", model) or "default"
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """Hold an exclusive advisory lock on ``path`` across processes."""
+    with open(path, "a+b") as f:
+        if os.name == "nt":  # Windows
+            import msvcrt
+
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class EmbeddingStore:
+    """
+    Memory-mapped float32 embedding matrix with a hash -> row index.
+
+    Thread-safe within one process; appends from several processes are
+    serialized by a lock file. Rows older than ``ttl_seconds`` are treated
+    as missing and written again on the next ``put``.
+    """
+
+    def __init__(self, store_dir: str, model: str, ttl_seconds: Optional[float] = None):
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.model = model
+        self.ttl_seconds = ttl_seconds
+
+        self._slug = _model_slug(model)
+        self.meta_path = self.store_dir / f"{self._slug}.json"
+        self.lock_path = self.store_dir / f"{self._slug}.lock"
+
+        self._lock = threading.Lock()
+        self._index: Dict[bytes, int] = {}
+        self._written = np.empty(0, dtype=np.float64)
+        self._dim: Optional[int] = None
+        self._generation = 0
+        self._count = 0
+        self._keys_size = 0
+        self._meta_stamp: Optional[Tuple[int, int]] = None
+        self._view: Optional[np.ndarray] = None
+
+        with self._lock, _file_lock(self.lock_path):
+            self._load_locked()
+
+    def _data_path(self, suffix: str, generation: Optional[int] = None) -> Path:
+        generation = self._generation if generation is None else generation
+        stem = self._slug if generation == 0 else f"{self._slug}.{generation}"
+        return self.store_dir / f"{stem}.{suffix}"
+
+    @property
+    def vectors_path(self) -> Path:
+        return self._data_path("f32")
+
+    @property
+    def keys_path(self) -> Path:
+        return self._data_path("keys")
+
+    @property
+    def times_path(self) -> Path:
+        return self._data_path("ts")
+
+    def _load_locked(self) -> None:
+        """Rebuild the in-memory index from the key and time files."""
+        self._index, self._dim, self._generation, self._count, self._keys_size = {}, None, 0, 0, 0
+        self._written = np.empty(0, dtype=np.float64)
+        self._view = None
+        self._meta_stamp = self._stat_meta()
+        if self._meta_stamp is None:
+            return
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            self._dim = int(meta["dim"])
+            self._generation = int(meta.get("generation", 0))
+            self._sync_locked()
+            logger.debug(f"Loaded {self._count} embeddings for {self.model}")
+        except Exception as e:
+            logger.error(f"Failed to load embedding store for {self.model}: {e}")
+            self._index, self._dim, self._generation, self._count = {}, None, 0, 0
+            self._written = np.empty(0, dtype=np.float64)
+
+    def _sync_locked(self) -> None:
+        """Index rows appended to the key file since the last read."""
+        if not self.keys_path.exists():
+            return
+        keys = np.frombuffer(
+            self._read_tail(self.keys_path, self._count * KEY_BYTES, KEY_BYTES),
+            # Raw bytes: an "S" dtype would strip hashes ending in NUL
+            dtype=f"V{KEY_BYTES}",
+        )
+        vector_rows = self.vectors_path.stat().st_size // (4 * self._dim)
+        new_count = min(self._count + len(keys), vector_rows)
+        if new_count <= self._count:
+            return
+
+        written = np.frombuffer(
+            self._read_tail(self.times_path, self._count * 8, 8), dtype=np.float64
+        )
+        if len(written) < new_count - self._count:
+            # Times are appended before keys, so a short time file is corruption
+            raise ValueError(f"{self.times_path.name} has fewer rows than {self.keys_path.name}")
+
+        for offset, key in enumerate(keys[: new_count - self._count].tolist()):
+            self._index[key] = self._count + offset
+        self._written = np.concatenate([self._written, written[: new_count - self._count]])
+        self._count = new_count
+        self._keys_size = self._count * KEY_BYTES
+
+    @staticmethod
+    def _read_tail(path: Path, offset: int, item_size: int) -> bytes:
+        """Whole items stored in ``path`` past ``offset``."""
+        if not path.exists():
+            return b""
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        return data[: len(data) - len(data) % item_size]
+
+    def _stat_meta(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.meta_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _refresh_locked(self) -> None:
+        """Pick up appends or a compaction made by another process."""
+        if self._stat_meta() != self._meta_stamp:
+            # Created or compacted into a new generation elsewhere
+            self._load_locked()
+            return
+        if self._dim is None:
+            return
+        try:
+            keys_size = self.keys_path.stat().st_size
+            if keys_size != self._keys_size:
+                self._sync_locked()
+        except (FileNotFoundError, ValueError):
+            # Reloading logs the problem and resets a corrupt store
+            self._load_locked()
+
+    def refresh(self) -> None:
+        """Make rows written by other processes visible to this one."""
+        with self._lock:
+            self._refresh_locked()
+
+    def _cutoff(self) -> float:
+        if self.ttl_seconds is None:
+            return float("-inf")
+        return time.time() - self.ttl_seconds
+
+    @property
+    def dim(self) -> Optional[int]:
+        return self._dim
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: bytes) -> bool:
+        row = self._index.get(key)
+        return row is not None and self._written[row] >= self._cutoff()
+
+    def matrix(self) -> np.ndarray:
+        """
+        Read-only ``(rows, dim)`` view of every stored vector.
+
+        The view is memory-mapped, so slicing or multiplying it does not copy
+        the file into memory first. Rows appended later need a fresh call.
+        """
+        with self._lock:
+            self._refresh_locked()
+            return self._matrix_locked()
+
+    def _matrix_locked(self) -> np.ndarray:
+        if self._dim is None or self._count == 0:
+            return np.empty((0, self._dim or 0), dtype=np.float32)
+        if self._view is None or len(self._view) != self._count:
+            self._view = np.memmap(
+                self.vectors_path, dtype=np.float32, mode="r", shape=(self._count, self._dim)
+            )
+        return self._view
+
+    def rows(self, keys: Iterable[bytes]) -> np.ndarray:
+        """Row of each key in ``matrix()``, ``-1`` for keys not stored or expired."""
+        index = self._index
+        rows = np.fromiter((index.get(key, -1) for key in keys), dtype=np.int64)
+        if self.ttl_seconds is not None and len(rows):
+            stored = rows >= 0
+            expired = np.zeros_like(stored)
+            expired[stored] = self._written[rows[stored]] < self._cutoff()
+            rows[expired] = -1
+        return rows
+
+    def get_many(self, keys: Sequence[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Look up vectors for many keys at once.
+
+        Returns ``(vectors, found)``: a ``(len(keys), dim)`` float32 array
+        (zeros for misses) and a boolean mask of the keys that were stored.
+        """
+        with self._lock:
+            self._refresh_locked()
+            rows = self.rows(keys)
+            matrix = self._matrix_locked()
+        found = rows >= 0
+        vectors = np.zeros((len(keys), matrix.shape[1]), dtype=np.float32)
+        if found.any():
+            vectors[found] = matrix[rows[found]]
+        return vectors, found
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        """Vector for one key, or ``None`` when not stored or expired."""
+        vectors, found = self.get_many([key])
+        return vectors[0] if found[0] else None
+
+    def put_many(self, keys: Sequence[bytes], vectors) -> int:
+        """
+        Append vectors for keys not stored yet (or whose row has expired).
+
+        Returns the number of rows written. Duplicate keys within the call
+        keep their first vector.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        if len(keys) != len(vectors):
+            raise ValueError(f"Got {len(keys)} keys for {len(vectors)} vectors")
+
+        with self._lock, _file_lock(self.lock_path):
+            self._refresh_locked()
+            if self._dim is None:
+                self._dim = int(vectors.shape[1])
+                self._write_meta(0)
+            elif vectors.shape[1] != self._dim:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match store ({self._dim})"
+                )
+
+            stored = self.rows(keys) >= 0
+            new_rows: List[int] = []
+            new_keys: List[bytes] = []
+            seen = set()
+            for i, key in enumerate(keys):
+                if stored[i] or key in seen:
+                    continue
+                seen.add(key)
+                new_rows.append(i)
+                new_keys.append(key)
+            if not new_rows:
+                return 0
+
+            # Vectors and times first: an interrupted write leaves only unindexed rows
+            now = time.time()
+            self._append(self.vectors_path, self._count * 4 * self._dim, vectors[new_rows])
+            self._append(
+                self.times_path, self._count * 8, np.full(len(new_keys), now, dtype=np.float64)
+            )
+            self._append(
+                self.keys_path, self._count * KEY_BYTES, np.array(new_keys, dtype=f"S{KEY_BYTES}")
+            )
+
+            for offset, key in enumerate(new_keys):
+                self._index[key] = self._count + offset
+            self._written = np.concatenate(
+                [self._written, np.full(len(new_keys), now, dtype=np.float64)]
+            )
+            self._count += len(new_keys)
+            self._keys_size = self._count * KEY_BYTES
+            return len(new_keys)
+
+    @staticmethod
+    def _append(path: Path, indexed_size: int, data: np.ndarray) -> None:
+        """
+        Append ``data`` after the indexed rows.
+
+        Callers hold the store's file lock and have synced with the key file,
+        so bytes past ``indexed_size`` can only be a tail left by a crashed
+        writer and are dropped.
+        """
+        with open(path, "ab") as f:
+            if f.seek(0, 2) != indexed_size:
+                f.truncate(indexed_size)
+            np.ascontiguousarray(data).tofile(f)
+
+    def _write_meta(self, generation: int) -> None:
+        tmp_path = self.meta_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"model": self.model, "dim": self._dim, "generation": generation}, f)
+        os.replace(tmp_path, self.meta_path)
+        self._meta_stamp = self._stat_meta()
+
+    def put(self, key: bytes, vector) -> bool:
+        """Append one vector; ``False`` if the key was already stored."""
+        return self.put_many([key], np.asarray(vector).reshape(1, -1)) == 1
+
+    def compact(self) -> int:
+        """
+        Drop expired rows and rows superseded by a newer write.
+
+        The surviving rows go to a new generation of data files, which the
+        JSON file then points at; the old files are removed afterwards.
+        Returns the number of rows dropped.
+        """
+        with self._lock, _file_lock(self.lock_path):
+            self._refresh_locked()
+            if self._dim is None or self._count == 0:
+                return 0
+            live_keys = {
+                row: key
+                for key, row in self._index.items()
+                if self._written[row] >= self._cutoff()
+            }
+            dropped = self._count - len(live_keys)
+            if not dropped:
+                return 0
+
+            live_rows = np.array(sorted(live_keys), dtype=np.int64)
+            old_generation, new_generation = self._generation, self._generation + 1
+            matrix = self._matrix_locked()
+            matrix[live_rows].tofile(self._data_path("f32", new_generation))
+            self._written[live_rows].tofile(self._data_path("ts", new_generation))
+            np.array(
+                [live_keys[row] for row in live_rows.tolist()], dtype=f"S{KEY_BYTES}"
+            ).tofile(self._data_path("keys", new_generation))
+            self._write_meta(new_generation)
+
+            self._view = None
+            del matrix
+            for suffix in ("f32", "ts", "keys"):
+                try:
+                    self._data_path(suffix, old_generation).unlink()
+                except OSError:
+                    pass  # Still mapped by a reader on Windows; harmless leftover
+            self._load_locked()
+            logger.info(f"Compacted {self.model} embeddings: dropped {dropped} rows")
+            return dropped
+
+    def size_bytes(self) -> int:
+        """Bytes used on disk by this model's files."""
+        return sum(
+            path.stat().st_size
+            for path in (self.vectors_path, self.times_path, self.keys_path, self.meta_path)
+            if path.exists()
+        )
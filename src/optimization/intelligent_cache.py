@@ -7,12 +7,17 @@ Profile-aware caching with dashboard analytics support
 import hashlib
 import json
 import logging
-import pickle
+import os
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence
 from datetime import datetime, timedelta
 from cachetools import LRUCache
 
+import numpy as np
+
+from .embedding_store import EmbeddingStore, content_key
+
 logger = logging.getLogger(__name__)
 
 # Legacy compatibility caches
@@ -26,6 +31,7 @@ class IntelligentCache:
 
     Features:
     - Content-based hashing for cache keys
+    - Embeddings in one memory-mapped matrix per model (see EmbeddingStore)
     - Profile-aware caching and statistics
     - Dashboard analytics integration
     - Automatic expiration and cleanup
@@ -47,6 +53,10 @@ class IntelligentCache:
         self.html_ttl = timedelta(hours=html_ttl_hours)
         self.embedding_ttl = timedelta(hours=embedding_ttl_hours)
 
+        # One embedding store per model, opened on first use
+        self._embedding_stores: Dict[str, EmbeddingStore] = {}
+        self._stores_lock = threading.Lock()
+
         # Statistics for dashboard
         self._stats = {
             "html_hits": 0,
@@ -114,35 +124,39 @@ class IntelligentCache:
 
         return result
 
+    def get_embedding_store(self, model: str) -> EmbeddingStore:
+        """Get the memory-mapped embedding store for a model"""
+        with self._stores_lock:
+            store = self._embedding_stores.get(model)
+            if store is None:
+                store = EmbeddingStore(
+                    self.embedding_dir, model, ttl_seconds=self.embedding_ttl.total_seconds()
+                )
+                self._embedding_stores[model] = store
+            return store
+
     def cache_embedding(self, text_h: str, model: str, emb, profile: str = "default"):
         """Cache embedding with profile and model tracking"""
-        try:
-            key = f"{text_h}:{model}"
-            EMBED_CACHE[key] = emb
-
-            # Enhanced caching with persistence
-            embedding_path = self.embedding_dir / f"{key.replace(':', '_')}.pkl"
-            with open(embedding_path, "wb") as f:
-                pickle.dump(emb, f)
-
-            # Store metadata for dashboard analytics
-            metadata = {
-                "timestamp": datetime.now().isoformat(),
-                "profile": profile,
-                "content_hash": text_h,
-                "model_name": model,
-                "cache_type": "embedding",
-            }
+        self.cache_embeddings([text_h], model, [emb], profile)
 
-            metadata_path = self.metadata_dir / f"{key.replace(':', '_')}.json"
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
+    def cache_embeddings(
+        self, text_hs: Sequence[str], model: str, embs, profile: str = "default"
+    ) -> int:
+        """Cache many embeddings of one model with a single append"""
+        try:
+            for text_h, emb in zip(text_hs, embs):
+                EMBED_CACHE[f"{text_h}:{model}"] = emb
 
-            self._stats["total_cached_items"] += 1
-            logger.debug(f"Cached embedding for profile {profile}: {key}")
+            written = self.get_embedding_store(model).put_many(
+                [content_key(text_h) for text_h in text_hs], np.asarray(embs)
+            )
+            self._stats["total_cached_items"] += written
+            logger.debug(f"Cached {written} embeddings for profile {profile} ({model})")
+            return written
 
         except Exception as e:
             logger.error(f"Failed to cache embedding: {e}")
+            return 0
 
     def get_cached_embedding(self, text_h: str, model: str):
         """Get cached embedding with hit/miss tracking"""
@@ -153,20 +167,34 @@ class IntelligentCache:
             self._stats["embedding_hits"] += 1
             logger.debug(f"Cache hit for embedding: {key}")
         else:
-            self._stats["embedding_misses"] += 1
-            # Try file cache
+            # Try the persistent store
             try:
-                embedding_path = self.embedding_dir / f"{key.replace(':', '_')}.pkl"
-                if embedding_path.exists():
-                    with open(embedding_path, "rb") as f:
-                        result = pickle.load(f)
-                    EMBED_CACHE[key] = result  # Update memory cache
-                    self._stats["embedding_hits"] += 1
+                result = self.get_embedding_store(model).get(content_key(text_h))
             except Exception as e:
                 logger.error(f"Error reading cached embedding: {e}")
+            if result is not None:
+                EMBED_CACHE[key] = result  # Update memory cache
+                self._stats["embedding_hits"] += 1
+            else:
+                self._stats["embedding_misses"] += 1
 
         return result
 
+    def get_cached_embeddings(self, text_hs: Sequence[str], model: str) -> List[Optional[Any]]:
+        """Get cached embeddings for many texts, ``None`` for each miss"""
+        try:
+            vectors, found = self.get_embedding_store(model).get_many(
+                [content_key(text_h) for text_h in text_hs]
+            )
+        except Exception as e:
+            logger.error(f"Error reading cached embeddings: {e}")
+            vectors, found = None, np.zeros(len(text_hs), dtype=bool)
+
+        hits = int(found.sum())
+        self._stats["embedding_hits"] += hits
+        self._stats["embedding_misses"] += len(text_hs) - hits
+        return [vectors[i] if hit else None for i, hit in enumerate(found)]
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics for dashboard"""
         total_html = self._stats["html_hits"] + self._stats["html_misses"]
@@ -178,7 +206,9 @@ class IntelligentCache:
                 "html_hit_rate": (self._stats["html_hits"] / max(total_html, 1)),
                 "embedding_hit_rate": (self._stats["embedding_hits"] / max(total_embedding, 1)),
                 "total_html_items": len(HTML_CACHE),
-                "total_embedding_items": len(EMBED_CACHE),
+                "total_embedding_items": sum(
+                    len(store) for store in self._embedding_stores.values()
+                ),
                 "cache_size_mb": self._calculate_cache_size(),
             }
         )
@@ -187,11 +217,14 @@ class IntelligentCache:
     def _calculate_cache_size(self) -> float:
         """Calculate cache size for dashboard display"""
         try:
+            # Embeddings are a few files per model; HTML and metadata are flat dirs
             total_size = 0
-            if self.cache_dir.exists():
-                for file_path in self.cache_dir.rglob("*"):
-                    if file_path.is_file():
-                        total_size += file_path.stat().st_size
+            for directory in (self.html_dir, self.metadata_dir, self.embedding_dir):
+                if directory.exists():
+                    with os.scandir(directory) as entries:
+                        total_size += sum(
+                            entry.stat().st_size for entry in entries if entry.is_file()
+                        )
             return round(total_size / (1024 * 1024), 2)
         except Exception:
             return 0.0
@@ -232,6 +265,15 @@ class IntelligentCache:
                 except Exception as e:
                     logger.error(f"Error processing {metadata_path}: {e}")
 
+            # Embedding stores drop expired rows by compacting their files
+            for meta_path in self.embedding_dir.glob("*.json"):
+                try:
+                    with open(meta_path, "r", encoding="utf-8") as f:
+                        model = json.load(f)["model"]
+                    cleaned_count += self.get_embedding_store(model).compact()
+                except Exception as e:
+                    logger.error(f"Error compacting {meta_path}: {e}")
+
             logger.info(f"Cleaned up {cleaned_count} expired cache items")
             return cleaned_count
 
@@ -8,14 +8,19 @@ import json
 import logging
 import torch
 import torch.nn.functional as F
+import numpy as np
 from typing import Dict, Any, Optional, List
 from sentence_transformers import SentenceTransformer
-from .intelligent_cache import cache_embedding, get_cached_embedding
+from .embedding_store import content_key
+from .intelligent_cache import cache_embedding, get_cache, get_cached_embedding
 
 logger = logging.getLogger(__name__)
 
 MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
 
+# Texts per model.encode call when embedding cache misses
+EMBED_BATCH_SIZE = 64
+
 # PERFORMANCE FIX: Check if heavy AI models are disabled
 if (
     os.environ.get("DISABLE_SENTENCE_TRANSFORMERS") == "1"
@@ -183,6 +188,76 @@ class ProfileEmbedding:
             logger.error(f"Failed to generate job embedding: {e}")
             return None
 
+    def get_job_embeddings(
+        self, job_texts: List[str], batch_size: int = EMBED_BATCH_SIZE
+    ) -> Optional[np.ndarray]:
+        """
+        Get a ``(len(job_texts), dim)`` embedding matrix for many job texts
+
+        Only texts missing from the embedding store are encoded, in batches,
+        and written back with a single append.
+        """
+        if not self.model:
+            return None
+
+        store = get_cache().get_embedding_store(MODEL_NAME)
+        keys = [content_key(text) for text in job_texts]
+        found = store.rows(keys) >= 0
+
+        missing = list(dict.fromkeys(text for text, hit in zip(job_texts, found) if not hit))
+        hits = int(found.sum())
+        self._stats["cache_hits"] += hits
+        self._stats["cache_misses"] += len(job_texts) - hits
+
+        if missing:
+            try:
+                embs = self.model.encode(missing, batch_size=batch_size, convert_to_numpy=True)
+                get_cache().cache_embeddings(missing, MODEL_NAME, embs)
+                self._stats["jobs_embedded"] += len(missing)
+            except Exception as e:
+                logger.error(f"Failed to generate job embeddings: {e}")
+                return None
+
+        vectors, _ = store.get_many(keys)
+        return vectors
+
+    def score_jobs(
+        self, profile_data: Dict[str, Any], jobs_data: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        """
+        Semantic similarity of every job to a profile in one pass
+
+        Same 0.0-1.0 scale as ``calculate_semantic_similarity``: cosine
+        similarity of each job row against the profile vector, computed with a
+        single matrix-vector product over the job embedding matrix.
+        """
+        scores = np.zeros(len(jobs_data), dtype=np.float32)
+        if not self.model or not jobs_data:
+            return scores
+
+        profile_text = self.extract_profile_text(profile_data)
+        if not profile_text:
+            return scores
+
+        profile_emb = get_profile_embedding(profile_text)
+        job_texts = [self._extract_job_text(job) for job in jobs_data]
+        matrix = self.get_job_embeddings(job_texts)
+        if profile_emb is None or matrix is None:
+            return scores
+
+        profile_vec = np.asarray(profile_emb, dtype=np.float32).ravel()
+        profile_vec = profile_vec / max(float(np.linalg.norm(profile_vec)), 1e-12)
+        norms = np.linalg.norm(matrix, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cosine = np.where(norms > 0, (matrix @ profile_vec) / norms, -1.0)
+
+        # Convert to 0-1 range; jobs without any text score 0 as in the single-job path
+        scores = np.clip((cosine + 1) / 2, 0.0, 1.0).astype(np.float32)
+        scores[np.array([not text for text in job_texts], dtype=bool)] = 0.0
+
+        self._stats["similarity_calculations"] += len(jobs_data)
+        return scores
+
     def get_stats(self) -> Dict[str, Any]:
         """Get embedding statistics for dashboard"""
         stats = self._stats.copy()
@@ -193,6 +268,18 @@ class ProfileEmbedding:
         return stats
 
 
+def top_k_indices(scores: np.ndarray, k: int, min_score: float = 0.0) -> np.ndarray:
+    """Indices of the ``k`` highest scores at or above ``min_score``, best first"""
+    candidates = np.flatnonzero(scores >= min_score)
+    if k <= 0 or candidates.size == 0:
+        return np.empty(0, dtype=np.int64)
+    if candidates.size > k:
+        part = np.argpartition(scores[candidates], -k)[-k:]
+        candidates = np.sort(candidates[part])
+    # Stable sort so equal scores keep input order
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
 # Global instance
 _profile_embedding_instance = None
 
@@ -5,7 +5,7 @@ Implements semantic scoring from AI_STRATEGY_ANALYSIS.md
 
 import logging
 from typing import Dict, Any, List, Tuple
-from .profile_embedding import get_profile_embedding_service
+from .profile_embedding import get_profile_embedding_service, top_k_indices
 from .intelligent_cache import get_cache
 
 logger = logging.getLogger(__name__)
@@ -55,24 +55,7 @@ class SemanticScorer:
                 profile_name, profile_data, job_data
             )
 
-            # Add score to job data for caching
-            job_data["semantic_score"] = semantic_score
-            job_data["profile_similarity"] = semantic_score
-
-            # Update statistics
-            self._update_score_stats(semantic_score)
-
-            # Determine match quality
-            match_quality = self._determine_match_quality(semantic_score)
-
-            result = {
-                "semantic_score": semantic_score,
-                "match_quality": match_quality,
-                "profile_name": profile_name,
-                "job_id": job_data.get("id", "unknown"),
-                "cache_hit": False,  # Updated by cache system
-                "timestamp": self._get_timestamp(),
-            }
+            result = self._build_score_result(profile_name, job_data, semantic_score)
 
             logger.debug(
                 f"Calculated semantic score: {semantic_score:.3f} "
@@ -108,11 +91,12 @@ class SemanticScorer:
             List of score dictionaries
         """
         try:
-            scores = []
+            semantic_scores = self.embedding_service.score_jobs(profile_data, jobs_data)
 
-            for job_data in jobs_data:
-                score_result = self.calculate_job_score(profile_name, profile_data, job_data)
-                scores.append(score_result)
+            scores = [
+                self._build_score_result(profile_name, job_data, float(semantic_score))
+                for job_data, semantic_score in zip(jobs_data, semantic_scores)
+            ]
 
             logger.info(f"Calculated {len(scores)} semantic scores " f"for profile {profile_name}")
 
@@ -122,6 +106,23 @@ class SemanticScorer:
             logger.error(f"Failed to batch score jobs: {e}")
             return []
 
+    def _build_score_result(
+        self, profile_name: str, job_data: Dict[str, Any], semantic_score: float
+    ) -> Dict[str, Any]:
+        """Record a score on the job and build its score dictionary"""
+        job_data["semantic_score"] = semantic_score
+        job_data["profile_similarity"] = semantic_score
+        self._update_score_stats(semantic_score)
+
+        return {
+            "semantic_score": semantic_score,
+            "match_quality": self._determine_match_quality(semantic_score),
+            "profile_name": profile_name,
+            "job_id": job_data.get("id", "unknown"),
+            "cache_hit": False,  # Updated by cache system
+            "timestamp": self._get_timestamp(),
+        }
+
     def rank_jobs_by_score(
         self, scored_jobs: List[Dict[str, Any]], min_score: float = 0.0
     ) -> List[Dict[str, Any]]:
@@ -175,14 +176,14 @@ class SemanticScorer:
             List of top matching jobs with scores
         """
         try:
-            # Calculate scores for all jobs
-            scored_jobs = self.batch_score_jobs(profile_name, profile_data, jobs_data)
-
-            # Rank jobs
-            ranked_jobs = self.rank_jobs_by_score(scored_jobs, min_score)
+            # Score all jobs in one pass, then select the top K without a full sort
+            semantic_scores = self.embedding_service.score_jobs(profile_data, jobs_data)
+            top_indices = top_k_indices(semantic_scores, top_k, min_score)
 
-            # Return top K
-            top_matches = ranked_jobs[:top_k]
+            top_matches = [
+                self._build_score_result(profile_name, jobs_data[i], float(semantic_scores[i]))
+                for i in top_indices
+            ]
 
             logger.info(f"Found {len(top_matches)} top matches " f"for profile {profile_name}")
 
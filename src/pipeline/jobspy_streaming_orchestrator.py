@@ -3,9 +3,10 @@
 """
 JobSpy → Two-Stage Processor Orchestrator (streaming batches with backpressure)
 
-- Runs multi-site JobSpy workers in parallel
-- Optionally enriches missing descriptions asynchronously
-- Streams jobs into TwoStageJobProcessor in bounded batches to keep memory stable
+- Runs multi-site JobSpy workers as a producer feeding a bounded queue
+- Optionally enriches missing descriptions per search result
+- Deduplicates and processes jobs while discovery is still running
+- Writes each processed batch to DuckDB as soon as it finishes
 
 Usage (example):
 
@@ -30,22 +31,48 @@ Usage (example):
 from __future__ import annotations
 
 import asyncio
+import time
+from contextlib import aclosing, nullcontext
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
 import pandas as pd
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
 from src.scrapers.multi_site_jobspy_workers import MultiSiteJobSpyWorkers
-from src.analysis.two_stage_processor import get_two_stage_processor, TwoStageResult
+from src.analysis.two_stage_processor import (
+    get_two_stage_processor,
+    TwoStageJobProcessor,
+    TwoStageResult,
+)
+from src.core.duckdb_database import DuckDBJobDatabase
+from src.core.persistent_dedup_index import PersistentDedupIndex
+from src.core.processing_planner import ProcessingPlanner
 from src.utils.profile_helpers import load_profile
 
 # Phase 2: Unified Deduplication
-from src.core.unified_deduplication import deduplicate_jobs_unified
+from src.core.unified_deduplication import UnifiedJobDeduplicator
 
 console = Console()
 
+# Marks the end of discovery on the search-result queue
+_DISCOVERY_DONE = object()
+
+# (processor key, JobSpy column, default when the column is missing or null)
+_JOB_DICT_FIELDS = (
+    ("title", "title", ""),
+    ("company", "company", ""),
+    ("location", "location", ""),
+    ("description", "description", ""),
+    ("url", "job_url", ""),
+    ("source_site", "source_site", "jobspy"),
+    ("search_term", "search_term", ""),
+    ("search_location", "search_location", ""),
+    ("date_posted", "date_posted", ""),
+    ("compensation", "compensation", ""),
+)
+
 
 @dataclass
 class OrchestratorConfig:
@@ -55,7 +82,7 @@ class OrchestratorConfig:
     sites: Optional[List[str]] = None  # defaults to all
     max_jobs_per_site_location: int = 80  # results_wanted
     per_site_concurrency: int = 4
-    max_total_jobs: Optional[int] = 2200  # early stop per site
+    max_total_jobs: Optional[int] = 2200  # stop discovery after this many unique jobs
 
     # Enrichment
     fetch_descriptions: bool = True
@@ -66,64 +93,213 @@ class OrchestratorConfig:
     cpu_workers: int = 12
     max_concurrent_stage2: int = 2
 
+    # Streaming
+    queue_size: int = 8  # search results buffered before discovery waits
+    save_to_db: bool = True
+    skip_known_jobs: bool = True  # drop jobs already stored in the profile DB
+
+
+@dataclass
+class StreamingStats:
+    """Counters for one streaming run."""
+
+    searches_received: int = 0
+    jobs_discovered: int = 0
+    jobs_known: int = 0
+    jobs_unique: int = 0
+    jobs_processed: int = 0
+    jobs_saved: int = 0
+    batches: int = 0
+    first_batch_seconds: Optional[float] = None
+
 
 def _df_to_job_dicts(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Convert JobSpy DataFrame rows into processor-friendly dicts."""
-    records: List[Dict[str, Any]] = []
-    for _, row in df.iterrows():
-        rec = {
-            "id": str(row.get("job_id") or row.get("id") or row.get("job_url") or ""),
-            "title": row.get("title", ""),
-            "company": row.get("company", ""),
-            "location": row.get("location", ""),
-            "description": row.get("description", ""),
-            "url": row.get("job_url", ""),
-            "source_site": row.get("source_site", "jobspy"),
-            "search_term": row.get("search_term", ""),
-            "search_location": row.get("search_location", ""),
-            "date_posted": row.get("date_posted", ""),
-            "compensation": row.get("compensation", ""),
-        }
-        records.append(rec)
-    return records
-
-
-async def _process_in_batches(
-    jobs: List[Dict[str, Any]], cpu_workers: int, max_concurrent_stage2: int, batch_size: int
+    if df is None or df.empty:
+        return []
+
+    frame = pd.DataFrame(
+        {
+            key: df[column] if column in df.columns else default
+            for key, column, default in _JOB_DICT_FIELDS
+        },
+        index=df.index,
+    ).astype(object)
+    for key, _, default in _JOB_DICT_FIELDS:
+        frame[key] = frame[key].where(frame[key].notna(), default)
+
+    # First non-empty identifier wins: job_id, then id, then job_url
+    ids = pd.Series(None, index=df.index, dtype=object)
+    for column in ("job_id", "id", "job_url"):
+        if column in df.columns:
+            candidate = df[column].astype(object)
+            candidate = candidate.where(candidate.notna() & (candidate != ""))
+            ids = ids.where(ids.notna(), candidate)
+    frame.insert(0, "id", ids.where(ids.notna(), "").astype(str))
+
+    return frame.to_dict("records")
+
+
+async def _discover_into_queue(
+    workers: MultiSiteJobSpyWorkers,
+    queue: asyncio.Queue,
+    stop: asyncio.Event,
+    stats: StreamingStats,
+    locations: List[str],
+    search_terms: List[str],
+    sites: List[str],
+    fetch_descriptions: bool,
+    description_fetch_concurrency: int,
+    known_index: Optional[PersistentDedupIndex] = None,
+) -> None:
+    """Producer: push each search's jobs onto the bounded queue as it completes.
+
+    Jobs already stored by earlier runs are dropped here, before they cost
+    an enrichment fetch or a Stage 1 pass.
+    """
+    try:
+        searches = workers.iter_discovery(
+            sites=sites,
+            locations=locations,
+            search_terms=search_terms,
+            max_jobs_per_site=workers.max_jobs_per_site,
+            per_site_concurrency=workers.concurrency,
+        )
+        async with aclosing(searches):
+            async for df in searches:
+                jobs = _df_to_job_dicts(df)
+                stats.jobs_discovered += len(jobs)
+
+                if known_index is not None:
+                    is_new = known_index.new_job_mask(jobs)
+                    stats.jobs_known += is_new.count(False)
+                    df = df[is_new]
+                    jobs = [job for job, new in zip(jobs, is_new) if new]
+                if not jobs:
+                    continue
+
+                if fetch_descriptions:
+                    try:
+                        df = await workers.run_optimized_description_fetching(
+                            df, max_concurrency=description_fetch_concurrency
+                        )
+                        jobs = _df_to_job_dicts(df)
+                    except Exception as e:
+                        console.print(f"[yellow]Description enrichment failed: {e}[/yellow]")
+
+                # Blocks while the consumer is behind, so memory stays bounded
+                await queue.put(jobs)
+                if stop.is_set():
+                    break
+    except Exception as e:
+        console.print(f"[red]❌ Streaming discovery failed: {e}[/red]")
+    # Not in a finally: a cancelled producer has no consumer left to signal
+    await queue.put(_DISCOVERY_DONE)
+
+
+async def _process_batch(
+    batch: List[Dict[str, Any]],
+    processor: TwoStageJobProcessor,
+    db: Optional[DuckDBJobDatabase],
+    stats: StreamingStats,
+    planner: Optional[ProcessingPlanner] = None,
 ) -> List[TwoStageResult]:
-    """Process jobs in bounded batches to keep memory stable."""
-    from math import ceil
+    """Run one batch through both stages and write it back immediately.
 
-    processor = get_two_stage_processor(
-        {"profile_name": "auto"},
-        cpu_workers=cpu_workers,
-        max_concurrent_stage2=max_concurrent_stage2,
-    )
+    Saved jobs are recorded with ``planner`` so later planned runs skip them
+    until their text or the profile changes. The write-back runs on a worker
+    thread so discovery keeps going while DuckDB writes.
+    """
+    results = await processor.process_jobs(batch)
+    stats.batches += 1
+    stats.jobs_processed += len(results)
 
-    total = len(jobs)
-    if total == 0:
-        return []
+    if db is not None:
+        try:
+            stats.jobs_saved += await asyncio.to_thread(_save_batch, batch, results, db, planner)
+        except Exception as e:
+            console.print(f"[yellow]Saving batch {stats.batches} failed: {e}[/yellow]")
+
+    return results
+
+
+def _save_batch(
+    batch: List[Dict[str, Any]],
+    results: List[TwoStageResult],
+    db: DuckDBJobDatabase,
+    planner: Optional[ProcessingPlanner],
+) -> int:
+    """Store a processed batch, write its analysis and record it as processed.
+
+    Returns the number of newly stored jobs.
+    """
+    saved = db.add_jobs_batch(batch)
+    summary = db.bulk_update_analysis([result.to_analysis_update() for result in results])
+    if planner is not None:
+        missing = set(summary["missing_ids"])
+        planner.mark_jobs_processed(
+            result.job_id for result in results if str(result.job_id) not in missing
+        )
+    return saved
 
+
+async def _process_stream(
+    queue: asyncio.Queue,
+    stop: asyncio.Event,
+    stats: StreamingStats,
+    processor: TwoStageJobProcessor,
+    db: Optional[DuckDBJobDatabase],
+    planner: Optional[ProcessingPlanner],
+    batch_size: int,
+    max_total_jobs: Optional[int],
+    progress: Progress,
+    task_id: Any,
+    started_at: float,
+) -> List[TwoStageResult]:
+    """Consumer: dedup incoming jobs and process batches as soon as work is available.
+
+    A batch is dispatched once ``batch_size`` jobs are pending, or earlier
+    whenever discovery has nothing new queued, so the first ranked jobs
+    arrive after the first search rather than after the whole crawl.
+    """
+    deduplicator = UnifiedJobDeduplicator()
+    pending: List[Dict[str, Any]] = []
     all_results: List[TwoStageResult] = []
-    batches = ceil(total / batch_size)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Processing batches...", total=batches)
-        for i in range(0, total, batch_size):
-            batch = jobs[i : i + batch_size]
-            # Stage 1 + Stage 2 (internally batched/concurrent)
-            results = await processor.process_jobs(batch)
-            all_results.extend(results)
-            # Explicitly drop references before next loop step
-            del results
-            progress.advance(task)
+    while True:
+        item = await queue.get()
+        if item is _DISCOVERY_DONE:
+            break
+        stats.searches_received += 1
+        if stop.is_set():
+            # Cap reached: drain so the producer is never left blocked
+            continue
+
+        unique = deduplicator.deduplicate_incremental(item)
+        if max_total_jobs:
+            unique = unique[: max(0, max_total_jobs - stats.jobs_unique)]
+            if stats.jobs_unique + len(unique) >= max_total_jobs:
+                stop.set()
+        stats.jobs_unique += len(unique)
+        pending.extend(unique)
+
+        while pending and (len(pending) >= batch_size or queue.empty()):
+            batch, pending = pending[:batch_size], pending[batch_size:]
+            all_results.extend(await _process_batch(batch, processor, db, stats, planner))
+            if stats.first_batch_seconds is None:
+                stats.first_batch_seconds = time.perf_counter() - started_at
+            progress.update(
+                task_id,
+                description=(
+                    f"Processed {stats.jobs_processed}/{stats.jobs_unique} unique jobs "
+                    f"({stats.searches_received} searches)"
+                ),
+            )
+
+    # Flush whatever arrived with the final search
+    while pending:
+        batch, pending = pending[:batch_size], pending[batch_size:]
+        all_results.extend(await _process_batch(batch, processor, db, stats, planner))
 
     return all_results
 
@@ -141,43 +317,107 @@ async def run_jobspy_to_two_stage(
     max_concurrent_stage2: int = 2,
     fetch_descriptions: bool = True,
     description_fetch_concurrency: int = 24,
+    queue_size: int = 8,
+    save_to_db: bool = True,
+    skip_known_jobs: bool = True,
 ) -> List[TwoStageResult]:
-    """End-to-end: discover with JobSpy, optionally enrich, then process in batches.
+    """End-to-end streaming: discover with JobSpy, dedup, process and save as results arrive.
+
+    Discovery feeds a bounded queue (``queue_size`` search results); when
+    processing falls behind, discovery waits instead of buffering the whole
+    crawl. Each processed batch is written to the profile's DuckDB file
+    right away when ``save_to_db`` is set; with ``skip_known_jobs`` the
+    jobs that file already holds are dropped as soon as they are discovered.
 
     Returns TwoStageResult list so callers can summarize/save as needed.
     """
     profile = load_profile(profile_name) or {"profile_name": profile_name}
 
-    # Step 1: Discover
     workers = MultiSiteJobSpyWorkers(profile_name, max_jobs_per_site_location, per_site_concurrency)
-    ms_result = await workers.run_comprehensive_search(
-        location_set=location_set,
-        query_preset=query_preset,
-        sites=sites,
-        per_site_concurrency=per_site_concurrency,
-        max_total_jobs=max_total_jobs,
+    locations, search_terms, sites = workers.resolve_search_space(
+        location_set, query_preset, sites
+    )
+    console.print(
+        f"[cyan]🔍 Streaming search: {len(sites)} sites × {len(locations)} locations × {len(search_terms)} terms[/cyan]"
+    )
+
+    # Score and fingerprint with the same profile as the CLI, so a job this run
+    # records is not planned for a re-score by the next planned run
+    processor = get_two_stage_processor(
+        profile,
+        cpu_workers=cpu_workers,
+        max_concurrent_stage2=max_concurrent_stage2,
+        stage1_mode="auto",  # Worker processes for large batches; closed below
     )
-    df = ms_result.combined_data
 
-    # Step 2: Optional enrichment
-    if fetch_descriptions and isinstance(df, pd.DataFrame) and not df.empty:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+    stop = asyncio.Event()
+    stats = StreamingStats()
+    started_at = time.perf_counter()
+
+    db_context = (
+        DuckDBJobDatabase(profile_name=profile_name) if save_to_db else nullcontext(None)
+    )
+    with db_context as db, Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        known_index = None
+        if db is not None:
+            db.backfill_search_index()
+        if db is not None and skip_known_jobs:
+            known_index = PersistentDedupIndex.load(db)
+            console.print(f"[cyan]📚 {len(known_index)} jobs already stored for this profile[/cyan]")
+
+        task_id = progress.add_task("Waiting for first search results...", total=None)
+        producer = asyncio.create_task(
+            _discover_into_queue(
+                workers,
+                queue,
+                stop,
+                stats,
+                locations=locations,
+                search_terms=search_terms,
+                sites=sites,
+                fetch_descriptions=fetch_descriptions,
+                description_fetch_concurrency=description_fetch_concurrency,
+                known_index=known_index,
+            )
+        )
         try:
-            df = await workers.run_optimized_description_fetching(
-                df, max_concurrency=description_fetch_concurrency
+            results = await _process_stream(
+                queue,
+                stop,
+                stats,
+                processor,
+                db,
+                ProcessingPlanner(db, profile) if db is not None else None,
+                batch_size=max(1, batch_size),
+                max_total_jobs=max_total_jobs,
+                progress=progress,
+                task_id=task_id,
+                started_at=started_at,
             )
-        except Exception as e:
-            console.print(f"[yellow]Description enrichment failed: {e}[/yellow]")
+        finally:
+            stop.set()
+            if not producer.done():
+                producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            processor.close()
 
-    if df is None or df.empty:
+    if not results:
         console.print("[yellow]No jobs to process after discovery/enrichment[/yellow]")
         return []
 
-    # Step 3: Stream to processor in batches
-    jobs = _df_to_job_dicts(df)
-    results = await _process_in_batches(
-        jobs,
-        cpu_workers=cpu_workers,
-        max_concurrent_stage2=max_concurrent_stage2,
-        batch_size=batch_size,
+    first_batch = (
+        f"{stats.first_batch_seconds:.1f}s" if stats.first_batch_seconds is not None else "n/a"
+    )
+    console.print(
+        f"[green]✅ Streamed {stats.jobs_discovered} discovered → {stats.jobs_known} already stored → "
+        f"{stats.jobs_unique} new unique → "
+        f"{stats.jobs_processed} processed in {stats.batches} batches "
+        f"(first batch after {first_batch}, {stats.jobs_saved} new jobs saved)[/green]"
     )
     return results
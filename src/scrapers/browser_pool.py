@@ -0,0 +1,250 @@
+"""
+Browser Pool
+One (or a few) shared Chromium processes serving many lightweight contexts.
+
+Each browser context costs a few MB where a separate Chromium process costs
+hundreds, so concurrent fetches share browsers and only differ in context.
+Pages are reused across URLs, requests for images, fonts, media and
+analytics are aborted before they reach the network, and a per-domain cap
+keeps a large batch from hammering a single site.
+
+Usage:
+    async with BrowserPool(max_pages=30) as pool:
+        async with pool.page(url) as page:
+            await page.goto(url)
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import Browser, BrowserContext, Page, Route, async_playwright
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
+)
+
+BROWSER_ARGS = ["--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"]
+
+# Resource types job description extraction never needs
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "imageset", "texttrack"})
+
+# Analytics, ads and tracking hosts (subdomains included)
+BLOCKED_DOMAINS = frozenset(
+    {
+        "google-analytics.com",
+        "googletagmanager.com",
+        "googleadservices.com",
+        "googlesyndication.com",
+        "doubleclick.net",
+        "facebook.net",
+        "connect.facebook.net",
+        "hotjar.com",
+        "segment.io",
+        "segment.com",
+        "mixpanel.com",
+        "newrelic.com",
+        "nr-data.net",
+        "optimizely.com",
+        "bat.bing.com",
+        "clarity.ms",
+        "quantserve.com",
+        "scorecardresearch.com",
+        "adsrvr.org",
+    }
+)
+
+
+def url_domain(url: str) -> str:
+    """Host of ``url`` without a leading ``www.`` (empty for unparseable URLs)."""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def is_blocked_request(resource_type: str, url: str) -> bool:
+    """Whether a request is a heavy asset or goes to an analytics/ads host."""
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    host = url_domain(url)
+    parts = host.split(".")
+    # Check the host and each parent domain: a.b.hotjar.com -> hotjar.com
+    return any(".".join(parts[i:]) in BLOCKED_DOMAINS for i in range(len(parts) - 1))
+
+
+class BrowserPool:
+    """
+    Shared browsers with a bounded pool of reusable pages.
+
+    Args:
+        num_browsers: Chromium processes to launch; contexts are spread across them
+        max_pages: Pages (one context each) open at the same time
+        per_domain_limit: Concurrent pages per domain
+        block_resources: Abort images/fonts/media and analytics requests
+        headless: Run Chromium headless
+        timeout_ms: Default navigation/action timeout for pages
+    """
+
+    def __init__(
+        self,
+        num_browsers: int = 1,
+        max_pages: int = 30,
+        per_domain_limit: int = 4,
+        block_resources: bool = True,
+        headless: bool = True,
+        timeout_ms: int = 30000,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        self.num_browsers = max(1, num_browsers)
+        self.max_pages = max(1, max_pages)
+        self.per_domain_limit = max(1, per_domain_limit)
+        self.block_resources = block_resources
+        self.headless = headless
+        self.timeout_ms = timeout_ms
+        self.user_agent = user_agent
+
+        self._playwright = None
+        self._browsers: List[Browser] = []
+        self._contexts: List[BrowserContext] = []
+        self._idle_pages: List[Page] = []
+        self._page_slots: Optional[asyncio.Semaphore] = None
+        self._domain_slots: Dict[str, asyncio.Semaphore] = {}
+        self.stats = {
+            "pages_created": 0,
+            "pages_reused": 0,
+            "requests_blocked": 0,
+            "requests_allowed": 0,
+        }
+
+    async def __aenter__(self) -> "BrowserPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Launch the shared browsers."""
+        self._playwright = await async_playwright().start()
+        self._page_slots = asyncio.Semaphore(self.max_pages)
+        for _ in range(self.num_browsers):
+            browser = await self._playwright.chromium.launch(
+                headless=self.headless, args=BROWSER_ARGS
+            )
+            self._browsers.append(browser)
+        logger.info(
+            f"Browser pool started: {self.num_browsers} browser(s), "
+            f"{self.max_pages} pages, {self.per_domain_limit} per domain"
+        )
+
+    async def close(self) -> None:
+        """Close every context, browser and the Playwright driver."""
+        for context in self._contexts:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        for browser in self._browsers:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+        self._contexts.clear()
+        self._browsers.clear()
+        self._idle_pages.clear()
+        self._playwright = None
+        logger.info(f"Browser pool closed: {self.stats}")
+
+    @asynccontextmanager
+    async def page(self, url: str = "") -> AsyncIterator[Page]:
+        """
+        Borrow a page for fetching ``url``.
+
+        Waits for a free page slot and, when ``url`` is given, a slot for its
+        domain. The page goes back to the pool afterwards unless it was closed.
+        """
+        domain_slot = self._domain_slot(url_domain(url)) if url else None
+        if domain_slot is not None:
+            await domain_slot.acquire()
+        try:
+            async with self._page_slots:
+                page = await self._checkout_page()
+                try:
+                    yield page
+                finally:
+                    await self._checkin_page(page)
+        finally:
+            if domain_slot is not None:
+                domain_slot.release()
+
+    def _domain_slot(self, domain: str) -> asyncio.Semaphore:
+        if domain not in self._domain_slots:
+            self._domain_slots[domain] = asyncio.Semaphore(self.per_domain_limit)
+        return self._domain_slots[domain]
+
+    async def _checkout_page(self) -> Page:
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not page.is_closed():
+                self.stats["pages_reused"] += 1
+                return page
+            await self._discard_page(page)
+        return await self._new_page()
+
+    async def _checkin_page(self, page: Page) -> None:
+        if page.is_closed():
+            await self._discard_page(page)
+        else:
+            self._idle_pages.append(page)
+
+    async def _discard_page(self, page: Page) -> None:
+        """Close the context of a page that was closed or crashed."""
+        context = page.context
+        if context in self._contexts:
+            self._contexts.remove(context)
+        try:
+            await context.close()
+        except Exception:
+            pass
+
+    async def _new_page(self) -> Page:
+        """Open a page in a new context, spreading contexts round-robin over browsers."""
+        browser = self._browsers[self.stats["pages_created"] % len(self._browsers)]
+        context = await browser.new_context(
+            viewport={"width": 1280, "height": 800},
+            user_agent=self.user_agent,
+            service_workers="block",
+        )
+        if self.block_resources:
+            await context.route("**/*", self._route_request)
+        self._contexts.append(context)
+
+        page = await context.new_page()
+        page.set_default_timeout(self.timeout_ms)
+        self.stats["pages_created"] += 1
+        return page
+
+    async def _route_request(self, route: Route) -> None:
+        request = route.request
+        if is_blocked_request(request.resource_type, request.url):
+            self.stats["requests_blocked"] += 1
+            await route.abort()
+        else:
+            self.stats["requests_allowed"] += 1
+            await route.continue_()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Page and request counters."""
+        return {
+            **self.stats,
+            "browsers": len(self._browsers),
+            "contexts": len(self._contexts),
+            "idle_pages": len(self._idle_pages),
+        }
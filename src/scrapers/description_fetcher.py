@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Async Job Description Fetcher
+HTTP-first description enrichment with a browser fallback only where needed.
+
+Most job pages ship their description in the HTML (often as a JSON-LD
+``JobPosting``), so a pooled async HTTP client fetches them directly:
+
+- ``max_concurrency`` requests in flight across all hosts
+- ``per_host_limit`` concurrent requests and ``host_interval`` seconds between
+  request starts per host
+- ``If-None-Match`` / ``If-Modified-Since`` from earlier fetches, so unchanged
+  pages come back as a bodiless 304
+
+Only pages whose HTML has no extractable description (JavaScript shells) or
+that refuse plain HTTP clients are rendered in the shared ``BrowserPool``.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+from .multi_site_jobspy_workers import SiteRateLimiter
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+# Descriptions shorter than this are treated as missing
+MIN_DESCRIPTION_CHARS = 200
+MAX_DESCRIPTION_CHARS = 20000
+
+# Statuses worth retrying in a real browser (bot walls that let browsers through)
+BROWSER_RETRY_STATUSES = frozenset({401, 403})
+
+# Common job content containers, most specific first
+DESCRIPTION_SELECTORS = [
+    "#jobDescriptionText",
+    ".job-description",
+    ".jobsearch-JobComponent-description",
+    ".description__text",
+    ".job-details",
+    ".job-content",
+    ".posting-content",
+    '[data-automation-id="jobPostingDescription"]',
+    '[class*="description"]',
+    '[class*="posting"]',
+    "article",
+    "main",
+]
+
+_JSON_LD_RE = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _html_to_text(html: str) -> str:
+    text = BeautifulSoup(html, HTML_PARSER).get_text(" ")
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _json_ld_description(html: str) -> Optional[str]:
+    """Description of the first schema.org ``JobPosting`` in the page."""
+    for block in _JSON_LD_RE.findall(html):
+        try:
+            data = json.loads(block.strip())
+        except ValueError:
+            continue
+        items = data if isinstance(data, list) else data.get("@graph", [data])
+        for item in items:
+            if isinstance(item, dict) and item.get("@type") == "JobPosting":
+                description = item.get("description")
+                if description:
+                    return _html_to_text(description)
+    return None
+
+
+def extract_description(html: str) -> Optional[str]:
+    """
+    Extract the job description text from a page.
+
+    Prefers structured ``JobPosting`` data, then the largest matching content
+    container. Returns None when nothing long enough is found.
+    """
+    if not html:
+        return None
+
+    description = _json_ld_description(html)
+    if not description or len(description) < MIN_DESCRIPTION_CHARS:
+        soup = BeautifulSoup(html, HTML_PARSER)
+        for tag in soup(["script", "style", "noscript", "nav", "header", "footer"]):
+            tag.decompose()
+
+        description = None
+        for selector in DESCRIPTION_SELECTORS:
+            elements = soup.select(selector)
+            if elements:
+                texts = [element.get_text(" ") for element in elements]
+                largest = _WHITESPACE_RE.sub(" ", max(texts, key=len)).strip()
+                if len(largest) >= MIN_DESCRIPTION_CHARS:
+                    description = largest
+                    break
+
+    if not description or len(description) < MIN_DESCRIPTION_CHARS:
+        return None
+    return description[:MAX_DESCRIPTION_CHARS]
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching one job URL."""
+
+    url: str
+    description: Optional[str] = None
+    status: Optional[int] = None
+    method: str = "failed"  # http | not_modified | browser | failed
+    error: Optional[str] = None
+
+
+class AsyncDescriptionFetcher:
+    """
+    Fetch job descriptions concurrently over pooled HTTP connections.
+
+    Args:
+        max_concurrency: Requests in flight across all hosts
+        per_host_limit: Concurrent requests to one host
+        host_interval: Minimum seconds between request starts to one host
+        timeout: Total seconds allowed per request
+        browser_fallback: Render pages without an HTML description in a browser
+        browser_concurrency: Browser pages open at once during the fallback
+        validators: ``url -> {etag, last_modified, description}`` from earlier
+            fetches; updated in place so callers can keep it across runs
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 24,
+        per_host_limit: int = 4,
+        host_interval: float = 0.25,
+        timeout: float = 15.0,
+        browser_fallback: bool = True,
+        browser_concurrency: int = 6,
+        validators: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.host_interval = host_interval
+        self.timeout = timeout
+        self.browser_fallback = browser_fallback
+        self.browser_concurrency = max(1, browser_concurrency)
+        self.validators = validators if validators is not None else {}
+        self.stats = {
+            "requested": 0,
+            "http": 0,
+            "not_modified": 0,
+            "browser": 0,
+            "failed": 0,
+            "processing_time": 0.0,
+        }
+
+    async def fetch_all(self, urls: Iterable[str]) -> Dict[str, FetchResult]:
+        """
+        Fetch every distinct URL; returns a result per URL.
+
+        Pages that need JavaScript are rendered afterwards in one shared browser.
+        """
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        start = time.time()
+        self.stats["requested"] += len(unique_urls)
+        if not unique_urls:
+            return {}
+
+        host_slots: Dict[str, asyncio.Semaphore] = {}
+        host_limiters: Dict[str, SiteRateLimiter] = {}
+        in_flight = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(session: aiohttp.ClientSession, url: str) -> FetchResult:
+            host = urlparse(url).netloc.lower()
+            if host not in host_slots:
+                host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+                host_limiters[host] = SiteRateLimiter(self.host_interval)
+            # Wait for the host first so a busy host never holds global slots
+            async with host_slots[host]:
+                await host_limiters[host].wait()
+                async with in_flight:
+                    return await self._fetch_http(session, url)
+
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers=DEFAULT_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as session:
+            fetched = await asyncio.gather(*(fetch(session, url) for url in unique_urls))
+        results = {result.url: result for result in fetched}
+
+        needs_browser = [
+            result.url
+            for result in fetched
+            if result.description is None
+            and (result.status == 200 or result.status in BROWSER_RETRY_STATUSES)
+        ]
+        if needs_browser and self.browser_fallback:
+            results.update(await self._fetch_with_browser(needs_browser))
+
+        for result in results.values():
+            self.stats[result.method] += 1
+        self.stats["processing_time"] += time.time() - start
+        logger.info(f"Fetched descriptions for {len(unique_urls)} URLs: {self.stats}")
+        return results
+
+    async def _fetch_http(self, session: aiohttp.ClientSession, url: str) -> FetchResult:
+        cached = self.validators.get(url)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            async with session.get(url, headers=headers, allow_redirects=True) as response:
+                if response.status == 304 and cached:
+                    return FetchResult(url, cached["description"], 304, "not_modified")
+                if response.status != 200:
+                    return FetchResult(url, status=response.status, error=response.reason)
+
+                html = await response.text(errors="replace")
+                description = extract_description(html)
+                if description:
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        self.validators[url] = {
+                            "etag": etag,
+                            "last_modified": last_modified,
+                            "description": description,
+                        }
+                    return FetchResult(url, description, 200, "http")
+                return FetchResult(url, status=200, error="no description in HTML")
+        except Exception as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e}")
+            return FetchResult(url, error=str(e) or type(e).__name__)
+
+    async def _fetch_with_browser(self, urls: List[str]) -> Dict[str, FetchResult]:
+        """Render pages in the shared browser pool and extract from the DOM."""
+        try:
+            from .browser_pool import BrowserPool
+        except ImportError:
+            logger.warning(f"Playwright not installed; {len(urls)} JS pages left unfetched")
+            return {}
+
+        results: Dict[str, FetchResult] = {}
+
+        async def render(pool: BrowserPool, url: str) -> None:
+            try:
+                async with pool.page(url) as page:
+                    await page.goto(url, wait_until="domcontentloaded")
+                    try:
+                        await page.wait_for_load_state("networkidle", timeout=5000)
+                    except Exception:
+                        pass  # Long-polling pages never go idle; use what rendered
+                    html = await page.content()
+                description = extract_description(html)
+                if description:
+                    results[url] = FetchResult(url, description, 200, "browser")
+            except Exception as e:
+                logger.debug(f"Browser fetch failed for {url}: {e}")
+
+        try:
+            async with BrowserPool(
+                max_pages=min(self.browser_concurrency, len(urls)),
+                per_domain_limit=self.per_host_limit,
+                timeout_ms=int(self.timeout * 1000),
+            ) as pool:
+                await asyncio.gather(*(render(pool, url) for url in urls))
+        except Exception as e:
+            logger.warning(f"Browser fallback unavailable: {e}")
+        return results
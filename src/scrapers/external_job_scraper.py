@@ -3,16 +3,21 @@
 External Job Description Scraper
 Parallel scraping of job descriptions from external sites (non-Eluta).
 Respects Eluta anti-bot by only scraping external job sites in parallel.
+
+Workers share one BrowserPool (a single Chromium by default) and borrow a
+reusable page per URL, so concurrency costs a browser context, not a process.
 """
 
 import asyncio
 import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from playwright.async_api import async_playwright, Page
 from rich.console import Console
 from rich.progress import Progress, TaskID
 
+from .browser_pool import BrowserPool, url_domain
 from .enhanced_job_description_scraper import ImprovedJobDescriptionScraper
 
 console = Console()
@@ -24,14 +29,32 @@ class ExternalJobDescriptionScraper(ImprovedJobDescriptionScraper):
     Does NOT scrape Eluta directly - only external sites that Eluta URLs point to.
     """
 
-    def __init__(self, num_workers: int = 6):
+    def __init__(
+        self,
+        num_workers: int = 30,
+        num_browsers: int = 1,
+        per_domain_limit: int = 4,
+        block_resources: bool = True,
+    ):
+        """
+        Args:
+            num_workers: Concurrent fetches (pages borrowed from the pool)
+            num_browsers: Chromium processes shared by all workers
+            per_domain_limit: Concurrent fetches per external domain
+            block_resources: Abort images, fonts, media and analytics requests
+        """
         super().__init__()
         self.num_workers = num_workers
+        self.num_browsers = num_browsers
+        self.per_domain_limit = per_domain_limit
+        self.block_resources = block_resources
         self.stats = {
             "total_jobs": 0,
             "successful_scrapes": 0,
             "failed_scrapes": 0,
             "workers_used": num_workers,
+            "browsers_used": num_browsers,
+            "browser_pool": {},
             "start_time": None,
             "end_time": None,
             "processing_time": 0.0,
@@ -69,49 +92,40 @@ class ExternalJobDescriptionScraper(ImprovedJobDescriptionScraper):
 
         results = []
 
-        async with async_playwright() as p:
-            # Create persistent browsers for workers
-            browsers = []
-            try:
-                for i in range(self.num_workers):
-                    browser = await p.chromium.launch(
-                        headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"]
-                    )
-                    browsers.append(browser)
-
-                # Create job queue
-                job_queue = asyncio.Queue()
-                for url in external_urls:
-                    await job_queue.put(url)
-
-                # Start worker tasks
-                with Progress() as progress:
-                    task = progress.add_task(
-                        "[green]Scraping external job descriptions...", total=len(external_urls)
-                    )
-
-                    worker_tasks = [
-                        self._external_worker_loop(browser, worker_id, job_queue, progress, task)
-                        for worker_id, browser in enumerate(browsers)
-                    ]
-
-                    # Wait for all workers to complete
-                    worker_results = await asyncio.gather(*worker_tasks, return_exceptions=True)
-
-                    # Collect results from all workers
-                    for worker_result in worker_results:
-                        if isinstance(worker_result, list):
-                            results.extend(worker_result)
-                        elif isinstance(worker_result, Exception):
-                            console.print(f"[red]❌ Worker error: {worker_result}[/red]")
-
-            finally:
-                # Clean up browsers
-                for browser in browsers:
-                    try:
-                        await browser.close()
-                    except:
-                        pass
+        pool = BrowserPool(
+            num_browsers=self.num_browsers,
+            max_pages=self.num_workers,
+            per_domain_limit=self.per_domain_limit,
+            block_resources=self.block_resources,
+        )
+        async with pool:
+            # Create job queue; alternate domains so workers rarely wait on a domain cap
+            job_queue = asyncio.Queue()
+            for url in self._interleave_by_domain(external_urls):
+                job_queue.put_nowait(url)
+
+            # Start worker tasks
+            with Progress() as progress:
+                task = progress.add_task(
+                    "[green]Scraping external job descriptions...", total=len(external_urls)
+                )
+
+                worker_tasks = [
+                    self._external_worker_loop(pool, worker_id, job_queue, progress, task)
+                    for worker_id in range(min(self.num_workers, len(external_urls)))
+                ]
+
+                # Wait for all workers to complete
+                worker_results = await asyncio.gather(*worker_tasks, return_exceptions=True)
+
+                # Collect results from all workers
+                for worker_result in worker_results:
+                    if isinstance(worker_result, list):
+                        results.extend(worker_result)
+                    elif isinstance(worker_result, Exception):
+                        console.print(f"[red]❌ Worker error: {worker_result}[/red]")
+
+            self.stats["browser_pool"] = pool.get_stats()
 
         # Update statistics
         self.stats["end_time"] = time.time()
@@ -127,14 +141,34 @@ class ExternalJobDescriptionScraper(ImprovedJobDescriptionScraper):
 
         return results
 
+    @staticmethod
+    def _interleave_by_domain(urls: List[str]) -> List[str]:
+        """Order URLs round-robin across domains, keeping each domain's order."""
+        by_domain: "OrderedDict[str, List[str]]" = OrderedDict()
+        for url in urls:
+            by_domain.setdefault(url_domain(url), []).append(url)
+
+        interleaved = []
+        queues = [list(reversed(domain_urls)) for domain_urls in by_domain.values()]
+        while queues:
+            for domain_urls in queues:
+                interleaved.append(domain_urls.pop())
+            queues = [domain_urls for domain_urls in queues if domain_urls]
+        return interleaved
+
     async def _external_worker_loop(
-        self, browser, worker_id: int, job_queue: asyncio.Queue, progress: Progress, task: TaskID
+        self,
+        pool: BrowserPool,
+        worker_id: int,
+        job_queue: asyncio.Queue,
+        progress: Progress,
+        task: TaskID,
     ) -> List[Dict[str, Any]]:
         """
         Worker loop for processing external job URLs.
 
         Args:
-            browser: Playwright browser instance
+            pool: Shared browser pool to borrow pages from
             worker_id: Unique worker identifier
             job_queue: Queue of job URLs to process
             progress: Rich progress bar
@@ -144,67 +178,46 @@ class ExternalJobDescriptionScraper(ImprovedJobDescriptionScraper):
             List of scraped job data
         """
         worker_results = []
-        context = None
 
-        try:
-            # Create browser context for this worker
-            context = await browser.new_context(
-                viewport={"width": 1280, "height": 800},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36",
-            )
-            page = await context.new_page()
-            page.set_default_timeout(30000)  # 30 second timeout
-
-            console.print(f"[dim]🔧 Worker {worker_id} started[/dim]")
+        console.print(f"[dim]🔧 Worker {worker_id} started[/dim]")
 
-            while True:
-                try:
-                    # Get next job URL with timeout
-                    job_url = await asyncio.wait_for(job_queue.get(), timeout=1.0)
+        while True:
+            try:
+                job_url = job_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                # No more jobs in queue
+                break
 
-                    console.print(f"[dim]Worker {worker_id}: Processing {job_url[:50]}...[/dim]")
+            try:
+                console.print(f"[dim]Worker {worker_id}: Processing {job_url[:50]}...[/dim]")
 
-                    # Scrape job description using parent class method
+                # Borrow a page (waits for the domain's cap), scrape with the parent method
+                async with pool.page(job_url) as page:
                     job_data = await self.scrape_job_description(job_url, page)
 
-                    if job_data and job_data.get("description"):
-                        # Add worker metadata
-                        job_data["worker_id"] = worker_id
-                        job_data["scraping_method"] = "external_parallel"
-                        job_data["scraped_at"] = datetime.now().isoformat()
-
-                        worker_results.append(job_data)
-                        console.print(
-                            f"[green]✅ Worker {worker_id}: Scraped {job_data.get('title', 'Unknown')[:30]}...[/green]"
-                        )
-                    else:
-                        console.print(
-                            f"[yellow]⚠️ Worker {worker_id}: Failed to scrape {job_url[:50]}...[/yellow]"
-                        )
-
-                    # Mark job as done and update progress
-                    job_queue.task_done()
-                    progress.update(task, advance=1)
-
-                    # Small delay to be respectful
-                    await asyncio.sleep(0.5)
-
-                except asyncio.TimeoutError:
-                    # No more jobs in queue
-                    break
-                except Exception as e:
-                    console.print(f"[red]❌ Worker {worker_id} error: {e}[/red]")
-                    # Continue processing other jobs
-                    continue
-
-        except Exception as e:
-            console.print(f"[red]❌ Worker {worker_id} setup error: {e}[/red]")
-        finally:
-            if context:
-                try:
-                    await context.close()
-                except:
-                    pass
+                if job_data and job_data.get("description"):
+                    # Add worker metadata
+                    job_data["worker_id"] = worker_id
+                    job_data["scraping_method"] = "external_parallel"
+                    job_data["scraped_at"] = datetime.now().isoformat()
+
+                    worker_results.append(job_data)
+                    console.print(
+                        f"[green]✅ Worker {worker_id}: Scraped {job_data.get('title', 'Unknown')[:30]}...[/green]"
+                    )
+                else:
+                    console.print(
+                        f"[yellow]⚠️ Worker {worker_id}: Failed to scrape {job_url[:50]}...[/yellow]"
+                    )
+            except Exception as e:
+                console.print(f"[red]❌ Worker {worker_id} error: {e}[/red]")
+            finally:
+                # Mark job as done and update progress
+                job_queue.task_done()
+                progress.update(task, advance=1)
+
+            # Small delay to be respectful
+            await asyncio.sleep(0.5)
 
         console.print(
             f"[dim]🏁 Worker {worker_id} finished: {len(worker_results)} jobs scraped[/dim]"
@@ -234,9 +247,13 @@ class ExternalJobDescriptionScraper(ImprovedJobDescriptionScraper):
 
 
 # Convenience function
-def get_external_job_scraper(num_workers: int = 6) -> ExternalJobDescriptionScraper:
+def get_external_job_scraper(
+    num_workers: int = 30, num_browsers: int = 1, per_domain_limit: int = 4
+) -> ExternalJobDescriptionScraper:
     """Get configured external job scraper instance."""
-    return ExternalJobDescriptionScraper(num_workers=num_workers)
+    return ExternalJobDescriptionScraper(
+        num_workers=num_workers, num_browsers=num_browsers, per_domain_limit=per_domain_limit
+    )
 
 
 # CLI test function
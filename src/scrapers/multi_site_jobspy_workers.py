@@ -8,8 +8,11 @@ is being developed.
 """
 
 import asyncio
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 from rich.console import Console
@@ -18,6 +21,25 @@ from src.core.unified_deduplication import deduplicate_jobs_unified
 
 console = Console()
 
+# Columns callers can rely on even when discovery returns nothing
+JOBSPY_RESULT_COLUMNS = [
+    "title",
+    "company",
+    "location",
+    "job_url",
+    "description",
+    "date_posted",
+    "search_term",
+    "search_location",
+    "source_site",
+]
+
+# Minimum seconds between request starts to the same site
+DEFAULT_SITE_REQUEST_INTERVAL = 1.0
+SITE_REQUEST_INTERVALS = {
+    "linkedin": 2.0,  # LinkedIn throttles bursts from one IP quickly
+}
+
 
 @dataclass
 class JobSpyWorkerConfig:
@@ -27,7 +49,27 @@ class JobSpyWorkerConfig:
     locations: List[str] = None
     search_terms: List[str] = None
     max_jobs_per_site: int = 50
-    concurrency: int = 4
+    concurrency: int = 4  # concurrent searches per site
+    request_interval: float = DEFAULT_SITE_REQUEST_INTERVAL
+    site_request_intervals: Dict[str, float] = field(
+        default_factory=lambda: dict(SITE_REQUEST_INTERVALS)
+    )
+
+
+class SiteRateLimiter:
+    """Space out request starts to one site by a minimum interval."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._next_slot = 0.0
+
+    async def wait(self) -> None:
+        """Sleep until this caller's slot; slots are reserved in arrival order."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
 
 class MultiSiteJobSpyWorkers:
@@ -49,6 +91,9 @@ class MultiSiteJobSpyWorkers:
         self.concurrency = concurrency
         self.console = Console()
 
+        # ETag/Last-Modified per job URL, kept across description fetches
+        self.description_validators: Dict[str, Dict[str, Any]] = {}
+
         # Initialize default config
         self.config = JobSpyWorkerConfig(
             sites=["indeed", "linkedin"],
@@ -174,12 +219,210 @@ class MultiSiteJobSpyWorkers:
         filtered_df = jobs_df[jobs_df.apply(is_relevant, axis=1)].copy()
         return filtered_df
 
+    def _build_scrape_params(
+        self, site: str, location: str, search_term: str, max_jobs_per_site: int
+    ) -> Dict[str, Any]:
+        """Build site-specific JobSpy parameters for a single search."""
+        console.print(
+            f"[dim]    JobSpy params: site={site}, term='{search_term}', location='{location}', results={min(max_jobs_per_site, 20)}[/dim]"
+        )
+        # Determine country for site-specific parameters
+        is_canada = any(
+            x in location.upper()
+            for x in [
+                "CA",
+                "ON",
+                "BC",
+                "AB",
+                "QC",
+                "NS",
+                "NB",
+                "MB",
+                "SK",
+                "PE",
+                "NL",
+                "YT",
+                "NT",
+                "NU",
+            ]
+        )
+        country = "Canada" if is_canada else "USA"
+
+        # Prepare site-specific parameters
+        scrape_params = {
+            "site_name": site,
+            "search_term": search_term,
+            "location": location,
+            "results_wanted": min(max_jobs_per_site, 20),
+            "hours_old": 168,  # 7 days
+            "country_indeed": country,  # Used by Indeed and Glassdoor
+        }
+
+        # Site-specific location formatting
+        if site == "glassdoor":
+            # Glassdoor works better with city name only for Canadian locations
+            # Extract just the city name if format is "City, Province"
+            if "," in location:
+                city_only = location.split(",")[0].strip()
+                scrape_params["location"] = city_only
+                console.print(
+                    f"[dim]    Glassdoor: using simplified location '{city_only}' (was '{location}')[/dim]"
+                )
+            console.print(f"[dim]    Glassdoor country: {country}[/dim]")
+        elif site == "indeed":
+            console.print(f"[dim]    Indeed country: {country}[/dim]")
+
+        return scrape_params
+
+    async def _scrape_search(
+        self,
+        scrape_jobs: Callable[..., pd.DataFrame],
+        site: str,
+        location: str,
+        search_term: str,
+        max_jobs_per_site: int,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> Optional[pd.DataFrame]:
+        """Run one site × location × term search and return its relevant jobs."""
+        try:
+            console.print(
+                f"[yellow]  Searching {site}: {search_term} in {location}[/yellow]"
+            )
+            scrape_params = self._build_scrape_params(
+                site, location, search_term, max_jobs_per_site
+            )
+
+            # JobSpy is blocking; run it off the event loop so consumers keep working
+            loop = asyncio.get_running_loop()
+            jobs_df = await loop.run_in_executor(
+                executor, partial(scrape_jobs, **scrape_params)
+            )
+
+            if jobs_df is None or jobs_df.empty:
+                console.print(f"[yellow]    No jobs found[/yellow]")
+                return None
+
+            # Add metadata
+            jobs_df["search_term"] = search_term
+            jobs_df["search_location"] = location
+            jobs_df["source_site"] = site
+
+            # Apply relevance filtering
+            original_count = len(jobs_df)
+            jobs_df = self._filter_relevant_jobs(jobs_df, search_term)
+            filtered_count = len(jobs_df)
+
+            if jobs_df.empty:
+                console.print(
+                    f"[yellow]    No relevant jobs found (filtered all {original_count})[/yellow]"
+                )
+                return None
+
+            console.print(f"[green]    Found {filtered_count} jobs[/green]")
+            if filtered_count < original_count:
+                console.print(
+                    f"[dim]    (filtered {original_count - filtered_count} irrelevant jobs)[/dim]"
+                )
+            return jobs_df
+
+        except Exception as e:
+            error_msg = str(e)
+            console.print(f"[red]    ❌ Error with {site}/{search_term}:[/red]")
+            console.print(f"[red]       {error_msg}[/red]")
+
+            # Site-specific troubleshooting hints
+            if site == "glassdoor":
+                console.print(
+                    f"[yellow]    💡 Glassdoor tip: Ensure location format is correct (e.g., 'Toronto, ON')[/yellow]"
+                )
+            elif site == "linkedin":
+                console.print(
+                    f"[yellow]    💡 LinkedIn tip: May require specific location codes or authentication[/yellow]"
+                )
+            return None
+
+    def _site_rate_limiter(self, site: str) -> SiteRateLimiter:
+        interval = self.config.site_request_intervals.get(
+            site, self.config.request_interval
+        )
+        return SiteRateLimiter(interval)
+
+    async def iter_discovery(
+        self,
+        sites: List[str] = None,
+        locations: List[str] = None,
+        search_terms: List[str] = None,
+        max_jobs_per_site: int = 50,
+        per_site_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        Yield the relevant jobs of each site × location × term search as it completes.
+
+        Searches fan out over a thread pool. Each site gets its own
+        concurrency limit (``per_site_concurrency``, default
+        ``self.concurrency``) and rate limiter, so sites run in parallel
+        while no single site sees more than its share of requests. Lets
+        callers start deduplicating and processing while discovery is
+        still running instead of waiting for the combined DataFrame.
+        """
+        sites = sites or self.config.sites or ["indeed", "linkedin"]
+        locations = locations or self.config.locations or ["Toronto, ON"]
+        search_terms = search_terms or self.config.search_terms or ["Software Developer"]
+        per_site_concurrency = max(1, per_site_concurrency or self.concurrency)
+
+        console.print(
+            f"[cyan]🔍 JobSpy Discovery: {len(sites)} sites × {len(locations)} locations × {len(search_terms)} terms "
+            f"({per_site_concurrency} concurrent per site)[/cyan]"
+        )
+
+        try:
+            from jobspy import scrape_jobs
+        except ImportError:
+            console.print(
+                "[red]❌ JobSpy not installed. Install with: pip install python-jobspy[/red]"
+            )
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=len(sites) * per_site_concurrency,
+            thread_name_prefix="jobspy",
+        )
+        semaphores = {site: asyncio.Semaphore(per_site_concurrency) for site in sites}
+        limiters = {site: self._site_rate_limiter(site) for site in sites}
+
+        async def run_search(site: str, location: str, search_term: str):
+            async with semaphores[site]:
+                await limiters[site].wait()
+                return await self._scrape_search(
+                    scrape_jobs, site, location, search_term, max_jobs_per_site, executor
+                )
+
+        # Interleave sites so every site starts on its first search immediately
+        tasks = [
+            asyncio.create_task(run_search(site, location, search_term))
+            for location in locations
+            for search_term in search_terms
+            for site in sites
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                jobs_df = await next_done
+                if jobs_df is not None:
+                    yield jobs_df
+        finally:
+            # Early exit (caller closed the generator): drop searches not yet started
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            executor.shutdown(wait=False, cancel_futures=True)
+
     async def run_discovery(
         self,
         sites: List[str] = None,
         locations: List[str] = None,
         search_terms: List[str] = None,
         max_jobs_per_site: int = 50,
+        per_site_concurrency: Optional[int] = None,
         **kwargs,
     ) -> pd.DataFrame:
         """
@@ -188,169 +431,28 @@ class MultiSiteJobSpyWorkers:
         Returns a pandas DataFrame with job data in JobSpy format.
         """
         try:
-            # Use provided parameters or fall back to config
-            sites = sites or self.config.sites or ["indeed", "linkedin"]
-            locations = locations or self.config.locations or ["Toronto, ON"]
-            search_terms = (
-                search_terms or self.config.search_terms or ["Software Developer"]
-            )
-
-            console.print(
-                f"[cyan]🔍 JobSpy Discovery: {len(sites)} sites × {len(locations)} locations × {len(search_terms)} terms[/cyan]"
-            )
+            all_jobs = [
+                jobs_df
+                async for jobs_df in self.iter_discovery(
+                    sites=sites,
+                    locations=locations,
+                    search_terms=search_terms,
+                    max_jobs_per_site=max_jobs_per_site,
+                    per_site_concurrency=per_site_concurrency,
+                )
+            ]
 
-            # Try to import and use JobSpy
-            try:
-                from jobspy import scrape_jobs
-
-                all_jobs = []
-
-                for site in sites:
-                    for location in locations:
-                        for search_term in search_terms:
-                            try:
-                                console.print(
-                                    f"[yellow]  Searching {site}: {search_term} in {location}[/yellow]"
-                                )
-
-                                # Run JobSpy scraping
-                                console.print(
-                                    f"[dim]    JobSpy params: site={site}, term='{search_term}', location='{location}', results={min(max_jobs_per_site, 20)}[/dim]"
-                                )
-                                # Determine country for site-specific parameters
-                                is_canada = any(
-                                    x in location.upper()
-                                    for x in [
-                                        "CA",
-                                        "ON",
-                                        "BC",
-                                        "AB",
-                                        "QC",
-                                        "NS",
-                                        "NB",
-                                        "MB",
-                                        "SK",
-                                        "PE",
-                                        "NL",
-                                        "YT",
-                                        "NT",
-                                        "NU",
-                                    ]
-                                )
-                                country = "Canada" if is_canada else "USA"
-
-                                # Prepare site-specific parameters
-                                scrape_params = {
-                                    "site_name": site,
-                                    "search_term": search_term,
-                                    "location": location,
-                                    "results_wanted": min(max_jobs_per_site, 20),
-                                    "hours_old": 168,  # 7 days
-                                    "country_indeed": country,  # Used by Indeed and Glassdoor
-                                }
-
-                                # Site-specific location formatting
-                                if site == "glassdoor":
-                                    # Glassdoor works better with city name only for Canadian locations
-                                    # Extract just the city name if format is "City, Province"
-                                    if "," in location:
-                                        city_only = location.split(",")[0].strip()
-                                        scrape_params["location"] = city_only
-                                        console.print(
-                                            f"[dim]    Glassdoor: using simplified location '{city_only}' (was '{location}')[/dim]"
-                                        )
-                                    console.print(
-                                        f"[dim]    Glassdoor country: {country}[/dim]"
-                                    )
-                                elif site == "indeed":
-                                    console.print(
-                                        f"[dim]    Indeed country: {country}[/dim]"
-                                    )
-
-                                jobs_df = scrape_jobs(**scrape_params)
-
-                                if jobs_df is not None and not jobs_df.empty:
-                                    # Add metadata
-                                    jobs_df["search_term"] = search_term
-                                    jobs_df["search_location"] = location
-                                    jobs_df["source_site"] = site
-
-                                    # Apply relevance filtering
-                                    original_count = len(jobs_df)
-                                    jobs_df = self._filter_relevant_jobs(
-                                        jobs_df, search_term
-                                    )
-                                    filtered_count = len(jobs_df)
-
-                                    if not jobs_df.empty:
-                                        all_jobs.append(jobs_df)
-                                        console.print(
-                                            f"[green]    Found {filtered_count} jobs[/green]"
-                                        )
-                                        if filtered_count < original_count:
-                                            console.print(
-                                                f"[dim]    (filtered {original_count - filtered_count} irrelevant jobs)[/dim]"
-                                            )
-                                    else:
-                                        console.print(
-                                            f"[yellow]    No relevant jobs found (filtered all {original_count})[/yellow]"
-                                        )
-                                else:
-                                    console.print(f"[yellow]    No jobs found[/yellow]")
-
-                                # Small delay to be respectful
-                                await asyncio.sleep(1)
-
-                            except Exception as e:
-                                error_msg = str(e)
-                                console.print(
-                                    f"[red]    ❌ Error with {site}/{search_term}:[/red]"
-                                )
-                                console.print(f"[red]       {error_msg}[/red]")
-
-                                # Site-specific troubleshooting hints
-                                if site == "glassdoor":
-                                    console.print(
-                                        f"[yellow]    💡 Glassdoor tip: Ensure location format is correct (e.g., 'Toronto, ON')[/yellow]"
-                                    )
-                                elif site == "linkedin":
-                                    console.print(
-                                        f"[yellow]    💡 LinkedIn tip: May require specific location codes or authentication[/yellow]"
-                                    )
-
-                                continue
-
-                # Combine all results
-                if all_jobs:
-                    combined_df = pd.concat(all_jobs, ignore_index=True)
-                    console.print(
-                        f"[green]✅ JobSpy Discovery completed: {len(combined_df)} total jobs[/green]"
-                    )
-                    return combined_df
-                else:
-                    console.print(
-                        "[yellow]⚠️ No jobs found across all searches[/yellow]"
-                    )
-                    return pd.DataFrame()
-
-            except ImportError:
+            # Combine all results
+            if all_jobs:
+                combined_df = pd.concat(all_jobs, ignore_index=True)
                 console.print(
-                    "[red]❌ JobSpy not installed. Install with: pip install python-jobspy[/red]"
-                )
-                # Return empty DataFrame with expected columns
-                return pd.DataFrame(
-                    columns=[
-                        "title",
-                        "company",
-                        "location",
-                        "job_url",
-                        "description",
-                        "date_posted",
-                        "search_term",
-                        "search_location",
-                        "source_site",
-                    ]
+                    f"[green]✅ JobSpy Discovery completed: {len(combined_df)} total jobs[/green]"
                 )
+                return combined_df
+
+            console.print("[yellow]⚠️ No jobs found across all searches[/yellow]")
+            # Return empty DataFrame with expected columns
+            return pd.DataFrame(columns=JOBSPY_RESULT_COLUMNS)
 
         except Exception as e:
             console.print(f"[red]❌ JobSpy discovery failed: {e}[/red]")
@@ -359,36 +461,18 @@ class MultiSiteJobSpyWorkers:
     async def enrich_descriptions(
         self, jobs_df: pd.DataFrame, concurrency: int = 4
     ) -> pd.DataFrame:
-        """
-        Enrich job descriptions (placeholder implementation).
-
-        In the full implementation, this would fetch missing descriptions
-        from job URLs asynchronously.
-        """
-        console.print(f"[cyan]📝 Description enrichment: {len(jobs_df)} jobs[/cyan]")
-
-        # For now, just return the DataFrame as-is
-        # In the full implementation, this would:
-        # 1. Identify jobs with missing/short descriptions
-        # 2. Fetch full descriptions from job URLs
-        # 3. Update the DataFrame with enriched content
-
-        return jobs_df
+        """Fill missing descriptions; see ``run_optimized_description_fetching``."""
+        return await self.run_optimized_description_fetching(
+            jobs_df, max_concurrency=concurrency
+        )
 
-    async def run_comprehensive_search(
+    def resolve_search_space(
         self,
         location_set: str = "canada_comprehensive",
         query_preset: str = "comprehensive",
         sites: Optional[List[str]] = None,
-        per_site_concurrency: int = 4,
-        max_total_jobs: Optional[int] = None,
-        **kwargs,
-    ) -> "MultiSiteResult":
-        """
-        Run comprehensive JobSpy search across multiple sites and locations.
-
-        Returns a MultiSiteResult object with combined_data DataFrame.
-        """
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """Expand a location set and query preset into (locations, search_terms, sites)."""
         from src.config.jobspy_integration_config import (
             JOBSPY_LOCATION_SETS,
             JOBSPY_QUERY_PRESETS,
@@ -408,6 +492,25 @@ class MultiSiteJobSpyWorkers:
 
         # Use provided sites or defaults
         sites = sites or ["indeed", "linkedin"]
+        return locations, search_terms, sites
+
+    async def run_comprehensive_search(
+        self,
+        location_set: str = "canada_comprehensive",
+        query_preset: str = "comprehensive",
+        sites: Optional[List[str]] = None,
+        per_site_concurrency: int = 4,
+        max_total_jobs: Optional[int] = None,
+        **kwargs,
+    ) -> "MultiSiteResult":
+        """
+        Run comprehensive JobSpy search across multiple sites and locations.
+
+        Returns a MultiSiteResult object with combined_data DataFrame.
+        """
+        locations, search_terms, sites = self.resolve_search_space(
+            location_set, query_preset, sites
+        )
 
         console.print(
             f"[cyan]🔍 Comprehensive search: {len(sites)} sites × {len(locations)} locations × {len(search_terms)} terms[/cyan]"
@@ -419,6 +522,7 @@ class MultiSiteJobSpyWorkers:
             locations=locations,
             search_terms=search_terms,
             max_jobs_per_site=self.max_jobs_per_site,
+            per_site_concurrency=per_site_concurrency,
         )
 
         # Return result in expected format
@@ -428,16 +532,56 @@ class MultiSiteJobSpyWorkers:
         self, jobs_df: pd.DataFrame, max_concurrency: int = 24
     ) -> pd.DataFrame:
         """
-        Fetch and enrich job descriptions.
+        Fetch descriptions for jobs whose description is missing or too short.
+
+        Pages are fetched over HTTP with ``max_concurrency`` requests in flight
+        (see ``AsyncDescriptionFetcher``); only pages that need JavaScript are
+        rendered in a browser. The direct employer URL is preferred when
+        JobSpy provides one.
 
-        This is a placeholder implementation for Phase 1.
+        Returns:
+            Copy of ``jobs_df`` with fetched descriptions filled in
         """
+        from .description_fetcher import MIN_DESCRIPTION_CHARS, AsyncDescriptionFetcher
+
+        if jobs_df is None or jobs_df.empty or "job_url" not in jobs_df:
+            return jobs_df
+
+        descriptions = (
+            jobs_df["description"].fillna("").astype(str)
+            if "description" in jobs_df
+            else pd.Series("", index=jobs_df.index)
+        )
+        urls = jobs_df["job_url"]
+        if "job_url_direct" in jobs_df:
+            urls = jobs_df["job_url_direct"].where(jobs_df["job_url_direct"].notna(), urls)
+        missing = (descriptions.str.len() < MIN_DESCRIPTION_CHARS) & urls.notna()
+
         console.print(
-            f"[cyan]📝 Description fetching: {len(jobs_df)} jobs (max_concurrency={max_concurrency})[/cyan]"
+            f"[cyan]📝 Description fetching: {int(missing.sum())} of {len(jobs_df)} jobs "
+            f"need descriptions (max_concurrency={max_concurrency})[/cyan]"
         )
+        if not missing.any():
+            return jobs_df
+
+        fetcher = AsyncDescriptionFetcher(
+            max_concurrency=max_concurrency, validators=self.description_validators
+        )
+        results = await fetcher.fetch_all(urls[missing])
 
-        # For Phase 1, just return the DataFrame as-is
-        # In the full implementation, this would fetch missing descriptions
+        fetched = urls[missing].map(
+            lambda url: results[url].description if url in results else None
+        )
+        fetched = fetched[fetched.notna()]
+
+        jobs_df = jobs_df.copy()
+        jobs_df["description"] = descriptions.where(descriptions != "", None)
+        jobs_df.loc[fetched.index, "description"] = fetched
+        console.print(
+            f"[green]✅ Fetched {len(fetched)} descriptions "
+            f"({fetcher.stats['not_modified']} unchanged, {fetcher.stats['browser']} via browser, "
+            f"{fetcher.stats['failed']} failed)[/green]"
+        )
         return jobs_df
 
     def get_stats(self) -> Dict[str, Any]:
@@ -10,245 +10,386 @@ Features:
 - Location and remote work trends
 - Match score distributions
 - Export functionality (CSV, JSON)
+
+Every analysis is a DuckDB aggregate over the whole ``jobs`` table (scoped
+to the database's profile), so reports cover the full history without
+loading job rows into Python. Reports are cached per period and rebuilt only
+when a cheap version probe of the table changes.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict, Counter
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime
 import json
 import csv
-from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Jobs with an application on record (status set by hand or tracked pipeline)
+APPLIED_SQL = (
+    "(status = 'applied' OR "
+    "coalesce(application_status, 'discovered') NOT IN ('discovered', 'interested'))"
+)
+BOOKMARKED_SQL = "(application_status = 'interested')"
+# Applications that moved beyond 'applied'
+RESPONDED_SQL = "(application_status NOT IN ('discovered', 'interested', 'applied'))"
+
+# fit_score is stored as 0-1 or 0-100 depending on the scorer; report on 0-1
+SCORE_SQL = "(CASE WHEN fit_score > 1 THEN fit_score / 100 ELSE fit_score END)"
+HIGH_SCORE = 0.8
+
+UNKNOWN_COMPANIES = ("", "Unknown", "Unknown Company")
+
+# Cheap probe: the cached report is reused while none of these change.
+# Not every writer bumps last_updated (update_job_status sets status alone),
+# so an order-independent hash covers the columns the report reads.
+_VERSION_QUERY = """
+    SELECT
+        COUNT(*), MAX(last_updated), MAX(created_at), CURRENT_DATE,
+        bit_xor(hash(
+            id, status, application_status, application_date, fit_score, skills,
+            keywords, company, location, location_type, job_type, created_at
+        ))
+    FROM jobs
+    WHERE {where}
+"""
+
+SKILL_CATEGORIES = {
+    "Programming Languages": ["python", "javascript", "java", "c++", "c#"],
+    "Web Technologies": ["react", "angular", "vue", "html", "css"],
+    "Databases": ["sql", "mysql", "postgresql", "mongodb"],
+    "Cloud & DevOps": ["aws", "azure", "docker", "kubernetes"],
+    "Data Science": ["machine learning", "pandas", "numpy", "tensorflow"],
+}
+
 
 class JobAnalyticsService:
     """Service for analyzing job search data and generating insights."""
 
     def __init__(self, db):
         self.db = db
+        self._reports: Dict[int, Tuple[Tuple[Any, ...], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
 
     def generate_comprehensive_report(self, days: int = 30) -> Dict[str, Any]:
-        """Generate a comprehensive analytics report."""
-
-        # Get jobs from the specified time period
-        jobs = self._get_recent_jobs(days)
+        """
+        Generate a comprehensive analytics report.
+
+        Args:
+            days: Recent window for daily averages, emerging skills and skill
+                trends; every other figure covers the full history
+        """
+        days = max(1, int(days))
+        try:
+            version = tuple(self._fetchone(_VERSION_QUERY))
+        except Exception as e:
+            logger.error(f"Error probing jobs table: {e}")
+            version = (0,)
 
-        if not jobs:
+        if not version[0]:
             return {
                 "status": "no_data",
-                "message": f"No jobs found in the last {days} days",
+                "message": "No jobs found",
                 "period_days": days,
             }
 
+        with self._lock:
+            cached = self._reports.get(days)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        overview = self._generate_overview(days)
+        skill_rows = self._skill_rows(days)
+        skills = self._analyze_skills(skill_rows)
+        companies = self._analyze_companies()
+        match_scores = self._analyze_match_scores()
+
         report = {
             "period_days": days,
             "generated_at": datetime.now().isoformat(),
-            "total_jobs": len(jobs),
-            "overview": self._generate_overview(jobs),
-            "trends": self._analyze_trends(jobs, days),
-            "companies": self._analyze_companies(jobs),
-            "skills": self._analyze_skills(jobs),
-            "locations": self._analyze_locations(jobs),
-            "applications": self._analyze_applications(jobs),
-            "match_scores": self._analyze_match_scores(jobs),
-            "job_types": self._analyze_job_types(jobs),
-            "recommendations": self._generate_recommendations(jobs),
+            "total_jobs": overview["total_jobs"],
+            "overview": overview,
+            "trends": self._analyze_trends(days, overview["recent_jobs"]),
+            "companies": companies,
+            "skills": skills,
+            "locations": self._analyze_locations(overview["total_jobs"]),
+            "applications": self._analyze_applications(overview),
+            "match_scores": match_scores,
+            "job_types": self._analyze_job_types(overview),
+            "recommendations": self._generate_recommendations(overview, skill_rows, companies),
         }
 
-        logger.info(f"Analytics report generated: {len(jobs)} jobs analyzed " f"over {days} days")
+        with self._lock:
+            self._reports[days] = (version, report)
+
+        logger.info(
+            f"Analytics report generated: {overview['total_jobs']} jobs analyzed "
+            f"({days}-day window)"
+        )
 
         return report
 
-    def _get_recent_jobs(self, days: int) -> List[Dict[str, Any]]:
-        """Get jobs from the recent time period."""
-        try:
-            # Use the database method to get recent jobs
-            return self.db.get_jobs(limit=1000)  # Adjust limit as needed
-        except Exception as e:
-            logger.error(f"Error getting recent jobs: {e}")
-            return []
+    def invalidate(self) -> None:
+        """Drop cached reports."""
+        with self._lock:
+            self._reports.clear()
+
+    # Query helpers
+    def _scope(self) -> Tuple[str, List[Any]]:
+        """WHERE clause restricting queries to the database's profile."""
+        if getattr(self.db, "profile_name", None):
+            return "profile_name = ?", [self.db.profile_name]
+        return "1=1", []
+
+    def _fetchall(self, query: str, params: Optional[List[Any]] = None) -> List[Tuple[Any, ...]]:
+        """Run a query whose ``{where}`` placeholders precede any other parameters."""
+        where, scope_params = self._scope()
+        params = scope_params * query.count("{where}") + (params or [])
+        return self.db.conn.execute(query.format(where=where), params).fetchall()
+
+    def _fetchone(self, query: str, params: Optional[List[Any]] = None) -> Tuple[Any, ...]:
+        return self._fetchall(query, params)[0]
+
+    def _top_counts(self, expression: str, limit: int = 10) -> Dict[str, int]:
+        """Most frequent non-empty values of an expression, by job count."""
+        rows = self._fetchall(
+            f"""
+            SELECT value, COUNT(*) AS jobs
+            FROM (SELECT {expression} AS value FROM jobs WHERE {{where}})
+            WHERE value IS NOT NULL AND value NOT IN ('', 'Unknown')
+            GROUP BY value
+            ORDER BY jobs DESC, value
+            LIMIT ?
+            """,
+            [limit],
+        )
+        return dict(rows)
 
-    def _generate_overview(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _generate_overview(self, days: int) -> Dict[str, Any]:
         """Generate high-level overview statistics."""
-        applied_jobs = [job for job in jobs if job.get("applied", 0) == 1]
-        bookmarked_jobs = [job for job in jobs if job.get("is_bookmarked", 0) == 1]
-
-        # Calculate average match score
-        match_scores = [
-            job.get("match_score", 0) or job.get("compatibility_score", 0) for job in jobs
-        ]
-        avg_match_score = sum(match_scores) / len(match_scores) if match_scores else 0
-
-        # Get status distribution
-        status_counts = Counter(job.get("status", "unknown") for job in jobs)
+        (
+            total,
+            applied,
+            bookmarked,
+            average_score,
+            high_score,
+            recent,
+            unique_companies,
+            unique_locations,
+            status_counts,
+            job_types,
+        ) = self._fetchone(
+            f"""
+            SELECT
+                COUNT(*),
+                COUNT(*) FILTER (WHERE {APPLIED_SQL}),
+                COUNT(*) FILTER (WHERE {BOOKMARKED_SQL}),
+                AVG(coalesce({SCORE_SQL}, 0)),
+                COUNT(*) FILTER (WHERE {SCORE_SQL} >= {HIGH_SCORE}),
+                COUNT(*) FILTER (WHERE created_at >= CURRENT_DATE - INTERVAL {days} DAY),
+                COUNT(DISTINCT company),
+                COUNT(DISTINCT location),
+                histogram(coalesce(status, 'unknown')),
+                histogram(coalesce(nullif(job_type, ''), 'Unknown'))
+            FROM jobs
+            WHERE {{where}}
+            """
+        )
 
         return {
-            "total_jobs": len(jobs),
-            "applied_jobs": len(applied_jobs),
-            "bookmarked_jobs": len(bookmarked_jobs),
-            "application_rate": len(applied_jobs) / len(jobs) * 100 if jobs else 0,
-            "bookmark_rate": len(bookmarked_jobs) / len(jobs) * 100 if jobs else 0,
-            "average_match_score": avg_match_score,
-            "status_distribution": dict(status_counts),
-            "unique_companies": len(set(job.get("company", "Unknown") for job in jobs)),
-            "unique_locations": len(set(job.get("location", "Unknown") for job in jobs)),
+            "total_jobs": total,
+            "applied_jobs": applied,
+            "bookmarked_jobs": bookmarked,
+            "application_rate": applied / total * 100 if total else 0,
+            "bookmark_rate": bookmarked / total * 100 if total else 0,
+            "average_match_score": average_score or 0,
+            "status_distribution": dict(status_counts or {}),
+            "unique_companies": unique_companies,
+            "unique_locations": unique_locations,
+            "high_score_jobs": high_score,
+            "recent_jobs": recent,
+            "job_type_distribution": dict(job_types or {}),
         }
 
-    def _analyze_trends(self, jobs: List[Dict[str, Any]], days: int) -> Dict[str, Any]:
+    def _analyze_trends(self, days: int, recent_jobs: int) -> Dict[str, Any]:
         """Analyze job posting trends over time."""
-        # Group jobs by date
-        jobs_by_date = defaultdict(int)
-
-        for job in jobs:
-            scraped_at = job.get("scraped_at", "") or job.get("created_at", "")
-            if scraped_at:
-                try:
-                    # Parse different date formats
-                    if "T" in scraped_at:
-                        date = datetime.fromisoformat(scraped_at.replace("Z", "+00:00"))
-                    else:
-                        date = datetime.strptime(scraped_at, "%Y-%m-%d %H:%M:%S")
-
-                    date_key = date.strftime("%Y-%m-%d")
-                    jobs_by_date[date_key] += 1
-                except Exception:
-                    continue
-
-        # Calculate weekly trends
-        weekly_data = self._group_by_week(jobs_by_date)
-
-        # Calculate daily average
-        daily_avg = len(jobs) / days if days > 0 else 0
+        daily = self._fetchall(
+            """
+            SELECT CAST(created_at AS DATE) AS day, COUNT(*) AS jobs
+            FROM jobs
+            WHERE {where} AND created_at IS NOT NULL
+            GROUP BY day
+            ORDER BY day
+            """
+        )
+        weekly = self._fetchall(
+            """
+            WITH weekly AS (
+                SELECT CAST(date_trunc('week', created_at) AS DATE) AS week, COUNT(*) AS jobs
+                FROM jobs
+                WHERE {where} AND created_at IS NOT NULL
+                GROUP BY week
+            )
+            SELECT
+                strftime(week, '%Y-W%U'),
+                jobs,
+                jobs - lag(jobs) OVER w,
+                AVG(jobs) OVER (w ROWS BETWEEN 3 PRECEDING AND CURRENT ROW)
+            FROM weekly
+            WINDOW w AS (ORDER BY week)
+            ORDER BY week
+            """
+        )
+        jobs_by_date = {day.isoformat(): count for day, count in daily}
 
         return {
-            "daily_average": daily_avg,
-            "jobs_by_date": dict(jobs_by_date),
-            "weekly_trends": weekly_data,
+            "daily_average": recent_jobs / days,
+            "jobs_by_date": jobs_by_date,
+            "weekly_trends": {week: count for week, count, _, _ in weekly},
+            "week_over_week_change": {
+                week: change for week, _, change, _ in weekly if change is not None
+            },
+            "weekly_moving_average": {week: average for week, _, _, average in weekly},
             "peak_day": max(jobs_by_date.items(), key=lambda x: x[1]) if jobs_by_date else None,
-            "trend_direction": self._calculate_trend_direction(weekly_data),
+            "trend_direction": self._calculate_trend_direction([count for _, count, _, _ in weekly]),
         }
 
-    def _analyze_companies(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_companies(self) -> Dict[str, Any]:
         """Analyze company-related statistics."""
-        company_counts = Counter(job.get("company", "Unknown") for job in jobs)
-        company_counts.pop("Unknown", None)  # Remove unknown companies
-
-        # Company application rates
-        company_apps = defaultdict(lambda: {"total": 0, "applied": 0})
-        for job in jobs:
-            company = job.get("company", "Unknown")
-            if company != "Unknown":
-                company_apps[company]["total"] += 1
-                if job.get("applied", 0) == 1:
-                    company_apps[company]["applied"] += 1
-
-        # Calculate application rates
-        company_app_rates = {}
-        for company, data in company_apps.items():
-            if data["total"] > 0:
-                rate = (data["applied"] / data["total"]) * 100
-                company_app_rates[company] = rate
+        rows = self._fetchall(
+            f"""
+            WITH companies AS (
+                SELECT
+                    company,
+                    COUNT(*) AS jobs,
+                    COUNT(*) FILTER (WHERE {APPLIED_SQL}) * 100.0 / COUNT(*) AS application_rate
+                FROM jobs
+                WHERE {{where}} AND company IS NOT NULL AND NOT list_contains(?, company)
+                GROUP BY company
+            )
+            SELECT
+                company,
+                jobs,
+                application_rate,
+                COUNT(*) OVER () AS total_companies,
+                SUM(CASE WHEN jobs > 1 THEN 1 ELSE 0 END) OVER () AS multi_job_companies,
+                row_number() OVER (ORDER BY jobs DESC, company) AS jobs_rank,
+                row_number() OVER (ORDER BY application_rate DESC, jobs DESC, company) AS rate_rank
+            FROM companies
+            QUALIFY jobs_rank <= 10 OR rate_rank <= 10
+            """,
+            [list(UNKNOWN_COMPANIES)],
+        )
 
+        by_jobs = sorted((row for row in rows if row[5] <= 10), key=lambda row: row[5])
+        by_rate = sorted((row for row in rows if row[6] <= 10), key=lambda row: row[6])
         return {
-            "top_companies": dict(company_counts.most_common(10)),
-            "total_unique_companies": len(company_counts),
-            "company_application_rates": dict(
-                sorted(company_app_rates.items(), key=lambda x: x[1], reverse=True)[:10]
+            "top_companies": {row[0]: row[1] for row in by_jobs},
+            "total_unique_companies": rows[0][3] if rows else 0,
+            "company_application_rates": {row[0]: row[2] for row in by_rate},
+            "companies_with_multiple_jobs": rows[0][4] if rows else 0,
+        }
+
+    def _skill_rows(self, days: int) -> List[Tuple[Any, ...]]:
+        """
+        Per-skill job counts, most demanded first.
+
+        ``keywords``/``skills`` hold JSON lists or comma/semicolon separated
+        text; each job counts once per skill. Rows are ``(skill, jobs,
+        keyword_jobs, recent_share, earlier_share)`` where the shares are the
+        skill's fraction of mentions inside and before the recent window.
+        """
+        return self._fetchall(
+            f"""
+            WITH skill_values AS (
+                SELECT id, created_at, 'keywords' AS source, keywords AS value
+                FROM jobs WHERE {{where}} AND keywords <> ''
+                UNION ALL
+                SELECT id, created_at, 'skills' AS source, skills AS value
+                FROM jobs WHERE {{where}} AND skills <> ''
             ),
-            "companies_with_multiple_jobs": len(
-                [c for c, count in company_counts.items() if count > 1]
+            mentions AS (
+                SELECT
+                    id,
+                    created_at >= CURRENT_DATE - INTERVAL {days} DAY AS recent,
+                    source,
+                    lower(trim(skill)) AS skill
+                FROM skill_values, UNNEST(
+                    CASE WHEN starts_with(ltrim(value), '[') AND json_valid(value)
+                         THEN from_json(value, '["VARCHAR"]')
+                         ELSE string_split_regex(value, '[,;]')
+                    END
+                ) AS t(skill)
             ),
-        }
+            skills AS (
+                SELECT
+                    skill,
+                    COUNT(DISTINCT id) AS jobs,
+                    COUNT(DISTINCT id) FILTER (WHERE recent) AS recent_jobs,
+                    COUNT(DISTINCT id) FILTER (WHERE NOT recent OR recent IS NULL) AS earlier_jobs,
+                    COUNT(DISTINCT id) FILTER (WHERE source = 'keywords') AS keyword_jobs
+                FROM mentions
+                WHERE skill <> ''
+                GROUP BY skill
+            )
+            SELECT
+                skill,
+                jobs,
+                keyword_jobs,
+                recent_jobs / nullif(SUM(recent_jobs) OVER (), 0) AS recent_share,
+                earlier_jobs / nullif(SUM(earlier_jobs) OVER (), 0) AS earlier_share
+            FROM skills
+            ORDER BY jobs DESC, skill
+            """
+        )
 
-    def _analyze_skills(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_skills(self, rows: List[Tuple[Any, ...]]) -> Dict[str, Any]:
         """Analyze skill demand and trends."""
-        all_skills = []
-
-        # Extract skills from various fields
-        for job in jobs:
-            # From keywords field
-            keywords = job.get("keywords", "")
-            if isinstance(keywords, str):
-                try:
-                    skill_list = json.loads(keywords)
-                    if isinstance(skill_list, list):
-                        all_skills.extend(skill_list)
-                except:
-                    # Split by common delimiters
-                    skills = [s.strip() for s in keywords.split(",")]
-                    all_skills.extend(skills)
-            elif isinstance(keywords, list):
-                all_skills.extend(keywords)
-
-            # From required_skills field
-            req_skills = job.get("required_skills", "")
-            if req_skills:
-                if isinstance(req_skills, str):
-                    try:
-                        skill_list = json.loads(req_skills)
-                        if isinstance(skill_list, list):
-                            all_skills.extend(skill_list)
-                    except:
-                        skills = [s.strip() for s in req_skills.split(",")]
-                        all_skills.extend(skills)
-                elif isinstance(req_skills, list):
-                    all_skills.extend(req_skills)
-
-        # Clean and count skills
-        cleaned_skills = [skill.strip().lower() for skill in all_skills if skill and skill.strip()]
-        skill_counts = Counter(cleaned_skills)
-
-        # Group skills by category
-        skill_categories = self._categorize_skills(skill_counts)
+        skill_counts = {skill: jobs for skill, jobs, _, _, _ in rows}
+        shares = {skill: (recent or 0, earlier or 0) for skill, _, _, recent, earlier in rows}
 
         return {
-            "top_skills": dict(skill_counts.most_common(20)),
+            "top_skills": dict(list(skill_counts.items())[:20]),
             "total_unique_skills": len(skill_counts),
-            "skill_categories": skill_categories,
-            "emerging_skills": self._identify_emerging_skills(jobs),
-            "skill_demand_trend": self._analyze_skill_trends(jobs),
+            "skill_categories": self._categorize_skills(skill_counts),
+            "emerging_skills": self._identify_emerging_skills(rows),
+            "skill_demand_trend": self._analyze_skill_trends(shares),
         }
 
-    def _analyze_locations(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_locations(self, total_jobs: int) -> Dict[str, Any]:
         """Analyze location and remote work trends."""
-        location_counts = Counter(job.get("location", "Unknown") for job in jobs)
-        location_counts.pop("Unknown", None)
-
-        # Analyze location types
-        location_type_counts = Counter(job.get("location_type", "unknown") for job in jobs)
-
-        # Calculate remote work percentage
-        remote_jobs = location_type_counts.get("remote", 0)
-        hybrid_jobs = location_type_counts.get("hybrid", 0)
-        total_jobs = len(jobs)
+        location_types, location_diversity = self._fetchone(
+            """
+            SELECT
+                histogram(coalesce(nullif(location_type, ''), 'unknown')),
+                COUNT(DISTINCT location) FILTER (WHERE location NOT IN ('', 'Unknown'))
+            FROM jobs
+            WHERE {where}
+            """
+        )
+        location_types = dict(location_types or {})
 
-        remote_percentage = (remote_jobs / total_jobs * 100) if total_jobs > 0 else 0
-        hybrid_percentage = (hybrid_jobs / total_jobs * 100) if total_jobs > 0 else 0
+        remote_percentage = location_types.get("remote", 0) / total_jobs * 100 if total_jobs else 0
+        hybrid_percentage = location_types.get("hybrid", 0) / total_jobs * 100 if total_jobs else 0
         flexible_percentage = remote_percentage + hybrid_percentage
 
-        # Analyze city/region patterns
-        cities = self._extract_cities_from_locations(location_counts)
-
         return {
-            "top_locations": dict(location_counts.most_common(10)),
-            "location_types": dict(location_type_counts),
+            "top_locations": self._top_counts("location"),
+            "location_types": location_types,
             "remote_work_stats": {
                 "remote_percentage": remote_percentage,
                 "hybrid_percentage": hybrid_percentage,
                 "flexible_work_percentage": flexible_percentage,
                 "onsite_percentage": 100 - flexible_percentage,
             },
-            "top_cities": cities,
-            "location_diversity": len(location_counts),
+            "top_cities": self._top_counts("trim(split_part(location, ',', 1))"),
+            "location_diversity": location_diversity,
         }
 
-    def _analyze_applications(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_applications(self, overview: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze application patterns and success rates."""
-        applied_jobs = [job for job in jobs if job.get("applied", 0) == 1]
-
-        if not applied_jobs:
+        if not overview["applied_jobs"]:
             return {
                 "total_applications": 0,
                 "application_rate": 0,
@@ -256,47 +397,59 @@ class JobAnalyticsService:
                 "response_rate": 0,
             }
 
-        # Application status distribution
-        app_status_counts = Counter(
-            job.get("application_status", "not_applied") for job in applied_jobs
+        total, responded, status_counts, first_date, last_date = self._fetchone(
+            f"""
+            SELECT
+                COUNT(*),
+                COUNT(*) FILTER (WHERE {RESPONDED_SQL}),
+                histogram(coalesce(application_status, 'not_applied')),
+                MIN(application_date),
+                MAX(application_date)
+            FROM jobs
+            WHERE {{where}} AND {APPLIED_SQL}
+            """
         )
-
-        # Response rate (applications that moved beyond 'applied')
-        responded_apps = len(
-            [job for job in applied_jobs if job.get("application_status", "applied") != "applied"]
+        by_date = self._fetchall(
+            f"""
+            SELECT application_date, COUNT(*)
+            FROM jobs
+            WHERE {{where}} AND {APPLIED_SQL} AND application_date IS NOT NULL
+            GROUP BY application_date
+            ORDER BY application_date
+            """
         )
-        response_rate = (responded_apps / len(applied_jobs) * 100) if applied_jobs else 0
-
-        # Time-based application analysis
-        app_by_date = defaultdict(int)
-        for job in applied_jobs:
-            app_date = job.get("application_date", "")
-            if app_date:
-                try:
-                    date = datetime.fromisoformat(app_date).strftime("%Y-%m-%d")
-                    app_by_date[date] += 1
-                except:
-                    continue
+        weeks = max(1.0, (last_date - first_date).days / 7) if first_date else 1.0
 
         return {
-            "total_applications": len(applied_jobs),
-            "application_rate": len(applied_jobs) / len(jobs) * 100 if jobs else 0,
-            "status_distribution": dict(app_status_counts),
-            "response_rate": response_rate,
-            "applications_by_date": dict(app_by_date),
-            "average_applications_per_week": len(applied_jobs) / 4 if applied_jobs else 0,
+            "total_applications": total,
+            "application_rate": overview["application_rate"],
+            "status_distribution": dict(status_counts or {}),
+            "response_rate": responded / total * 100 if total else 0,
+            "applications_by_date": {day.isoformat(): count for day, count in by_date},
+            "average_applications_per_week": total / weeks,
         }
 
-    def _analyze_match_scores(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_match_scores(self) -> Dict[str, Any]:
         """Analyze match score distributions and patterns."""
-        match_scores = []
-
-        for job in jobs:
-            score = job.get("match_score", 0) or job.get("compatibility_score", 0)
-            if score and score > 0:
-                match_scores.append(float(score))
-
-        if not match_scores:
+        row = self._fetchone(
+            f"""
+            SELECT
+                COUNT(*),
+                AVG(score),
+                median(score),
+                COUNT(*) FILTER (WHERE score >= 0.9),
+                COUNT(*) FILTER (WHERE score >= 0.8 AND score < 0.9),
+                COUNT(*) FILTER (WHERE score >= 0.7 AND score < 0.8),
+                COUNT(*) FILTER (WHERE score >= 0.6 AND score < 0.7),
+                COUNT(*) FILTER (WHERE score >= 0.5 AND score < 0.6),
+                COUNT(*) FILTER (WHERE score < 0.5),
+                COUNT(*) FILTER (WHERE score >= {HIGH_SCORE})
+            FROM (SELECT {SCORE_SQL} AS score FROM jobs WHERE {{where}})
+            WHERE score > 0
+            """
+        )
+        scored = row[0]
+        if not scored:
             return {
                 "average_score": 0,
                 "score_distribution": {},
@@ -304,78 +457,50 @@ class JobAnalyticsService:
                 "total_scored_jobs": 0,
             }
 
-        # Calculate score distribution
-        score_ranges = {
-            "0.9-1.0": len([s for s in match_scores if s >= 0.9]),
-            "0.8-0.9": len([s for s in match_scores if 0.8 <= s < 0.9]),
-            "0.7-0.8": len([s for s in match_scores if 0.7 <= s < 0.8]),
-            "0.6-0.7": len([s for s in match_scores if 0.6 <= s < 0.7]),
-            "0.5-0.6": len([s for s in match_scores if 0.5 <= s < 0.6]),
-            "Below 0.5": len([s for s in match_scores if s < 0.5]),
-        }
-
-        high_score_jobs = len([s for s in match_scores if s >= 0.8])
-
+        ranges = ["0.9-1.0", "0.8-0.9", "0.7-0.8", "0.6-0.7", "0.5-0.6", "Below 0.5"]
         return {
-            "average_score": sum(match_scores) / len(match_scores),
-            "median_score": sorted(match_scores)[len(match_scores) // 2],
-            "score_distribution": score_ranges,
-            "high_score_jobs": high_score_jobs,
-            "high_score_percentage": (high_score_jobs / len(match_scores) * 100),
-            "total_scored_jobs": len(match_scores),
+            "average_score": row[1],
+            "median_score": row[2],
+            "score_distribution": dict(zip(ranges, row[3:9])),
+            "high_score_jobs": row[9],
+            "high_score_percentage": row[9] / scored * 100,
+            "total_scored_jobs": scored,
         }
 
-    def _analyze_job_types(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_job_types(self, overview: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze job types and employment patterns."""
-        job_types = Counter(job.get("job_type", "Unknown") for job in jobs)
-        employment_types = Counter(job.get("employment_type", "Unknown") for job in jobs)
-        experience_levels = Counter(job.get("experience_level", "Unknown") for job in jobs)
+        total = overview["total_jobs"]
+        job_types = overview["job_type_distribution"]
 
         return {
-            "job_types": dict(job_types),
-            "employment_types": dict(employment_types),
-            "experience_levels": dict(experience_levels),
-            "full_time_percentage": (
-                (job_types.get("Full-time", 0) / len(jobs) * 100) if jobs else 0
-            ),
+            "job_types": job_types,
+            # Not tracked by the jobs table
+            "employment_types": {"Unknown": total},
+            "experience_levels": {"Unknown": total},
+            "full_time_percentage": job_types.get("Full-time", 0) / total * 100 if total else 0,
         }
 
-    def _generate_recommendations(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _generate_recommendations(
+        self,
+        overview: Dict[str, Any],
+        skill_rows: List[Tuple[Any, ...]],
+        companies: Dict[str, Any],
+    ) -> Dict[str, Any]:
         """Generate actionable recommendations based on analysis."""
+        # Most requested keywords
+        keyword_skills = sorted(
+            (row for row in skill_rows if row[2]), key=lambda row: (-row[2], row[0])
+        )
         recommendations = {
-            "skills_to_learn": [],
-            "companies_to_target": [],
+            "skills_to_learn": [row[0] for row in keyword_skills[:5]],
+            "companies_to_target": [
+                company for company, count in companies["top_companies"].items() if count > 1
+            ][:5],
             "application_strategy": [],
             "search_optimization": [],
         }
 
-        # Skill recommendations based on demand
-        skill_counts = Counter()
-        for job in jobs:
-            keywords = job.get("keywords", "")
-            if isinstance(keywords, str):
-                try:
-                    skills = json.loads(keywords)
-                    if isinstance(skills, list):
-                        skill_counts.update(skill.lower() for skill in skills)
-                except:
-                    skills = [s.strip().lower() for s in keywords.split(",")]
-                    skill_counts.update(skills)
-
-        top_skills = [skill for skill, count in skill_counts.most_common(10)]
-        recommendations["skills_to_learn"] = top_skills[:5]
-
-        # Company recommendations (companies with multiple jobs)
-        company_counts = Counter(job.get("company", "") for job in jobs)
-        multi_job_companies = [
-            company for company, count in company_counts.items() if count > 1 and company
-        ]
-        recommendations["companies_to_target"] = multi_job_companies[:5]
-
-        # Application strategy recommendations
-        applied_jobs = [job for job in jobs if job.get("applied", 0) == 1]
-        application_rate = len(applied_jobs) / len(jobs) * 100 if jobs else 0
-
+        application_rate = overview["application_rate"]
         if application_rate < 5:
             recommendations["application_strategy"].append(
                 "Consider applying to more positions - current application rate is low"
@@ -385,14 +510,8 @@ class JobAnalyticsService:
                 "Focus on quality over quantity - high application rate detected"
             )
 
-        # Search optimization recommendations
-        high_score_jobs = [
-            job
-            for job in jobs
-            if (job.get("match_score", 0) or job.get("compatibility_score", 0)) >= 0.8
-        ]
-
-        if len(high_score_jobs) / len(jobs) < 0.3 if jobs else False:
+        total = overview["total_jobs"]
+        if total and overview["high_score_jobs"] / total < 0.3:
             recommendations["search_optimization"].append(
                 "Refine search keywords to find better matching positions"
             )
@@ -439,77 +558,50 @@ class JobAnalyticsService:
             raise
 
     # Helper methods
-    def _group_by_week(self, daily_data: Dict[str, int]) -> Dict[str, int]:
-        """Group daily data by week."""
-        weekly_data = defaultdict(int)
-
-        for date_str, count in daily_data.items():
-            try:
-                date = datetime.strptime(date_str, "%Y-%m-%d")
-                week_start = date - timedelta(days=date.weekday())
-                week_key = week_start.strftime("%Y-W%U")
-                weekly_data[week_key] += count
-            except:
-                continue
-
-        return dict(weekly_data)
-
-    def _calculate_trend_direction(self, weekly_data: Dict[str, int]) -> str:
+    def _calculate_trend_direction(self, weekly_counts: List[int]) -> str:
         """Calculate if trend is increasing, decreasing, or stable."""
-        if len(weekly_data) < 2:
+        if len(weekly_counts) < 2:
             return "insufficient_data"
 
-        weeks = sorted(weekly_data.items())
-        if len(weeks) < 2:
-            return "stable"
-
-        recent_avg = sum(count for _, count in weeks[-2:]) / 2
-        earlier_avg = sum(count for _, count in weeks[:-2]) / max(1, len(weeks) - 2)
+        recent_avg = sum(weekly_counts[-2:]) / 2
+        earlier_avg = sum(weekly_counts[:-2]) / max(1, len(weekly_counts) - 2)
+        return self._direction(recent_avg, earlier_avg)
 
-        if recent_avg > earlier_avg * 1.1:
+    def _direction(self, recent: float, earlier: float) -> str:
+        if recent > earlier * 1.1:
             return "increasing"
-        elif recent_avg < earlier_avg * 0.9:
+        elif recent < earlier * 0.9:
             return "decreasing"
         else:
             return "stable"
 
-    def _categorize_skills(self, skill_counts: Counter) -> Dict[str, Dict[str, int]]:
+    def _categorize_skills(self, skill_counts: Dict[str, int]) -> Dict[str, Dict[str, int]]:
         """Categorize skills into technology groups."""
-        categories = {
-            "Programming Languages": ["python", "javascript", "java", "c++", "c#"],
-            "Web Technologies": ["react", "angular", "vue", "html", "css"],
-            "Databases": ["sql", "mysql", "postgresql", "mongodb"],
-            "Cloud & DevOps": ["aws", "azure", "docker", "kubernetes"],
-            "Data Science": ["machine learning", "pandas", "numpy", "tensorflow"],
-        }
-
-        categorized = defaultdict(dict)
-
-        for category, category_skills in categories.items():
-            for skill in category_skills:
-                if skill in skill_counts:
-                    categorized[category][skill] = skill_counts[skill]
-
-        return dict(categorized)
+        categorized: Dict[str, Dict[str, int]] = {}
 
-    def _identify_emerging_skills(self, jobs: List[Dict[str, Any]]) -> List[str]:
-        """Identify potentially emerging skills (placeholder for now)."""
-        # This could be enhanced with time-based analysis
-        return ["ai", "blockchain", "kubernetes", "typescript", "graphql"]
+        for category, category_skills in SKILL_CATEGORIES.items():
+            found = {skill: skill_counts[skill] for skill in category_skills if skill in skill_counts}
+            if found:
+                categorized[category] = found
 
-    def _analyze_skill_trends(self, jobs: List[Dict[str, Any]]) -> Dict[str, str]:
-        """Analyze skill demand trends (placeholder for now)."""
-        return {"ai_ml": "increasing", "cloud": "stable", "mobile": "decreasing"}
+        return categorized
 
-    def _extract_cities_from_locations(self, location_counts: Counter) -> Dict[str, int]:
-        """Extract city names from location strings."""
-        cities = defaultdict(int)
-
-        for location, count in location_counts.items():
-            # Simple city extraction (could be enhanced)
-            parts = location.split(",")
-            if parts:
-                city = parts[0].strip()
-                cities[city] += count
-
-        return dict(sorted(cities.items(), key=lambda x: x[1], reverse=True)[:10])
+    def _identify_emerging_skills(self, rows: List[Tuple[Any, ...]], limit: int = 5) -> List[str]:
+        """Skills whose share of recent jobs grew most against earlier jobs."""
+        lifts = [
+            (recent / earlier if earlier else float("inf"), jobs, skill)
+            for skill, jobs, _, recent, earlier in rows
+            if recent and jobs >= 3 and (not earlier or recent > earlier * 1.5)
+        ]
+        lifts.sort(key=lambda lift: (-lift[0], -lift[1], lift[2]))
+        return [skill for _, _, skill in lifts[:limit]]
+
+    def _analyze_skill_trends(self, shares: Dict[str, Tuple[float, float]]) -> Dict[str, str]:
+        """Recent against earlier demand per skill category."""
+        trends = {}
+        for category, category_skills in SKILL_CATEGORIES.items():
+            recent = sum(shares.get(skill, (0, 0))[0] for skill in category_skills)
+            earlier = sum(shares.get(skill, (0, 0))[1] for skill in category_skills)
+            if recent or earlier:
+                trends[category] = self._direction(recent, earlier)
+        return trends
@@ -48,18 +48,29 @@ class RCIPEnrichmentService:
             job["location_category"] = "unknown"
             return job
 
-        # Analyze location using categorizer
+        # Analyze location using categorizer (memoized per location string)
         location_info: LocationInfo = self.location_categorizer.analyze_location(location)
+        return self._apply_location(job, location_info, self._location_fields(location_info))
 
-        # Add RCIP fields to job
-        job["is_rcip_city"] = location_info.is_rcip_city
-        job["is_immigration_priority"] = location_info.is_immigration_priority
-        job["city_tags"] = ",".join(location_info.city_tags) if location_info.city_tags else ""
-        job["location_category"] = location_info.location_category
-        job["location_type"] = location_info.location_type
-        job["province_code"] = location_info.province_code
-        job["city"] = location_info.city
-        job["province"] = location_info.province
+    @staticmethod
+    def _location_fields(location_info: LocationInfo) -> Dict[str, Any]:
+        """RCIP fields a job gets for its analyzed location."""
+        return {
+            "is_rcip_city": location_info.is_rcip_city,
+            "is_immigration_priority": location_info.is_immigration_priority,
+            "city_tags": ",".join(location_info.city_tags) if location_info.city_tags else "",
+            "location_category": location_info.location_category,
+            "location_type": location_info.location_type,
+            "province_code": location_info.province_code,
+            "city": location_info.city,
+            "province": location_info.province,
+        }
+
+    def _apply_location(
+        self, job: Dict[str, Any], location_info: LocationInfo, location_fields: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Add the location fields to ``job`` and boost it when it is in an RCIP city."""
+        job.update(location_fields)
 
         # Apply ranking boost for RCIP jobs
         if location_info.is_rcip_city:
@@ -83,7 +94,7 @@ class RCIPEnrichmentService:
                 existing_tags.append("RCIP")
             job["tags"] = existing_tags
 
-            logger.debug(f"Applied RCIP boost to job '{job.get('title')}' in {location_info.city}")
+            logger.debug("Applied RCIP boost to job '%s' in %s", job.get("title"), location_info.city)
 
         return job
 
@@ -101,8 +112,18 @@ class RCIPEnrichmentService:
         rcip_count = 0
         immigration_priority_count = 0
 
+        # Jobs share a few hundred locations; analyze each distinct one once
+        resolved: Dict[str, tuple] = {}
+
         for job in jobs:
-            enriched_job = self.enrich_job(job)
+            location = job.get("location", "")
+            if not location or not isinstance(location, str):
+                enriched_job = self.enrich_job(job)
+            else:
+                if location not in resolved:
+                    location_info = self.location_categorizer.analyze_location(location)
+                    resolved[location] = (location_info, self._location_fields(location_info))
+                enriched_job = self._apply_location(job, *resolved[location])
             enriched_jobs.append(enriched_job)
 
             if enriched_job.get("is_rcip_city"):
@@ -175,6 +175,11 @@ class ConfigDrivenSalaryParser:
                     "weight": pattern_data.get("weight", "medium")
                 }
         
+        # Highest confidence first; parse_salary walks this for every call
+        self.ordered_patterns: List[Tuple[str, Dict[str, Any]]] = sorted(
+            self.compiled_patterns.items(), key=lambda x: x[1]["confidence"], reverse=True
+        )
+
         logger.debug(f"Compiled {len(self.compiled_patterns)} salary pattern groups")
 
     def parse_salary(
@@ -203,11 +208,7 @@ class ConfigDrivenSalaryParser:
         search_text = f"{job_title} {text}"
         
         # Try patterns in order of confidence
-        for pattern_type, pattern_info in sorted(
-            self.compiled_patterns.items(),
-            key=lambda x: x[1]["confidence"],
-            reverse=True
-        ):
+        for pattern_type, pattern_info in self.ordered_patterns:
             for pattern in pattern_info["compiled"]:
                 match = pattern.search(search_text)
                 if match:
@@ -15,6 +15,7 @@ Models used:
 - Llama3.2 3B (best accuracy)
 """
 
+import asyncio
 import requests
 import json
 import time
@@ -66,6 +67,44 @@ class WebContentFetcher:
                 "Connection": "keep-alive",
             }
         )
+        # ETag/Last-Modified per URL for conditional re-fetches
+        self.validators: Dict[str, Dict] = {}
+
+    def fetch_job_contents(self, urls: List[str], max_concurrency: int = 8) -> Dict[str, str]:
+        """Fetch many URLs concurrently; returns cleaned content for those that succeeded
+
+        Runs its own event loop, so it is for synchronous callers only; code
+        already inside a loop awaits ``fetch_job_contents_async`` instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.fetch_job_contents_async(urls, max_concurrency))
+        raise RuntimeError(
+            "fetch_job_contents() called from a running event loop; "
+            "await fetch_job_contents_async() instead"
+        )
+
+    async def fetch_job_contents_async(
+        self, urls: List[str], max_concurrency: int = 8
+    ) -> Dict[str, str]:
+        """Async variant of ``fetch_job_contents`` for callers inside an event loop"""
+        from src.scrapers.description_fetcher import AsyncDescriptionFetcher
+
+        fetcher = AsyncDescriptionFetcher(
+            max_concurrency=max_concurrency, validators=self.validators
+        )
+        try:
+            results = await fetcher.fetch_all(urls)
+        except Exception as e:
+            logger.error(f"Error fetching content for {len(urls)} URLs: {e}")
+            return {}
+
+        return {
+            url: self._clean_text(result.description)
+            for url, result in results.items()
+            if result.description
+        }
 
     def fetch_job_content(self, url: str) -> Optional[str]:
         """Fetch and clean job content from URL"""
@@ -475,12 +514,18 @@ class JobContentExtractor:
 
         logger.info(f"Found {len(jobs_to_process)} jobs to process")
 
+        # Fetch all pages up front, concurrently; analysis below stays sequential
+        prefetched = self.fetcher.fetch_job_contents([url for _, url in jobs_to_process])
+
         for job_id, url in jobs_to_process:
             try:
                 logger.info(f"Processing job {job_id}: {url}")
 
-                # Fetch content
-                content = self.fetcher.fetch_job_content(url)
+                # Fetch content (single-page fallback for pages the batch missed)
+                content = prefetched.get(url)
+                fetched_individually = content is None
+                if fetched_individually:
+                    content = self.fetcher.fetch_job_content(url)
                 if not content:
                     logger.warning(f"Could not fetch content for job {job_id}")
                     stats["failed"] += 1
@@ -504,8 +549,8 @@ class JobContentExtractor:
 
                 stats["processed"] += 1
 
-                # Delay between requests
-                if delay > 0:
+                # Delay between individual requests
+                if fetched_individually and delay > 0:
                     time.sleep(delay)
 
             except Exception as e:
@@ -2,30 +2,76 @@
 """
 Language Detection Utility for AutoJobAgent
 Detects and filters out non-English job postings before processing.
+
+Batches are cheap: a stopword/ASCII pre-filter settles obvious English and
+French text without the probabilistic detector, ambiguous text is sampled to
+``MAX_SAMPLE_CHARS`` and detected once, and results are cached by content hash.
 """
 
+import copy
+import hashlib
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 import re
-from langdetect import detect, detect_langs
+from langdetect import DetectorFactory, detect_langs
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Deterministic langdetect results, so cached and fresh detections agree
+DetectorFactory.seed = 0
+
+# Text beyond this many characters does not change the detected language
+MAX_SAMPLE_CHARS = 2000
+
+# Minimum words before the stopword pre-filter decides on its own
+MIN_PREFILTER_WORDS = 12
+
+# Share of words that must be stopwords of one language (and at most
+# PREFILTER_MAX_OTHER of the other) for the pre-filter to decide
+PREFILTER_MIN_SHARE = 0.12
+PREFILTER_MAX_OTHER = 0.02
+
+DEFAULT_CACHE_SIZE = 10000
+
+# Frequent function words that rarely appear in the other language
+ENGLISH_STOPWORDS = frozenset(
+    "the and of to in for with is are you we our will be this that on as an or "
+    "your have from at by who can it all their they has"
+    .split()
+)
+FRENCH_STOPWORDS = frozenset(
+    "le la les des du de et est un une pour dans avec vous nous notre nos sur "
+    "au aux ce cette qui que sont votre être ou par plus"
+    .split()
+)
+
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
 
 class JobLanguageDetector:
     """Detects and filters job postings by language."""
 
-    def __init__(self, english_threshold: float = 0.6, french_threshold: float = 0.4):
+    def __init__(
+        self,
+        english_threshold: float = 0.6,
+        french_threshold: float = 0.4,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
         """
         Initialize language detector.
 
         Args:
             english_threshold: Minimum confidence for English detection
             french_threshold: Maximum allowable French confidence before filtering
+            cache_size: Detection results kept by content hash (0 disables)
         """
         self.english_threshold = english_threshold
         self.french_threshold = french_threshold
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self.stats = {"cache_hits": 0, "prefiltered": 0, "detected": 0}
 
         # Common French job posting indicators
         self.french_indicators = [
@@ -97,16 +143,54 @@ class JobLanguageDetector:
         Returns:
             Dictionary with language detection results
         """
-        try:
-            # Combine relevant text fields
-            text_fields = []
+        combined_text = self._combine_text(job_data)
+        key = hashlib.md5(combined_text.encode("utf-8")).hexdigest()
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return copy.deepcopy(cached)
+
+        result = self._detect_text(combined_text)
+        if self.cache_size > 0 and result["detected_language"] != "error":
+            self._cache[key] = copy.deepcopy(result)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def detect_languages_batch(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Detect the language of many job postings.
 
-            for field in ["title", "summary", "job_description", "requirements", "company"]:
-                if field in job_data and job_data[field]:
-                    text_fields.append(str(job_data[field]))
+        Postings with identical text are detected once, within and across
+        batches, through the content-hash cache.
 
-            combined_text = " ".join(text_fields)
+        Args:
+            jobs: List of job dictionaries
+
+        Returns:
+            Detection results in the order of ``jobs``
+        """
+        return [self.detect_job_language(job) for job in jobs]
 
+    def clear_cache(self) -> None:
+        """Drop cached detection results."""
+        self._cache.clear()
+
+    def _combine_text(self, job_data: Dict) -> str:
+        """Join the text fields the language is detected from."""
+        text_fields = []
+
+        for field in ["title", "summary", "job_description", "requirements", "company"]:
+            if field in job_data and job_data[field]:
+                text_fields.append(str(job_data[field]))
+
+        return " ".join(text_fields)
+
+    def _detect_text(self, combined_text: str) -> Dict:
+        """Language detection result for the combined job text."""
+        try:
             if not combined_text.strip():
                 return {
                     "detected_language": "unknown",
@@ -116,11 +200,16 @@ class JobLanguageDetector:
                     "reason": "No text content to analyze",
                 }
 
-            # Clean text for better detection
-            cleaned_text = self._clean_text(combined_text)
+            # Clean a bounded sample for better (and bounded-cost) detection
+            cleaned_text = self._clean_text(combined_text[:MAX_SAMPLE_CHARS])
 
-            # Perform language detection
-            detection_result = self._detect_with_fallback(cleaned_text)
+            # Obvious English/French from stopwords, else one probabilistic pass
+            detection_result = self._prefilter_language(cleaned_text)
+            if detection_result:
+                self.stats["prefiltered"] += 1
+            else:
+                detection_result = self._detect_with_fallback(cleaned_text)
+                self.stats["detected"] += 1
 
             if not detection_result:
                 return {
@@ -131,15 +220,12 @@ class JobLanguageDetector:
                     "reason": "Language detection failed",
                 }
 
-            primary_lang = detection_result[0]
-            confidence = detection_result[1]
-
-            # Get detailed language probabilities
-            lang_probs = self._get_language_probabilities(cleaned_text)
+            primary_lang, confidence, lang_probs = detection_result
 
             # Calculate keyword-based indicators
-            french_score = self._calculate_french_indicators(combined_text.lower())
-            english_score = self._calculate_english_indicators(combined_text.lower())
+            lower_text = combined_text.lower()
+            french_score = self._calculate_french_indicators(lower_text)
+            english_score = self._calculate_english_indicators(lower_text)
 
             # Make processing decision
             should_process, reason = self._should_process_job(
@@ -180,22 +266,47 @@ class JobLanguageDetector:
         text = re.sub(r"\s+", " ", text)
         return text.strip()
 
-    def _detect_with_fallback(self, text: str) -> Optional[Tuple[str, float]]:
-        """Detect language with fallback mechanisms."""
-        try:
-            # Primary detection
-            detected_lang = detect(text)
+    def _prefilter_language(self, text: str) -> Optional[Tuple[str, float, List[Dict]]]:
+        """
+        Decide obvious English or French text from stopword shares.
 
-            # Get confidence from detailed detection
-            lang_list = detect_langs(text)
-            confidence = 0.0
+        Returns:
+            ``(language, confidence, probabilities)`` like ``_detect_with_fallback``,
+            or None when the text is ambiguous
+        """
+        words = _WORD_RE.findall(text.lower())
+        if len(words) < MIN_PREFILTER_WORDS:
+            return None
+
+        english = sum(1 for word in words if word in ENGLISH_STOPWORDS) / len(words)
+        french = sum(1 for word in words if word in FRENCH_STOPWORDS) / len(words)
+        non_ascii = sum(1 for word in words if not word.isascii()) / len(words)
+
+        if english >= PREFILTER_MIN_SHARE and french <= PREFILTER_MAX_OTHER and non_ascii <= 0.02:
+            language = "en"
+        elif french >= PREFILTER_MIN_SHARE and english <= PREFILTER_MAX_OTHER:
+            language = "fr"
+        else:
+            return None
 
-            for lang_obj in lang_list:
-                if lang_obj.lang == detected_lang:
-                    confidence = lang_obj.prob
-                    break
+        # Share of the stopword evidence as a probability-like confidence
+        probs = sorted(
+            [("en", english / (english + french)), ("fr", french / (english + french))],
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        return (
+            language,
+            probs[0][1],
+            [{"language": lang, "probability": prob} for lang, prob in probs if prob > 0],
+        )
 
-            return detected_lang, confidence
+    def _detect_with_fallback(self, text: str) -> Optional[Tuple[str, float, List[Dict]]]:
+        """Detect language, confidence and all probabilities in one detector pass."""
+        try:
+            lang_list = detect_langs(text)
+            lang_probs = [{"language": lang.lang, "probability": lang.prob} for lang in lang_list]
+            return lang_list[0].lang, lang_list[0].prob, lang_probs
 
         except Exception:
             # Fallback to keyword-based detection
@@ -203,24 +314,15 @@ class JobLanguageDetector:
             english_score = self._calculate_english_indicators(text.lower())
 
             if french_score > english_score and french_score > 0.3:
-                return "fr", french_score
+                return "fr", french_score, []
             elif english_score > 0.3:
-                return "en", english_score
+                return "en", english_score, []
 
             return None
         except Exception as e:
             logger.warning(f"Language detection failed: {e}")
             return None
 
-    def _get_language_probabilities(self, text: str) -> List[Dict]:
-        """Get detailed language probabilities."""
-        try:
-            lang_list = detect_langs(text)
-            return [{"language": lang.lang, "probability": lang.prob} for lang in lang_list]
-        except Exception as e:
-            logger.debug("Language detection failed: %s", str(e))
-            return []
-
     def _calculate_french_indicators(self, text: str) -> float:
         """Calculate French language indicator score."""
         if not text:
@@ -300,8 +402,7 @@ class JobLanguageDetector:
         processable_jobs = []
         filtered_jobs = []
 
-        for job in jobs:
-            detection_result = self.detect_job_language(job)
+        for job, detection_result in zip(jobs, self.detect_languages_batch(jobs)):
 
             # Add language detection metadata to job
             job["language_detection"] = detection_result
@@ -312,7 +413,8 @@ class JobLanguageDetector:
                 filtered_jobs.append(job)
 
         logger.info(
-            f"Language filtering: {len(processable_jobs)} processable, {len(filtered_jobs)} filtered"
+            f"Language filtering: {len(processable_jobs)} processable, {len(filtered_jobs)} filtered "
+            f"({self.stats})"
         )
 
         return processable_jobs, filtered_jobs
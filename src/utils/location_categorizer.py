@@ -1,12 +1,37 @@
 """
 Location Categorization and RCIP City Tagging Utility
 Provides functionality to analyze and categorize job locations with special focus on RCIP cities.
+
+A profile has a few hundred distinct location strings across tens of thousands
+of jobs, so results are memoized per string (bounded LRU) and
+``analyze_locations`` categorizes each distinct value of a column once.
 """
 
 import json
 import re
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+import sys
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from dataclasses import asdict, dataclass, fields
+
+import pandas as pd
+
+# Distinct location strings kept per categorizer
+DEFAULT_CACHE_SIZE = 4096
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_PROVINCE_CODE_RE = re.compile(r",\s*([A-Z]{2})(?:\s|$)")
+_REMOTE_RE = re.compile(
+    "remote|work from home|telecommute|virtual|anywhere|home office|distributed"
+)
+
+
+def normalize_city(city: str) -> str:
+    """Lookup key for a city name: lowercase, no accents or periods, single spaces."""
+    decomposed = unicodedata.normalize("NFKD", city.lower())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _WHITESPACE_RE.sub(" ", stripped.replace(".", "")).strip()
 
 
 @dataclass
@@ -25,9 +50,14 @@ class LocationInfo:
 
 
 class LocationCategorizer:
-    """Categorizes and tags job locations with RCIP and immigration priority information."""
+    """
+    Categorizes and tags job locations with RCIP and immigration priority information.
+
+    Results are memoized per location string and shared between calls;
+    treat returned ``LocationInfo`` objects as read-only.
+    """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
         # RCIP (Regional and Community Immigration Program) Cities
         self.rcip_cities = {
             # Atlantic Canada
@@ -161,10 +191,66 @@ class LocationCategorizer:
             "yt": "YT",
         }
 
+        self._build_lookup_tables()
+        self._analyze_cached = lru_cache(maxsize=cache_size)(self._analyze_location)
+
+    def _build_lookup_tables(self):
+        """Precompute normalized city flags and province names for O(1) lookups."""
+        self._code_to_province = {code: name.title() for name, code in self.province_codes.items()}
+
+        # normalized city -> (is_rcip, is_immigration_priority, is_major, is_tech_hub)
+        self._city_flags: Dict[str, Tuple[bool, bool, bool, bool]] = {}
+        for city in self.rcip_cities | self.immigration_priority_cities | self.major_cities | (
+            self.tech_hubs
+        ):
+            self._city_flags[normalize_city(city)] = (
+                city in self.rcip_cities,
+                city in self.immigration_priority_cities,
+                city in self.major_cities,
+                city in self.tech_hubs,
+            )
+
+    def _flags(self, city: str) -> Tuple[bool, bool, bool, bool]:
+        return self._city_flags.get(normalize_city(city), (False, False, False, False))
+
     def analyze_location(self, location: str) -> LocationInfo:
         """Analyze a job location string and return detailed categorization."""
         if not location or not isinstance(location, str):
             return self._create_unknown_location(location or "Unknown")
+        return self._analyze_cached(sys.intern(location))
+
+    def analyze_locations(
+        self, locations: Union[pd.Series, Iterable[Optional[str]]]
+    ) -> pd.DataFrame:
+        """
+        Categorize a column of locations, analyzing each distinct value once.
+
+        Args:
+            locations: Location strings (``None``/NaN allowed)
+
+        Returns:
+            DataFrame with one ``LocationInfo`` field per column, aligned with
+            ``locations`` (same index for a Series)
+        """
+        series = locations if isinstance(locations, pd.Series) else pd.Series(list(locations))
+        series = series.astype(object).where(series.notna(), None)
+
+        codes, uniques = pd.factorize(series, use_na_sentinel=False)
+        columns = [field.name for field in fields(LocationInfo)]
+        if not len(uniques):
+            return pd.DataFrame(columns=columns, index=series.index)
+
+        analyzed = pd.DataFrame(
+            [asdict(self.analyze_location(location)) for location in uniques], columns=columns
+        )
+        return analyzed.iloc[codes].set_axis(series.index)
+
+    def cache_info(self):
+        """Hit/miss statistics of the per-string memo."""
+        return self._analyze_cached.cache_info()
+
+    def _analyze_location(self, location: str) -> LocationInfo:
+        """Uncached ``analyze_location`` for a non-empty string."""
 
         location_clean = self._clean_location(location)
 
@@ -182,8 +268,7 @@ class LocationCategorizer:
         location_type = self._determine_location_type(location_clean)
         location_category = self._categorize_location(city)
         city_tags = self._generate_city_tags(city, province_code)
-        is_rcip = city.lower() in self.rcip_cities
-        is_immigration_priority = city.lower() in self.immigration_priority_cities
+        is_rcip, is_immigration_priority, _, _ = self._flags(city)
 
         return LocationInfo(
             original=location,
@@ -200,29 +285,18 @@ class LocationCategorizer:
     def _clean_location(self, location: str) -> str:
         """Clean and normalize location string."""
         # Remove extra whitespace and convert to lowercase for analysis
-        return re.sub(r"\s+", " ", location.strip())
+        return _WHITESPACE_RE.sub(" ", location.strip())
 
     def _is_remote(self, location: str) -> bool:
         """Check if location indicates remote work."""
-        remote_indicators = [
-            "remote",
-            "work from home",
-            "telecommute",
-            "virtual",
-            "anywhere",
-            "home office",
-            "distributed",
-        ]
-        location_lower = location.lower()
-        return any(indicator in location_lower for indicator in remote_indicators)
+        return _REMOTE_RE.search(location.lower()) is not None
 
     def _extract_city_province(self, location: str) -> Tuple[str, str, str]:
         """Extract city name and province from location string."""
         # Common patterns: "City, Province" or "City, AB"
 
         # First, try to find province code pattern
-        province_pattern = r",\s*([A-Z]{2})(?:\s|$)"
-        province_match = re.search(province_pattern, location)
+        province_match = _PROVINCE_CODE_RE.search(location)
 
         if province_match:
             province_code = province_match.group(1).upper()
@@ -245,8 +319,7 @@ class LocationCategorizer:
 
     def _get_province_name(self, province_code: str) -> str:
         """Get full province name from code."""
-        code_to_name = {v: k for k, v in self.province_codes.items()}
-        return code_to_name.get(province_code.upper(), "Unknown").title()
+        return self._code_to_province.get(province_code.upper(), "Unknown")
 
     def _determine_location_type(self, location: str) -> str:
         """Determine if location is remote, hybrid, or onsite."""
@@ -261,13 +334,13 @@ class LocationCategorizer:
 
     def _categorize_location(self, city: str) -> str:
         """Categorize the city based on its characteristics."""
-        city_lower = city.lower()
+        is_rcip, is_immigration_priority, is_major, _ = self._flags(city)
 
-        if city_lower in self.major_cities:
+        if is_major:
             return "major_city"
-        elif city_lower in self.rcip_cities:
+        elif is_rcip:
             return "rcip_city"
-        elif city_lower in self.immigration_priority_cities:
+        elif is_immigration_priority:
             return "immigration_priority"
         else:
             return "custom"
@@ -275,18 +348,18 @@ class LocationCategorizer:
     def _generate_city_tags(self, city: str, province_code: str) -> List[str]:
         """Generate tags for the city based on its characteristics."""
         tags = []
-        city_lower = city.lower()
+        is_rcip, is_immigration_priority, is_major, is_tech_hub = self._flags(city)
 
-        if city_lower in self.rcip_cities:
+        if is_rcip:
             tags.append("rcip")
 
-        if city_lower in self.immigration_priority_cities:
+        if is_immigration_priority:
             tags.append("immigration_priority")
 
-        if city_lower in self.major_cities:
+        if is_major:
             tags.append("major_city")
 
-        if city_lower in self.tech_hubs:
+        if is_tech_hub:
             tags.append("tech_hub")
 
         # Add province-specific tags
@@ -357,8 +430,18 @@ class LocationCategorizer:
         return rcip_mapping
 
 
+_location_categorizer: Optional[LocationCategorizer] = None
+
+
+def get_location_categorizer() -> LocationCategorizer:
+    """Get the shared (memoized) location categorizer."""
+    global _location_categorizer
+    if _location_categorizer is None:
+        _location_categorizer = LocationCategorizer()
+    return _location_categorizer
+
+
 # Convenience function for easy usage
 def categorize_job_location(location: str) -> LocationInfo:
     """Analyze and categorize a job location string."""
-    categorizer = LocationCategorizer()
-    return categorizer.analyze_location(location)
+    return get_location_categorizer().analyze_location(location)
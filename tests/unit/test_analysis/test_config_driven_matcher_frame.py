@@ -0,0 +1,91 @@
+"""
+Unit tests for column-wise scoring with ConfigDrivenMatcher.score_frame.
+"""
+
+import pytest
+
+pytest.importorskip("tenacity")  # src.utils (config loader) depends on it
+
+import pandas as pd
+
+from src.analysis.config_driven_matcher import ConfigDrivenMatcher
+
+JOBS = [
+    {
+        "title": "Senior Python Developer",
+        "description": "Python, SQL and Power BI. 5+ years experience",
+        "location": "Remote",
+        "salary_min": 90000,
+        "salary_max": 120000,
+    },
+    {
+        "title": "Junior Data Analyst",
+        "description": "Entry level role using Excel and Tableau",
+        "location": "Hybrid - Ottawa",
+        "salary_min": 40000,
+        "salary_max": 50000,
+    },
+    {
+        "title": "Machine Learning Engineer",
+        "description": "ML with k8s and postgres",
+        "summary": "Great team",
+        "location": None,
+    },
+    {"title": "Analyst", "description": "", "location": "Toronto, ON"},
+]
+
+PROFILE = {
+    "skills": ["Python", "SQL", "Machine Learning", "Kubernetes", "Excel", "Tableau"],
+    "years_of_experience": 4,
+    "location": "Toronto",
+    "remote_preference": "remote",
+    "expected_salary_min": 80000,
+    "expected_salary_max": 130000,
+}
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return ConfigDrivenMatcher()
+
+
+class TestScoreFrame:
+    """Test that frame scoring agrees with per-job matching."""
+
+    def test_matches_calculate_match_per_row(self, matcher):
+        """Test every score, skill list and readiness level against calculate_match."""
+        scored = matcher.score_frame(pd.DataFrame(JOBS), PROFILE)
+
+        assert len(scored) == len(JOBS)
+        for row, job in zip(scored.to_dict("records"), JOBS):
+            expected = matcher.calculate_match(job, PROFILE)
+            for key in ("overall_match", "skill_match", "experience_match",
+                        "location_match", "salary_match"):
+                assert row[key] == pytest.approx(expected[key])
+            assert list(row["matched_skills"]) == expected["matched_skills"]
+            assert list(row["missing_skills"]) == expected["missing_skills"]
+            assert row["readiness_level"] == expected["readiness_level"]
+
+    def test_fit_messages_and_missing_values(self, matcher):
+        """Test fit messages and that missing fields count as empty."""
+        scored = matcher.score_frame(pd.DataFrame(JOBS), PROFILE)
+
+        assert scored["location_fit"].tolist()[:3] == [
+            "🟢 Remote match",
+            "🟡 Hybrid available",
+            "⚠️ Location: Not specified",
+        ]
+        assert scored["salary_fit"].tolist() == [
+            "🟢 Salary: $90,000-$120,000",
+            "❌ Salary below expectations",
+            "⚠️ Salary not disclosed",
+            "⚠️ Salary not disclosed",
+        ]
+        assert scored["title"].tolist() == [job["title"] for job in JOBS]
+
+    def test_empty_frame(self, matcher):
+        """Test that an empty frame gets the result columns."""
+        scored = matcher.score_frame(pd.DataFrame(columns=["title"]), PROFILE)
+
+        assert scored.empty
+        assert "overall_match" in scored and "readiness_level" in scored
@@ -0,0 +1,65 @@
+"""
+Unit tests for the shared pre-normalized job text.
+"""
+
+from src.analysis.extractors import CustomExtractor, PreparedJobText, SkillsExtractor
+
+JOB = {
+    "title": "Python Developer",
+    "company": "Acme",
+    "description": "About us:\nWe build  tools.\n\nRequirements:\nPython and SQL. Docker is a plus!",
+    "summary": "Remote, Power BI dashboards",
+    "salary": 90000,
+}
+
+
+class TestPreparedJobText:
+    """Test memoized views and their derived forms."""
+
+    def test_views_are_built_once_and_skip_empty_fields(self):
+        """Test that a field list is joined once and non-string fields are ignored."""
+        job = PreparedJobText(JOB)
+
+        view = job.view(("title", "missing", "salary", "summary"), " ")
+
+        assert view.raw == "Python Developer Remote, Power BI dashboards"
+        assert job.view(["title", "missing", "salary", "summary"], " ") is view
+        assert PreparedJobText.of(job) is job
+        assert job.get("company") == "Acme" and "salary" in job
+
+    def test_derived_forms(self):
+        """Test lowercase, normalized, token, sentence and section forms."""
+        view = PreparedJobText(JOB).view(("description",))
+
+        assert view.normalized.startswith("about us: we build tools. requirements:")
+        assert (view.tokens[0], view.tokens[1]) == ((0, "about"), (6, "us"))
+        assert [view.raw[start:end] for start, end in view.sentences][1:] == [
+            "We build  tools.",
+            "Requirements:",
+            "Python and SQL.",
+            "Docker is a plus!",
+        ]
+        assert [heading for heading, _, _ in view.sections] == ["about us", "requirements"]
+        assert view.section("require") == "Python and SQL. Docker is a plus!"
+
+
+class TestExtractorsShareText:
+    """Test that extractors accept prepared text and give the same results."""
+
+    def test_prepared_and_plain_input_agree(self):
+        """Test that the coordinator returns the same fields for both inputs."""
+        extractor = CustomExtractor()
+
+        plain = extractor.extract_job_data(dict(JOB))
+        prepared = extractor.extract_job_data(PreparedJobText(dict(JOB)))
+
+        assert prepared.title == plain.title
+        assert prepared.skills == plain.skills
+        assert prepared.benefits == plain.benefits
+
+    def test_standard_skills_keep_first_occurrence_case(self):
+        """Test single-scan skill lookup against the built-in skills database."""
+        extractor = SkillsExtractor(use_dynamic_skills=False)
+        job = {"description": "NODE.JS, node.js and Power  BI, power bi; Go and x-ray"}
+
+        assert extractor.extract_skills(job) == ["Go", "NODE.JS", "power bi", "x-ray"]
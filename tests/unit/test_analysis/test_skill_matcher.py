@@ -0,0 +1,82 @@
+"""
+Unit tests for the shared single-pass skill matcher.
+"""
+
+import json
+import os
+import re
+
+from src.analysis.skill_matcher import SkillMatcher, build_skill_vocabulary, get_skill_matcher
+
+TERMS = ["python", "sql", "c++", "c#", ".net", "asp.net", "node.js", "power bi", "ci/cd", "r", "go"]
+
+TEXTS = [
+    "Python/SQL developer with C++ and C# (ASP.NET, .NET core)",
+    "Experience with node.js, nodejs or Node.JS; Power BI and power  bi dashboards",
+    "CI/CD pipelines, r programming, R, rust, going, go-to, golang, c++11",
+    "pythonic sqlalchemy c+++ #c# .network asp.netcore",
+    "",
+]
+
+
+def regex_spans(term: str, text: str):
+    return [m.span() for m in re.finditer(rf"\b{re.escape(term)}\b", text.lower())]
+
+
+class TestSkillMatcher:
+    """Test that one scan reproduces per-skill word-boundary regexes."""
+
+    def test_hits_match_boundary_regex(self):
+        """Test positions of every hit against re.finditer with \\b anchors."""
+        matcher = SkillMatcher({term: term.title() for term in TERMS})
+
+        for text in TEXTS:
+            hits = matcher.find_all(text)
+            for term in TERMS:
+                spans = [(hit.start, hit.end) for hit in hits if hit.term == term]
+                assert spans == regex_spans(term, text), (term, text)
+
+    def test_counts_and_custom_terms(self):
+        """Test skill counts and fallback matching of terms outside the vocabulary."""
+        matcher = SkillMatcher({"python": "Python", "py": "Python", "sql": "SQL"})
+        text = "Python and SQL; more python, some py scripts"
+
+        assert matcher.skill_counts(text) == {"Python": 3, "SQL": 1}
+        assert matcher.find_terms(text, {"sql", "scripts", "script", "java"}) == {
+            "sql",
+            "scripts",
+        }
+
+    def test_shared_matcher_rebuilds_when_config_changes(self, tmp_path):
+        """Test that the cached matcher is reused until a config file changes."""
+        skills_path = tmp_path / "skills_database.json"
+        skills_path.write_text(json.dumps({"industries": {"tech": {"skills": ["Python"]}}}))
+        (tmp_path / "job_matching_config.json").write_text(
+            json.dumps({"skill_synonyms": {"description": "ignored", "python": ["py"]}})
+        )
+
+        first = get_skill_matcher(tmp_path)
+        assert get_skill_matcher(tmp_path) is first
+        assert first.matched_skills("py and python") == {"Python"}
+
+        skills_path.write_text(json.dumps({"industries": {"tech": {"skills": ["Python", "Rust"]}}}))
+        stat = skills_path.stat()
+        os.utime(skills_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        rebuilt = get_skill_matcher(tmp_path)
+        assert rebuilt is not first
+        assert "rust" in rebuilt
+
+    def test_vocabulary_includes_aliases_and_synonyms(self):
+        """Test that aliases and synonym variations map to canonical skills."""
+        vocabulary = build_skill_vocabulary(
+            {
+                "industries": {"data": {"skills": ["Natural Language Processing", "Python"]}},
+                "skill_aliases": {"NLP": "Natural Language Processing"},
+            },
+            {"description": "text", "python": ["python3", "py"]},
+        )
+
+        assert vocabulary["nlp"] == "Natural Language Processing"
+        assert vocabulary["python3"] == "Python"
+        assert "description" not in vocabulary
@@ -0,0 +1,173 @@
+"""
+Unit tests for batched Stage 2 processing in the two-stage processor.
+"""
+
+import pytest
+
+from src.analysis.two_stage_processor import (
+    Stage1CPUProcessor,
+    Stage1Result,
+    Stage2Result,
+    TwoStageJobProcessor,
+    TwoStageResult,
+    plan_token_batches,
+)
+
+
+class FakeStage2Processor:
+    """Records the chunks handed to the batched Stage 2 entry point."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def process_jobs_semantic_batch(self, items):
+        self.chunks.append([job["id"] for job, _ in items])
+        return [
+            Stage2Result(semantic_compatibility=s1.basic_compatibility, model_confidence=0.85)
+            for _, s1 in items
+        ]
+
+
+class TestPlanTokenBatches:
+    """Test length-sorted dynamic batching of tokenized texts."""
+
+    def test_batches_respect_token_and_size_limits(self):
+        """Test that every batch fits the padded-token budget and batch size."""
+        lengths = [120, 8, 512, 40, 33, 9, 300, 41, 7, 64]
+
+        batches = plan_token_batches(lengths, max_tokens_per_batch=512, max_batch_size=3)
+
+        assert sorted(i for batch in batches for i in batch) == list(range(len(lengths)))
+        for batch in batches:
+            assert len(batch) <= 3
+            assert max(lengths[i] for i in batch) * len(batch) <= 512
+
+    def test_similar_lengths_are_grouped(self):
+        """Test that short texts are not padded to the length of long ones."""
+        lengths = [500, 10, 490, 12, 11, 505]
+
+        batches = plan_token_batches(lengths, max_tokens_per_batch=1024, max_batch_size=8)
+
+        assert batches == [[1, 4, 3], [2, 0], [5]]
+
+    def test_oversized_sequence_gets_own_batch(self):
+        """Test that a sequence above the token budget is still embedded."""
+        assert plan_token_batches([900, 10], max_tokens_per_batch=256) == [[1], [0]]
+
+
+class TestStage2Chunking:
+    """Test that process_jobs hands Stage 2 whole chunks of jobs."""
+
+    @pytest.mark.asyncio
+    async def test_process_jobs_runs_stage2_in_chunks(self):
+        """Test that passed jobs are embedded in chunks and all results are kept."""
+        processor = TwoStageJobProcessor({}, cpu_workers=1, stage2_chunk_size=4)
+        processor.stage2_processor = FakeStage2Processor()
+        processor.stage1_processor.process_jobs_batch = lambda jobs: [
+            Stage1Result(basic_compatibility=0.8, passes_basic_filter=job["id"] != "job-3")
+            for job in jobs
+        ]
+        jobs = [{"id": f"job-{i}", "description": "Python role"} for i in range(10)]
+
+        results = await processor.process_jobs(jobs)
+
+        chunks = processor.stage2_processor.chunks
+        assert sorted(len(chunk) for chunk in chunks) == [1, 4, 4]
+        assert "job-3" not in {job_id for chunk in chunks for job_id in chunk}
+        assert len(results) == 10
+        assert {r.job_id for r in results if r.stages_completed == 2} == {
+            f"job-{i}" for i in range(10) if i != 3
+        }
+
+
+class TestStage1ExecutionModes:
+    """Test thread/process selection and process-pool Stage 1 results."""
+
+    PROFILE = {"skills": ["Python", "SQL", "Tableau"]}
+
+    def test_auto_mode_uses_processes_only_for_large_batches(self, monkeypatch):
+        """Test that small batches stay on threads and large ones use processes."""
+        monkeypatch.setattr("os.cpu_count", lambda: 16)
+        processor = Stage1CPUProcessor(
+            self.PROFILE, max_workers=4, execution_mode="auto", process_min_jobs=100
+        )
+
+        assert processor.select_execution_mode(99) == "thread"
+        assert processor.select_execution_mode(100) == "process"
+        single = Stage1CPUProcessor(self.PROFILE, max_workers=1, execution_mode="auto")
+        assert single.select_execution_mode(500) == "thread"
+        assert Stage1CPUProcessor(self.PROFILE, max_workers=4).select_execution_mode(500) == (
+            "thread"
+        )
+        with pytest.raises(ValueError):
+            Stage1CPUProcessor(self.PROFILE, execution_mode="gpu")
+
+    def test_process_mode_matches_thread_mode(self):
+        """Test that chunked worker processes return the same results in input order."""
+        jobs = [
+            {
+                "id": f"job-{i}",
+                "title": f"Data Analyst {i}",
+                "company": "Acme Analytics",
+                "description": f"Python and SQL required. {'Tableau a plus. ' * (i % 2)}Toronto",
+            }
+            for i in range(7)
+        ]
+        threaded = Stage1CPUProcessor(self.PROFILE, max_workers=2, execution_mode="thread")
+        pooled = Stage1CPUProcessor(
+            self.PROFILE, max_workers=2, execution_mode="process", chunk_size=3
+        )
+
+        try:
+            expected = threaded.process_jobs_batch(jobs)
+            results = pooled.process_jobs_batch(jobs)
+        finally:
+            pooled.close()
+
+        assert [r.title for r in results] == [r.title for r in expected]
+        assert [r.basic_skills for r in results] == [r.basic_skills for r in expected]
+        assert [r.basic_compatibility for r in results] == [
+            r.basic_compatibility for r in expected
+        ]
+        assert {r.worker_id for r in results} == {0, 1}
+
+
+class TestStage1Rescoring:
+    """Test re-scoring stored jobs without running the extractors."""
+
+    def test_rescore_matches_full_scoring_without_extraction(self, monkeypatch):
+        """Test that re-scoring keeps stored fields and recomputes profile scores."""
+        processor = Stage1CPUProcessor({"skills": ["Python", "SQL"]}, max_workers=1)
+        job = {
+            "id": "job-1",
+            "title": "Data Analyst",
+            "company": "Acme",
+            "location": "Toronto, ON",
+            "description": "Python and SQL reporting",
+        }
+        full = processor.process_job_fast(job)
+
+        def fail(_):
+            raise AssertionError("extractor should not run")
+
+        monkeypatch.setattr(processor.extractor, "extract_job_data", fail)
+        rescored = processor.rescore_job(job)
+
+        assert rescored.location == "Toronto, ON"
+        assert rescored.basic_skills == full.basic_skills == ["Python", "SQL"]
+        assert rescored.basic_compatibility == full.basic_compatibility
+        assert rescored.passes_basic_filter
+
+    def test_rescore_update_keeps_stored_skills(self):
+        """Test that re-scored results write the score but not profile-matched skills."""
+        full = TwoStageResult(job_id="job-1", final_compatibility=0.5, final_skills=["Python"])
+        rescored = TwoStageResult(
+            job_id="job-1", final_compatibility=0.5, processing_method="rescore"
+        )
+
+        assert full.to_analysis_update()["skills"] == ["Python"]
+        assert rescored.to_analysis_update() == {
+            "id": "job-1",
+            "fit_score": 50.0,
+            "status": "processed",
+        }
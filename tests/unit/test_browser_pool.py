@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared browser pool used by external description scraping.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from src.scrapers.browser_pool import BrowserPool, is_blocked_request, url_domain
+from src.scrapers.external_job_scraper import ExternalJobDescriptionScraper
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    def set_default_timeout(self, timeout):
+        self.timeout = timeout
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+        self.closed = False
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    async def new_page(self):
+        return FakePage(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **kwargs):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+def fake_pool(**kwargs) -> BrowserPool:
+    """Pool wired to fake browsers instead of launching Chromium."""
+    pool = BrowserPool(**kwargs)
+    pool._browsers = [FakeBrowser() for _ in range(pool.num_browsers)]
+    pool._page_slots = asyncio.Semaphore(pool.max_pages)
+    return pool
+
+
+class TestRequestBlocking:
+    """Test which requests the pool aborts."""
+
+    def test_blocked_requests(self):
+        """Test heavy resource types and analytics hosts are blocked."""
+        assert is_blocked_request("image", "https://boards.greenhouse.io/logo.png")
+        assert is_blocked_request("font", "https://fonts.gstatic.com/a.woff2")
+        assert is_blocked_request("script", "https://www.google-analytics.com/analytics.js")
+        assert is_blocked_request("xhr", "https://script.hotjar.com/modules.js")
+        assert not is_blocked_request("document", "https://acme.wd3.myworkdayjobs.com/job/1")
+        assert not is_blocked_request("script", "https://boards.greenhouse.io/embed.js")
+        assert url_domain("https://www.Example.com/jobs?id=1") == "example.com"
+
+
+class TestBrowserPool:
+    """Test page reuse, round-robin contexts and per-domain caps."""
+
+    async def test_pages_are_reused(self):
+        """Test that sequential fetches reuse one page and context."""
+        pool = fake_pool(num_browsers=2, max_pages=5)
+
+        async with pool.page("https://a.com/1") as first:
+            pass
+        async with pool.page("https://b.com/2") as second:
+            pass
+
+        assert second is first
+        assert pool.stats["pages_created"] == 1 and pool.stats["pages_reused"] == 1
+        assert len(pool._browsers[0].contexts[0].routes) == 1
+
+    async def test_domain_cap_and_page_limit(self):
+        """Test concurrency limits per domain and across the pool."""
+        pool = fake_pool(num_browsers=2, max_pages=6, per_domain_limit=2)
+        active, peak = {}, {}
+
+        async def fetch(url):
+            domain = url_domain(url)
+            async with pool.page(url):
+                active[domain] = active.get(domain, 0) + 1
+                peak[domain] = max(peak.get(domain, 0), active[domain])
+                await asyncio.sleep(0.01)
+                active[domain] -= 1
+
+        urls = [f"https://{site}.com/{i}" for site in ("a", "b", "c", "d") for i in range(5)]
+        await asyncio.gather(*(fetch(url) for url in urls))
+
+        assert max(peak.values()) == 2
+        assert pool.stats["pages_created"] <= 6
+        assert [len(browser.contexts) for browser in pool._browsers] == [3, 3]
+
+    async def test_closed_page_releases_its_context(self):
+        """Test that a page closed while borrowed has its context closed and forgotten."""
+        pool = fake_pool(max_pages=2)
+
+        async with pool.page("https://a.com/1") as crashed:
+            crashed.closed = True
+        async with pool.page("https://a.com/2") as fresh:
+            pass
+
+        assert fresh is not crashed
+        assert crashed.context.closed
+        assert pool._contexts == [fresh.context]
+        assert pool.get_stats()["contexts"] == 1
+
+
+class TestExternalScraperQueue:
+    """Test the order URLs are queued in."""
+
+    def test_interleave_by_domain(self):
+        """Test round-robin across domains, keeping order within a domain."""
+        urls = ["https://a.com/1", "https://a.com/2", "https://a.com/3", "https://b.com/1"]
+
+        assert ExternalJobDescriptionScraper._interleave_by_domain(urls) == [
+            "https://a.com/1",
+            "https://b.com/1",
+            "https://a.com/2",
+            "https://a.com/3",
+        ]
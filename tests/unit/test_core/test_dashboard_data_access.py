@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Unit tests for view-projected dashboard data access.
+"""
+
+import pandas as pd
+import pytest
+
+from src.core.dashboard_data_access import (
+    CARD_DESCRIPTION_CHARS,
+    DEFAULT_COLUMNS,
+    DashboardDataAccess,
+    frame_to_records,
+)
+from src.core.duckdb_connection_manager import DuckDBConnectionManager
+from src.core.duckdb_database import DuckDBJobDatabase
+
+
+@pytest.fixture
+def profile_db(tmp_path, monkeypatch):
+    """Profile database with jobs carrying long descriptions."""
+    monkeypatch.chdir(tmp_path)
+    profile = "projection_test"
+    db = DuckDBJobDatabase(profile_name=profile, pooled=True)
+    for i in range(3):
+        db.add_job(
+            {
+                "id": f"job-{i}",
+                "title": "Data Engineer",
+                "company": "Acme",
+                "location": "Toronto, ON",
+                "fit_score": 0.8,
+                "description": "d" * 5000,
+                "keywords": "python; sql",
+                "is_rcip_city": 1,
+            }
+        )
+    db.conn.execute(
+        "UPDATE jobs SET application_notes = 'Call back Monday' WHERE id = 'job-0'"
+    )
+    yield profile
+    db.close()
+
+
+@pytest.mark.unit
+class TestDashboardViews:
+    """Test column projections and single-execution fetches."""
+
+    def test_views_project_description(self, profile_db, monkeypatch):
+        """Test list views skip the description and cards get a preview."""
+        executed = []
+        original = DuckDBConnectionManager.query_df
+
+        def spy(query, params=None, profile_name=None):
+            executed.append(query)
+            return original(query, params, profile_name)
+
+        monkeypatch.setattr(DuckDBConnectionManager, "query_df", spy)
+        monkeypatch.setattr(
+            DuckDBConnectionManager,
+            "get_columns",
+            lambda *args, **kwargs: pytest.fail("query executed twice"),
+        )
+        access = DashboardDataAccess()
+
+        listing = access.get_jobs(profile_db)
+        cards = access.get_jobs(profile_db, view="card")
+        access.get_jobs(profile_db, view="card")
+
+        assert len(executed) == 2
+        assert "description" not in executed[0]
+        assert listing.records[0]["description"] == ""
+        assert listing.records[0]["has_rcip"]
+        assert listing.records[0]["match_score"] == pytest.approx(80)
+        assert len(cards.records[0]["description"]) == CARD_DESCRIPTION_CHARS
+
+    def test_job_detail_fetches_full_text(self, profile_db):
+        """Test on-demand detail returns the full description and notes."""
+        detail = DashboardDataAccess().get_job_detail(profile_db, "job-0")
+
+        assert len(detail["description"]) == 5000
+        assert detail["application_notes"] == "Call back Monday"
+        assert DashboardDataAccess().get_job_detail(profile_db, "missing") is None
+
+    def test_unknown_view(self, profile_db):
+        """Test unknown views are rejected."""
+        with pytest.raises(ValueError):
+            DashboardDataAccess().get_jobs(profile_db, view="everything")
+
+
+@pytest.mark.unit
+class TestFrameNormalisation:
+    """Test column-wise normalisation of raw job rows."""
+
+    def test_normalise_frame(self):
+        """Test status, salary, keyword, tag and ranking derivation."""
+        raw = pd.DataFrame(
+            {
+                "id": ["a", "b", "c"],
+                "title": ["Dev", None, "Analyst"],
+                "location": ["Remote", "Sudbury, ON", None],
+                "status": ["processed", "reviewing", None],
+                "application_status": ["discovered", "interview", None],
+                "salary_range": ["$90k", None, "not specified"],
+                "fit_score": [0.5, 72.0, None],
+                "keywords": ["python; sql, python", "", None],
+                "skills": [None, "excel", None],
+                "is_rcip_city": [0, 1, None],
+                "is_immigration_priority": [1, 0, 0],
+                "created_at": ["2024-08-01T10:00:00", "2024-07-15", None],
+            }
+        )
+
+        frame = DashboardDataAccess()._normalise_frame(raw)
+        records = frame_to_records(frame)
+
+        assert list(frame.columns) == list(DEFAULT_COLUMNS)
+        assert frame["status"].tolist() == ["ready_to_apply", "interview", "new"]
+        assert frame["salary"].tolist() == ["$90k", "Not specified", "Not specified"]
+        assert frame["match_score"].tolist() == [50.0, 72.0, 0.0]
+        assert frame["keywords"].tolist() == ["Python, Sql", "Excel", "No keywords"]
+        assert frame["created_at"].iloc[:2].tolist() == ["2024-08-01", "2024-07-15"]
+        assert records[0]["tags"] == ["IMMIGRATION_PRIORITY", "REMOTE", "KEYWORDED"]
+        assert records[1]["tags"] == ["RCIP", "INTERVIEW"]
+        assert records[1]["rcip_indicator"] == "🇨🇦 RCIP" and records[1]["title"] is None
+        assert records[2]["fit_score"] is None
+        assert records[2]["ranking"] == {"match_score": 0.0}
+        assert records[0]["ranking"] == {"match_score": 50.0, "fit_score": 0.5}
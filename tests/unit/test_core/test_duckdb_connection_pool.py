@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the process-wide DuckDB connection pool.
+"""
+
+import threading
+
+import duckdb
+import pytest
+
+from src.core.duckdb_connection_manager import DuckDBConnectionPool
+from src.core.duckdb_database import DuckDBJobDatabase
+
+
+@pytest.mark.unit
+class TestDuckDBConnectionPool:
+    """Test cursor checkout and once-per-file schema setup."""
+
+    def test_schema_initializer_runs_once_per_file(self, temp_dir):
+        pool = DuckDBConnectionPool()
+        db_path = str(temp_dir / "pool.db")
+        calls = []
+
+        def initializer(conn):
+            calls.append(1)
+            conn.execute("CREATE TABLE IF NOT EXISTS jobs (id VARCHAR)")
+
+        for _ in range(3):
+            with pool.cursor(db_path, initializer) as conn:
+                assert conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 0
+
+        assert len(calls) == 1
+        pool.close()
+
+    def test_cursors_are_returned_and_reused(self, temp_dir):
+        pool = DuckDBConnectionPool(max_idle_cursors=2)
+        db_path = str((temp_dir / "pool.db").resolve())
+
+        first = pool.acquire(db_path)
+        second = pool.acquire(db_path)
+        assert pool.get_stats()[db_path]["checked_out"] == 2
+
+        pool.release(db_path, first)
+        pool.release(db_path, second)
+        stats = pool.get_stats()[db_path]
+        assert stats["checked_out"] == 0
+        assert stats["idle"] == 2
+
+        assert pool.acquire(db_path) in (first, second)
+        pool.close()
+
+    def test_writer_and_readers_share_one_database(self, temp_dir):
+        pool = DuckDBConnectionPool()
+        db_path = str(temp_dir / "pool.db")
+
+        with pool.writer(db_path) as conn:
+            conn.execute("CREATE TABLE jobs (id VARCHAR)")
+            conn.execute("INSERT INTO jobs VALUES ('a'), ('b')")
+
+        with pool.cursor(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 2
+        pool.close()
+
+    def test_pooled_job_database_returns_cursor_on_close(self, temp_dir):
+        db_path = str(temp_dir / "jobs.db")
+
+        with DuckDBJobDatabase(db_path=db_path, pooled=True) as db:
+            assert db.add_job({"id": "job-1", "title": "Engineer", "company": "Acme"})
+
+        assert db.conn is None
+        with DuckDBJobDatabase(db_path=db_path, pooled=True) as db:
+            assert db.get_job_count() == 1
+
+    def test_idle_handle_releases_file(self, temp_dir):
+        """Test the root handle closes once idle so other processes can write."""
+        pool = DuckDBConnectionPool(idle_timeout=0)
+        db_path = str((temp_dir / "pool.db").resolve())
+
+        with pool.writer(db_path) as conn:
+            conn.execute("CREATE TABLE jobs (id VARCHAR)")
+        assert pool.get_stats()[db_path]["open"] == 0
+
+        # A differently configured handle would fail while the pool held the file
+        other = duckdb.connect(db_path, read_only=True)
+        other.close()
+        pool.close()
+
+    def test_read_only_checkout_reopens_for_writes(self, temp_dir):
+        """Test readers get a read-only handle and a later writer reopens read-write."""
+        pool = DuckDBConnectionPool(idle_timeout=0)
+        db_path = str((temp_dir / "pool.db").resolve())
+        with pool.writer(db_path) as conn:
+            conn.execute("CREATE TABLE jobs (id VARCHAR)")
+
+        with pool.cursor(db_path, read_only=True) as conn:
+            assert pool.is_read_only(db_path)
+            assert conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 0
+            with pytest.raises(duckdb.Error):
+                conn.execute("INSERT INTO jobs VALUES ('a')")
+
+        with pool.writer(db_path) as conn:
+            conn.execute("INSERT INTO jobs VALUES ('a')")
+        assert not pool.is_read_only(db_path)
+        pool.close()
+
+    def test_write_waits_for_read_only_checkout(self, temp_dir):
+        """Test a write while a reader holds the read-only handle still reaches the file."""
+        pool = DuckDBConnectionPool(idle_timeout=0, write_timeout=5)
+        db_path = str((temp_dir / "pool.db").resolve())
+        with pool.writer(db_path) as conn:
+            conn.execute("CREATE TABLE jobs (id VARCHAR)")
+
+        reader = pool.acquire(db_path, read_only=True)
+        assert pool.is_read_only(db_path)
+        threading.Timer(0.2, pool.release, args=(db_path, reader)).start()
+
+        with pool.writer(db_path) as conn:
+            conn.execute("INSERT INTO jobs VALUES ('a')")
+        assert not pool.is_read_only(db_path)
+        with pool.cursor(db_path, read_only=True) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 1
+        pool.close()
+
+    def test_write_never_served_read_only_handle(self, temp_dir):
+        """Test a writer raises instead of receiving a reader's read-only handle."""
+        pool = DuckDBConnectionPool(idle_timeout=0, write_timeout=0.1)
+        db_path = str((temp_dir / "pool.db").resolve())
+        with pool.writer(db_path) as conn:
+            conn.execute("CREATE TABLE jobs (id VARCHAR)")
+
+        with pool.cursor(db_path, read_only=True):
+            with pytest.raises(duckdb.IOException):
+                pool.acquire(db_path, read_only=False)
+            assert pool.get_stats()[db_path]["checked_out"] == 1
+        pool.close()
+
+    def test_pooled_update_while_reader_checked_out(self, temp_dir, monkeypatch):
+        """Test update_job_status succeeds while a read-only pooled checkout is open."""
+        pool = DuckDBConnectionPool(idle_timeout=0, write_timeout=5)
+        monkeypatch.setattr("src.core.duckdb_database.get_connection_pool", lambda: pool)
+        db_path = str((temp_dir / "jobs.db").resolve())
+        with DuckDBJobDatabase(db_path=db_path, pooled=True) as db:
+            assert db.add_job({"id": "job-1", "title": "Engineer", "company": "Acme"})
+
+        reader = DuckDBJobDatabase(db_path=db_path, pooled=True, read_only=True)
+        assert pool.is_read_only(db_path)
+        threading.Timer(0.2, reader.close).start()
+
+        with DuckDBJobDatabase(db_path=db_path, pooled=True) as db:
+            assert db.update_job_status("job-1", "applied")
+            row = db.conn.execute("SELECT status FROM jobs WHERE id = 'job-1'").fetchone()
+        assert row[0] == "applied"
+        pool.close()
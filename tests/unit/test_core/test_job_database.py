@@ -202,6 +202,61 @@ class TestJobDatabasePerformance:
         db.close()
 
 
+@pytest.mark.unit
+class TestJobDatabaseBulkAnalysis:
+    """Test batched write-back of processing results."""
+
+    def test_bulk_update_analysis_applies_batch(self, test_db):
+        """Test that one bulk call updates every known job and reports misses."""
+        db = test_db
+        for i in range(3):
+            db.add_job({"id": f"job-{i}", "title": f"Job {i}", "company": "Acme"})
+
+        summary = db.bulk_update_analysis(
+            [
+                {"id": "job-0", "fit_score": 82.5, "skills": ["Python", "SQL"], "status": "processed"},
+                {"job_id": "job-1", "fit_score": 40},
+                {"id": "unknown", "fit_score": 10},
+            ]
+        )
+
+        assert summary["requested"] == 3
+        assert summary["updated"] == 2
+        assert summary["missing_ids"] == ["unknown"]
+
+        jobs = {job["id"]: job for job in db.get_all_jobs()}
+        assert jobs["job-0"]["fit_score"] == pytest.approx(82.5)
+        assert jobs["job-0"]["skills"] == "Python, SQL"
+        assert jobs["job-0"]["status"] == "processed"
+        assert jobs["job-1"]["fit_score"] == pytest.approx(40)
+        # Fields absent from a result keep their stored value
+        assert jobs["job-1"]["status"] == "new"
+        assert jobs["job-2"]["fit_score"] is None
+
+    def test_add_jobs_batch_inserts_new_jobs_only(self, test_db):
+        """Test that a batch insert fills the wider table and skips known ids."""
+        db = test_db
+        db.add_job({"id": "job-0", "title": "Existing", "company": "Acme"})
+
+        added = db.add_jobs_batch(
+            [
+                {"id": "job-0", "title": "Existing", "company": "Acme"},
+                {"id": "job-1", "title": "Python Developer", "company": "Acme"},
+                {"id": "job-1", "title": "Python Developer", "company": "Acme"},
+                {"id": "job-2", "title": "Data Analyst", "company": "Globex"},
+            ]
+        )
+
+        assert added == 2
+        assert db.get_job_count() == 3
+
+    def test_bulk_update_analysis_empty_batch(self, test_db):
+        """Test that an empty batch is a no-op."""
+        summary = test_db.bulk_update_analysis([])
+        assert summary["requested"] == 0
+        assert summary["updated"] == 0
+
+
 @pytest.mark.unit
 class TestJobDatabaseErrorHandling:
     """Test database error handling and edge cases."""
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the BM25 job search index.
+"""
+
+import pytest
+
+from src.core.duckdb_database import DuckDBJobDatabase
+from src.core.job_search_index import parse_search_query, tokenize
+
+
+@pytest.fixture
+def search_db(tmp_path, monkeypatch):
+    """Profile database with a few indexed jobs."""
+    monkeypatch.chdir(tmp_path)
+    db = DuckDBJobDatabase(profile_name="search_test", pooled=True)
+    db.add_jobs_batch(
+        [
+            {
+                "id": "job-1",
+                "title": "Senior Python Developer",
+                "company": "Acme",
+                "description": "Build data pipelines with Python and SQL.",
+            },
+            {
+                "id": "job-2",
+                "title": "Data Engineer",
+                "company": "Globex",
+                "description": "Python developer wanted for data engineering work.",
+            },
+            {
+                "id": "job-3",
+                "title": "Java Developer",
+                "company": "Initech",
+                "description": "Spring Boot services.",
+            },
+        ]
+    )
+    yield db
+    db.close()
+
+
+@pytest.mark.unit
+class TestSearchQueryParsing:
+    """Test tokenizing and query parsing."""
+
+    def test_tokenize_keeps_language_names(self):
+        """Test stopwords are dropped and c++/c# survive."""
+        assert tokenize("The C++ and C# developer") == ["c++", "c#", "developer"]
+
+    def test_parse_search_query(self):
+        """Test phrases, explicit prefixes and search-as-you-type."""
+        query = parse_search_query('"data engineer" pyth dev*', prefix_last=True)
+
+        assert query.terms == [
+            ("data", False),
+            ("engineer", False),
+            ("pyth", False),
+            ("dev", True),
+        ]
+        assert query.phrases == [["data", "engineer"]]
+        assert parse_search_query("pyth", prefix_last=True).terms == [("pyth", True)]
+        assert parse_search_query("pyth ", prefix_last=True).terms == [("pyth", False)]
+        assert not parse_search_query("the and")
+
+
+@pytest.mark.unit
+class TestJobSearch:
+    """Test ranked search against the database."""
+
+    def test_ranking_requires_every_term(self, search_db):
+        """Test title matches outrank description matches and all terms must match."""
+        assert [job_id for job_id, _ in search_db.search_job_ids("python developer")] == [
+            "job-1",
+            "job-2",
+        ]
+        assert search_db.search_job_ids("python java") == []
+
+    def test_prefix_and_phrase(self, search_db):
+        """Test prefix expansion and phrase verification."""
+        assert {job_id for job_id, _ in search_db.search_job_ids("dev*")} == {
+            "job-1",
+            "job-2",
+            "job-3",
+        }
+        assert [job_id for job_id, _ in search_db.search_job_ids("pyth", prefix_last=True)] == [
+            "job-1",
+            "job-2",
+        ]
+        assert [job_id for job_id, _ in search_db.search_job_ids('"python developer"')] == [
+            "job-1",
+            "job-2",
+        ]
+        assert [job_id for job_id, _ in search_db.search_job_ids('"data engineer"')] == ["job-2"]
+
+    def test_index_follows_writes(self, search_db):
+        """Test new jobs, skill updates and deletions reach the index."""
+        search_db.add_job({"id": "job-4", "title": "Rust Developer", "company": "Hooli"})
+        assert [job["id"] for job in search_db.search_jobs("rust")] == ["job-4"]
+
+        search_db.bulk_update_analysis([{"id": "job-3", "skills": ["Kubernetes"]}])
+        assert [job_id for job_id, _ in search_db.search_job_ids("kubernetes")] == ["job-3"]
+
+        search_db.delete_job("job-3")
+        assert search_db.search_job_ids("java") == []
+        assert search_db.search_job_ids("kubernetes") == []
+
+    def test_unindexed_jobs_are_scanned_until_backfilled(self, search_db, monkeypatch):
+        """Test that searching never indexes, and a backfill restores ranked search."""
+        search_db.conn.execute(
+            "INSERT INTO jobs (id, title, company) VALUES ('legacy', 'Go Developer', 'Umbrella')"
+        )
+
+        assert search_db.search_job_ids("go dev*") == [("legacy", 0.0)]
+        assert search_db.conn.execute("SELECT count(*) FROM job_search_docs").fetchone() == (3,)
+
+        def fail(jobs):
+            raise RuntimeError("read-only")
+
+        with monkeypatch.context() as patch:
+            patch.setattr("src.core.duckdb_database.build_search_postings", fail)
+            assert search_db.backfill_search_index() == 0
+        assert search_db.search_job_ids("go") == [("legacy", 0.0)]
+
+        assert search_db.backfill_search_index() == 1
+        assert len(search_db.search_job_ids("developer")) == 4
+        assert search_db.search_job_ids("go")[0][1] > 0
+
+    def test_delete_then_add_between_searches(self, search_db):
+        """Test a deletion is noticed even when an insert keeps the document count equal."""
+        assert [job_id for job_id, _ in search_db.search_job_ids("java")] == ["job-3"]
+
+        search_db.delete_job("job-3")
+        search_db.add_jobs_batch([{"id": "job-5", "title": "Go Developer", "company": "Hooli"}])
+
+        assert search_db.search_job_ids("java") == []
+        assert {job_id for job_id, _ in search_db.search_job_ids("developer")} == {
+            "job-1",
+            "job-2",
+            "job-5",
+        }
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the near-duplicate candidate index.
+"""
+
+import random
+
+import pytest
+
+from src.core.near_duplicate_index import NearDuplicateIndex
+from src.core.smart_deduplication import SmartJobDeduplicator
+
+TITLES = [
+    "Python Developer",
+    "Senior Python Developer",
+    "Sr. Python Developer",
+    "Data Analyst",
+    "Data Analyst II",
+    "Software Engineer",
+    "Software Engineer (Remote)",
+    "Full Stack Developer",
+    "Java Developer",
+]
+COMPANIES = ["Tech Corp Inc.", "Tech Corp", "Shopify", "Globex Ltd", "Globex", "Initech"]
+LOCATIONS = ["Toronto, ON", "Toronto, Ontario", "Vancouver, BC", "Remote", ""]
+
+
+def make_jobs(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    return [
+        {
+            "title": rng.choice(TITLES),
+            "company": rng.choice(COMPANIES),
+            "location": rng.choice(LOCATIONS),
+            "url": f"https://{rng.choice(['a.com', 'b.com'])}/job/{i}",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+class TestNearDuplicateIndex:
+    """Test candidate bounds and their use in deduplication."""
+
+    def test_bounds_never_undercut_exact_similarity(self):
+        """Test that every bound is at least the exact SequenceMatcher ratio."""
+        dedup = SmartJobDeduplicator()
+        jobs = make_jobs(60)
+        index = NearDuplicateIndex(dedup.normalize_text)
+        for job in jobs:
+            index.add(job)
+
+        for job in jobs:
+            bounds = index.similarity_bounds(job)
+            for field in ("title", "company", "location"):
+                for row, existing in enumerate(jobs):
+                    exact = dedup.calculate_text_similarity(job[field], existing[field])
+                    assert bounds[field][row] >= exact
+
+    def test_indexed_dedup_matches_pairwise_scan(self):
+        """Test that index-backed dedup keeps the same jobs with the same reasons."""
+        jobs = make_jobs(200, seed=11)
+
+        pairwise = SmartJobDeduplicator()
+        expected_unique, expected_reasons = [], []
+        for job in jobs:
+            is_dup, reason = pairwise.is_duplicate_job(job, expected_unique)
+            expected_reasons.append(reason)
+            if not is_dup:
+                expected_unique.append(job)
+                pairwise.add_job_to_tracking(job)
+
+        indexed = SmartJobDeduplicator()
+        index = NearDuplicateIndex(indexed.normalize_text)
+        unique, reasons = [], []
+        for job in jobs:
+            is_dup, reason = indexed.is_duplicate_job(job, unique, index)
+            reasons.append(reason)
+            if not is_dup:
+                unique.append(job)
+                index.add(job)
+                indexed.add_job_to_tracking(job)
+
+        assert unique == expected_unique
+        assert reasons == expected_reasons
+
+    def test_unrelated_jobs_are_not_candidates(self):
+        """Test that clearly different titles are pruned."""
+        dedup = SmartJobDeduplicator()
+        index = NearDuplicateIndex(dedup.normalize_text)
+        index.add({"title": "Data Analyst", "company": "Shopify", "location": "Toronto, ON"})
+
+        bounds = index.similarity_bounds(
+            {"title": "Full Stack Developer", "company": "Initech", "location": "Remote"}
+        )
+
+        # Every SmartJobDeduplicator rule needs a title similarity of at least 0.8
+        assert bounds["title"][0] < 0.8
+
+    def test_incremental_dedup_compares_across_batches(self):
+        """Test that a job cross-posted in a later batch is caught like in one batch."""
+        indeed = {
+            "title": "Senior Software Developer",
+            "company": "Shopify",
+            "location": "Toronto, ON",
+            "url": "https://ca.indeed.com/viewjob?jk=1",
+        }
+        linkedin = {
+            "title": "Senior Software Developers",
+            "company": "Shopify",
+            "location": "Remote",
+            "url": "https://www.linkedin.com/jobs/view/2",
+        }
+
+        assert len(SmartJobDeduplicator().deduplicate_job_list([indeed, linkedin])[0]) == 1
+
+        streamed = SmartJobDeduplicator()
+        assert streamed.deduplicate_incremental([indeed])[0] == [indeed]
+        assert streamed.deduplicate_incremental([linkedin])[0] == []
+        assert streamed.kept_jobs == [indeed]
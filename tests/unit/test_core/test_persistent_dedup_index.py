@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the persistent cross-run dedup index.
+"""
+
+import pytest
+
+from src.core.duckdb_database import DuckDBJobDatabase
+from src.core.persistent_dedup_index import PersistentDedupIndex
+from src.core.unified_deduplication import UnifiedJobDeduplicator
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = DuckDBJobDatabase(db_path=str(tmp_path / "dedup.db"))
+    yield database
+    database.close()
+
+
+STORED_JOB = {
+    "id": "job-1",
+    "title": "Python Developer",
+    "company": "Tech Corp Inc.",
+    "location": "Toronto, ON",
+    "url": "https://example.com/job/1",
+}
+
+
+@pytest.mark.unit
+class TestPersistentDedupIndex:
+    """Test storing, loading and applying cross-run dedup keys."""
+
+    def test_inserted_jobs_are_known_on_next_load(self, db):
+        """Test that keys written on insert identify the job in a later run."""
+        db.add_jobs_batch([STORED_JOB])
+
+        index = PersistentDedupIndex.load(db)
+
+        assert index.contains(dict(STORED_JOB, id="other"))[1] == "Known URL"
+        assert index.contains(dict(STORED_JOB, url="https://mirror.com/9"))[1] == (
+            "Known job signature"
+        )
+        assert index.contains(dict(STORED_JOB, url="", location="Remote"))[1] == (
+            "Known title-company pair"
+        )
+        assert index.contains(
+            {"title": "Data Analyst", "company": "Globex", "url": "https://example.com/job/2"}
+        ) == (False, "")
+
+    def test_jobs_without_keys_are_backfilled(self, db):
+        """Test that jobs stored before the keys table existed get keys on load."""
+        db.conn.execute(
+            "INSERT INTO jobs (id, title, company, location, url) VALUES (?, ?, ?, ?, ?)",
+            ["legacy", "Data Analyst", "Globex", "Vancouver, BC", "https://example.com/legacy"],
+        )
+
+        index = PersistentDedupIndex.load(db)
+
+        assert index.contains({"url": "https://example.com/legacy"})[0]
+        count = db.conn.execute("SELECT COUNT(*) FROM job_dedup_keys").fetchone()[0]
+        assert count == 1
+
+    def test_deleted_jobs_can_be_stored_again(self, db):
+        """Test that deleting or clearing jobs drops their keys."""
+        db.add_jobs_batch([STORED_JOB, dict(STORED_JOB, id="job-2", url="https://example.com/2")])
+
+        db.delete_job("job-1")
+        assert not PersistentDedupIndex.load(db).contains(dict(STORED_JOB, title="Other"))[0]
+        assert db.add_job(STORED_JOB)
+
+        db.clear_all_jobs()
+        assert len(PersistentDedupIndex.load(db)) == 0
+        assert db.add_jobs_batch([STORED_JOB]) == 1
+
+    def test_unified_deduplicator_skips_known_jobs(self, db):
+        """Test that stored jobs are dropped before in-run deduplication."""
+        db.add_job(STORED_JOB)
+        deduplicator = UnifiedJobDeduplicator()
+        assert deduplicator.load_known_jobs(db) == 1
+
+        new_job = {
+            "title": "Data Engineer",
+            "company": "Globex",
+            "location": "Calgary, AB",
+            "url": "https://example.com/job/3",
+        }
+        unique = deduplicator.deduplicate_jobs([dict(STORED_JOB), new_job])
+
+        assert unique == [new_job]
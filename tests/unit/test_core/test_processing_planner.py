@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Unit tests for fingerprint-based incremental processing.
+"""
+
+import asyncio
+
+import pytest
+
+from src.analysis.two_stage_processor import TwoStageJobProcessor
+from src.core.duckdb_database import DuckDBJobDatabase
+from src.core.processing_planner import (
+    ProcessingPlanner,
+    content_fingerprint,
+    profile_fingerprint,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = DuckDBJobDatabase(db_path=str(tmp_path / "planner.db"))
+    database.add_jobs_batch(
+        [
+            {
+                "id": f"job-{i}",
+                "title": f"Data Analyst {i}",
+                "company": "Globex",
+                "description": f"SQL and Python role {i}",
+            }
+            for i in range(4)
+        ]
+    )
+    yield database
+    database.close()
+
+
+PROFILE = {"skills": ["Python", "SQL"], "last_updated": "2025-01-01"}
+
+
+@pytest.mark.unit
+class TestProcessingPlanner:
+    """Test planning, recording and stage selection from fingerprints."""
+
+    def test_processed_jobs_are_skipped_until_text_changes(self, db):
+        """Test that recorded jobs are skipped and an edited job is re-extracted."""
+        planner = ProcessingPlanner(db, PROFILE)
+        plan = planner.plan()
+        assert plan.get_stats() == {"extract": 4, "rescore": 0, "unchanged": 0}
+        assert "_stage" not in plan.extract[0]
+
+        assert planner.mark_processed(plan) == 4
+        assert len(planner.plan()) == 0
+
+        db.conn.execute("UPDATE jobs SET description = 'Now Rust' WHERE id = 'job-2'")
+        replanned = planner.plan()
+
+        assert [job["id"] for job in replanned.extract] == ["job-2"]
+        assert replanned.unchanged == 3
+
+    def test_profile_edit_only_rescores(self, db):
+        """Test that a skills edit re-scores every job without re-extraction."""
+        planner = ProcessingPlanner(db, PROFILE)
+        planner.mark_processed(planner.plan())
+
+        edited = ProcessingPlanner(db, dict(PROFILE, last_updated="2025-02-01"))
+        assert len(edited.plan()) == 0
+
+        rescore = ProcessingPlanner(db, dict(PROFILE, skills=["Python", "SQL", "Tableau"])).plan(
+            limit=3
+        )
+        assert rescore.get_stats() == {"extract": 0, "rescore": 3, "unchanged": 0}
+
+    def test_zero_scores_are_not_reprocessed(self, db):
+        """Test that a legitimately zero-scored job leaves the processing queue."""
+        assert len(db.get_jobs_for_processing(limit=10)) == 4
+
+        planner = ProcessingPlanner(db, PROFILE)
+        plan = planner.plan()
+        db.bulk_update_analysis([{"id": job["id"], "fit_score": 0.0} for job in plan.jobs])
+        planner.mark_processed(plan, ["job-0", "job-1"])
+
+        remaining = {job["id"] for job in db.get_jobs_for_processing(limit=10)}
+        assert remaining == {"job-2", "job-3"}
+
+    def test_jobs_processed_outside_a_plan(self, db):
+        """Test that streamed batches are recorded and rescores keep stored skills."""
+        db.bulk_update_analysis([{"id": "job-0", "skills": "Python, SQL"}])
+        planner = ProcessingPlanner(db, PROFILE)
+
+        assert planner.mark_jobs_processed(["job-0", "job-1", "unknown"]) == 2
+        assert {job["id"] for job in planner.plan().extract} == {"job-2", "job-3"}
+
+        db.bulk_update_analysis([{"id": "job-0", "fit_score": 55.0, "skills": None}])
+        assert db.conn.execute("SELECT skills FROM jobs WHERE id = 'job-0'").fetchone() == (
+            "Python, SQL",
+        )
+
+    def test_deleted_and_readded_job_is_planned_again(self, db):
+        """Test that deleting or clearing a job forgets its processing state."""
+        planner = ProcessingPlanner(db, PROFILE)
+        planner.mark_processed(planner.plan())
+        job = db.conn.execute("SELECT * FROM jobs WHERE id = 'job-1'").df().to_dict("records")[0]
+
+        assert db.delete_job("job-1")
+        db.add_jobs_batch([job])
+        assert [job["id"] for job in planner.plan().extract] == ["job-1"]
+
+        planner.mark_processed(planner.plan())
+        assert db.clear_all_jobs()
+        db.add_jobs_batch([job])
+        assert [job["id"] for job in planner.plan().extract] == ["job-1"]
+
+    def test_scopes_and_fingerprints(self, db):
+        """Test that scopes are independent and SQL and Python hashes agree."""
+        pipeline = ProcessingPlanner(db, PROFILE)
+        pipeline.mark_processed(pipeline.plan())
+
+        assert len(ProcessingPlanner(db, PROFILE, scope="semantic").plan()) == 4
+
+        row = db.conn.execute("SELECT * FROM jobs WHERE id = 'job-1'").df().iloc[0].to_dict()
+        stored = db.conn.execute(
+            "SELECT content_hash FROM job_processing_state WHERE job_id = 'job-1'"
+        ).fetchone()[0]
+        assert content_fingerprint(row) == stored
+        assert profile_fingerprint({"a": 1, "b": 2}) == profile_fingerprint({"b": 2, "a": 1})
+
+    def test_stage1_rejections_are_recorded(self, db):
+        """Test that jobs Stage 1 rejects are stored as filtered and not replanned."""
+        db.conn.execute(
+            "UPDATE jobs SET description = 'Poste bilingue, français requis' WHERE id = 'job-3'"
+        )
+        planner = ProcessingPlanner(db, PROFILE)
+        plan = planner.plan()
+        processor = TwoStageJobProcessor(PROFILE, cpu_workers=1, stage1_mode="thread")
+        processor.stage2_processor = None
+
+        results = asyncio.run(processor.process_plan(plan))
+        summary = db.bulk_update_analysis([result.to_analysis_update() for result in results])
+        recorded = planner.mark_processed(
+            plan, [r.job_id for r in results if r.job_id not in summary["missing_ids"]]
+        )
+
+        assert recorded == 4
+        assert len(planner.plan()) == 0
+        statuses = dict(db.conn.execute("SELECT id, status FROM jobs").fetchall())
+        assert statuses["job-3"] == "filtered"
+        assert statuses["job-0"] == "processed"
+
+    def test_profile_name_does_not_change_fingerprint(self):
+        """Test that entry points setting profile_name plan against the same state."""
+        assert profile_fingerprint(dict(PROFILE, profile_name="Nirajan")) == profile_fingerprint(
+            PROFILE
+        )
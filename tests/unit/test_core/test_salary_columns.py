@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for parsed salary columns.
+"""
+
+import pandas as pd
+import pytest
+
+from src.core.duckdb_database import DuckDBJobDatabase
+from src.core.salary_columns import parse_salary_frame, parse_salary_text
+
+
+@pytest.mark.unit
+class TestSalaryParsing:
+    """Test vectorized salary text parsing."""
+
+    def test_frame_parsing(self):
+        """Test ranges, units, periods, currencies and unparseable text."""
+        texts = pd.Series(
+            [
+                "$80,000 - $100,000 a year",
+                "CA$25–CA$30 an hour",
+                "70-85k",
+                "€4,000 per month",
+                "Competitive",
+                None,
+                "$80,000 - $100,000 a year",
+            ],
+            index=[10, 11, 12, 13, 14, 15, 16],
+        )
+
+        parsed = parse_salary_frame(texts)
+
+        assert list(parsed.index) == list(texts.index)
+        assert parsed.loc[10].tolist() == [80000.0, 100000.0, "yearly", "CAD"]
+        assert parsed.loc[11].tolist() == [52000.0, 62400.0, "hourly", "CAD"]
+        assert parsed.loc[12, ["salary_min", "salary_max"]].tolist() == [70000.0, 85000.0]
+        assert parsed.loc[13].tolist() == [48000.0, 48000.0, "monthly", "EUR"]
+        assert parsed.loc[[14, 15]].isna().all().all()
+        assert parsed.loc[16].tolist() == parsed.loc[10].tolist()
+
+    def test_amounts_need_salary_context(self):
+        """Test 401(k) mentions and lone bare numbers are not salaries."""
+        assert parse_salary_text("401k matching")["salary_min"] is None
+        assert parse_salary_text("120k")["salary_min"] is None
+        assert parse_salary_text("5000 signing bonus")["salary_min"] is None
+        assert parse_salary_text("401(k) match, $70k salary")["salary_min"] == 70000
+        assert parse_salary_text("Salary: 95000")["salary_min"] == 95000
+        assert parse_salary_text("Pay: 30/hr")["salary_period"] == "hourly"
+
+    def test_prefers_amount_with_currency_or_unit(self):
+        """Test an earlier bare number does not shadow the marked salary amount."""
+        assert parse_salary_text("2 years experience, $90k")["salary_min"] == 90000
+        assert parse_salary_text("3 days onsite, 80-100k")["salary_max"] == 100000
+        assert parse_salary_text("Salary 95000, 2 openings")["salary_min"] == 95000
+
+    def test_open_ended_minimum(self):
+        """Test a trailing "+" gives the amount as the minimum with no maximum."""
+        assert parse_salary_text("100k+") == {
+            "salary_min": 100000,
+            "salary_max": None,
+            "salary_period": "yearly",
+            "salary_currency": "CAD",
+        }
+        assert parse_salary_text("$120,000+")["salary_min"] == 120000
+        assert parse_salary_text("$120,000+")["salary_max"] is None
+        assert parse_salary_text("CA$30+/hr")["salary_min"] == 62400
+        assert parse_salary_text("5000+ signing bonus")["salary_min"] is None
+
+    def test_single_text(self):
+        """Test the scalar helper returns None for missing values."""
+        assert parse_salary_text("US$120k") == {
+            "salary_min": 120000.0,
+            "salary_max": 120000.0,
+            "salary_period": "yearly",
+            "salary_currency": "USD",
+        }
+        assert parse_salary_text("") == dict.fromkeys(
+            ["salary_min", "salary_max", "salary_period", "salary_currency"]
+        )
+
+
+@pytest.mark.unit
+class TestSalaryColumns:
+    """Test salary columns filled at ingest and by the backfill."""
+
+    def test_ingest_and_backfill(self, tmp_path):
+        """Test that inserts parse salaries and the backfill fills old rows."""
+        with DuckDBJobDatabase(db_path=str(tmp_path / "salary.db")) as db:
+            db.add_jobs_batch(
+                [
+                    {"id": "a", "title": "Analyst", "company": "Acme", "salary": "$60k - $80k"},
+                    {"id": "b", "title": "Analyst", "company": "Acme", "salary_min": 50000},
+                ]
+            )
+            db.add_job({"id": "c", "title": "Dev", "company": "Acme", "salary_range": "$45/hour"})
+            db.conn.execute(
+                "INSERT INTO jobs (id, title, company, salary_range) "
+                "VALUES ('d', 'Old', 'Acme', '$100,000 - $120,000')"
+            )
+
+            assert db.backfill_salary_columns() == 1
+            assert db.backfill_salary_columns() == 0
+
+            rows = db.conn.execute(
+                "SELECT id, salary_min, salary_max, salary_period FROM jobs ORDER BY id"
+            ).fetchall()
+            assert rows == [
+                ("a", 60000.0, 80000.0, "yearly"),
+                ("b", 50000.0, None, None),
+                ("c", 93600.0, 93600.0, "hourly"),
+                ("d", 100000.0, 120000.0, "yearly"),
+            ]
+
+            stats = db.get_salary_statistics()
+            assert stats["count"] == 3
+            assert stats["min"] == 60000.0 and stats["max"] == 120000.0
+            assert [bucket["range"] for bucket in stats["distribution"]] == [
+                "$50k-75k",
+                "$75k-100k",
+                "$100k-125k",
+            ]
+
+    def test_metadata_update_reparses_salary(self, tmp_path):
+        """Test that new salary text re-fills the parsed columns unless amounts are given."""
+        with DuckDBJobDatabase(db_path=str(tmp_path / "salary.db")) as db:
+            db.add_job({"id": "a", "title": "Dev", "company": "Acme", "salary_range": "$60k"})
+
+            assert db.update_job_metadata("a", {"salary_range": "$45/hour"})
+            row = db.conn.execute(
+                "SELECT salary_min, salary_max, salary_period FROM jobs WHERE id = 'a'"
+            ).fetchone()
+            assert row == (93600.0, 93600.0, "hourly")
+
+            assert db.update_job_metadata("a", {"salary_range": "Competitive", "salary_min": 70000})
+            row = db.conn.execute(
+                "SELECT salary_range, salary_min, salary_max FROM jobs WHERE id = 'a'"
+            ).fetchone()
+            assert row == ("Competitive", 70000.0, 93600.0)
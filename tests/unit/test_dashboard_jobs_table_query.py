@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit tests for server-side jobs table paging, sorting and filtering.
+"""
+
+import pytest
+
+from src.core.duckdb_database import DuckDBJobDatabase
+from src.dashboard.services.jobs_table_query import (
+    build_order_by,
+    parse_filter_query,
+    query_job_companies,
+    query_jobs_page,
+    query_jobs_table_metrics,
+    query_status_counts,
+)
+
+
+@pytest.fixture
+def profile_db(tmp_path, monkeypatch):
+    """Profile database with 30 jobs under an isolated working directory."""
+    monkeypatch.chdir(tmp_path)
+    profile = "table_test"
+    db = DuckDBJobDatabase(profile_name=profile, pooled=True)
+    for i in range(30):
+        db.add_job(
+            {
+                "id": f"job-{i:02d}",
+                "title": "Python Developer" if i % 3 == 0 else "Data Analyst",
+                "company": "Acme" if i % 2 else "Globex",
+                "location": "Toronto, ON",
+                "fit_score": i / 30,
+                "status": "processed" if i < 5 else "new",
+                "salary_range": f"${50 + i}k",
+                "description": "x" * 1000,
+                "url": f"https://example.com/{i}",
+            }
+        )
+    yield profile
+    db.close()
+
+
+@pytest.mark.unit
+class TestTableQueryTranslation:
+    """Test DataTable filter and sort translation."""
+
+    def test_parse_filter_query(self):
+        """Test supported operators, quoting and ignored terms."""
+        conditions, params = parse_filter_query(
+            '{title} icontains "py_dev" && {match_score} >= 80 && {actions} contains x '
+            "&& {posted_date} datestartswith 2024-08"
+        )
+
+        assert len(conditions) == 3
+        assert params == ["%py\\_dev%", 80.0, "2024-08%"]
+        assert parse_filter_query("{match_score} > abc") == ([], [])
+
+    def test_build_order_by(self):
+        """Test whitelisted sort columns with an id tie-break."""
+        assert build_order_by([{"column_id": "company", "direction": "desc"}]) == (
+            "company DESC NULLS LAST, id"
+        )
+        assert build_order_by([{"column_id": "id; DROP TABLE jobs", "direction": "asc"}]) == (
+            build_order_by(None)
+        )
+
+
+@pytest.mark.unit
+class TestQueryJobsPage:
+    """Test pages fetched from DuckDB."""
+
+    def test_page_sort_and_filter(self, profile_db):
+        """Test LIMIT/OFFSET paging over sorted, filtered rows."""
+        page = query_jobs_page(
+            profile_db,
+            page_current=1,
+            page_size=4,
+            sort_by=[{"column_id": "match_score", "direction": "desc"}],
+            filter_query="{title} contains python",
+        )
+
+        assert page.total == 10 and page.page_count == 3
+        assert page.rows["id"].tolist() == ["job-15", "job-12", "job-09", "job-06"]
+        assert page.rows["match_score"].tolist() == pytest.approx([50, 40, 30, 20])
+        assert page.rows["description"].str.len().max() == 200
+
+    def test_panel_filters_and_export(self, profile_db):
+        """Test panel filters, resolved status and unpaged full-text export."""
+        page = query_jobs_page(
+            profile_db,
+            page_size=None,
+            description_chars=None,
+            filters={"status": "ready_to_apply", "company": "Acme", "search": "analyst"},
+        )
+
+        assert sorted(page.rows["id"]) == ["job-01"]
+        assert page.rows["status"].tolist() == ["ready_to_apply"]
+        assert page.rows["description"].str.len().tolist() == [1000]
+
+    def test_metrics_and_companies(self, profile_db):
+        """Test status counters and company options."""
+        metrics = query_jobs_table_metrics(profile_db)
+
+        assert metrics == {"total": 30, "new": 25, "ready_to_apply": 5, "applied": 0}
+        assert query_status_counts(profile_db) == {"new": 25, "ready_to_apply": 5}
+        assert query_job_companies(profile_db) == ["Acme", "Globex"]
+
+
+class TestJobsTableLayout:
+    """The table the Jobs tab builds must hand paging to the callbacks."""
+
+    def test_table_view_is_server_side(self):
+        """Test paging, sorting and filtering are custom on the built table."""
+        pytest.importorskip("dash")
+        from src.dashboard.dash_app.layouts.jobs_layout import create_table_view
+
+        table = create_table_view().children[0]
+
+        assert table.id == "jobs-table"
+        assert table.page_action == "custom"
+        assert table.sort_action == "custom"
+        assert table.filter_action == "custom"
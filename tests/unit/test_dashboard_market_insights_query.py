@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Market Insights SQL aggregates.
+"""
+
+import pytest
+
+from src.core.duckdb_database import DuckDBJobDatabase
+from src.dashboard.services.market_insights_query import (
+    query_market_counts,
+    query_market_stats,
+)
+
+
+@pytest.fixture
+def profile_db(tmp_path, monkeypatch):
+    """Profile database with a few jobs under an isolated working directory."""
+    monkeypatch.chdir(tmp_path)
+    profile = "insights_test"
+    db = DuckDBJobDatabase(profile_name=profile, pooled=True)
+    jobs = [
+        {"id": "1", "title": "Python Developer", "company": "Acme", "location": "Toronto",
+         "description": "Docker and SQL", "is_rcip_city": 1, "date_posted": "2024-08-05"},
+        {"id": "2", "title": "Data Analyst", "company": "Acme ", "location": "Sudbury",
+         "description": "Excel, SQL and Tableau", "date_posted": "2024-08-06"},
+        {"id": "3", "title": "Java Developer", "company": "Unknown", "location": "Toronto",
+         "description": "Spring services", "date_posted": "2024-08-20"},
+    ]
+    for job in jobs:
+        db.add_job(job)
+    yield profile
+    db.close()
+
+
+@pytest.mark.unit
+class TestMarketInsightsQuery:
+    """Test card counts and skill, company and week aggregates."""
+
+    def test_market_stats(self, profile_db):
+        """Test totals, distinct companies and locations, and RCIP jobs."""
+        assert query_market_stats(profile_db) == {
+            "total_jobs": 3,
+            "companies": 3,
+            "locations": 2,
+            "rcip_jobs": 1,
+        }
+
+    def test_market_counts_read_descriptions(self, profile_db):
+        """Test skills are matched in full descriptions and companies are trimmed."""
+        counts = query_market_counts(profile_db, ["python", "sql", "Tableau", "rust"])
+
+        assert counts.total_jobs == 3
+        assert counts.skill_counts == {"python": 1, "sql": 2, "Tableau": 1}
+        assert counts.company_counts == {"Acme": 2}
+        assert counts.week_counts == {"2024-W31": 2, "2024-W33": 1}
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the single-query dashboard stats snapshot.
+"""
+
+import pytest
+
+from src.core.duckdb_database import DuckDBJobDatabase
+from src.dashboard.services.stats_snapshot import DashboardStatsSnapshot
+
+
+@pytest.fixture
+def profile_db(tmp_path, monkeypatch):
+    """Profile database created under an isolated working directory."""
+    monkeypatch.chdir(tmp_path)
+    profile = "snapshot_test"
+    db = DuckDBJobDatabase(profile_name=profile, pooled=True)
+    jobs = [
+        {"id": "1", "title": "Data Engineer", "company": "Acme", "location": "Toronto",
+         "fit_score": 85, "is_rcip_city": 1, "status": "new"},
+        {"id": "2", "title": "Analyst", "company": "Acme", "location": "Sudbury",
+         "fit_score": 40, "status": "applied"},
+        {"id": "3", "title": "Developer", "company": "Globex", "location": "Toronto",
+         "fit_score": 72, "status": "interviewing"},
+    ]
+    for job in jobs:
+        db.add_job(job)
+    yield profile, db
+    db.close()
+
+
+@pytest.mark.unit
+class TestDashboardStatsSnapshot:
+    """Test counter values and version-based change detection."""
+
+    def test_snapshot_counts(self, profile_db):
+        profile, _ = profile_db
+        snapshot = DashboardStatsSnapshot().get(profile)
+
+        assert snapshot.total_jobs == 3
+        assert snapshot.high_match == 2
+        assert snapshot.new_last_24h == 3
+        assert snapshot.rcip_jobs == 1
+        assert (snapshot.to_apply, snapshot.applied, snapshot.responses) == (1, 1, 1)
+        assert snapshot.top_companies[0] == ("Acme", 2)
+        assert snapshot.top_locations[0] == ("Toronto", 2)
+
+    def test_unchanged_table_reuses_snapshot(self, profile_db):
+        profile, _ = profile_db
+        service = DashboardStatsSnapshot()
+
+        first = service.get(profile)
+        second = service.get(profile)
+
+        assert second is first
+        assert service.get_stats()["recomputes"] == 1
+
+    def test_new_rows_trigger_recompute(self, profile_db):
+        profile, db = profile_db
+        service = DashboardStatsSnapshot()
+
+        service.get(profile)
+        db.add_job({"id": "4", "title": "QA", "company": "Initech", "fit_score": 90})
+        snapshot = service.get(profile)
+
+        assert snapshot.total_jobs == 4
+        assert snapshot.high_match == 3
+        assert service.get_stats()["recomputes"] == 2
+
+    def test_status_update_triggers_recompute(self, profile_db):
+        profile, db = profile_db
+        service = DashboardStatsSnapshot()
+
+        first = service.get(profile)
+        db.update_job_status("2", "interviewing")
+        snapshot = service.get(profile)
+
+        assert snapshot is not first
+        assert snapshot.responses == 2
+
+    def test_high_match_excludes_threshold(self, profile_db):
+        profile, db = profile_db
+        db.add_job({"id": "5", "title": "QA", "company": "Initech", "fit_score": 70})
+
+        assert DashboardStatsSnapshot().get(profile).high_match == 2
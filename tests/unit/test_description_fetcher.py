@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Unit tests for HTTP-first job description fetching.
+"""
+
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+from aiohttp import web
+
+from src.scrapers import description_fetcher
+from src.scrapers.description_fetcher import AsyncDescriptionFetcher, extract_description
+from src.scrapers.multi_site_jobspy_workers import MultiSiteJobSpyWorkers
+
+BODY = "Build data pipelines in Python and SQL for our analytics platform. " * 5
+JSON_LD_PAGE = (
+    "<html><head><script type='application/ld+json'>"
+    + json.dumps({"@type": "JobPosting", "title": "Dev", "description": f"<p>{BODY}</p>"})
+    + "</script></head><body><div id='app'></div></body></html>"
+)
+HTML_PAGE = f"<html><body><nav>Menu</nav><div class='job-description'>{BODY}</div></body></html>"
+JS_SHELL = "<html><body><div id='root'></div><script src='app.js'></script></body></html>"
+
+
+def page(html):
+    async def handler(request):
+        return web.Response(text=html, content_type="text/html")
+
+    return handler
+
+
+@pytest.fixture
+async def job_site():
+    """Local job site counting conditional requests and peak concurrency."""
+    state = {"active": 0, "peak": 0, "conditional": 0}
+
+    async def slow(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.05)
+        state["active"] -= 1
+        return web.Response(text=HTML_PAGE, content_type="text/html")
+
+    async def gone(request):
+        return web.Response(status=404)
+
+    async def etag(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            state["conditional"] += 1
+            return web.Response(status=304)
+        return web.Response(text=HTML_PAGE, content_type="text/html", headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/ld", page(JSON_LD_PAGE))
+    app.router.add_get("/js", page(JS_SHELL))
+    app.router.add_get("/gone", gone)
+    app.router.add_get("/etag", etag)
+    app.router.add_get("/slow/{n}", slow)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", state
+    await runner.cleanup()
+
+
+class TestExtractDescription:
+    """Test description extraction from HTML."""
+
+    def test_json_ld_and_selectors(self):
+        """Test JSON-LD JobPosting first, then content containers, else None."""
+        assert extract_description(JSON_LD_PAGE) == BODY.strip()
+        assert extract_description(HTML_PAGE) == BODY.strip()
+        assert extract_description(JS_SHELL) is None
+
+
+class TestAsyncDescriptionFetcher:
+    """Test concurrency limits, conditional requests and fallbacks."""
+
+    async def test_fetch_results(self, job_site):
+        """Test HTTP results, failures and the 304 path on a second fetch."""
+        base, state = job_site
+        fetcher = AsyncDescriptionFetcher(host_interval=0, browser_fallback=False)
+        urls = [f"{base}/ld", f"{base}/js", f"{base}/gone", f"{base}/etag"]
+
+        first = await fetcher.fetch_all(urls + [f"{base}/ld"])
+        second = await fetcher.fetch_all([f"{base}/etag"])
+
+        assert len(first) == 4
+        assert first[f"{base}/ld"].method == "http"
+        assert first[f"{base}/js"].description is None and first[f"{base}/js"].status == 200
+        assert first[f"{base}/gone"].status == 404
+        assert second[f"{base}/etag"].method == "not_modified"
+        assert second[f"{base}/etag"].description == BODY.strip()
+        assert state["conditional"] == 1
+
+    async def test_concurrency_limits(self, job_site):
+        """Test max_concurrency requests in flight and the per-host cap."""
+        base, state = job_site
+        urls = [f"{base}/slow/{n}" for n in range(60)]
+
+        await AsyncDescriptionFetcher(
+            max_concurrency=24, per_host_limit=100, host_interval=0, browser_fallback=False
+        ).fetch_all(urls)
+        assert state["peak"] == 24
+
+        state["peak"] = 0
+        await AsyncDescriptionFetcher(
+            max_concurrency=24, per_host_limit=3, host_interval=0, browser_fallback=False
+        ).fetch_all([f"{url}?again" for url in urls[:12]])
+        assert state["peak"] == 3
+
+
+class TestDescriptionEnrichment:
+    """Test filling descriptions into a JobSpy frame."""
+
+    async def test_fills_missing_descriptions(self, job_site, monkeypatch):
+        """Test that only missing or short descriptions are fetched and filled."""
+        base, _ = job_site
+
+        class LocalFetcher(AsyncDescriptionFetcher):
+            def __init__(self, **kwargs):
+                super().__init__(host_interval=0, browser_fallback=False, **kwargs)
+
+        monkeypatch.setattr(description_fetcher, "AsyncDescriptionFetcher", LocalFetcher)
+        jobs = pd.DataFrame(
+            {
+                "title": ["A", "B", "C"],
+                "job_url": [f"{base}/ld", f"{base}/gone", "https://example.invalid/c"],
+                "description": [None, "short", "x" * 300],
+            }
+        )
+
+        enriched = await MultiSiteJobSpyWorkers().run_optimized_description_fetching(jobs)
+
+        assert enriched["description"].tolist() == [BODY.strip(), "short", "x" * 300]
+        assert jobs["description"].tolist()[0] is None
+
+
+class TestWebContentFetcher:
+    """Test the extractor's batch fetch from inside and outside an event loop."""
+
+    async def test_sync_and_async_fetch(self, job_site, monkeypatch):
+        """Test the async variant in a loop and the sync wrapper from a plain thread."""
+        from src.utils.job_content_extractor import WebContentFetcher
+
+        base, _ = job_site
+
+        class LocalFetcher(AsyncDescriptionFetcher):
+            def __init__(self, **kwargs):
+                super().__init__(host_interval=0, browser_fallback=False, **kwargs)
+
+        monkeypatch.setattr(description_fetcher, "AsyncDescriptionFetcher", LocalFetcher)
+        fetcher = WebContentFetcher()
+        urls = [f"{base}/ld", f"{base}/gone"]
+
+        assert await fetcher.fetch_job_contents_async(urls) == {f"{base}/ld": BODY.strip()}
+        assert await asyncio.to_thread(fetcher.fetch_job_contents, urls) == {
+            f"{base}/ld": BODY.strip()
+        }
+        with pytest.raises(RuntimeError, match="fetch_job_contents_async"):
+            fetcher.fetch_job_contents(urls)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the memory-mapped embedding store.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+# The optimization package loads the sentence-transformers model on import
+pytest.importorskip("sentence_transformers")
+
+from src.optimization.embedding_store import EmbeddingStore, content_key
+from src.optimization.intelligent_cache import IntelligentCache
+
+MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+@pytest.mark.unit
+class TestEmbeddingStore:
+    """Test batched put/get, reopening, crash recovery and expiry."""
+
+    def test_batched_round_trip_survives_reopen(self, tmp_path):
+        """Test that vectors written in one batch are found after reopening."""
+        vectors = np.random.default_rng(0).random((50, 8), dtype=np.float32)
+        keys = [content_key(f"job {i}") for i in range(50)]
+
+        store = EmbeddingStore(tmp_path, MODEL)
+        assert store.put_many(keys, vectors) == 50
+        assert store.put_many(keys[:5], vectors[:5]) == 0
+
+        reopened = EmbeddingStore(tmp_path, MODEL)
+        found_vectors, found = reopened.get_many(keys[10:12] + [content_key("missing")])
+
+        assert len(reopened) == 50
+        assert found.tolist() == [True, True, False]
+        np.testing.assert_array_equal(found_vectors[:2], vectors[10:12])
+        np.testing.assert_array_equal(reopened.matrix()[reopened.rows(keys[:3])], vectors[:3])
+
+    def test_unindexed_tail_is_dropped(self, tmp_path):
+        """Test that a partially written append is ignored and overwritten."""
+        store = EmbeddingStore(tmp_path, MODEL)
+        store.put(content_key("a"), np.ones(4))
+        with open(store.vectors_path, "ab") as f:
+            f.write(b"\0" * 10)
+
+        reopened = EmbeddingStore(tmp_path, MODEL)
+        reopened.put(content_key("b"), np.full(4, 2.0))
+
+        assert reopened.vectors_path.stat().st_size == 2 * 4 * 4
+        np.testing.assert_array_equal(reopened.get(content_key("b")), np.full(4, 2.0))
+
+    def test_short_time_file_resets_store(self, tmp_path):
+        """Test that rows without write times are treated as corruption and dropped."""
+        store = EmbeddingStore(tmp_path, MODEL)
+        store.put_many([content_key("a"), content_key("b")], np.ones((2, 4)))
+        with open(store.times_path, "r+b") as f:
+            f.truncate(8)
+
+        reopened = EmbeddingStore(tmp_path, MODEL)
+        assert len(reopened) == 0
+        assert reopened.put(content_key("c"), np.full(4, 3.0))
+
+        again = EmbeddingStore(tmp_path, MODEL)
+        assert len(again) == 1
+        np.testing.assert_array_equal(again.get(content_key("c")), np.full(4, 3.0))
+
+    def test_concurrent_writers_keep_each_others_rows(self, tmp_path):
+        """Test that a second handle on the same files never truncates the first's rows."""
+        first = EmbeddingStore(tmp_path, MODEL)
+        second = EmbeddingStore(tmp_path, MODEL)
+
+        first.put(content_key("a"), np.ones(4))
+        second.put(content_key("b"), np.full(4, 2.0))
+        first.put(content_key("c"), np.full(4, 3.0))
+
+        assert first.vectors_path.stat().st_size == 3 * 4 * 4
+        np.testing.assert_array_equal(second.get(content_key("c")), np.full(4, 3.0))
+        reopened = EmbeddingStore(tmp_path, MODEL)
+        np.testing.assert_array_equal(reopened.get(content_key("b")), np.full(4, 2.0))
+        assert len(reopened) == 3
+
+    def test_expired_rows_are_rewritten_and_compacted(self, tmp_path, monkeypatch):
+        """Test that rows past the TTL miss, are written again and compact away."""
+        store = EmbeddingStore(tmp_path, MODEL, ttl_seconds=60)
+        store.put_many([content_key("old"), content_key("kept")], np.ones((2, 4)))
+
+        later = time.time() + 120
+        monkeypatch.setattr("src.optimization.embedding_store.time.time", lambda: later)
+        assert store.get(content_key("old")) is None
+        assert store.put(content_key("old"), np.full(4, 5.0))
+
+        assert store.compact() == 2
+        reopened = EmbeddingStore(tmp_path, MODEL, ttl_seconds=60)
+        assert len(reopened) == 1
+        np.testing.assert_array_equal(reopened.get(content_key("old")), np.full(4, 5.0))
+        np.testing.assert_array_equal(store.get(content_key("old")), np.full(4, 5.0))
+
+    def test_intelligent_cache_uses_store(self, tmp_path):
+        """Test that the cache API persists embeddings without per-item files."""
+        cache = IntelligentCache(cache_dir=str(tmp_path))
+        cache.cache_embeddings(["python job", "java job"], MODEL, np.eye(2, 3))
+
+        fresh = IntelligentCache(cache_dir=str(tmp_path))
+        cached = fresh.get_cached_embeddings(["java job", "rust job"], MODEL)
+
+        np.testing.assert_array_equal(cached[0], [0.0, 1.0, 0.0])
+        assert cached[1] is None
+        assert {path.suffix for path in fresh.embedding_dir.iterdir()} == {
+            ".f32",
+            ".ts",
+            ".keys",
+            ".json",
+            ".lock",
+        }
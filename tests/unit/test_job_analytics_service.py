@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the SQL-aggregated job analytics report.
+"""
+
+import pytest
+
+from src.core.duckdb_database import DuckDBJobDatabase
+from src.services.job_analytics_service import JobAnalyticsService
+
+
+@pytest.fixture
+def analytics_db(tmp_path, monkeypatch):
+    """Profile database with jobs spread over several weeks."""
+    monkeypatch.chdir(tmp_path)
+    db = DuckDBJobDatabase(profile_name="analytics_test")
+    db.add_jobs_batch(
+        [
+            {
+                "id": f"job-{i}",
+                "title": "Developer",
+                "company": "Acme" if i % 2 else "Globex",
+                "location": "Toronto, ON" if i < 4 else "Remote",
+                "location_type": "remote" if i >= 4 else "onsite",
+                "keywords": '["Python", "SQL"]' if i % 2 else "python; docker",
+                "skills": "SQL, AWS",
+                "fit_score": [0.95, 85, 0.72, None, 0.4, 0.55][i],
+                "job_type": "Full-time",
+            }
+            for i in range(6)
+        ]
+    )
+    db.conn.execute(
+        """
+        UPDATE jobs SET
+            created_at = CURRENT_TIMESTAMP - to_days(CAST(regexp_extract(id, '\\d+') AS INTEGER) * 10),
+            application_status = CASE id WHEN 'job-0' THEN 'applied' WHEN 'job-1' THEN 'offer'
+                                         WHEN 'job-2' THEN 'interested' ELSE 'discovered' END,
+            application_date = CASE WHEN id IN ('job-0', 'job-1') THEN CURRENT_DATE END
+        """
+    )
+    yield db
+    db.close()
+
+
+@pytest.mark.unit
+class TestJobAnalyticsReport:
+    """Test report figures computed by DuckDB aggregates."""
+
+    def test_report_covers_full_history(self, analytics_db):
+        """Test overview, scores, skills, companies and applications."""
+        report = JobAnalyticsService(analytics_db).generate_comprehensive_report(days=15)
+
+        overview = report["overview"]
+        assert report["total_jobs"] == 6
+        assert overview["applied_jobs"] == 2 and overview["bookmarked_jobs"] == 1
+        assert overview["recent_jobs"] == 2
+        assert report["trends"]["daily_average"] == pytest.approx(2 / 15)
+        assert sum(report["trends"]["jobs_by_date"].values()) == 6
+
+        scores = report["match_scores"]
+        assert scores["total_scored_jobs"] == 5
+        assert scores["high_score_jobs"] == 2
+        assert scores["score_distribution"]["0.8-0.9"] == 1
+
+        skills = report["skills"]["top_skills"]
+        assert skills == {"sql": 6, "aws": 6, "python": 6, "docker": 3}
+        assert report["recommendations"]["skills_to_learn"][0] == "python"
+
+        assert report["companies"]["top_companies"] == {"Acme": 3, "Globex": 3}
+        assert list(report["locations"]["top_cities"].items()) == [("Toronto", 4), ("Remote", 2)]
+        assert report["applications"]["response_rate"] == pytest.approx(50)
+
+    def test_report_cached_until_table_changes(self, analytics_db):
+        """Test reports are reused until a write changes the table version."""
+        service = JobAnalyticsService(analytics_db)
+        first = service.generate_comprehensive_report()
+
+        assert service.generate_comprehensive_report() is first
+
+        analytics_db.add_job({"id": "job-new", "title": "Analyst", "company": "Initech"})
+        second = service.generate_comprehensive_report()
+        assert second is not first and second["total_jobs"] == 7
+
+    def test_status_update_invalidates_report(self, analytics_db):
+        """Test writes that leave last_updated alone still refresh the report."""
+        service = JobAnalyticsService(analytics_db)
+        first = service.generate_comprehensive_report()
+        assert first["overview"]["applied_jobs"] == 2
+
+        analytics_db.update_job_status("job-3", "applied")
+        second = service.generate_comprehensive_report()
+        assert second is not first and second["overview"]["applied_jobs"] == 3
+
+    def test_empty_table(self, tmp_path, monkeypatch):
+        """Test an empty database reports no data."""
+        monkeypatch.chdir(tmp_path)
+        with DuckDBJobDatabase(profile_name="analytics_empty") as db:
+            report = JobAnalyticsService(db).generate_comprehensive_report()
+        assert report["status"] == "no_data"
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the streaming JobSpy → two-stage orchestrator.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.analysis.two_stage_processor import Stage1Result, TwoStageJobProcessor
+from src.pipeline.jobspy_streaming_orchestrator import (
+    _DISCOVERY_DONE,
+    StreamingStats,
+    _process_stream,
+)
+
+
+class FakeProgress:
+    def update(self, task_id, **kwargs):
+        pass
+
+
+class SlowDatabase:
+    """Blocking write-back that records when it runs."""
+
+    def __init__(self, events, delay):
+        self.events = events
+        self.delay = delay
+
+    def add_jobs_batch(self, jobs):
+        self.events.append("save_start")
+        time.sleep(self.delay)
+        self.events.append("save_end")
+        return len(jobs)
+
+    def bulk_update_analysis(self, updates):
+        return {"missing_ids": []}
+
+
+@pytest.mark.unit
+class TestStreamingOverlap:
+    """Test that discovery keeps running while a batch is scored and saved."""
+
+    @pytest.mark.asyncio
+    async def test_producer_progresses_during_slow_batch(self):
+        """Test searches are queued while Stage 1 and the DuckDB write-back block."""
+        events = []
+
+        def slow_stage1(jobs):
+            events.append("stage1_start")
+            time.sleep(0.3)
+            events.append("stage1_end")
+            return [Stage1Result(basic_compatibility=0.8, passes_basic_filter=True) for _ in jobs]
+
+        processor = TwoStageJobProcessor({}, cpu_workers=1)
+        processor.stage2_processor = None
+        processor.stage1_processor.process_jobs_batch = slow_stage1
+
+        queue = asyncio.Queue(maxsize=32)
+
+        async def produce():
+            for i in range(8):
+                await queue.put(
+                    [
+                        {
+                            "id": f"job-{i}",
+                            "title": f"Role {i} {'x' * i}",
+                            "company": f"Company {i}",
+                            "url": f"https://example.com/{i}",
+                        }
+                    ]
+                )
+                events.append("put")
+                await asyncio.sleep(0.05)
+            await queue.put(_DISCOVERY_DONE)
+
+        producer = asyncio.create_task(produce())
+        stats = StreamingStats()
+        await _process_stream(
+            queue,
+            asyncio.Event(),
+            stats,
+            processor,
+            SlowDatabase(events, delay=0.3),
+            None,
+            batch_size=1,
+            max_total_jobs=None,
+            progress=FakeProgress(),
+            task_id=None,
+            started_at=time.perf_counter(),
+        )
+        await producer
+
+        def puts_between(start, end):
+            first = events.index(start)
+            return events[first : events.index(end, first)].count("put")
+
+        assert puts_between("stage1_start", "stage1_end") > 0
+        assert puts_between("save_start", "save_end") > 0
+        assert stats.jobs_saved == stats.jobs_processed == stats.jobs_unique > 1
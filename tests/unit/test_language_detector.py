@@ -0,0 +1,74 @@
+"""
+Unit tests for batched job language detection.
+"""
+
+import pytest
+
+pytest.importorskip("langdetect")
+pytest.importorskip("tenacity")  # src.utils package imports it
+
+from src.utils import language_detector
+from src.utils.language_detector import JobLanguageDetector
+
+ENGLISH = {
+    "title": "Python Developer",
+    "job_description": "We are looking for a skilled Python developer to join our team. "
+    "You will work with the data team and build pipelines for our clients.",
+}
+FRENCH = {
+    "title": "Développeur Python",
+    "job_description": "Nous recherchons un développeur Python pour rejoindre notre équipe. "
+    "Vous travaillerez avec les équipes de données et des clients dans la région.",
+}
+AMBIGUOUS = {"title": "Python SQL AWS Docker developer"}
+
+
+@pytest.fixture
+def detector_calls(monkeypatch):
+    """Count calls into the probabilistic detector."""
+    calls = []
+    real_detect_langs = language_detector.detect_langs
+
+    def counting_detect_langs(text):
+        calls.append(text)
+        return real_detect_langs(text)
+
+    monkeypatch.setattr(language_detector, "detect_langs", counting_detect_langs)
+    return calls
+
+
+class TestBatchedLanguageDetection:
+    """Test the pre-filter, single detector pass and result cache."""
+
+    def test_prefilter_decides_obvious_text(self, detector_calls):
+        """Test that clear English and French never reach the detector."""
+        detector = JobLanguageDetector()
+
+        english, french = detector.detect_languages_batch([ENGLISH, FRENCH])
+
+        assert english["detected_language"] == "en" and english["should_process"]
+        assert french["detected_language"] == "fr" and not french["should_process"]
+        assert detector_calls == []
+
+    def test_ambiguous_text_is_detected_once_and_cached(self, detector_calls):
+        """Test one detector call per distinct ambiguous text across batches."""
+        detector = JobLanguageDetector()
+
+        processable, filtered = detector.filter_jobs_by_language(
+            [dict(AMBIGUOUS), dict(AMBIGUOUS), dict(ENGLISH)]
+        )
+        detector.detect_job_language(dict(AMBIGUOUS))
+
+        assert len(processable) + len(filtered) == 3
+        assert len(detector_calls) == 1
+        assert detector.stats["cache_hits"] == 2
+        assert processable[0]["language_detection"]["languages"]
+
+    def test_sample_is_bounded(self, detector_calls):
+        """Test that long postings are truncated before detection."""
+        detector = JobLanguageDetector(cache_size=0)
+
+        result = detector.detect_job_language({"title": "Python " * 5000})
+
+        assert result["text_length"] <= language_detector.MAX_SAMPLE_CHARS
+        assert len(detector_calls[0]) <= language_detector.MAX_SAMPLE_CHARS
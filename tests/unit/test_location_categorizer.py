@@ -0,0 +1,77 @@
+"""
+Unit tests for memoized location categorization and RCIP batch enrichment.
+"""
+
+import pytest
+
+pytest.importorskip("tenacity")  # src.utils package imports it
+
+import pandas as pd
+
+from src.services.rcip_enrichment_service import RCIPEnrichmentService
+from src.utils.location_categorizer import LocationCategorizer, normalize_city
+
+
+class TestLocationCategorizer:
+    """Test lookup tables, memoization and bulk analysis."""
+
+    def test_lookup_tables(self):
+        """Test categories and tags from the precomputed city tables."""
+        categorizer = LocationCategorizer()
+
+        sudbury = categorizer.analyze_location("Sudbury, ON")
+        toronto = categorizer.analyze_location("Toronto, ON (Hybrid)")
+
+        assert (sudbury.city, sudbury.province) == ("Sudbury", "Ontario")
+        assert sudbury.is_rcip_city and sudbury.location_category == "rcip_city"
+        assert sudbury.city_tags == ["rcip", "high_demand_province"]
+        assert toronto.location_type == "hybrid" and toronto.location_category == "major_city"
+        assert normalize_city("  St. John's ") == "st john's"
+        assert normalize_city("Montréal") == "montreal"
+
+    def test_results_are_memoized(self):
+        """Test that repeated strings are analyzed once."""
+        categorizer = LocationCategorizer()
+
+        first = categorizer.analyze_location("Moncton, NB")
+        again = categorizer.analyze_location("Moncton, NB")
+
+        assert again is first
+        assert categorizer.cache_info().misses == 1
+
+    def test_analyze_locations(self):
+        """Test bulk analysis keeps order and index, including missing values."""
+        categorizer = LocationCategorizer()
+        locations = pd.Series(
+            ["Sudbury, ON", None, "Remote", "Sudbury, ON"], index=[7, 8, 9, 10]
+        )
+
+        analyzed = categorizer.analyze_locations(locations)
+
+        assert list(analyzed.index) == [7, 8, 9, 10]
+        assert analyzed["city"].tolist() == ["Sudbury", "Unknown", "Remote", "Sudbury"]
+        assert analyzed["is_rcip_city"].tolist() == [True, False, False, True]
+        assert categorizer.cache_info().misses == 2
+        assert categorizer.analyze_locations([]).empty
+
+
+class TestRCIPBatchEnrichment:
+    """Test that batch enrichment matches per-job enrichment."""
+
+    def test_batch_matches_single(self):
+        """Test fields and RCIP boost for shared and missing locations."""
+        service = RCIPEnrichmentService(ranking_boost=0.1)
+        jobs = [
+            {"title": "A", "location": "Thunder Bay, ON", "fit_score": 0.5},
+            {"title": "B", "location": "Toronto, ON", "fit_score": 0.5},
+            {"title": "C", "location": "Thunder Bay, ON", "fit_score": 0.95},
+            {"title": "D", "location": ""},
+        ]
+
+        batch = service.enrich_jobs_batch([dict(job) for job in jobs])
+        single = [service.enrich_job(dict(job)) for job in jobs]
+
+        assert batch == single
+        assert batch[0]["fit_score"] == pytest.approx(0.6) and batch[2]["fit_score"] == 1.0
+        assert batch[0]["tags"] == ["RCIP"] and "tags" not in batch[1]
+        assert batch[3]["location_category"] == "unknown"
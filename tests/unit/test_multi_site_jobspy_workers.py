@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Unit tests for concurrent JobSpy discovery.
+"""
+
+import sys
+import threading
+import time
+import types
+
+import pandas as pd
+import pytest
+
+from src.scrapers.multi_site_jobspy_workers import MultiSiteJobSpyWorkers, SiteRateLimiter
+
+
+class FakeJobSpy:
+    """Blocking scrape_jobs replacement that records per-site concurrency."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.calls = 0
+
+    def scrape_jobs(self, site_name, search_term, location, **kwargs):
+        with self.lock:
+            self.calls += 1
+            self.active[site_name] = self.active.get(site_name, 0) + 1
+            self.peak[site_name] = max(self.peak.get(site_name, 0), self.active[site_name])
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[site_name] -= 1
+        return pd.DataFrame(
+            {
+                "title": [f"{search_term} ({site_name})"],
+                "company": ["Acme"],
+                "description": [f"{search_term} role"],
+                "job_url": [f"https://{site_name}/{search_term}/{location}"],
+            }
+        )
+
+
+@pytest.fixture
+def fake_jobspy(monkeypatch):
+    fake = FakeJobSpy()
+    module = types.ModuleType("jobspy")
+    module.scrape_jobs = fake.scrape_jobs
+    monkeypatch.setitem(sys.modules, "jobspy", module)
+    return fake
+
+
+@pytest.fixture
+def workers():
+    workers = MultiSiteJobSpyWorkers(profile_name="test", max_jobs_per_site=5, concurrency=2)
+    workers.config.request_interval = 0.0
+    workers.config.site_request_intervals = {}
+    return workers
+
+
+@pytest.mark.unit
+class TestConcurrentDiscovery:
+    """Test the fan-out of site × location × term searches."""
+
+    @pytest.mark.asyncio
+    async def test_iter_discovery_respects_per_site_limit(self, fake_jobspy, workers):
+        """Test that sites run in parallel without exceeding their own limit."""
+        frames = [
+            df
+            async for df in workers.iter_discovery(
+                sites=["indeed", "linkedin"],
+                locations=["Toronto, ON", "Vancouver, BC"],
+                search_terms=["Python Developer", "Data Analyst"],
+                per_site_concurrency=2,
+            )
+        ]
+
+        assert len(frames) == 8
+        assert fake_jobspy.calls == 8
+        assert fake_jobspy.peak == {"indeed": 2, "linkedin": 2}
+        assert {df["source_site"].iloc[0] for df in frames} == {"indeed", "linkedin"}
+
+    @pytest.mark.asyncio
+    async def test_iter_discovery_stops_when_closed_early(self, fake_jobspy, workers):
+        """Test that closing the generator cancels searches not yet started."""
+        searches = workers.iter_discovery(
+            sites=["indeed"],
+            locations=["Toronto, ON"],
+            search_terms=[f"Developer {i}" for i in range(10)],
+            per_site_concurrency=1,
+        )
+        first = await searches.__anext__()
+        await searches.aclose()
+
+        assert len(first) == 1
+        assert fake_jobspy.calls < 10
+
+    @pytest.mark.asyncio
+    async def test_site_rate_limiter_spaces_requests(self):
+        """Test that request starts are spaced by the minimum interval."""
+        limiter = SiteRateLimiter(0.05)
+        started = time.monotonic()
+        for _ in range(3):
+            await limiter.wait()
+        assert time.monotonic() - started >= 0.1
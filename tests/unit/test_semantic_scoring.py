@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Unit tests for vectorized semantic scoring helpers.
+"""
+
+import numpy as np
+import pytest
+
+# The optimization package loads the sentence-transformers model on import
+pytest.importorskip("sentence_transformers")
+
+from src.optimization.profile_embedding import top_k_indices
+
+
+@pytest.mark.unit
+class TestTopKIndices:
+    """Test top-k selection over a score vector."""
+
+    def test_matches_full_sort(self):
+        """Test that argpartition selection equals sorting every score."""
+        scores = np.random.default_rng(7).random(5000).astype(np.float32)
+
+        top = top_k_indices(scores, 25)
+
+        assert top.tolist() == np.argsort(-scores, kind="stable")[:25].tolist()
+
+    def test_min_score_and_ties(self):
+        """Test that low scores are dropped and ties keep input order."""
+        scores = np.array([0.2, 0.9, 0.5, 0.9, 0.6], dtype=np.float32)
+
+        assert top_k_indices(scores, 3, min_score=0.55).tolist() == [1, 3, 4]
+        assert top_k_indices(scores, 10, min_score=0.95).tolist() == []